@@ -41,20 +41,17 @@ for text, expected_slot in test_inputs:
         print(f"  ✗ FAILED: {expected_slot} not found")
     print()
 
-# 개별 함수 테스트
-print("\n=== Individual Function Test ===\n")
+# 규칙 엔진 후보 구간 테스트
+print("\n=== RuleEngine Candidate Test ===\n")
 
-test_functions = [
-    ("_extract_budget", ["100만원", "100만 원", "50만원", "10만원"]),
-    ("_extract_companions", ["친구 2명", "가족", "혼자", "연인"]),
-    ("_extract_purpose", ["휴양", "관광", "먹방", "여행"]),
+test_utterances = [
+    "100만 원", "50 만원", "친구 2명", "가족", "혼자", "연인", "휴양", "관광", "먹방",
+    "제주도로 3월 15일에 3박 4일로 가려고 해요",
 ]
 
-for func_name, test_cases in test_functions:
-    func = getattr(parser, func_name)
-    print(f"{func_name}():")
-    for text in test_cases:
-        result = func(text)
-        status = "✓" if result else "✗"
-        print(f"  {status} '{text}' -> {result}")
-    print()
+for text in test_utterances:
+    candidates = parser.rule_engine.scan(text)
+    status = "✓" if candidates else "✗"
+    print(f"  {status} '{text}'")
+    for c in candidates:
+        print(f"      [{c.start}:{c.end}] {c.rule_id} -> {c.value}")
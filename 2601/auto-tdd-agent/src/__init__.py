@@ -1,6 +1,11 @@
 """
 src 패키지 초기화
 """
-from .graph import create_graph, AgentState
+from .graph import create_graph, get_compiled_graph, clear_compiled_graphs, AgentState
 
-__all__ = ["create_graph", "AgentState"]
+__all__ = [
+    "create_graph",
+    "get_compiled_graph",
+    "clear_compiled_graphs",
+    "AgentState",
+]
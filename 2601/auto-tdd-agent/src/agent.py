@@ -1,49 +1,94 @@
 """
 Planning Agent 통합 인터페이스
 """
-from typing import Dict, Any, Optional
-from langgraph.checkpoint.memory import MemorySaver
-from .graph import create_graph
+from contextlib import nullcontext
+from typing import ContextManager, Dict, Any, Iterator, Optional
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from .graph import create_graph, get_compiled_graph
+from .checkpoint import create_checkpointer
 from .core.config import AgentConfig
+from .core.admission import AdmissionController, get_admission_controller
+from .core.session_locks import SessionLocks
 from .core.state import AgentState
 
 
-class PlanningAgent:
-    """Planning Agent 클래스"""
+class SessionNotFound(LookupError):
+    """이어갈 대화 상태가 없음 (시작하지 않았거나, 만료/삭제된 세션)"""
+
+    def __init__(self, thread_id: str):
+        super().__init__(thread_id)
+        self.thread_id = thread_id
+
+    def __str__(self) -> str:
+        return f"세션을 찾을 수 없거나 만료되었습니다: {self.thread_id}"
 
-    def __init__(self, config: Optional[AgentConfig] = None):
+
+class PlanningAgent:
+    """
+    Planning Agent 클래스
+
+    인스턴스 하나를 여러 워커 스레드(ThreadPoolExecutor 등)가 함께 써도 됩니다.
+    같은 thread_id에 대한 run/continue_conversation/reset은 호출 순서대로 하나씩 실행되고
+    (get_state → update_state 사이에 다른 턴이 끼어들지 않음), 다른 thread_id의 호출은
+    동시에 실행됩니다. 컴파일된 그래프는 호출마다 상태를 체크포인터에서 읽으므로 공유해도
+    되며, 직접 넘기는 checkpointer는 스레드 안전해야 합니다 (src.checkpoint의 저장소는 모두 해당).
+    get_current_state는 기다리지 않고 마지막으로 저장된 상태를 돌려줍니다.
+
+    admission을 설정하면 턴(run/continue_conversation/stream) 실행 전에 자리를 받고, 받지 못하면
+    AdmissionRejected가 발생합니다 (이때 상태는 바뀌지 않음). 이어지는 대화의 턴이 새 대화보다
+    먼저 들어갑니다.
+    """
+
+    def __init__(
+        self,
+        config: Optional[AgentConfig] = None,
+        checkpointer: Optional[BaseCheckpointSaver] = None,
+        admission: Optional[AdmissionController] = None
+    ):
         """
         Args:
             config: Agent 설정 (None인 경우 기본 설정 사용)
+            checkpointer: 대화 상태 저장소 (None인 경우 CHECKPOINT_* 환경 설정에 따라 생성)
+            admission: 동시 턴 수 제한 (None인 경우 ADMISSION_* 환경 설정의 프로세스 공유 제한, 꺼져 있으면 제한 없음)
         """
         self.config = config or AgentConfig.default()
-        self.graph = create_graph(self.config)
-        self.checkpointer = MemorySaver()
-        self.compiled = self.graph.compile(
+        self.checkpointer = checkpointer if checkpointer is not None else create_checkpointer()
+        # 같은 설정의 그래프는 프로세스에서 한 번만 컴파일하고 체크포인터만 바꿔 끼움
+        self.compiled = get_compiled_graph(
+            self.config,
             checkpointer=self.checkpointer,
             interrupt_before=['ask_user']
         )
+        self.admission = admission if admission is not None else get_admission_controller()
+        self._session_locks = SessionLocks()
 
-    def run(self, initial_message: str, thread_id: str = 'default') -> Dict[str, Any]:
+    @property
+    def graph(self):
+        """컴파일 전 StateGraph (필요할 때 새로 조립)"""
+        return create_graph(self.config)
+
+    def run(
+        self,
+        initial_message: str,
+        thread_id: str = 'default',
+        reference_date: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Agent 실행
 
         Args:
             initial_message: 초기 사용자 메시지
             thread_id: 스레드 ID (대화 세션 구분)
+            reference_date: "내일" 등 상대 날짜 해석 기준일 (YYYY-MM-DD, None인 경우 매 턴 오늘)
 
         Returns:
             실행 결과 상태
         """
         config = {'configurable': {'thread_id': thread_id}}
+        initial_state = self._initial_state(initial_message, reference_date)
 
-        initial_state: AgentState = {
-            'messages': [{'role': 'user', 'content': initial_message}],
-            'current_plan': {},
-            'turn_count': 0
-        }
-
-        result = self.compiled.invoke(initial_state, config)
+        with self._session_locks.hold(thread_id), self._admit(resume=False):
+            result = self.compiled.invoke(initial_state, config)
         return result
 
     def continue_conversation(
@@ -60,25 +105,84 @@ class PlanningAgent:
 
         Returns:
             업데이트된 상태
+
+        Raises:
+            SessionNotFound: 스레드에 저장된 대화가 없음 (시작하지 않았거나 체크포인터가 만료/축출함)
         """
         config = {'configurable': {'thread_id': thread_id}}
 
-        # 현재 상태 가져오기
-        current_state = self.compiled.get_state(config)
+        # 같은 세션의 다른 턴이 상태를 읽고 쓰는 사이에 끼어들지 않도록 순서대로 실행
+        with self._session_locks.hold(thread_id):
+            values = self.compiled.get_state(config).values
+            if not values:
+                raise SessionNotFound(thread_id)
+            with self._admit(resume=True):
+                self._append_user_response(config, values, user_response)
 
-        # 상태 업데이트
-        updated_state = current_state.values.copy()
+                # 그래프 재개
+                result = self.compiled.invoke(None, config)
+
+        return result
+
+    def stream(
+        self,
+        user_message: str,
+        thread_id: str = 'default',
+        reference_date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        한 턴을 노드 단위로 실행하며 상태 갱신을 차례로 반환
+
+        스레드에 저장된 상태가 없으면 run, 있으면 continue_conversation과 같은 턴을 실행합니다.
+        생성기를 끝까지 소비하거나 닫을 때까지 같은 thread_id의 다른 턴은 기다립니다.
+
+        Args:
+            user_message: 사용자 메시지
+            thread_id: 스레드 ID
+            reference_date: 새 대화일 때 상대 날짜 해석 기준일 (YYYY-MM-DD)
+
+        Yields:
+            {노드 이름: 그 노드가 반환한 상태 갱신}
+        """
+        config = {'configurable': {'thread_id': thread_id}}
+
+        with self._session_locks.hold(thread_id):
+            values = self.compiled.get_state(config).values
+            with self._admit(resume=bool(values)):
+                if values:
+                    self._append_user_response(config, values, user_message)
+                    graph_input = None
+                else:
+                    graph_input = self._initial_state(user_message, reference_date)
+                yield from self.compiled.stream(graph_input, config, stream_mode='updates')
+
+    def _admit(self, resume: bool) -> ContextManager[None]:
+        """턴 실행 자리 받기 (admission이 없으면 바로 실행)"""
+        if self.admission is None:
+            return nullcontext()
+        return self.admission.admit(resume=resume)
+
+    @staticmethod
+    def _initial_state(initial_message: str, reference_date: Optional[str]) -> AgentState:
+        """새 대화의 초기 상태"""
+        initial_state: AgentState = {
+            'messages': [{'role': 'user', 'content': initial_message}],
+            'current_plan': {},
+            'turn_count': 0
+        }
+        if reference_date:
+            initial_state['reference_date'] = reference_date
+        return initial_state
+
+    def _append_user_response(self, config: Dict[str, Any], values: Dict[str, Any], user_response: str):
+        """저장된 상태에 사용자 응답을 덧붙여 기록 (세션 잠금 안에서 호출)"""
+        updated_state = values.copy()
         updated_state['messages'].append({
             'role': 'user',
             'content': user_response
         })
         updated_state['turn_count'] = updated_state.get('turn_count', 0) + 1
-
-        # 그래프 재개
         self.compiled.update_state(config, updated_state)
-        result = self.compiled.invoke(None, config)
-
-        return result
 
     def get_current_state(self, thread_id: str = 'default') -> Dict[str, Any]:
         """
@@ -101,9 +205,6 @@ class PlanningAgent:
         Args:
             thread_id: 스레드 ID
         """
-        # MemorySaver는 메모리 기반이므로 새로운 checkpointer 생성
-        self.checkpointer = MemorySaver()
-        self.compiled = self.graph.compile(
-            checkpointer=self.checkpointer,
-            interrupt_before=['ask_user']
-        )
+        # 다른 스레드의 대화는 유지
+        with self._session_locks.hold(thread_id):
+            self.checkpointer.delete_thread(thread_id)
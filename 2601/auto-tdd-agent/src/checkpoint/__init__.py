@@ -0,0 +1,25 @@
+"""
+체크포인트 저장소: LangGraph 대화 상태 영속화
+"""
+from .base import LocalCheckpointSaver, StoredCheckpoint
+from .memory import EvictingMemorySaver
+from .redis import CheckpointConflict, RedisCheckpointer
+from .resp import RespClient, RespError
+from .serde import CompactSerializer
+from .sqlite import SqliteCheckpointer
+from .tiered import TieredCheckpointer
+from .factory import create_checkpointer
+
+__all__ = [
+    "LocalCheckpointSaver",
+    "StoredCheckpoint",
+    "EvictingMemorySaver",
+    "CompactSerializer",
+    "SqliteCheckpointer",
+    "TieredCheckpointer",
+    "RedisCheckpointer",
+    "CheckpointConflict",
+    "RespClient",
+    "RespError",
+    "create_checkpointer",
+]
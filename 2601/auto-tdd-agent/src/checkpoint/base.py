@@ -0,0 +1,131 @@
+"""
+로컬 체크포인터 공통 부분
+
+같은 프로세스 안에서 짧게 끝나는 저장소(메모리, 로컬 SQLite 파일)는 동기 메서드만
+구현하고, 비동기 인터페이스와 채널 버전 규칙은 여기서 공유합니다.
+"""
+import random
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+
+
+class StoredCheckpoint(NamedTuple):
+    """
+    직렬화된 체크포인트 하나 (저장소 사이에서 다시 직렬화하지 않고 옮기는 단위)
+
+    checkpoint/metadata와 writes의 값은 serde.dumps_typed 결과 (타입, 바이트)이고,
+    writes는 (task_id, idx, channel, 값, task_path) 목록입니다.
+    """
+    checkpoint_ns: str
+    checkpoint_id: str
+    parent_id: Optional[str]
+    checkpoint: Tuple[str, bytes]
+    metadata: Tuple[str, bytes]
+    writes: Tuple[Tuple[str, int, str, Tuple[str, bytes], str], ...] = ()
+
+
+class LocalCheckpointSaver(BaseCheckpointSaver[str]):
+    """
+    동기 구현을 그대로 비동기 인터페이스로 제공하는 체크포인터 기반 클래스
+
+    하위 클래스는 get_tuple, list, put, put_writes, delete_thread를 구현하고, 저장소 사이에서
+    세션을 옮길 수 있으면 export_thread/import_thread도 구현합니다.
+    """
+
+    def export_thread(self, thread_id: str) -> List[StoredCheckpoint]:
+        """
+        스레드의 체크포인트를 직렬화된 그대로 꺼냄
+
+        Args:
+            thread_id: 스레드 ID
+
+        Returns:
+            StoredCheckpoint 목록 (스레드가 없으면 빈 목록)
+        """
+        raise NotImplementedError
+
+    def import_thread(self, thread_id: str, records: Sequence[StoredCheckpoint]) -> None:
+        """
+        export_thread 결과를 스레드에 저장 (같은 체크포인트 ID는 덮어씀)
+
+        Args:
+            thread_id: 스레드 ID
+            records: StoredCheckpoint 목록
+        """
+        raise NotImplementedError
+
+    def with_allowlist(self, extra_allowlist) -> 'LocalCheckpointSaver':
+        """
+        msgpack 허용 목록을 적용한 직렬화기로 교체 (LangGraph가 그래프 컴파일 시 호출)
+
+        기본 구현은 얕은 복사본을 돌려주지만, 복사본과 원본이 커밋 번호/통계 같은
+        카운터를 따로 갖게 되므로 복제하지 않고 이 인스턴스의 직렬화기를 바꿉니다.
+        """
+        derived = super().with_allowlist(extra_allowlist)
+        if derived is not self:
+            self.serde = derived.serde
+        return self
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """
+        채널의 다음 버전 (InMemorySaver와 같은 "정수.난수" 형식, 문자열 순서 = 버전 순서)
+        """
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        return self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return self.delete_thread(thread_id)
+
+    def close(self):
+        """저장소 정리 (기본: 할 일 없음)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
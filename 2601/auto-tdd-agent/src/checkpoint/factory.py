@@ -0,0 +1,45 @@
+"""
+환경 설정에 따른 체크포인터 생성
+"""
+from langgraph.checkpoint.base import BaseCheckpointSaver
+
+from ..core.env_config import EnvConfig
+from .memory import EvictingMemorySaver
+from .redis import RedisCheckpointer
+from .sqlite import SqliteCheckpointer
+from .tiered import TieredCheckpointer
+
+
+def create_checkpointer() -> BaseCheckpointSaver:
+    """
+    EnvConfig의 CHECKPOINT_* 설정으로 체크포인터 생성
+
+    - CHECKPOINT_REDIS_URL: 여러 노드가 공유하는 Redis 저장소 (세션 TTL/이력 깊이 적용)
+    - CHECKPOINT_DB 없음: 메모리 저장소 (세션 수/TTL/이력 깊이 제한은 설정한 경우에만)
+    - CHECKPOINT_DB + CHECKPOINT_SPILL_AFTER > 0: 유휴 세션을 그 파일로 내리는 계층형 저장소
+    - CHECKPOINT_DB만: 모든 체크포인트를 그 파일에 바로 기록
+
+    Returns:
+        체크포인터 인스턴스
+    """
+    if EnvConfig.CHECKPOINT_REDIS_URL:
+        return RedisCheckpointer.from_url(
+            EnvConfig.CHECKPOINT_REDIS_URL,
+            prefix=EnvConfig.CHECKPOINT_REDIS_PREFIX,
+            history=EnvConfig.CHECKPOINT_HISTORY or None,
+            ttl=int(EnvConfig.CHECKPOINT_SESSION_TTL) or None,
+        )
+    if not EnvConfig.CHECKPOINT_DB:
+        return EvictingMemorySaver(
+            max_sessions=EnvConfig.CHECKPOINT_MAX_SESSIONS or None,
+            ttl=EnvConfig.CHECKPOINT_SESSION_TTL or None,
+            history=EnvConfig.CHECKPOINT_HISTORY or None,
+        )
+    if EnvConfig.CHECKPOINT_SPILL_AFTER > 0:
+        return TieredCheckpointer(
+            EnvConfig.CHECKPOINT_DB,
+            idle_after=EnvConfig.CHECKPOINT_SPILL_AFTER,
+            max_hot_sessions=EnvConfig.CHECKPOINT_MAX_SESSIONS or None,
+            history=EnvConfig.CHECKPOINT_HISTORY or None,
+        )
+    return SqliteCheckpointer(EnvConfig.CHECKPOINT_DB)
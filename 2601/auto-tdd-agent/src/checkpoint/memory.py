@@ -0,0 +1,506 @@
+"""
+세션 수/유휴 시간/이력 깊이를 제한하는 메모리 체크포인터
+
+MemorySaver는 모든 스레드의 모든 체크포인트를 프로세스가 끝날 때까지 보관하므로,
+오래 도는 워커에는 버려진 세션과 턴마다 복사된 메시지 이력이 쌓입니다.
+EvictingMemorySaver는 스레드별로 최근 체크포인트 몇 개만 남기고, 오래 쓰이지 않은
+세션(TTL)과 세션 수 한도를 넘는 가장 오래전에 쓰인 세션(LRU)을 버립니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from .base import LocalCheckpointSaver, StoredCheckpoint
+
+# 직렬화된 값: (타입, 바이트)
+_Typed = Tuple[str, bytes]
+
+
+def _typed_size(typed: _Typed) -> int:
+    """직렬화된 값의 바이트 수"""
+    return len(typed[1])
+
+
+@dataclass
+class _Checkpoint:
+    """저장된 체크포인트 하나와 그 중간 쓰기"""
+    checkpoint: _Typed
+    metadata: _Typed
+    parent_id: Optional[str]
+    # (task_id, idx) → (task_id, channel, 값, task_path)
+    writes: Dict[Tuple[str, int], Tuple[str, str, _Typed, str]] = field(default_factory=dict)
+    nbytes: int = 0
+
+
+@dataclass
+class _Session:
+    """스레드 하나의 체크포인트 (네임스페이스 → 체크포인트 ID → _Checkpoint)"""
+    namespaces: Dict[str, Dict[str, _Checkpoint]] = field(default_factory=dict)
+    last_access: float = 0.0
+    nbytes: int = 0
+
+
+class EvictingMemorySaver(LocalCheckpointSaver):
+    """
+    세션 수, 유휴 TTL, 스레드별 이력 깊이를 제한하는 메모리 체크포인터
+
+    각 네임스페이스에서 최근 history개의 체크포인트만 남깁니다. 대화를 이어가는 데에는
+    최신 체크포인트와 그 중간 쓰기만 필요하므로 history=1이어도 재개할 수 있고,
+    그보다 앞선 체크포인트로의 시간 여행(get_state_history)만 잘립니다.
+
+    세션은 읽거나 쓸 때마다 최근 사용으로 표시되며, 만료/초과 세션은 쓰기 시점에
+    정리됩니다 (evict_expired로 직접 정리할 수도 있음).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_sessions: Optional[int] = None,
+        ttl: Optional[float] = None,
+        history: Optional[int] = None,
+        serde: Optional[SerializerProtocol] = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_evict: Optional[Callable[[str, List[StoredCheckpoint]], None]] = None,
+    ):
+        """
+        Args:
+            max_sessions: 보관할 최대 세션(스레드) 수 (None인 경우 제한 없음)
+            ttl: 세션 유휴 만료 시간 (초, None인 경우 만료 없음)
+            history: 네임스페이스별로 남길 체크포인트 수 (None인 경우 전부)
+            serde: 체크포인트 직렬화기 (None인 경우 LangGraph 기본값)
+            clock: 현재 시각 함수 (테스트용)
+            on_evict: TTL/세션 수 한도로 세션을 버리기 직전에 (스레드 ID, 체크포인트)로 호출
+                (잠금 안에서 호출되며, 예외가 나면 세션을 버리지 않음. delete_thread에는 호출 안 함)
+
+        Raises:
+            ValueError: 한도가 1보다 작거나 ttl이 0 이하
+        """
+        super().__init__(serde=serde)
+        for name, value in (("max_sessions", max_sessions), ("history", history)):
+            if value is not None and value < 1:
+                raise ValueError(f"{name}는 1 이상이어야 합니다: {value}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl은 0보다 커야 합니다: {ttl}")
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self.history = history
+        self._clock = clock
+        self.on_evict = on_evict
+        # 스레드 ID → _Session (앞쪽일수록 오래전에 사용)
+        self._sessions: "OrderedDict[str, _Session]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._nbytes = 0
+        self.evicted_sessions = 0
+        self.pruned_checkpoints = 0
+
+    # 세션 관리
+
+    def _touch(self, thread_id: str, create: bool = False) -> Optional[_Session]:
+        """세션을 최근 사용으로 표시 (잠금 안에서 호출)"""
+        session = self._sessions.get(thread_id)
+        if session is None:
+            if not create:
+                return None
+            session = self._sessions[thread_id] = _Session()
+        else:
+            self._sessions.move_to_end(thread_id)
+        session.last_access = self._clock()
+        return session
+
+    def _drop(self, thread_id: str):
+        """세션 삭제 (잠금 안에서 호출)"""
+        session = self._sessions.pop(thread_id, None)
+        if session is not None:
+            self._nbytes -= session.nbytes
+
+    def _evict_one(self, thread_id: str):
+        """한도/만료로 세션 하나를 버림 (잠금 안에서 호출)"""
+        if self.on_evict is not None:
+            self.on_evict(thread_id, self._records(self._sessions[thread_id]))
+        self._drop(thread_id)
+        self.evicted_sessions += 1
+
+    def _evict(self):
+        """만료 세션과 한도를 넘는 세션 정리 (잠금 안에서 호출)"""
+        if self.ttl is not None:
+            deadline = self._clock() - self.ttl
+            # 사용 순서로 정렬되어 있으므로 앞에서부터 만료된 것만 확인
+            while self._sessions:
+                thread_id, session = next(iter(self._sessions.items()))
+                if session.last_access > deadline:
+                    break
+                self._evict_one(thread_id)
+        if self.max_sessions is not None:
+            while len(self._sessions) > self.max_sessions:
+                self._evict_one(next(iter(self._sessions)))
+
+    def evict_expired(self) -> int:
+        """
+        만료/초과 세션 정리
+
+        Returns:
+            정리한 세션 수
+        """
+        with self._lock:
+            before = len(self._sessions)
+            self._evict()
+            return before - len(self._sessions)
+
+    def touch(self, thread_id: str) -> bool:
+        """
+        스레드를 최근 사용으로 표시
+
+        Args:
+            thread_id: 스레드 ID
+
+        Returns:
+            메모리에 있으면 True
+        """
+        with self._lock:
+            return self._touch(thread_id) is not None
+
+    def evict_all(self) -> int:
+        """
+        모든 세션을 버림 (on_evict 호출, 종료 전에 다른 저장소로 옮길 때)
+
+        Returns:
+            버린 세션 수
+        """
+        with self._lock:
+            count = len(self._sessions)
+            while self._sessions:
+                self._evict_one(next(iter(self._sessions)))
+            return count
+
+    @staticmethod
+    def _records(session: _Session) -> List[StoredCheckpoint]:
+        """세션 → StoredCheckpoint 목록 (잠금 안에서 호출)"""
+        return [
+            StoredCheckpoint(
+                checkpoint_ns, checkpoint_id, saved.parent_id, saved.checkpoint, saved.metadata,
+                tuple(
+                    (task_id, idx, channel, typed, task_path)
+                    for (_, idx), (task_id, channel, typed, task_path) in saved.writes.items()
+                ),
+            )
+            for checkpoint_ns, checkpoints in session.namespaces.items()
+            for checkpoint_id, saved in sorted(checkpoints.items())
+        ]
+
+    def export_thread(self, thread_id: str) -> List[StoredCheckpoint]:
+        """
+        스레드의 체크포인트를 직렬화된 그대로 꺼냄 (사용 시각은 바꾸지 않음)
+
+        Args:
+            thread_id: 스레드 ID
+
+        Returns:
+            StoredCheckpoint 목록 (스레드가 없으면 빈 목록)
+        """
+        with self._lock:
+            session = self._sessions.get(thread_id)
+            return self._records(session) if session is not None else []
+
+    def import_thread(self, thread_id: str, records: Sequence[StoredCheckpoint]) -> None:
+        """
+        직렬화된 체크포인트를 스레드에 저장하고 최근 사용으로 표시
+
+        Args:
+            thread_id: 스레드 ID
+            records: StoredCheckpoint 목록
+        """
+        with self._lock:
+            session = self._touch(thread_id, create=True)
+            touched = set()
+            for record in records:
+                saved = _Checkpoint(record.checkpoint, record.metadata, record.parent_id)
+                for task_id, idx, channel, typed, task_path in record.writes:
+                    saved.writes[(task_id, idx)] = (task_id, channel, typed, task_path)
+                saved.nbytes = (
+                    _typed_size(saved.checkpoint) + _typed_size(saved.metadata)
+                    + sum(_typed_size(w[2]) for w in saved.writes.values())
+                )
+                checkpoints = session.namespaces.setdefault(record.checkpoint_ns, {})
+                previous = checkpoints.get(record.checkpoint_id)
+                if previous is not None:
+                    session.nbytes -= previous.nbytes
+                    self._nbytes -= previous.nbytes
+                checkpoints[record.checkpoint_id] = saved
+                session.nbytes += saved.nbytes
+                self._nbytes += saved.nbytes
+                touched.add(record.checkpoint_ns)
+            for checkpoint_ns in touched:
+                self._prune(session, session.namespaces[checkpoint_ns])
+            self._evict()
+
+    def _prune(self, session: _Session, checkpoints: Dict[str, _Checkpoint]):
+        """네임스페이스의 오래된 체크포인트 정리 (잠금 안에서 호출)"""
+        if self.history is None:
+            return
+        while len(checkpoints) > self.history:
+            removed = checkpoints.pop(min(checkpoints))
+            session.nbytes -= removed.nbytes
+            self._nbytes -= removed.nbytes
+            self.pruned_checkpoints += 1
+
+    def memory_usage(self) -> Dict[str, int]:
+        """
+        현재 보관 중인 양
+
+        Returns:
+            {"sessions", "checkpoints", "writes", "bytes"}
+            (bytes: 직렬화된 체크포인트/메타데이터/중간 쓰기의 바이트 수 합계)
+        """
+        with self._lock:
+            checkpoints = writes = 0
+            for session in self._sessions.values():
+                for namespace in session.namespaces.values():
+                    checkpoints += len(namespace)
+                    writes += sum(len(saved.writes) for saved in namespace.values())
+            return {
+                "sessions": len(self._sessions),
+                "checkpoints": checkpoints,
+                "writes": writes,
+                "bytes": self._nbytes,
+            }
+
+    # 쓰기
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        체크포인트 저장 후 오래된 체크포인트/세션 정리
+
+        Args:
+            config: 부모 체크포인트 설정
+            checkpoint: 저장할 체크포인트 (채널 값 포함)
+            metadata: 체크포인트 메타데이터
+            new_versions: 이번에 바뀐 채널 버전 (전체 스냅숏을 저장하므로 사용하지 않음)
+
+        Returns:
+            저장된 체크포인트 설정
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        saved = _Checkpoint(
+            self.serde.dumps_typed(checkpoint),
+            self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
+            configurable.get("checkpoint_id"),
+        )
+        saved.nbytes = _typed_size(saved.checkpoint) + _typed_size(saved.metadata)
+
+        with self._lock:
+            session = self._touch(thread_id, create=True)
+            checkpoints = session.namespaces.setdefault(checkpoint_ns, {})
+            previous = checkpoints.get(checkpoint["id"])
+            if previous is not None:
+                session.nbytes -= previous.nbytes
+                self._nbytes -= previous.nbytes
+            checkpoints[checkpoint["id"]] = saved
+            session.nbytes += saved.nbytes
+            self._nbytes += saved.nbytes
+            self._prune(session, checkpoints)
+            self._evict()
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        체크포인트에 대한 중간 쓰기 저장 (정리된 체크포인트에 대한 쓰기는 버림)
+
+        Args:
+            config: 대상 체크포인트 설정
+            writes: (채널, 값) 목록
+            task_id: 쓰기를 만든 태스크 ID
+            task_path: 태스크 경로
+        """
+        configurable = config["configurable"]
+        with self._lock:
+            session = self._touch(configurable["thread_id"])
+            if session is None:
+                return
+            saved = session.namespaces.get(configurable.get("checkpoint_ns", ""), {}).get(
+                configurable["checkpoint_id"]
+            )
+            if saved is None:
+                return
+            for index, (channel, value) in enumerate(writes):
+                key = (task_id, WRITES_IDX_MAP.get(channel, index))
+                previous = saved.writes.get(key)
+                if previous is not None:
+                    if key[1] >= 0:
+                        continue  # 일반 채널은 처음 쓴 값 유지
+                    saved.nbytes -= _typed_size(previous[2])
+                    session.nbytes -= _typed_size(previous[2])
+                    self._nbytes -= _typed_size(previous[2])
+                typed = self.serde.dumps_typed(value)
+                saved.writes[key] = (task_id, channel, typed, task_path)
+                saved.nbytes += _typed_size(typed)
+                session.nbytes += _typed_size(typed)
+                self._nbytes += _typed_size(typed)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        스레드의 모든 체크포인트와 쓰기 삭제
+
+        Args:
+            thread_id: 스레드 ID
+        """
+        with self._lock:
+            self._drop(thread_id)
+
+    # 읽기
+
+    def _tuple(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        saved: _Checkpoint,
+        writes: List[Tuple[Tuple[str, int], Tuple[str, str, _Typed, str]]],
+    ) -> CheckpointTuple:
+        """저장된 체크포인트 → CheckpointTuple (writes: 잠금 안에서 복사한 중간 쓰기)"""
+        writes.sort(key=lambda item: writes_sort_key(item[1][3], *item[0]))
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed(saved.checkpoint),
+            metadata=self.serde.loads_typed(saved.metadata),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": saved.parent_id,
+                    }
+                }
+                if saved.parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed(typed))
+                for task_id, channel, typed, _ in (value for _, value in writes)
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        체크포인트 조회 (checkpoint_id가 없으면 스레드의 최신 체크포인트)
+
+        Args:
+            config: 조회할 체크포인트 설정
+
+        Returns:
+            CheckpointTuple 또는 없으면 None (정리/만료된 경우 포함)
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        with self._lock:
+            session = self._touch(thread_id)
+            if session is None:
+                return None
+            checkpoints = session.namespaces.get(checkpoint_ns)
+            if not checkpoints:
+                return None
+            checkpoint_id = get_checkpoint_id(config) or max(checkpoints)
+            saved = checkpoints.get(checkpoint_id)
+            if saved is None:
+                return None
+            writes = list(saved.writes.items())
+        return self._tuple(thread_id, checkpoint_ns, checkpoint_id, saved, writes)
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        남아 있는 체크포인트 목록 (스레드별 최신 순, 세션 사용 시각은 바꾸지 않음)
+
+        Args:
+            config: 스레드/네임스페이스/체크포인트 조건 (None인 경우 전체)
+            filter: 메타데이터 조건 (모든 키가 같은 값이어야 함)
+            before: 이 체크포인트보다 앞선 것만
+            limit: 최대 개수
+
+        Yields:
+            CheckpointTuple
+        """
+        configurable = config["configurable"] if config else {}
+        config_ns = configurable.get("checkpoint_ns")
+        config_id = get_checkpoint_id(config) if config else None
+        before_id = get_checkpoint_id(before) if before else None
+
+        # 잠금 안에서 대상만 골라 두고, 역직렬화는 잠금 밖에서
+        selected: List[Tuple[str, str, str, _Checkpoint, list]] = []
+        with self._lock:
+            if config:
+                thread_ids = [configurable["thread_id"]] if configurable["thread_id"] in self._sessions else []
+            else:
+                thread_ids = list(self._sessions)
+            for thread_id in thread_ids:
+                for checkpoint_ns, checkpoints in self._sessions[thread_id].namespaces.items():
+                    if config_ns is not None and checkpoint_ns != config_ns:
+                        continue
+                    for checkpoint_id in sorted(checkpoints, reverse=True):
+                        if config_id and checkpoint_id != config_id:
+                            continue
+                        if before_id and checkpoint_id >= before_id:
+                            continue
+                        saved = checkpoints[checkpoint_id]
+                        selected.append(
+                            (thread_id, checkpoint_ns, checkpoint_id, saved, list(saved.writes.items()))
+                        )
+
+        for thread_id, checkpoint_ns, checkpoint_id, saved, writes in selected:
+            if limit is not None and limit <= 0:
+                return
+            if filter:
+                metadata = self.serde.loads_typed(saved.metadata)
+                if not all(metadata.get(k) == v for k, v in filter.items()):
+                    continue
+            if limit is not None:
+                limit -= 1
+            yield self._tuple(thread_id, checkpoint_ns, checkpoint_id, saved, writes)
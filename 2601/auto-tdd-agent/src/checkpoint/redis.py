@@ -0,0 +1,495 @@
+"""
+Redis 체크포인터
+
+여러 노드의 워커가 같은 대화를 이어받을 수 있도록 체크포인트를 Redis(또는 RESP 호환
+서버)에 저장합니다. 스레드 하나가 해시 키 하나이고, 체크포인트와 중간 쓰기는 그 해시의
+필드입니다. 쓰기는 파이프라인으로 한 번에 보내고, 체크포인트 저장은 스레드의 턴 번호를
+WATCH로 확인하는 낙관적 동시성 제어로 다른 노드와의 동시 진행을 감지합니다.
+"""
+import struct
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from .base import LocalCheckpointSaver, StoredCheckpoint
+from .resp import RespClient, RespError
+from .serde import CompactSerializer
+
+# 해시 필드: 턴 번호, 체크포인트 (c\0ns\0id), 중간 쓰기 (w\0ns\0id\0task_id\0idx)
+_TURN = b"turn"
+_SEP = b"\x00"
+# 다른 필드(중간 쓰기)만 바뀌어 EXEC가 취소된 경우 다시 시도하는 횟수
+_MAX_RETRIES = 16
+# 턴 번호를 기억해 두는 최대 스레드 수
+_MAX_TRACKED = 10000
+# 전체 목록을 만들 때 SCAN 한 번에 요청하는 키 수
+_SCAN_COUNT = 512
+# SCAN MATCH 패턴에서 글자 그대로 맞추려면 이스케이프해야 하는 글자
+_GLOB_SPECIAL = frozenset("*?[]\\")
+
+
+class CheckpointConflict(RuntimeError):
+    """다른 워커가 같은 스레드에 먼저 체크포인트를 저장함 (이 턴의 결과는 저장되지 않음)"""
+
+
+def _pack(*parts: bytes) -> bytes:
+    return b"".join(struct.pack("<I", len(part)) + part for part in parts)
+
+
+def _unpack(data: bytes) -> List[bytes]:
+    parts, offset = [], 0
+    while offset < len(data):
+        (length,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+        parts.append(data[offset:offset + length])
+        offset += length
+    return parts
+
+
+def _glob_escape(text: str) -> str:
+    """SCAN MATCH 패턴의 특수 문자 이스케이프 (접두사를 글자 그대로 맞춤)"""
+    return "".join("\\" + char if char in _GLOB_SPECIAL else char for char in text)
+
+
+def _text(value: bytes) -> str:
+    return value.decode("utf-8")
+
+
+def _checkpoint_field(checkpoint_ns: str, checkpoint_id: str) -> bytes:
+    return b"c" + _SEP + checkpoint_ns.encode("utf-8") + _SEP + checkpoint_id.encode("utf-8")
+
+
+def _write_field(checkpoint_ns: str, checkpoint_id: str, task_id: str, idx: int) -> bytes:
+    return _SEP.join((
+        b"w", checkpoint_ns.encode("utf-8"), checkpoint_id.encode("utf-8"),
+        task_id.encode("utf-8"), str(idx).encode("ascii"),
+    ))
+
+
+def _records(fields: Dict[bytes, bytes]) -> Tuple[int, List[StoredCheckpoint]]:
+    """
+    스레드 해시 → (턴 번호, StoredCheckpoint 목록 - 네임스페이스, 체크포인트 ID 순)
+    """
+    turn = 0
+    checkpoints: Dict[Tuple[str, str], Tuple[Optional[str], Tuple[str, bytes], Tuple[str, bytes]]] = {}
+    writes: Dict[Tuple[str, str], list] = {}
+    for field, value in fields.items():
+        if field == _TURN:
+            turn = int(value)
+            continue
+        parts = field.split(_SEP)
+        if parts[0] == b"c":
+            parent_id, ctype, blob, mtype, mblob = _unpack(value)
+            checkpoints[(_text(parts[1]), _text(parts[2]))] = (
+                _text(parent_id) or None, (_text(ctype), blob), (_text(mtype), mblob),
+            )
+        elif parts[0] == b"w":
+            channel, vtype, vblob, task_path = _unpack(value)
+            writes.setdefault((_text(parts[1]), _text(parts[2])), []).append(
+                (_text(parts[3]), int(parts[4]), _text(channel), (_text(vtype), vblob), _text(task_path))
+            )
+    return turn, [
+        StoredCheckpoint(
+            checkpoint_ns, checkpoint_id, parent_id, checkpoint, metadata,
+            tuple(writes.get((checkpoint_ns, checkpoint_id), ())),
+        )
+        for (checkpoint_ns, checkpoint_id), (parent_id, checkpoint, metadata) in sorted(checkpoints.items())
+    ]
+
+
+def _as_dict(reply: Optional[List[bytes]]) -> Dict[bytes, bytes]:
+    """HGETALL 응답 [필드, 값, ...] → dict"""
+    reply = reply or []
+    return dict(zip(reply[::2], reply[1::2]))
+
+
+class RedisCheckpointer(LocalCheckpointSaver):
+    """
+    RESP 서버 기반 분산 체크포인터
+
+    키 구성: {prefix}thread:{thread_id} 해시 하나에 턴 번호와 체크포인트/중간 쓰기를 둡니다.
+    스레드 ID를 따로 모아 두지 않으므로 ttl로 만료된 스레드는 흔적 없이 사라지고, 전체 목록은
+    키 접두사를 SCAN해 만듭니다. 스레드를 읽으면 해시 전체를 한 번에 가져오므로, history로
+    스레드별 체크포인트 수를 제한해 해시를 작게 유지합니다.
+
+    체크포인트를 저장할 때마다 턴 번호가 1 늘어납니다. 이 인스턴스가 마지막으로 읽거나 쓴 뒤
+    다른 워커가 그 스레드를 저장했다면 put은 CheckpointConflict를 던집니다 (같은 대화의 턴이
+    두 노드에서 동시에 진행된 경우). 라우팅이 바뀌어 다른 노드가 대화를 이어받는 것은 항상
+    최신 상태를 먼저 읽으므로 충돌이 아닙니다.
+    """
+
+    def __init__(
+        self,
+        client: RespClient,
+        *,
+        prefix: str = "planning:",
+        history: Optional[int] = None,
+        ttl: Optional[int] = None,
+        serde: Optional[SerializerProtocol] = None,
+    ):
+        """
+        Args:
+            client: RESP 클라이언트
+            prefix: 키 접두사 (여러 앱이 한 서버를 쓸 때 구분)
+            history: 스레드의 네임스페이스별로 남길 체크포인트 수 (None인 경우 전부)
+            ttl: 마지막 저장 후 스레드를 지울 시간 (초, None인 경우 만료 없음)
+            serde: 체크포인트 직렬화기 (None인 경우 CompactSerializer)
+
+        Raises:
+            ValueError: history나 ttl이 1보다 작은 경우
+        """
+        if history is not None and history < 1:
+            raise ValueError("history는 1 이상이어야 합니다")
+        if ttl is not None and ttl < 1:
+            raise ValueError("ttl은 1 이상이어야 합니다")
+        super().__init__(serde=serde or CompactSerializer())
+        self.client = client
+        self.prefix = prefix
+        self.history = history
+        self.ttl = ttl
+        # 스레드별로 이 인스턴스가 마지막으로 본 턴 번호 (낙관적 동시성 확인용)
+        self._turns: "OrderedDict[str, int]" = OrderedDict()
+        self._turns_lock = threading.Lock()
+        self.conflicts = 0
+        self.retries = 0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> 'RedisCheckpointer':
+        """
+        redis:// URL로 생성
+
+        Args:
+            url: 서버 URL (RespClient.from_url 형식)
+            **kwargs: 그 외 생성자 인자 (prefix, history, ttl, serde)
+        """
+        return cls(RespClient.from_url(url), **kwargs)
+
+    def _key(self, thread_id: str) -> str:
+        return f"{self.prefix}thread:{thread_id}"
+
+    def _remember(self, thread_id: str, turn: Optional[int]):
+        with self._turns_lock:
+            if turn is None:
+                self._turns.pop(thread_id, None)
+                return
+            self._turns[thread_id] = turn
+            self._turns.move_to_end(thread_id)
+            while len(self._turns) > _MAX_TRACKED:
+                self._turns.popitem(last=False)
+
+    def _thread_ids(self) -> List[str]:
+        """저장된 스레드 ID (키 접두사 SCAN, 만료된 스레드는 서버가 이미 지워 나오지 않음)"""
+        key_prefix = self._key("")
+        start = len(key_prefix.encode("utf-8"))
+        pattern = _glob_escape(key_prefix) + "*"
+        thread_ids = set()
+        cursor = b"0"
+        while True:
+            cursor, keys = self.client.execute("SCAN", cursor, "MATCH", pattern, "COUNT", _SCAN_COUNT)
+            # SCAN은 같은 키를 두 번 돌려줄 수 있음
+            thread_ids.update(_text(key[start:]) for key in keys)
+            if int(cursor) == 0:
+                return sorted(thread_ids)
+
+    def _load(self, thread_id: str) -> List[StoredCheckpoint]:
+        """스레드 해시를 읽어 레코드로 (턴 번호를 기억)"""
+        turn, records = _records(_as_dict(self.client.execute("HGETALL", self._key(thread_id))))
+        self._remember(thread_id, turn if records else None)
+        return records
+
+    # 쓰기
+
+    def _pruned_fields(self, fields: Sequence[bytes], checkpoint_ns: str, new_id: str) -> List[bytes]:
+        """새 체크포인트를 더하면 history를 넘는 네임스페이스의 오래된 체크포인트와 그 쓰기 필드"""
+        if self.history is None:
+            return []
+        ns = checkpoint_ns.encode("utf-8")
+        split = [(field, field.split(_SEP)) for field in fields if field != _TURN]
+        ids = sorted({parts[2] for _, parts in split if parts[0] == b"c" and parts[1] == ns} | {new_id.encode("utf-8")})
+        stale = set(ids[:-self.history])
+        return [field for field, parts in split if parts[1] == ns and parts[2] in stale]
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        체크포인트 저장 (턴 번호 확인 후 MULTI/EXEC 한 번으로 기록)
+
+        Args:
+            config: 부모 체크포인트 설정
+            checkpoint: 저장할 체크포인트
+            metadata: 체크포인트 메타데이터
+            new_versions: 이번에 바뀐 채널 버전 (전체 스냅숏을 저장하므로 사용하지 않음)
+
+        Returns:
+            저장된 체크포인트 설정
+
+        Raises:
+            CheckpointConflict: 이 인스턴스가 본 뒤 다른 워커가 스레드를 저장한 경우
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        ctype, blob = self.serde.dumps_typed(checkpoint)
+        mtype, mblob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        value = _pack(
+            (configurable.get("checkpoint_id") or "").encode("utf-8"),
+            ctype.encode("utf-8"), blob, mtype.encode("utf-8"), mblob,
+        )
+        key = self._key(thread_id)
+        with self._turns_lock:
+            expected = self._turns.get(thread_id)
+
+        for _ in range(_MAX_RETRIES):
+            with self.client.connection() as conn:
+                watch = [("WATCH", key), ("HGET", key, _TURN)]
+                if self.history is not None:
+                    watch.append(("HKEYS", key))
+                replies = conn.call(*watch)
+                stored = int(replies[1] or 0)
+                if expected is not None and stored != expected:
+                    conn.call(("UNWATCH",))
+                    self.conflicts += 1
+                    self._remember(thread_id, None)
+                    raise CheckpointConflict(
+                        f"스레드 {thread_id}의 턴 번호가 {expected}에서 {stored}로 바뀌었습니다"
+                    )
+                pruned = self._pruned_fields(replies[2], checkpoint_ns, checkpoint["id"]) if self.history else []
+
+                transaction = [
+                    ("MULTI",),
+                    ("HSET", key, _checkpoint_field(checkpoint_ns, checkpoint["id"]), value, _TURN, stored + 1),
+                ]
+                if pruned:
+                    transaction.append(("HDEL", key, *pruned))
+                if self.ttl:
+                    transaction.append(("EXPIRE", key, self.ttl))
+                transaction.append(("EXEC",))
+                result = conn.call(*transaction)[-1]
+
+            if isinstance(result, RespError):
+                raise result
+            if result is None:
+                # 감시 중 키가 바뀜: 다른 필드(중간 쓰기)만 바뀌었으면 턴 번호가 같으므로 다시 시도
+                self.retries += 1
+                continue
+            for reply in result:
+                if isinstance(reply, RespError):
+                    raise reply
+            self._remember(thread_id, stored + 1)
+            return {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint["id"],
+                }
+            }
+        raise CheckpointConflict(f"스레드 {thread_id}를 저장하지 못했습니다 (동시 쓰기가 계속됨)")
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        중간 쓰기 저장 (파이프라인 한 번, 일반 채널은 처음 쓴 값 유지)
+
+        Args:
+            config: 대상 체크포인트 설정
+            writes: (채널, 값) 목록
+            task_id: 쓰기를 만든 태스크 ID
+            task_path: 태스크 경로
+        """
+        configurable = config["configurable"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = configurable["checkpoint_id"]
+        key = self._key(configurable["thread_id"])
+        commands = []
+        for index, (channel, value) in enumerate(writes):
+            idx = WRITES_IDX_MAP.get(channel, index)
+            vtype, vblob = self.serde.dumps_typed(value)
+            packed = _pack(channel.encode("utf-8"), vtype.encode("utf-8"), vblob, task_path.encode("utf-8"))
+            # 특수 채널(오류/인터럽트 등)은 덮어쓰고 일반 채널은 처음 값 유지
+            commands.append((
+                "HSET" if idx < 0 else "HSETNX", key,
+                _write_field(checkpoint_ns, checkpoint_id, task_id, idx), packed,
+            ))
+        if commands:
+            self.client.pipeline(*commands)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        스레드의 모든 체크포인트와 쓰기 삭제
+
+        Args:
+            thread_id: 스레드 ID
+        """
+        self.client.execute("DEL", self._key(thread_id))
+        self._remember(thread_id, None)
+
+    def export_thread(self, thread_id: str) -> List[StoredCheckpoint]:
+        """
+        스레드의 체크포인트를 직렬화된 그대로 꺼냄
+
+        Returns:
+            StoredCheckpoint 목록 (네임스페이스, 체크포인트 ID 순, 스레드가 없으면 빈 목록)
+        """
+        return self._load(thread_id)
+
+    def import_thread(self, thread_id: str, records: Sequence[StoredCheckpoint]) -> None:
+        """
+        직렬화된 체크포인트를 한 번의 파이프라인으로 저장 (턴 번호를 올려 다른 워커의 기대값 무효화)
+
+        Args:
+            thread_id: 스레드 ID
+            records: StoredCheckpoint 목록
+        """
+        if not records:
+            return
+        key = self._key(thread_id)
+        fields: List[bytes] = []
+        for record in records:
+            fields += [
+                _checkpoint_field(record.checkpoint_ns, record.checkpoint_id),
+                _pack(
+                    (record.parent_id or "").encode("utf-8"),
+                    record.checkpoint[0].encode("utf-8"), record.checkpoint[1],
+                    record.metadata[0].encode("utf-8"), record.metadata[1],
+                ),
+            ]
+            for task_id, idx, channel, (vtype, vblob), task_path in record.writes:
+                fields += [
+                    _write_field(record.checkpoint_ns, record.checkpoint_id, task_id, idx),
+                    _pack(channel.encode("utf-8"), vtype.encode("utf-8"), vblob, task_path.encode("utf-8")),
+                ]
+        commands = [
+            ("HSET", key, *fields),
+            ("HINCRBY", key, _TURN, 1),
+        ]
+        if self.ttl:
+            commands.append(("EXPIRE", key, self.ttl))
+        self.client.pipeline(*commands)
+        self._remember(thread_id, None)
+
+    # 읽기
+
+    def _tuple(self, thread_id: str, record: StoredCheckpoint) -> CheckpointTuple:
+        writes = sorted(record.writes, key=lambda w: writes_sort_key(w[4], w[0], w[1]))
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": record.checkpoint_ns,
+                    "checkpoint_id": record.checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed(record.checkpoint),
+            metadata=self.serde.loads_typed(record.metadata),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": record.checkpoint_ns,
+                        "checkpoint_id": record.parent_id,
+                    }
+                }
+                if record.parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed(typed))
+                for task_id, _, channel, typed, _ in writes
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        체크포인트 조회 (checkpoint_id가 없으면 최신, 스레드의 턴 번호를 기억)
+
+        Args:
+            config: 조회할 체크포인트 설정
+
+        Returns:
+            CheckpointTuple 또는 없으면 None
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_id = get_checkpoint_id(config)
+        records = [r for r in self._load(thread_id) if r.checkpoint_ns == checkpoint_ns]
+        if checkpoint_id:
+            records = [r for r in records if r.checkpoint_id == checkpoint_id]
+        return self._tuple(thread_id, records[-1]) if records else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        체크포인트 목록 (스레드별 최신 순)
+
+        Args:
+            config: 스레드/네임스페이스/체크포인트 조건 (None인 경우 전체)
+            filter: 메타데이터 조건 (모든 키가 같은 값이어야 함)
+            before: 이 체크포인트보다 앞선 것만
+            limit: 최대 개수
+
+        Yields:
+            CheckpointTuple
+        """
+        configurable = config["configurable"] if config else {}
+        config_ns = configurable.get("checkpoint_ns")
+        config_id = get_checkpoint_id(config) if config else None
+        before_id = get_checkpoint_id(before) if before else None
+
+        if config:
+            thread_ids = [configurable["thread_id"]]
+        else:
+            thread_ids = self._thread_ids()
+        replies = self.client.pipeline(*(("HGETALL", self._key(t)) for t in thread_ids)) if thread_ids else []
+
+        for thread_id, reply in zip(thread_ids, replies):
+            _, records = _records(_as_dict(reply))
+            for record in sorted(records, key=lambda r: (r.checkpoint_ns, r.checkpoint_id), reverse=True):
+                if config_ns is not None and record.checkpoint_ns != config_ns:
+                    continue
+                if config_id and record.checkpoint_id != config_id:
+                    continue
+                if before_id and record.checkpoint_id >= before_id:
+                    continue
+                if limit is not None and limit <= 0:
+                    return
+                if filter:
+                    metadata = self.serde.loads_typed(record.metadata)
+                    if not all(metadata.get(k) == v for k, v in filter.items()):
+                        continue
+                if limit is not None:
+                    limit -= 1
+                yield self._tuple(thread_id, record)
+
+    def close(self):
+        """연결 닫기"""
+        self.client.close()
@@ -0,0 +1,222 @@
+"""
+RESP(Redis 직렬화 프로토콜) 클라이언트
+
+Redis와 호환 서버(Valkey, KeyDB, Dragonfly 등)에 명령을 보내는 최소 동기 클라이언트입니다.
+여러 명령을 한 번에 보내고 응답을 한 번에 읽는 파이프라이닝과, WATCH/MULTI/EXEC처럼
+연결 상태가 필요한 흐름을 위한 연결 대여를 제공합니다. redis 패키지에 의존하지 않습니다.
+"""
+import socket
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional, Sequence, Union
+from urllib.parse import unquote, urlparse
+
+Command = Sequence[Union[str, bytes, int, float]]
+
+
+class RespError(Exception):
+    """서버가 돌려준 오류 응답 (-ERR ...)"""
+
+
+def _encode_command(command: Command) -> bytes:
+    parts = [b"*%d\r\n" % len(command)]
+    for arg in command:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode("utf-8")
+        else:
+            data = str(arg).encode("ascii")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+class RespConnection:
+    """
+    서버 연결 하나
+
+    call()은 명령들을 한 번에 보내고 같은 수의 응답을 읽습니다. 오류 응답은 예외로
+    던지지 않고 RespError 객체로 돌려주므로 트랜잭션 안의 개별 실패를 확인할 수 있습니다.
+    """
+
+    def __init__(self, host: str, port: int, timeout: Optional[float] = 5.0):
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+
+    def call(self, *commands: Command) -> List[Any]:
+        """
+        명령들을 파이프라인으로 실행
+
+        Args:
+            *commands: (명령, 인자...) 시퀀스들
+
+        Returns:
+            명령 순서대로 응답 (bytes, int, None, list 또는 RespError)
+
+        Raises:
+            ConnectionError: 연결이 끊긴 경우
+        """
+        self._sock.sendall(b"".join(_encode_command(command) for command in commands))
+        return [self._read() for _ in commands]
+
+    def _read(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("RESP 서버 연결이 끊겼습니다")
+        kind, body = line[:1], line[1:-2]
+        if kind == b"+":
+            return body
+        if kind == b"-":
+            return RespError(body.decode("utf-8", "replace"))
+        if kind == b":":
+            return int(body)
+        if kind == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            if len(data) != length + 2:
+                raise ConnectionError("RESP 서버 연결이 끊겼습니다")
+            return data[:-2]
+        if kind == b"*":
+            length = int(body)
+            if length < 0:
+                return None
+            return [self._read() for _ in range(length)]
+        raise ConnectionError(f"알 수 없는 RESP 응답입니다: {line[:32]!r}")
+
+    def close(self):
+        try:
+            self._reader.close()
+        finally:
+            self._sock.close()
+
+
+class RespClient:
+    """
+    연결 풀을 가진 RESP 클라이언트 (스레드 안전)
+
+    명령마다 쉬고 있는 연결을 빌려 쓰고 돌려놓습니다. 통신 중 오류가 난 연결은 버리므로
+    서버가 재시작되어도 다음 명령부터 새 연결로 이어집니다.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        *,
+        db: int = 0,
+        password: Optional[str] = None,
+        username: Optional[str] = None,
+        timeout: Optional[float] = 5.0,
+        max_idle: int = 8,
+    ):
+        """
+        Args:
+            host: 서버 주소
+            port: 서버 포트
+            db: 데이터베이스 번호 (SELECT)
+            password: 비밀번호 (AUTH)
+            username: ACL 사용자 이름 (password와 함께)
+            timeout: 소켓 타임아웃 (초)
+            max_idle: 풀에 남겨 둘 최대 연결 수
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._password = password
+        self._username = username
+        self._idle: List[RespConnection] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> 'RespClient':
+        """
+        redis://[[사용자]:비밀번호@]호스트[:포트][/db] 형식 URL로 생성
+
+        Args:
+            url: 서버 URL
+            **kwargs: 그 외 생성자 인자
+
+        Raises:
+            ValueError: redis:// 형식이 아닌 경우
+        """
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"지원하지 않는 URL입니다: {url}")
+        path = parsed.path.lstrip("/")
+        return cls(
+            parsed.hostname or "127.0.0.1",
+            parsed.port or 6379,
+            db=int(path) if path else 0,
+            password=unquote(parsed.password) if parsed.password else None,
+            username=unquote(parsed.username) if parsed.username else None,
+            **kwargs,
+        )
+
+    def _connect(self) -> RespConnection:
+        conn = RespConnection(self.host, self.port, self.timeout)
+        setup: List[Command] = []
+        if self._password is not None:
+            setup.append(("AUTH", self._username, self._password) if self._username else ("AUTH", self._password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        for reply in conn.call(*setup) if setup else ():
+            if isinstance(reply, RespError):
+                conn.close()
+                raise reply
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[RespConnection]:
+        """
+        연결 하나를 빌림 (WATCH/MULTI/EXEC처럼 같은 연결에서 이어야 하는 명령용)
+
+        블록이 예외로 끝나면 연결 상태를 알 수 없으므로 풀에 돌려놓지 않고 닫습니다.
+        """
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._connect()
+        try:
+            yield conn
+        except BaseException:
+            conn.close()
+            raise
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+
+    def pipeline(self, *commands: Command) -> List[Any]:
+        """
+        명령들을 한 번의 왕복으로 실행
+
+        Returns:
+            명령 순서대로 응답
+
+        Raises:
+            RespError: 오류 응답이 하나라도 있는 경우 (첫 번째 오류)
+        """
+        with self.connection() as conn:
+            replies = conn.call(*commands)
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    def execute(self, *command: Union[str, bytes, int, float]) -> Any:
+        """명령 하나 실행 (오류 응답은 RespError)"""
+        return self.pipeline(command)[0]
+
+    def close(self):
+        """쉬고 있는 연결 닫기"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
@@ -0,0 +1,417 @@
+"""
+체크포인트용 압축 바이너리 직렬화
+
+체크포인트는 대부분 dict/list/str과 {"role", "content"} 메시지, plan 슬롯 dict,
+"정수.난수" 형식의 채널 버전 문자열로 이루어집니다. CompactSerializer는 이런 값을
+태그 1바이트 + 가변 길이 정수로 적고, 메시지 역할은 열거값, plan 슬롯은 비트마스크와
+슬롯 순서, 반복되는 문자열은 앞선 위치 참조로 줄입니다. 결과가 기준 크기보다 크면
+zstd(zstandard 설치 시) 또는 zlib으로 압축합니다.
+
+지원하지 않는 값(LangGraph의 Send/Interrupt 객체 등)이 하나라도 있으면 그 값 전체를
+기본 직렬화기로 기록하며, 기존 형식(msgpack 등)으로 저장된 값도 그대로 읽습니다.
+"""
+import functools
+import re
+import struct
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성: 없으면 zlib 사용
+    zstandard = None
+
+# 직렬화 형식 이름 (dumps_typed의 타입)
+TYPE_COMPACT = "compact"
+TYPE_COMPACT_ZLIB = "compact+zlib"
+TYPE_COMPACT_ZSTD = "compact+zstd"
+
+# 이 크기(바이트) 이상이면 압축 시도
+DEFAULT_COMPRESS_THRESHOLD = 512
+
+# 형식 버전 (아래 표를 바꾸면 올리고, 이전 버전 표는 디코더에 남겨 둘 것)
+_FORMAT_VERSION = 1
+
+# 태그
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _REF, _KNOWN = range(8)
+_BYTES, _LIST, _TUPLE, _DICT, _MESSAGE, _PLAN, _VERSION = range(8, 15)
+
+# 메시지 역할 (열거값 = 인덱스)
+_ROLES = ("user", "assistant", "system", "tool")
+_ROLE_INDEX = {role: index for index, role in enumerate(_ROLES)}
+
+# plan 슬롯 (비트 i = i번째 슬롯)
+_PLAN_SLOTS = ("destination", "start_date", "duration", "budget", "companions", "purpose")
+_PLAN_INDEX = {slot: index for index, slot in enumerate(_PLAN_SLOTS)}
+
+# 자주 나오는 문자열 (체크포인트/상태 키, 채널 이름, 노드 이름, 메타데이터)
+_KNOWN_STRINGS = (
+    "v", "id", "ts", "channel_values", "channel_versions", "versions_seen", "updated_channels",
+    "messages", "current_plan", "turn_count", "reference_date", "slot_provenance",
+    "role", "content", "slot",
+    "__start__", "__input__", "__interrupt__", "__end__",
+    "branch:to:ask_user", "branch:to:process_input", "ask_user", "process_input",
+    "source", "step", "parents", "loop", "input", "update",
+    "confidence", "rule_id", "rule", "llm", "cache", "model",
+) + _PLAN_SLOTS
+_KNOWN_INDEX = {text: index for index, text in enumerate(_KNOWN_STRINGS)}
+
+# LocalCheckpointSaver.get_next_version 형식: 32자리 정수 + "." + 16자 폭 난수
+_VERSION_PATTERN = re.compile(r"(\d{32})\.(\d+\.\d+)\Z")
+
+_DOUBLE = struct.Struct("<d")
+
+
+class _Unsupported(Exception):
+    """압축 형식으로 적을 수 없는 값"""
+
+
+def _uint(value: int) -> bytes:
+    """부호 없는 가변 길이 정수 (7비트씩, 하위 먼저)"""
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+# 자주 쓰는 부호 있는 정수 (zigzag) 코드
+_SMALL_INTS = {n: bytes((_INT,)) + _uint(n * 2 if n >= 0 else -n * 2 - 1) for n in range(-64, 1024)}
+# 고정 표 문자열 → 코드 (인코더마다 복사해 앞선 위치 참조를 추가)
+_KNOWN_CODES = {text: bytes((_KNOWN,)) + _uint(index) for index, text in enumerate(_KNOWN_STRINGS)}
+# 코드를 캐시할 최대 문자열 길이 (채널 버전 문자열은 51자)
+_CACHED_TEXT_CHARS = 64
+# 앞선 위치 참조 코드
+_REF_CODES = [bytes((_REF,)) + _uint(index) for index in range(1024)]
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_code(value: str) -> bytes:
+    """처음 나온 문자열의 코드 (버전 형식이면 정수 + 실수, 아니면 UTF-8)
+
+    같은 스레드의 체크포인트는 이전 턴의 채널 버전을 대부분 그대로 담고 있으므로 캐시합니다.
+    """
+    match = _VERSION_PATTERN.match(value)
+    if match:
+        number, fraction = int(match.group(1)), float(match.group(2))
+        if f"{number:032}.{fraction:016}" == value:
+            return bytes((_VERSION,)) + _uint(number) + _DOUBLE.pack(fraction)
+    data = value.encode("utf-8")
+    return bytes((_STR,)) + _uint(len(data)) + data
+
+
+class _Encoder:
+    """값 하나를 압축 형식으로 인코딩 (문자열 참조 표는 값마다 새로 시작)"""
+
+    __slots__ = ("out", "codes", "nrefs")
+
+    def __init__(self):
+        self.out = bytearray((_FORMAT_VERSION,))
+        # 문자열 → 이미 정해진 코드 (고정 표 + 이 값에서 앞서 나온 문자열 참조)
+        self.codes: Dict[str, bytes] = dict(_KNOWN_CODES)
+        self.nrefs = 0
+
+    def new_text(self, value: str):
+        """처음 나온 문자열 (이후 같은 문자열은 참조로 적음)"""
+        index = self.nrefs
+        self.codes[value] = _REF_CODES[index] if index < len(_REF_CODES) else bytes((_REF,)) + _uint(index)
+        self.nrefs = index + 1
+        # 긴 문자열(메시지 내용 등)은 다시 나올 일이 적으므로 캐시에 넣지 않음
+        self.out += _text_code(value) if len(value) <= _CACHED_TEXT_CHARS else _text_code.__wrapped__(value)
+
+    def text(self, value: str):
+        code = self.codes.get(value)
+        if code is not None:
+            self.out += code
+        else:
+            self.new_text(value)
+
+    def items(self, mapping: Dict[Any, Any]):
+        out = self.out
+        codes = self.codes
+        value = self.value
+        size = len(mapping)
+        if size < 0x80:
+            out.append(size)
+        else:
+            out += _uint(size)
+        # 키와 값 대부분이 이미 코드가 정해진 문자열이므로 호출 없이 처리
+        for key, item in mapping.items():
+            code = codes.get(key) if type(key) is str else None
+            if code is not None:
+                out += code
+            else:
+                value(key)
+            code = codes.get(item) if type(item) is str else None
+            if code is not None:
+                out += code
+            else:
+                value(item)
+
+    def value(self, value: Any):
+        kind = type(value)
+        out = self.out
+        if kind is str:
+            code = self.codes.get(value)
+            if code is not None:
+                out += code
+            else:
+                self.new_text(value)
+        elif kind is dict:
+            self.mapping(value)
+        elif value is None:
+            out.append(_NONE)
+        elif kind is bool:
+            out.append(_TRUE if value else _FALSE)
+        elif kind is int:
+            code = _SMALL_INTS.get(value)
+            if code is None:
+                code = bytes((_INT,)) + _uint(value * 2 if value >= 0 else -value * 2 - 1)  # zigzag
+            out += code
+        elif kind is float:
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif kind is list or kind is tuple:
+            out.append(_LIST if kind is list else _TUPLE)
+            out += _uint(len(value))
+            for item in value:
+                self.value(item)
+        elif kind is bytes:
+            out.append(_BYTES)
+            out += _uint(len(value))
+            out += value
+        else:
+            raise _Unsupported(kind.__name__)
+
+    def mapping(self, value: Dict[Any, Any]):
+        out = self.out
+        role = value.get("role")
+        content = value.get("content")
+        if type(role) is str and type(content) is str and role in _ROLE_INDEX:
+            # 메시지: 역할 열거값 + 내용 + 나머지 키
+            out.append(_MESSAGE)
+            out.append(_ROLE_INDEX[role])
+            self.text(content)
+            self.items({k: v for k, v in value.items() if k != "role" and k != "content"})
+            return
+        if value and all(type(key) is str and key in _PLAN_INDEX for key in value):
+            # plan 슬롯 dict: 있는 슬롯의 비트마스크 + 슬롯 순서대로 값 (삽입 순서는 슬롯 순서로 바뀜)
+            mask = 0
+            for key in value:
+                mask |= 1 << _PLAN_INDEX[key]
+            out.append(_PLAN)
+            out += _uint(mask)
+            for slot in _PLAN_SLOTS:
+                if slot in value:
+                    self.value(value[slot])
+            return
+        out.append(_DICT)
+        self.items(value)
+
+
+class _Decoder:
+    """압축 형식 디코딩"""
+
+    __slots__ = ("data", "pos", "refs")
+
+    def __init__(self, data: bytes):
+        if not data or data[0] != _FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 압축 형식 버전: {data[:1]!r}")
+        self.data = data
+        self.pos = 1
+        self.refs: List[str] = []
+
+    def uint(self) -> int:
+        data, pos = self.data, self.pos
+        result = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self.pos = pos
+                return result
+            shift += 7
+
+    def raw(self, size: int) -> bytes:
+        start = self.pos
+        self.pos += size
+        return self.data[start:self.pos]
+
+    def items(self) -> Dict[Any, Any]:
+        return {self.value(): self.value() for _ in range(self.uint())}
+
+    def value(self) -> Any:
+        data, pos = self.data, self.pos
+        tag = data[pos]
+        if tag == _KNOWN or tag == _REF:
+            # 표 인덱스는 대부분 1바이트
+            index = data[pos + 1]
+            if index < 0x80:
+                self.pos = pos + 2
+            else:
+                self.pos = pos + 1
+                index = self.uint()
+            return _KNOWN_STRINGS[index] if tag == _KNOWN else self.refs[index]
+        self.pos = pos + 1
+        if tag == _STR:
+            text = self.raw(self.uint()).decode("utf-8")
+            self.refs.append(text)
+            return text
+        if tag == _VERSION:
+            number = self.uint()
+            text = f"{number:032}.{_DOUBLE.unpack(self.raw(8))[0]:016}"
+            self.refs.append(text)
+            return text
+        if tag == _NONE:
+            return None
+        if tag == _FALSE:
+            return False
+        if tag == _TRUE:
+            return True
+        if tag == _INT:
+            number = self.uint()
+            return -(number + 1) // 2 if number & 1 else number // 2
+        if tag == _FLOAT:
+            return _DOUBLE.unpack(self.raw(8))[0]
+        if tag == _DICT:
+            return self.items()
+        if tag == _LIST:
+            return [self.value() for _ in range(self.uint())]
+        if tag == _TUPLE:
+            return tuple(self.value() for _ in range(self.uint()))
+        if tag == _MESSAGE:
+            role = _ROLES[self.data[self.pos]]
+            self.pos += 1
+            message = {"role": role, "content": self.value()}
+            message.update(self.items())
+            return message
+        if tag == _PLAN:
+            mask = self.uint()
+            return {slot: self.value() for index, slot in enumerate(_PLAN_SLOTS) if mask >> index & 1}
+        if tag == _BYTES:
+            return self.raw(self.uint())
+        raise ValueError(f"알 수 없는 태그: {tag}")
+
+
+def encode(value: Any) -> bytes:
+    """
+    값을 압축 형식으로 인코딩 (압축 없음)
+
+    Args:
+        value: None/bool/int/float/str/bytes/list/tuple/dict로만 이루어진 값
+
+    Returns:
+        인코딩된 바이트
+
+    Raises:
+        TypeError: 지원하지 않는 타입의 값이 포함됨
+    """
+    encoder = _Encoder()
+    try:
+        encoder.value(value)
+    except _Unsupported as e:
+        raise TypeError(f"압축 형식으로 직렬화할 수 없는 타입: {e}") from None
+    return bytes(encoder.out)
+
+
+def decode(data: bytes) -> Any:
+    """
+    encode 결과를 디코딩
+
+    Args:
+        data: 인코딩된 바이트
+
+    Returns:
+        원래 값
+
+    Raises:
+        ValueError: 형식 버전이 다르거나 알 수 없는 태그
+    """
+    return _Decoder(data).value()
+
+
+class CompactSerializer(SerializerProtocol):
+    """
+    AgentState 체크포인트용 압축 직렬화기 (지원하지 않는 값은 기본 직렬화기로 대체)
+    """
+
+    def __init__(
+        self,
+        *,
+        compress_threshold: Optional[int] = DEFAULT_COMPRESS_THRESHOLD,
+        compression: Optional[str] = None,
+        fallback: Optional[SerializerProtocol] = None,
+    ):
+        """
+        Args:
+            compress_threshold: 이 크기(바이트) 이상이면 압축 시도 (None인 경우 압축 안 함)
+            compression: "zstd" 또는 "zlib" (None인 경우 zstandard가 설치되어 있으면 zstd)
+            fallback: 지원하지 않는 값과 기존 형식에 쓸 직렬화기 (None인 경우 LangGraph 기본값)
+
+        Raises:
+            ValueError: 알 수 없는 압축 방식이거나 zstandard 없이 zstd 지정
+        """
+        if compression is None:
+            compression = "zstd" if zstandard is not None else "zlib"
+        if compression not in ("zstd", "zlib"):
+            raise ValueError(f"알 수 없는 압축 방식: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd 압축에는 zstandard 패키지가 필요합니다")
+        self.compress_threshold = compress_threshold
+        self.compression = compression
+        self.fallback = fallback or JsonPlusSerializer()
+        self._compress: Callable[[bytes], bytes]
+        if compression == "zstd":
+            self._compress = zstandard.ZstdCompressor(level=3).compress
+            self._compressed_type = TYPE_COMPACT_ZSTD
+        else:
+            self._compress = lambda data: zlib.compress(data, 6)
+            self._compressed_type = TYPE_COMPACT_ZLIB
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        """
+        값 직렬화
+
+        Args:
+            obj: 직렬화할 값
+
+        Returns:
+            (형식 이름, 바이트)
+        """
+        encoder = _Encoder()
+        try:
+            encoder.value(obj)
+        except _Unsupported:
+            return self.fallback.dumps_typed(obj)
+        data = bytes(encoder.out)
+        if self.compress_threshold is not None and len(data) >= self.compress_threshold:
+            compressed = self._compress(data)
+            if len(compressed) < len(data):
+                return self._compressed_type, compressed
+        return TYPE_COMPACT, data
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        """
+        값 역직렬화 (기본 직렬화기 형식도 처리)
+
+        Args:
+            data: (형식 이름, 바이트)
+
+        Returns:
+            원래 값
+        """
+        kind, payload = data
+        if kind == TYPE_COMPACT:
+            return decode(payload)
+        if kind == TYPE_COMPACT_ZLIB:
+            return decode(zlib.decompress(payload))
+        if kind == TYPE_COMPACT_ZSTD:
+            if zstandard is None:
+                raise ValueError("zstd로 압축된 체크포인트를 읽으려면 zstandard 패키지가 필요합니다")
+            return decode(zstandard.ZstdDecompressor().decompress(payload))
+        return self.fallback.loads_typed(data)
@@ -0,0 +1,421 @@
+"""
+SQLite 체크포인터
+
+워커가 재시작되어도 진행 중인 plan이 남도록 LangGraph 체크포인트를 로컬 SQLite
+파일에 저장합니다. WAL 모드로 읽기와 쓰기가 서로 막지 않게 하고, 여러 세션이 동시에
+쓰면 한 번의 커밋으로 묶어(group commit) 턴당 쓰기 지연을 줄입니다.
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from .base import LocalCheckpointSaver, StoredCheckpoint
+from .serde import CompactSerializer
+
+# 테이블은 (thread_id, ...) 기본 키로 묶인 WITHOUT ROWID 테이블이므로, 기본 키가 곧
+# thread_id 색인입니다 (스레드의 행이 파일에서 연속으로 놓임). 같은 열의 색인을 따로
+# 두면 쓰기마다 색인을 하나 더 갱신하므로 두지 않습니다.
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        parent_checkpoint_id TEXT,
+        type TEXT,
+        checkpoint BLOB,
+        metadata_type TEXT,
+        metadata BLOB,
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS writes (
+        thread_id TEXT NOT NULL,
+        checkpoint_ns TEXT NOT NULL DEFAULT '',
+        checkpoint_id TEXT NOT NULL,
+        task_id TEXT NOT NULL,
+        idx INTEGER NOT NULL,
+        channel TEXT NOT NULL,
+        type TEXT,
+        value BLOB,
+        task_path TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+    ) WITHOUT ROWID
+    """,
+)
+
+# 문장은 상수 문자열이므로 sqlite3 모듈의 문장 캐시에서 준비된 문장을 재사용
+_INSERT_CHECKPOINT = (
+    "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, "
+    "parent_checkpoint_id, type, checkpoint, metadata_type, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_WRITE = (
+    "INSERT OR IGNORE INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, "
+    "channel, type, value, task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+# 특수 채널(오류/인터럽트 등) 쓰기는 같은 키의 이전 값을 덮어씀
+_REPLACE_WRITE = _INSERT_WRITE.replace("INSERT OR IGNORE", "INSERT OR REPLACE")
+_SELECT_COLUMNS = (
+    "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+    "type, checkpoint, metadata_type, metadata FROM checkpoints"
+)
+_SELECT_WRITES = (
+    "SELECT task_id, idx, channel, type, value, task_path FROM writes "
+    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?"
+)
+_SELECT_THREAD_WRITES = (
+    "SELECT checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value, task_path "
+    "FROM writes WHERE thread_id = ?"
+)
+
+
+class SqliteCheckpointer(LocalCheckpointSaver):
+    """
+    SQLite 파일 기반 LangGraph 체크포인터
+
+    연결 하나를 스레드들이 잠금으로 나눠 쓰며, put/put_writes는 자기 쓰기가 커밋된
+    뒤에 반환합니다. 커밋이 진행되는 동안 들어온 다른 세션의 쓰기는 다음 커밋 한 번에
+    함께 반영되므로(group commit), 동시 세션이 많을수록 쓰기당 커밋 비용이 줄어듭니다.
+    commit_delay를 주면 커밋을 맡은 스레드가 그만큼 기다렸다가 더 많은 쓰기를 묶습니다.
+
+    WAL + synchronous=NORMAL 설정에서는 커밋이 fsync 없이 WAL에 추가되므로 프로세스가
+    죽어도 커밋된 체크포인트는 남고, 전원 장애 시에만 마지막 커밋 일부를 잃을 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        serde: Optional[SerializerProtocol] = None,
+        commit_delay: float = 0.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Args:
+            path: 데이터베이스 파일 경로 (":memory:"이면 메모리 DB)
+            serde: 체크포인트 직렬화기 (None인 경우 CompactSerializer)
+            commit_delay: 커밋 전에 다른 세션의 쓰기를 기다리는 시간 (초)
+            busy_timeout_ms: 다른 프로세스가 쓰는 중일 때 기다리는 최대 시간
+        """
+        super().__init__(serde=serde or CompactSerializer())
+        self.path = str(path)
+        self.commit_delay = commit_delay
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level="DEFERRED", cached_statements=64
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+        self._lock = threading.Lock()  # 연결 사용
+        self._commit_lock = threading.Lock()  # 커밋을 맡는 스레드 하나
+        self._written = 0  # 실행한 쓰기 번호
+        self._committed = 0  # 커밋된 마지막 쓰기 번호
+        self.commit_count = 0  # 실행한 커밋 수 (벤치마크/테스트용)
+
+    # 쓰기
+
+    def _write(self, statements: Sequence[Tuple[str, Sequence[Any]]]):
+        """
+        문장들을 실행하고 그 쓰기가 커밋될 때까지 대기 (다른 세션의 쓰기와 함께 커밋)
+
+        여러 문장은 SAVEPOINT로 묶어, 중간에 실패하면 이 묶음만 되돌린 뒤 예외를 다시
+        던집니다. 일부만 실행된 쓰기가 다른 세션의 커밋에 섞여 들어가지 않습니다.
+        문장 하나는 SQLite가 문장 단위로 되돌리므로 SAVEPOINT 없이 실행합니다.
+        """
+        with self._lock:
+            if len(statements) == 1:
+                self._conn.execute(*statements[0])
+            else:
+                if not self._conn.in_transaction:
+                    # 트랜잭션 밖의 SAVEPOINT는 RELEASE 때 바로 커밋하므로 먼저 시작
+                    self._conn.execute("BEGIN")
+                self._conn.execute("SAVEPOINT batch")
+                try:
+                    for sql, params in statements:
+                        self._conn.execute(sql, params)
+                except BaseException:
+                    self._conn.execute("ROLLBACK TO batch")
+                    self._conn.execute("RELEASE batch")
+                    raise
+                self._conn.execute("RELEASE batch")
+            self._written += 1
+            sequence = self._written
+
+        with self._commit_lock:
+            if self._committed >= sequence:
+                return  # 앞선 커밋에 함께 반영됨
+            if self.commit_delay:
+                time.sleep(self.commit_delay)
+            with self._lock:
+                target = self._written
+                self._conn.commit()
+                self._committed = target
+                self.commit_count += 1
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """
+        체크포인트 저장
+
+        Args:
+            config: 부모 체크포인트 설정
+            checkpoint: 저장할 체크포인트 (채널 값 포함)
+            metadata: 체크포인트 메타데이터
+            new_versions: 이번에 바뀐 채널 버전 (전체 스냅숏을 저장하므로 사용하지 않음)
+
+        Returns:
+            저장된 체크포인트 설정
+        """
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+        self._write([(_INSERT_CHECKPOINT, (
+            thread_id, checkpoint_ns, checkpoint["id"], configurable.get("checkpoint_id"),
+            checkpoint_type, checkpoint_blob, metadata_type, metadata_blob,
+        ))])
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """
+        체크포인트에 대한 중간 쓰기 저장
+
+        Args:
+            config: 대상 체크포인트 설정
+            writes: (채널, 값) 목록
+            task_id: 쓰기를 만든 태스크 ID
+            task_path: 태스크 경로
+        """
+        configurable = config["configurable"]
+        key = (
+            configurable["thread_id"],
+            configurable.get("checkpoint_ns", ""),
+            configurable["checkpoint_id"],
+        )
+        sql = _REPLACE_WRITE if all(c in WRITES_IDX_MAP for c, _ in writes) else _INSERT_WRITE
+        statements = []
+        for index, (channel, value) in enumerate(writes):
+            value_type, value_blob = self.serde.dumps_typed(value)
+            statements.append((sql, key + (
+                task_id, WRITES_IDX_MAP.get(channel, index), channel, value_type, value_blob, task_path,
+            )))
+        if statements:
+            self._write(statements)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """
+        스레드의 모든 체크포인트와 쓰기 삭제
+
+        Args:
+            thread_id: 스레드 ID
+        """
+        self._write([
+            ("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,)),
+            ("DELETE FROM writes WHERE thread_id = ?", (thread_id,)),
+        ])
+
+    def import_thread(self, thread_id: str, records: Sequence[StoredCheckpoint]) -> None:
+        """
+        직렬화된 체크포인트를 한 번의 쓰기로 저장 (같은 키는 덮어씀)
+
+        Args:
+            thread_id: 스레드 ID
+            records: StoredCheckpoint 목록
+        """
+        statements = []
+        for record in records:
+            key = (thread_id, record.checkpoint_ns, record.checkpoint_id)
+            statements.append((_INSERT_CHECKPOINT, key + (
+                record.parent_id, *record.checkpoint, *record.metadata,
+            )))
+            for task_id, idx, channel, (value_type, value_blob), task_path in record.writes:
+                statements.append((_REPLACE_WRITE, key + (
+                    task_id, idx, channel, value_type, value_blob, task_path,
+                )))
+        if statements:
+            self._write(statements)
+
+    # 읽기
+
+    def _tuple(self, row: Sequence[Any]) -> CheckpointTuple:
+        """checkpoints 행 → CheckpointTuple (연결 잠금 안에서 호출)"""
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, ctype, blob, mtype, mblob = row
+        writes = self._conn.execute(_SELECT_WRITES, (thread_id, checkpoint_ns, checkpoint_id)).fetchall()
+        writes.sort(key=lambda w: writes_sort_key(w[5], w[0], w[1]))
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((ctype, blob)),
+            metadata=self.serde.loads_typed((mtype, mblob)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_id,
+                    }
+                }
+                if parent_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self.serde.loads_typed((vtype, value)))
+                for task_id, _, channel, vtype, value, _ in writes
+            ],
+        )
+
+    def export_thread(self, thread_id: str) -> List[StoredCheckpoint]:
+        """
+        스레드의 체크포인트를 직렬화된 그대로 꺼냄
+
+        Args:
+            thread_id: 스레드 ID
+
+        Returns:
+            StoredCheckpoint 목록 (체크포인트 ID 순, 스레드가 없으면 빈 목록)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                _SELECT_COLUMNS + " WHERE thread_id = ? ORDER BY checkpoint_ns, checkpoint_id",
+                (thread_id,),
+            ).fetchall()
+            write_rows = self._conn.execute(_SELECT_THREAD_WRITES, (thread_id,)).fetchall() if rows else []
+
+        writes: Dict[Tuple[str, str], list] = {}
+        for checkpoint_ns, checkpoint_id, task_id, idx, channel, vtype, value, task_path in write_rows:
+            writes.setdefault((checkpoint_ns, checkpoint_id), []).append(
+                (task_id, idx, channel, (vtype, value), task_path)
+            )
+        return [
+            StoredCheckpoint(
+                checkpoint_ns, checkpoint_id, parent_id, (ctype, blob), (mtype, mblob),
+                tuple(writes.get((checkpoint_ns, checkpoint_id), ())),
+            )
+            for _, checkpoint_ns, checkpoint_id, parent_id, ctype, blob, mtype, mblob in rows
+        ]
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        체크포인트 조회 (checkpoint_id가 없으면 스레드의 최신 체크포인트)
+
+        Args:
+            config: 조회할 체크포인트 설정
+
+        Returns:
+            CheckpointTuple 또는 없으면 None
+        """
+        configurable = config["configurable"]
+        params = [configurable["thread_id"], configurable.get("checkpoint_ns", "")]
+        sql = _SELECT_COLUMNS + " WHERE thread_id = ? AND checkpoint_ns = ?"
+        checkpoint_id = get_checkpoint_id(config)
+        if checkpoint_id:
+            sql += " AND checkpoint_id = ?"
+            params.append(checkpoint_id)
+        else:
+            sql += " ORDER BY checkpoint_id DESC LIMIT 1"
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+            return self._tuple(row) if row else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        체크포인트 목록 (최신 순)
+
+        Args:
+            config: 스레드/네임스페이스/체크포인트 조건 (None인 경우 전체)
+            filter: 메타데이터 조건 (모든 키가 같은 값이어야 함)
+            before: 이 체크포인트보다 앞선 것만
+            limit: 최대 개수
+
+        Yields:
+            CheckpointTuple
+        """
+        clauses, params = [], []
+        if config:
+            configurable = config["configurable"]
+            clauses.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            if configurable.get("checkpoint_ns") is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(configurable["checkpoint_ns"])
+            if get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(get_checkpoint_id(config))
+        if before and get_checkpoint_id(before):
+            clauses.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+        sql = _SELECT_COLUMNS
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY thread_id, checkpoint_ns, checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        for row in rows:
+            if limit is not None and limit <= 0:
+                return
+            with self._lock:
+                item = self._tuple(row)
+            if filter and not all(item.metadata.get(k) == v for k, v in filter.items()):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield item
+
+    def close(self):
+        """남은 쓰기를 커밋하고 연결 닫기"""
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
@@ -0,0 +1,237 @@
+"""
+계층형 세션 저장소
+
+대부분의 planning 세션은 ask_user 인터럽트에서 사용자 답을 기다리며 시간을 보냅니다.
+TieredCheckpointer는 최근에 쓰인 세션만 메모리(hot)에 두고, 일정 시간 쓰이지 않은
+세션은 SQLite 파일(cold)로 내려 보낸 뒤 다시 접근할 때 메모리로 올립니다.
+메모리에는 활성 세션만 남으므로 대기 중인 세션이 아주 많아도 상주 메모리가 작습니다.
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+)
+
+from .base import LocalCheckpointSaver, StoredCheckpoint
+from .memory import EvictingMemorySaver
+from .serde import CompactSerializer
+from .sqlite import SqliteCheckpointer
+
+
+class TieredCheckpointer(LocalCheckpointSaver):
+    """
+    메모리(hot) + SQLite(cold) 2단계 체크포인터
+
+    세션은 항상 한 계층에만 있습니다. idle_after초 동안 쓰이지 않았거나 hot 세션 수가
+    max_hot_sessions를 넘어 밀려난 세션은 직렬화된 그대로 cold로 옮겨지고,
+    그 스레드를 다시 읽거나 쓰면 cold에서 꺼내 hot으로 올립니다 (continue_conversation이
+    get_state를 먼저 부르므로 대화 재개 시 자동으로 올라옴).
+
+    close()는 hot 세션을 모두 cold로 내리므로, 같은 파일로 다시 만들면 대화를 이어갈 수
+    있습니다. 비정상 종료 시에는 hot에만 있던 세션을 잃습니다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        idle_after: float = 300.0,
+        max_hot_sessions: Optional[int] = None,
+        history: Optional[int] = None,
+        serde: Optional[SerializerProtocol] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            path: cold 계층 SQLite 파일 경로
+            idle_after: 이 시간(초) 동안 쓰이지 않은 세션을 cold로 내림
+            max_hot_sessions: 메모리에 둘 최대 세션 수 (None인 경우 제한 없음)
+            history: 스레드별로 남길 체크포인트 수 (None인 경우 전부)
+            serde: 체크포인트 직렬화기 (None인 경우 CompactSerializer, 두 계층이 공유)
+            clock: 현재 시각 함수 (테스트용)
+        """
+        super().__init__(serde=serde or CompactSerializer())
+        self.cold = SqliteCheckpointer(path, serde=self.serde)
+        self.hot = EvictingMemorySaver(
+            max_sessions=max_hot_sessions,
+            ttl=idle_after,
+            history=history,
+            serde=self.serde,
+            clock=clock,
+            on_evict=self._spill,
+        )
+        # cold → hot 이동 중 같은 스레드를 두 번 올리지 않도록
+        self._rehydrate_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self.hot_hits = 0
+        self.cold_hits = 0
+        self.misses = 0
+        self.spilled = 0
+
+    def with_allowlist(self, extra_allowlist) -> 'TieredCheckpointer':
+        """직렬화기 허용 목록 적용 (두 계층이 같은 직렬화기를 쓰도록 함께 교체)"""
+        super().with_allowlist(extra_allowlist)
+        self.hot.serde = self.cold.serde = self.serde
+        return self
+
+    # 계층 이동
+
+    def _spill(self, thread_id: str, records: List[StoredCheckpoint]):
+        """hot에서 밀려나는 세션을 cold에 기록 (hot 잠금 안에서 호출)"""
+        self.cold.import_thread(thread_id, records)
+        self.spilled += 1
+
+    def _ensure_hot(self, thread_id: str) -> Optional[str]:
+        """
+        스레드를 hot 계층으로 올림
+
+        Returns:
+            "hot" (이미 메모리), "cold" (디스크에서 올림), None (어디에도 없음)
+        """
+        # 확인과 함께 최근 사용으로 표시해 이어지는 읽기/쓰기 전에 내려가지 않게 함
+        if self.hot.touch(thread_id):
+            return "hot"
+        with self._rehydrate_lock:
+            if self.hot.touch(thread_id):
+                return "hot"
+            records = self.cold.export_thread(thread_id)
+            if not records:
+                return None
+            self.hot.import_thread(thread_id, records)
+            self.cold.delete_thread(thread_id)
+            return "cold"
+
+    def evict_idle(self) -> int:
+        """
+        유휴 세션을 cold로 내림 (주기적으로 불러 메모리를 줄일 때)
+
+        Returns:
+            내린 세션 수
+        """
+        return self.hot.evict_expired()
+
+    def tier_stats(self) -> Dict[str, Any]:
+        """
+        계층별 조회 적중 통계 (get_tuple 기준)
+
+        Returns:
+            {"hot_hits", "cold_hits", "misses", "hot_hit_rate", "spilled", "hot_sessions", "hot_bytes"}
+        """
+        usage = self.hot.memory_usage()
+        lookups = self.hot_hits + self.cold_hits + self.misses
+        return {
+            "hot_hits": self.hot_hits,
+            "cold_hits": self.cold_hits,
+            "misses": self.misses,
+            "hot_hit_rate": self.hot_hits / lookups if lookups else 0.0,
+            "spilled": self.spilled,
+            "hot_sessions": usage["sessions"],
+            "hot_bytes": usage["bytes"],
+        }
+
+    # 체크포인터 인터페이스
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """
+        체크포인트 조회 (cold에 있으면 hot으로 올린 뒤 조회)
+
+        Args:
+            config: 조회할 체크포인트 설정
+
+        Returns:
+            CheckpointTuple 또는 없으면 None
+        """
+        tier = self._ensure_hot(config["configurable"]["thread_id"])
+        with self._stats_lock:
+            if tier == "hot":
+                self.hot_hits += 1
+            elif tier == "cold":
+                self.cold_hits += 1
+            else:
+                self.misses += 1
+        return self.hot.get_tuple(config) if tier else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """
+        체크포인트 목록 (스레드를 지정하면 그 스레드를 hot으로 올림, 전체 조회는 hot → cold 순)
+
+        Args:
+            config: 스레드/네임스페이스/체크포인트 조건 (None인 경우 전체)
+            filter: 메타데이터 조건
+            before: 이 체크포인트보다 앞선 것만
+            limit: 최대 개수
+
+        Yields:
+            CheckpointTuple
+        """
+        if config:
+            self._ensure_hot(config["configurable"]["thread_id"])
+            yield from self.hot.list(config, filter=filter, before=before, limit=limit)
+            return
+        for tier in (self.hot, self.cold):
+            for item in tier.list(None, filter=filter, before=before, limit=limit):
+                if limit is not None:
+                    limit -= 1
+                yield item
+            if limit is not None and limit <= 0:
+                return
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트 저장 (cold에 있던 스레드는 먼저 hot으로 올림)"""
+        self._ensure_hot(config["configurable"]["thread_id"])
+        return self.hot.put(config, checkpoint, metadata, new_versions)
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """중간 쓰기 저장 (cold에 있던 스레드는 먼저 hot으로 올림)"""
+        self._ensure_hot(config["configurable"]["thread_id"])
+        self.hot.put_writes(config, writes, task_id, task_path)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """두 계층에서 스레드 삭제"""
+        with self._rehydrate_lock:
+            self.hot.delete_thread(thread_id)
+            self.cold.delete_thread(thread_id)
+
+    def export_thread(self, thread_id: str) -> List[StoredCheckpoint]:
+        """스레드가 있는 계층에서 직렬화된 체크포인트를 꺼냄"""
+        return self.hot.export_thread(thread_id) or self.cold.export_thread(thread_id)
+
+    def import_thread(self, thread_id: str, records: Sequence[StoredCheckpoint]) -> None:
+        """직렬화된 체크포인트를 cold 계층에 저장 (접근할 때 hot으로 올라옴)"""
+        if self.hot.touch(thread_id):
+            self.hot.import_thread(thread_id, records)
+        else:
+            self.cold.import_thread(thread_id, records)
+
+    def close(self):
+        """hot 세션을 모두 cold로 내리고 파일 닫기"""
+        with self._rehydrate_lock:
+            self.hot.evict_all()
+        self.cold.close()
@@ -3,8 +3,12 @@ Core 모듈: Agent의 기본 구성 요소
 """
 from .state import AgentState
 from .types import MessageDict, PlanDict, SlotType
-from .config import AgentConfig
+from .config import AgentConfig, ConfigRegistry, get_config_registry, load_config
 from .env_config import EnvConfig
+from .plan import PlanRecord
+from .file_watch import FileWatch
+from .session_locks import SessionLocks
+from .admission import AdmissionController, AdmissionRejected, get_admission_controller
 
 __all__ = [
     "AgentState",
@@ -12,5 +16,14 @@ __all__ = [
     "PlanDict",
     "SlotType",
     "AgentConfig",
+    "ConfigRegistry",
+    "get_config_registry",
+    "load_config",
     "EnvConfig",
+    "PlanRecord",
+    "FileWatch",
+    "SessionLocks",
+    "AdmissionController",
+    "AdmissionRejected",
+    "get_admission_controller",
 ]
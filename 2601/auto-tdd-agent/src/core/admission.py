@@ -0,0 +1,228 @@
+"""
+동시 턴 수 제한 (admission control)
+
+트래픽이 몰리면 새 대화마다 곧바로 LLM 호출이 시작되어 요청 한도를 넘고 모두 함께
+실패합니다. AdmissionController는 동시에 실행되는 턴 수를 제한하고, 넘치는 턴은 기한이
+있는 유한 대기열에 세웁니다. 이미 진행 중인 대화의 턴(resume)은 새 대화보다 먼저
+들어가며, 대기열이 가득 차거나 기한이 지나면 AdmissionRejected로 즉시 거절합니다.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional
+
+from .env_config import EnvConfig
+
+# 대기 시간 백분위 계산에 쓰는 최근 표본 수
+_WAIT_SAMPLES = 1024
+# 턴 실행 시간 이동 평균 가중치 (Retry-After 추정용)
+_SERVICE_EWMA = 0.2
+
+
+class AdmissionRejected(RuntimeError):
+    """
+    턴을 받아들이지 못함 (부하 차단)
+
+    Attributes:
+        reason: "queue_full" (대기열 가득 참), "timeout" (기한 초과), "shed" (우선 턴에 자리 양보)
+        retry_after: 다시 시도하기까지 권장 대기 시간 (초)
+    """
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason, retry_after)
+        self.reason = reason
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        return f"요청이 많아 처리할 수 없습니다 ({self.reason}, {self.retry_after:.1f}초 후 재시도)"
+
+
+class _Waiter:
+    """대기열의 턴 하나"""
+
+    __slots__ = ("condition", "outcome")
+
+    def __init__(self, lock: threading.Lock):
+        self.condition = threading.Condition(lock)
+        self.outcome: Optional[str] = None  # "admitted" 또는 "shed"
+
+
+class AdmissionController:
+    """
+    동시 턴 수 제한과 우선순위 대기열
+
+    admit() 블록은 최대 max_in_flight개까지 동시에 실행되고, 나머지는 대기열에서
+    resume(진행 중인 대화) → 새 대화 순, 같은 종류는 도착 순으로 차례를 기다립니다.
+    대기열이 가득 찼을 때 resume 턴이 오면 가장 늦게 온 새 대화 턴을 밀어내고 자리를 얻습니다.
+    제한은 프로세스 단위이므로 워커 프로세스가 N개면 전체 한도는 N × max_in_flight입니다.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        *,
+        max_queue: int = 0,
+        timeout: float = 30.0,
+    ):
+        """
+        Args:
+            max_in_flight: 동시에 실행할 최대 턴 수
+            max_queue: 대기열 최대 길이 (0이면 대기 없이 바로 거절)
+            timeout: 대기열 기본 기한 (초)
+
+        Raises:
+            ValueError: max_in_flight가 1보다 작거나 max_queue가 음수인 경우
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight는 1 이상이어야 합니다")
+        if max_queue < 0:
+            raise ValueError("max_queue는 0 이상이어야 합니다")
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._resume: Deque[_Waiter] = deque()
+        self._new: Deque[_Waiter] = deque()
+        self._in_flight = 0
+        self._service_time = 0.0  # 턴 실행 시간 이동 평균 (초)
+        # 지표
+        self.admitted = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "timeout": 0, "shed": 0}
+        self._waits: Deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._wait_total = 0.0
+        self._wait_count = 0
+        self._wait_max = 0.0
+
+    @contextmanager
+    def admit(self, *, resume: bool = False, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        차례가 올 때까지 기다린 뒤 블록 실행
+
+        Args:
+            resume: 진행 중인 대화의 턴인지 (True면 새 대화보다 먼저 들어감)
+            timeout: 대기 기한 (초, None인 경우 생성 시 timeout)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나, 기한이 지났거나, 우선 턴에 밀려난 경우
+        """
+        self._acquire(resume, self.timeout if timeout is None else timeout)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - started)
+
+    def _acquire(self, resume: bool, timeout: float):
+        with self._lock:
+            if self._in_flight < self.max_in_flight and not (self._resume or self._new):
+                self._in_flight += 1
+                self.admitted += 1
+                self._record_wait(0.0)
+                return
+
+            if len(self._resume) + len(self._new) >= self.max_queue:
+                if not (resume and self._new):
+                    self.rejected["queue_full"] += 1
+                    raise AdmissionRejected("queue_full", self._retry_after())
+                # 가장 늦게 온 새 대화 턴을 밀어내고 그 자리에 섬
+                shed = self._new.pop()
+                shed.outcome = "shed"
+                shed.condition.notify()
+
+            waiter = _Waiter(self._lock)
+            (self._resume if resume else self._new).append(waiter)
+            enqueued = time.monotonic()
+            deadline = enqueued + timeout
+            while waiter.outcome is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    (self._resume if resume else self._new).remove(waiter)
+                    self.rejected["timeout"] += 1
+                    raise AdmissionRejected("timeout", self._retry_after())
+                waiter.condition.wait(remaining)
+
+            if waiter.outcome == "shed":
+                self.rejected["shed"] += 1
+                raise AdmissionRejected("shed", self._retry_after())
+            self.admitted += 1
+            self._record_wait(time.monotonic() - enqueued)
+
+    def _release(self, elapsed: float):
+        with self._lock:
+            self._service_time += _SERVICE_EWMA * (elapsed - self._service_time)
+            # 빈 자리를 대기열 앞의 턴에 바로 넘김 (in_flight 수는 그대로)
+            queue = self._resume or self._new
+            if queue:
+                waiter = queue.popleft()
+                waiter.outcome = "admitted"
+                waiter.condition.notify()
+            else:
+                self._in_flight -= 1
+
+    def _record_wait(self, waited: float):
+        """대기 시간 기록 (잠금 안에서 호출)"""
+        self._waits.append(waited)
+        self._wait_total += waited
+        self._wait_count += 1
+        if waited > self._wait_max:
+            self._wait_max = waited
+
+    def _retry_after(self) -> float:
+        """대기열이 빠지는 데 걸릴 예상 시간 (잠금 안에서 호출, 최소 1초)"""
+        queued = len(self._resume) + len(self._new)
+        return max(1.0, self._service_time * (queued + 1) / self.max_in_flight)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        현재 부하와 누적 지표
+
+        Returns:
+            {"in_flight", "max_in_flight", "queued", "queued_resume", "queued_new", "max_queue",
+             "admitted", "rejected": {"queue_full", "timeout", "shed"},
+             "wait_avg", "wait_p50", "wait_p95", "wait_max" (초, 백분위는 최근 표본 기준),
+             "service_time_avg" (초)}
+        """
+        with self._lock:
+            waits = sorted(self._waits)
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queued": len(self._resume) + len(self._new),
+                "queued_resume": len(self._resume),
+                "queued_new": len(self._new),
+                "max_queue": self.max_queue,
+                "admitted": self.admitted,
+                "rejected": dict(self.rejected),
+                "wait_avg": self._wait_total / self._wait_count if self._wait_count else 0.0,
+                "wait_p50": waits[len(waits) // 2] if waits else 0.0,
+                "wait_p95": waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0,
+                "wait_max": self._wait_max,
+                "service_time_avg": self._service_time,
+            }
+
+
+_shared: Optional[AdmissionController] = None
+_shared_lock = threading.Lock()
+
+
+def get_admission_controller() -> Optional[AdmissionController]:
+    """
+    ADMISSION_* 환경 설정에 따른 프로세스 공유 AdmissionController 반환
+
+    요청마다 PlanningAgent를 새로 만들어도 한도가 프로세스 전체에 적용되도록 하나를 공유합니다.
+
+    Returns:
+        AdmissionController (ADMISSION_MAX_IN_FLIGHT가 0이면 None, 제한 없음)
+    """
+    global _shared
+    if EnvConfig.ADMISSION_MAX_IN_FLIGHT <= 0:
+        return None
+    with _shared_lock:
+        if _shared is None:
+            _shared = AdmissionController(
+                EnvConfig.ADMISSION_MAX_IN_FLIGHT,
+                max_queue=EnvConfig.ADMISSION_MAX_QUEUE,
+                timeout=EnvConfig.ADMISSION_QUEUE_TIMEOUT,
+            )
+        return _shared
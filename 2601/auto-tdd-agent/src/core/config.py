@@ -2,24 +2,132 @@
 Agent 설정 관리
 """
 from pathlib import Path
+import hashlib
 import json
+import threading
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, Mapping, Optional, Tuple
 
+from .env_config import EnvConfig
+from .file_watch import FileWatch
 
-@dataclass
+# 기본 스키마 파일 경로
+DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent.parent / "data" / "plan_schema.json"
+
+# 스키마 파일이 없을 때 사용하는 기본 스키마
+_DEFAULT_SCHEMA: Dict[str, Any] = {
+    "required_slots": ["destination", "start_date", "duration"],
+    "optional_slots": ["budget", "companions", "purpose"],
+    "slot_types": {
+        "destination": "string",
+        "start_date": "date",
+        "duration": "string",
+        "budget": "money",
+        "companions": "string",
+        "purpose": "string"
+    },
+    "max_turns": 15,
+}
+
+
+@dataclass(frozen=True)
 class AgentConfig:
-    """Agent 설정"""
-    required_slots: List[str] = field(default_factory=list)
-    optional_slots: List[str] = field(default_factory=list)
-    slot_types: Dict[str, str] = field(default_factory=dict)
+    """
+    Agent 설정 (불변)
+
+    여러 노드/서비스가 같은 인스턴스를 공유하므로 생성 후 변경할 수 없습니다.
+    슬롯 집합 등 파생 값은 생성 시 한 번만 계산되며,
+    config_hash는 캐시나 컴파일된 그래프의 키로 사용할 수 있습니다.
+    """
+    required_slots: Tuple[str, ...] = ()
+    optional_slots: Tuple[str, ...] = ()
+    slot_types: Mapping[str, str] = field(default_factory=dict)
     max_turns: int = 15
 
+    # 파생 값 (__post_init__에서 계산)
+    required_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    optional_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    all_slots: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    all_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    # 슬롯 비트마스크: all_slots 순서대로 i번째 슬롯이 i번째 비트
+    slot_index: Mapping[str, int] = field(init=False, repr=False, compare=False)
+    required_mask: int = field(init=False, repr=False, compare=False)
+    optional_mask: int = field(init=False, repr=False, compare=False)
+    full_mask: int = field(init=False, repr=False, compare=False)
+    config_hash: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        required = tuple(self.required_slots)
+        optional = tuple(slot for slot in self.optional_slots if slot not in required)
+        slot_types = dict(self.slot_types)
+
+        canonical = json.dumps(
+            {
+                "required_slots": required,
+                "optional_slots": optional,
+                "slot_types": slot_types,
+                "max_turns": self.max_turns,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+
+        setattr_ = object.__setattr__
+        setattr_(self, "required_slots", required)
+        setattr_(self, "optional_slots", optional)
+        setattr_(self, "slot_types", MappingProxyType(slot_types))
+        setattr_(self, "required_set", frozenset(required))
+        setattr_(self, "optional_set", frozenset(optional))
+        setattr_(self, "all_slots", required + optional)
+        setattr_(self, "all_set", frozenset(required + optional))
+        setattr_(
+            self, "slot_index",
+            MappingProxyType({slot: i for i, slot in enumerate(required + optional)}),
+        )
+        setattr_(self, "required_mask", (1 << len(required)) - 1)
+        setattr_(self, "full_mask", (1 << (len(required) + len(optional))) - 1)
+        setattr_(self, "optional_mask", self.full_mask & ~self.required_mask)
+        setattr_(
+            self, "config_hash",
+            hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16],
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.config_hash)
+
+    def __reduce__(self):
+        # MappingProxyType은 pickle되지 않으므로 생성자 인자로 직렬화
+        return (
+            self.__class__,
+            (self.required_slots, self.optional_slots, dict(self.slot_types), self.max_turns),
+        )
+
+    @classmethod
+    def from_dict(cls, schema: Dict[str, Any]) -> 'AgentConfig':
+        """
+        스키마 딕셔너리에서 설정 생성
+
+        Args:
+            schema: plan_schema.json 형식의 딕셔너리
+
+        Returns:
+            AgentConfig 인스턴스
+        """
+        return cls(
+            required_slots=schema.get('required_slots', []),
+            optional_slots=schema.get('optional_slots', []),
+            slot_types=schema.get('slot_types', {}),
+            max_turns=schema.get('max_turns', 15)
+        )
+
     @classmethod
     def from_schema_file(cls, schema_path: Path) -> 'AgentConfig':
         """
         plan_schema.json에서 설정 로드
 
+        매번 파일을 읽으므로 핫 패스에서는 load_config()를 사용하세요.
+
         Args:
             schema_path: 스키마 파일 경로
 
@@ -28,46 +136,130 @@ class AgentConfig:
         """
         if not schema_path.exists():
             # 기본 설정 반환
-            return cls(
-                required_slots=["destination", "start_date", "duration"],
-                optional_slots=["budget", "companions", "purpose"],
-                slot_types={
-                    "destination": "string",
-                    "start_date": "date",
-                    "duration": "string",
-                    "budget": "string",
-                    "companions": "string",
-                    "purpose": "string"
-                }
-            )
+            return cls.default()
 
         with open(schema_path, 'r', encoding='utf-8') as f:
             schema = json.load(f)
 
-        return cls(
-            required_slots=schema.get('required_slots', []),
-            optional_slots=schema.get('optional_slots', []),
-            slot_types=schema.get('slot_types', {}),
-            max_turns=schema.get('max_turns', 15)
-        )
+        return cls.from_dict(schema)
 
     @classmethod
     def default(cls) -> 'AgentConfig':
         """
         기본 설정 반환
 
+        불변 객체이므로 프로세스 내 공유 인스턴스를 반환합니다.
+
         Returns:
             기본 AgentConfig 인스턴스
         """
-        return cls(
-            required_slots=["destination", "start_date", "duration"],
-            optional_slots=["budget", "companions", "purpose"],
-            slot_types={
-                "destination": "string",
-                "start_date": "date",
-                "duration": "string",
-                "budget": "string",
-                "companions": "string",
-                "purpose": "string"
-            }
+        return _DEFAULT_CONFIG
+
+
+_DEFAULT_CONFIG = AgentConfig.from_dict(_DEFAULT_SCHEMA)
+
+
+class _Entry:
+    """레지스트리 내부 항목: 현재 설정과 파일 감시기"""
+
+    __slots__ = ("config", "watch")
+
+    def __init__(self, config: AgentConfig, watch: FileWatch):
+        self.config = config
+        self.watch = watch
+
+
+class ConfigRegistry:
+    """
+    스키마 파일별 AgentConfig 레지스트리
+
+    스키마 파일마다 한 번만 로드한 공유 인스턴스를 반환하고,
+    파일이 바뀌면 새 인스턴스로 교체합니다 (기존 인스턴스는 그대로 유효).
+    """
+
+    def __init__(self, check_interval: Optional[float] = None):
+        """
+        Args:
+            check_interval: 파일 변경 확인 주기 (초, None인 경우 환경 변수 값 사용)
+        """
+        self.check_interval = (
+            EnvConfig.RELOAD_CHECK_INTERVAL if check_interval is None else check_interval
         )
+        self._entries: Dict[Path, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, schema_path: Optional[Path] = None) -> AgentConfig:
+        """
+        설정 조회 (필요 시 로드/리로드)
+
+        Args:
+            schema_path: 스키마 파일 경로 (None인 경우 data/plan_schema.json)
+
+        Returns:
+            공유 AgentConfig 인스턴스
+        """
+        key = Path(schema_path or DEFAULT_SCHEMA_PATH)
+        entry = self._entries.get(key)
+        if entry is not None and not entry.watch.changed():
+            return entry.config
+
+        with self._lock:
+            # 다른 스레드가 먼저 리로드했을 수 있으므로 다시 확인
+            current = self._entries.get(key)
+            if current is not None and current is not entry:
+                return current.config
+
+            watch = FileWatch(key, self.check_interval)
+            watch.mark()
+            try:
+                config = AgentConfig.from_schema_file(key)
+            except (json.JSONDecodeError, OSError):
+                # 쓰는 도중의 파일 등 로드 실패 시 이전 설정 유지
+                if entry is None:
+                    raise
+                config = entry.config
+
+            # 내용이 같으면 기존 인스턴스를 유지해 키로 쓰는 캐시가 깨지지 않게 함
+            if entry is not None and entry.config == config:
+                config = entry.config
+            self._entries[key] = _Entry(config, watch)
+            return config
+
+    def invalidate(self, schema_path: Optional[Path] = None):
+        """
+        캐시 무효화 (다음 조회 시 다시 로드)
+
+        Args:
+            schema_path: 스키마 파일 경로 (None인 경우 전체)
+        """
+        with self._lock:
+            if schema_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(schema_path), None)
+
+
+_registry = ConfigRegistry()
+
+
+def get_config_registry() -> ConfigRegistry:
+    """
+    프로세스 공유 ConfigRegistry 반환
+
+    Returns:
+        ConfigRegistry 인스턴스
+    """
+    return _registry
+
+
+def load_config(schema_path: Optional[Path] = None) -> AgentConfig:
+    """
+    스키마 파일에서 공유 AgentConfig 로드
+
+    Args:
+        schema_path: 스키마 파일 경로 (None인 경우 data/plan_schema.json)
+
+    Returns:
+        공유 AgentConfig 인스턴스
+    """
+    return _registry.get(schema_path)
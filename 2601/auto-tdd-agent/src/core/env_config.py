@@ -26,10 +26,54 @@ class EnvConfig:
         "GLM_BASE_URL", "https://open.bigmodel.cn/api/paas/v4"
     )
 
+    # GLM 호출 한도: 분당 요청 수, 분당 토큰 수 (0: 제한 없음) - 같은 호스트의 프로세스가 함께 지킴
+    LLM_MAX_RPM: float = float(os.getenv("LLM_MAX_RPM", "0"))
+    LLM_MAX_TPM: float = float(os.getenv("LLM_MAX_TPM", "0"))
+    # 한도 버킷 SQLite 파일 (비어 있으면 임시 디렉터리에 계정별로), 대기 기한 (초),
+    # 질문 생성(낮은 우선순위)이 응답 파싱용으로 남겨 두는 버킷 비율
+    LLM_RATE_LIMIT_DB: str = os.getenv("LLM_RATE_LIMIT_DB", "")
+    LLM_RATE_LIMIT_TIMEOUT: float = float(os.getenv("LLM_RATE_LIMIT_TIMEOUT", "30"))
+    LLM_LOW_PRIORITY_RESERVE: float = float(os.getenv("LLM_LOW_PRIORITY_RESERVE", "0.2"))
+
     # Agent 설정
     MAX_TURNS: int = int(os.getenv("MAX_TURNS", "15"))
     TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.7"))
 
+    # 프롬프트/스키마 파일 변경 확인 주기 (초, 0: 매번 확인, 음수: 감시 안 함)
+    RELOAD_CHECK_INTERVAL: float = float(os.getenv("RELOAD_CHECK_INTERVAL", "2.0"))
+
+    # 규칙 기반 질문/메시지 로케일 (비어 있으면 extraction_rules.json의 default_locale)
+    AGENT_LOCALE: str = os.getenv("AGENT_LOCALE", "")
+
+    # 입력 크기 제한 (문자 수): 파서 입력 전체, LLM 프롬프트에 넣는 사용자 응답, 규칙 스캔 구간
+    MAX_INPUT_CHARS: int = int(os.getenv("MAX_INPUT_CHARS", "20000"))
+    MAX_PROMPT_INPUT_CHARS: int = int(os.getenv("MAX_PROMPT_INPUT_CHARS", "2000"))
+    EXTRACTION_WINDOW_CHARS: int = int(os.getenv("EXTRACTION_WINDOW_CHARS", "512"))
+
+    # LLM 파싱 결과 기록 파일 (JSON Lines, 비어 있으면 기록 안 함) - 슬롯 태거 학습 데이터
+    LLM_PARSE_LOG: str = os.getenv("LLM_PARSE_LOG", "")
+    # 학습된 슬롯 태거 경로 (비어 있으면 사용 안 함)와 LLM을 생략할 최소 신뢰도
+    SLOT_TAGGER_PATH: str = os.getenv("SLOT_TAGGER_PATH", "")
+    SLOT_TAGGER_MIN_CONFIDENCE: float = float(os.getenv("SLOT_TAGGER_MIN_CONFIDENCE", "0.9"))
+
+    # 대화 체크포인트 SQLite 파일 (비어 있으면 메모리에만 저장, 재시작 시 사라짐)
+    CHECKPOINT_DB: str = os.getenv("CHECKPOINT_DB", "")
+    # 메모리 저장 시 최대 세션 수, 세션 유휴 만료 시간 (초), 스레드별 보관 체크포인트 수
+    # (0: 제한 없음 - 기본값, 제한을 켜면 유휴 세션이 축출되어 이어갈 수 없게 됨)
+    CHECKPOINT_MAX_SESSIONS: int = int(os.getenv("CHECKPOINT_MAX_SESSIONS", "0"))
+    CHECKPOINT_SESSION_TTL: float = float(os.getenv("CHECKPOINT_SESSION_TTL", "0"))
+    CHECKPOINT_HISTORY: int = int(os.getenv("CHECKPOINT_HISTORY", "0"))
+    # CHECKPOINT_DB 사용 시 이 시간(초) 동안 유휴인 세션만 파일로 내리고 나머지는 메모리에 유지 (0: 모두 바로 기록)
+    CHECKPOINT_SPILL_AFTER: float = float(os.getenv("CHECKPOINT_SPILL_AFTER", "0"))
+    # 여러 노드가 세션을 공유할 Redis(RESP 호환) 서버 URL (설정 시 CHECKPOINT_DB보다 우선)과 키 접두사
+    CHECKPOINT_REDIS_URL: str = os.getenv("CHECKPOINT_REDIS_URL", "")
+    CHECKPOINT_REDIS_PREFIX: str = os.getenv("CHECKPOINT_REDIS_PREFIX", "planning:")
+
+    # 동시에 실행할 최대 턴 수 (0: 제한 없음), 대기열 최대 길이, 대기 기한 (초)
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "0"))
+    ADMISSION_MAX_QUEUE: int = int(os.getenv("ADMISSION_MAX_QUEUE", "64"))
+    ADMISSION_QUEUE_TIMEOUT: float = float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "30"))
+
     # 로깅 설정
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
@@ -0,0 +1,93 @@
+"""
+mtime 기반 파일 변경 감지
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+# (mtime_ns, size) 또는 파일이 없으면 None
+FileSignature = Optional[Tuple[int, int]]
+
+
+def stat_signature(path: Path) -> FileSignature:
+    """
+    파일의 변경 감지용 시그니처 반환
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        (mtime_ns, size) 또는 파일이 없으면 None
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class FileWatch:
+    """
+    파일 변경 감시기
+
+    check_interval 초마다 한 번만 stat을 호출하므로 핫 패스에서
+    매번 호출해도 비용이 거의 들지 않습니다.
+    check_interval이 0이면 매번 확인하고, 음수이면 변경을 감시하지 않습니다.
+    """
+
+    __slots__ = ("path", "check_interval", "_signature", "_next_check")
+
+    def __init__(self, path: Path, check_interval: float = 2.0):
+        """
+        Args:
+            path: 감시할 파일 경로
+            check_interval: 변경 확인 주기 (초)
+        """
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._signature: FileSignature = None
+        self._next_check = 0.0
+
+    @property
+    def signature(self) -> FileSignature:
+        """마지막으로 기록된 파일 시그니처"""
+        return self._signature
+
+    def mark(self, signature: FileSignature = None) -> FileSignature:
+        """
+        현재 파일 상태를 기준점으로 기록
+
+        파일을 읽기 *전에* 호출해야 읽는 도중의 변경을 놓치지 않습니다.
+
+        Args:
+            signature: 기록할 시그니처 (None인 경우 새로 stat)
+
+        Returns:
+            기록된 시그니처
+        """
+        if signature is None:
+            signature = stat_signature(self.path)
+        self._signature = signature
+        self._next_check = time.monotonic() + max(self.check_interval, 0.0)
+        return signature
+
+    def changed(self) -> bool:
+        """
+        마지막 기록 이후 파일이 변경되었는지 확인
+
+        확인 주기가 지나지 않았으면 stat 없이 False를 반환합니다.
+
+        Returns:
+            변경 여부
+        """
+        if self.check_interval < 0:
+            return False
+
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+
+        self._next_check = now + self.check_interval
+        return stat_signature(self.path) != self._signature
@@ -0,0 +1,193 @@
+"""
+비트마스크 기반 Plan 레코드
+"""
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from .config import AgentConfig
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    """
+    설정된 비트의 인덱스를 낮은 비트부터 순회
+
+    Args:
+        mask: 비트마스크
+
+    Yields:
+        비트 인덱스
+    """
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def next_slot_for_mask(config: AgentConfig, mask: int) -> Optional[str]:
+    """
+    채워진 슬롯 비트마스크 기준 다음에 수집할 슬롯
+
+    슬롯 비트는 필수 → 선택 순서이므로 가장 낮은 빈 비트가 다음 슬롯입니다.
+
+    Args:
+        config: Agent 설정
+        mask: 채워진 슬롯 비트마스크
+
+    Returns:
+        슬롯 이름 또는 모두 채워졌으면 None
+    """
+    missing = config.full_mask & ~mask
+    if not missing:
+        return None
+    return config.all_slots[(missing & -missing).bit_length() - 1]
+
+
+class PlanRecord(Mapping):
+    """
+    Plan 레코드
+
+    스키마 슬롯 값은 config.slot_index 순서의 고정 리스트에 저장하고,
+    채워진 슬롯은 비트마스크로 관리합니다. 완성도/누락/다음 슬롯 확인은
+    비트 연산으로 처리되며, mask 값은 그대로 캐시 키로 쓸 수 있습니다.
+
+    Mapping 인터페이스를 제공하므로 기존 dict plan 대신 읽기 전용으로
+    사용할 수 있습니다. 빈 값(None, "" 등)은 채워지지 않은 슬롯으로 취급합니다.
+    """
+
+    __slots__ = ("config", "_values", "_mask", "_extras")
+
+    def __init__(self, config: AgentConfig, plan: Optional[Mapping[str, Any]] = None):
+        """
+        Args:
+            config: Agent 설정 (슬롯 인덱스 제공)
+            plan: 초기 plan (선택적)
+        """
+        self.config = config
+        self._values: List[Any] = [None] * len(config.all_slots)
+        self._mask = 0
+        self._extras: Optional[Dict[str, Any]] = None  # 스키마 밖의 키
+
+        if plan:
+            for key, value in plan.items():
+                self.set(key, value)
+
+    @classmethod
+    def from_plan(cls, config: AgentConfig, plan: Optional[Mapping[str, Any]]) -> 'PlanRecord':
+        """
+        dict plan을 레코드로 변환 (이미 같은 설정의 레코드면 그대로 반환)
+
+        Args:
+            config: Agent 설정
+            plan: dict plan 또는 PlanRecord
+
+        Returns:
+            PlanRecord 인스턴스
+        """
+        if isinstance(plan, PlanRecord) and plan.config is config:
+            return plan
+        return cls(config, plan)
+
+    @property
+    def mask(self) -> int:
+        """채워진 슬롯 비트마스크"""
+        return self._mask
+
+    def set(self, slot: str, value: Any):
+        """
+        슬롯 값 설정 (빈 값이면 슬롯을 비움)
+
+        Args:
+            slot: 슬롯 이름
+            value: 슬롯 값
+        """
+        index = self.config.slot_index.get(slot)
+        if index is None:
+            if self._extras is None:
+                self._extras = {}
+            if value:
+                self._extras[slot] = value
+            else:
+                self._extras.pop(slot, None)
+            return
+
+        if value:
+            self._values[index] = value
+            self._mask |= 1 << index
+        else:
+            self._values[index] = None
+            self._mask &= ~(1 << index)
+
+    def is_complete(self) -> bool:
+        """필수 슬롯이 모두 채워졌는지 확인"""
+        required = self.config.required_mask
+        return self._mask & required == required
+
+    def is_full(self) -> bool:
+        """필수 + 선택 슬롯이 모두 채워졌는지 확인"""
+        full = self.config.full_mask
+        return self._mask & full == full
+
+    def missing_mask(self) -> int:
+        """채워지지 않은 스키마 슬롯 비트마스크"""
+        return self.config.full_mask & ~self._mask
+
+    def missing_required(self) -> List[str]:
+        """
+        누락된 필수 슬롯 목록
+
+        Returns:
+            스키마 순서의 누락 슬롯 목록
+        """
+        slots = self.config.all_slots
+        return [slots[i] for i in iter_bits(self.config.required_mask & ~self._mask)]
+
+    def next_slot(self) -> Optional[str]:
+        """
+        다음에 수집할 슬롯 (필수 슬롯 우선, 스키마 순서)
+
+        Returns:
+            슬롯 이름 또는 모두 채워졌으면 None
+        """
+        return next_slot_for_mask(self.config, self._mask)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        dict plan으로 변환 (상태 저장용)
+
+        Returns:
+            채워진 슬롯만 담은 dict
+        """
+        slots = self.config.all_slots
+        values = self._values
+        plan = {slots[i]: values[i] for i in iter_bits(self._mask)}
+        if self._extras:
+            plan.update(self._extras)
+        return plan
+
+    def __getitem__(self, key: str) -> Any:
+        index = self.config.slot_index.get(key)
+        if index is None:
+            if self._extras and key in self._extras:
+                return self._extras[key]
+            raise KeyError(key)
+        if not self._mask >> index & 1:
+            raise KeyError(key)
+        return self._values[index]
+
+    def __contains__(self, key: object) -> bool:
+        index = self.config.slot_index.get(key)
+        if index is None:
+            return bool(self._extras) and key in self._extras
+        return bool(self._mask >> index & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        slots = self.config.all_slots
+        for i in iter_bits(self._mask):
+            yield slots[i]
+        if self._extras:
+            yield from self._extras
+
+    def __len__(self) -> int:
+        return bin(self._mask).count("1") + (len(self._extras) if self._extras else 0)
+
+    def __repr__(self) -> str:
+        return f"PlanRecord({self.to_dict()!r}, mask={self._mask:#x})"
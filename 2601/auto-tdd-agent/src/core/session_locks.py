@@ -0,0 +1,83 @@
+"""
+세션별 실행 순서 보장
+
+같은 thread_id의 턴은 도착 순서대로 하나씩 실행하고, 다른 세션은 서로 기다리지 않게
+하는 잠금 표입니다. 세션마다 번호표 대기열을 두며, 그 세션을 쓰는 호출이 하나도 없으면
+항목을 지우므로 세션 수가 늘어도 표가 커지지 않습니다.
+"""
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class _Queue:
+    """세션 하나의 번호표 대기열"""
+
+    __slots__ = ("condition", "next_ticket", "serving", "users")
+
+    def __init__(self, lock: threading.Lock):
+        self.condition = threading.Condition(lock)
+        self.next_ticket = 0  # 다음에 발급할 번호
+        self.serving = 0  # 지금 실행 중인 번호
+        self.users = 0  # 실행 중 + 대기 중인 호출 수
+
+
+class SessionLocks:
+    """
+    키(thread_id)별 FIFO 잠금
+
+    hold(key) 블록은 같은 키에 대해 한 번에 하나만 실행되며, 먼저 hold를 부른 호출이
+    먼저 실행됩니다 (threading.Lock은 깨우는 순서를 보장하지 않으므로 번호표 사용).
+    같은 스레드에서 같은 키로 다시 hold하면 교착되므로 중첩해서 쓰지 않습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queues: Dict[str, _Queue] = {}
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        """
+        키의 차례가 올 때까지 기다린 뒤 블록 실행
+
+        Args:
+            key: 세션 키 (thread_id)
+        """
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = _Queue(self._lock)
+            ticket = queue.next_ticket
+            queue.next_ticket += 1
+            queue.users += 1
+            while queue.serving != ticket:
+                queue.condition.wait()
+        try:
+            yield
+        finally:
+            with self._lock:
+                queue.serving += 1
+                queue.users -= 1
+                if queue.users:
+                    queue.condition.notify_all()
+                else:
+                    del self._queues[key]
+
+    def pending(self, key: str) -> int:
+        """
+        키를 실행 중이거나 기다리는 호출 수
+
+        Args:
+            key: 세션 키
+
+        Returns:
+            호출 수 (0이면 사용 중이 아님)
+        """
+        with self._lock:
+            queue = self._queues.get(key)
+            return queue.users if queue else 0
+
+    def __len__(self) -> int:
+        """사용 중인 키 수"""
+        with self._lock:
+            return len(self._queues)
@@ -1,11 +1,18 @@
 """
 Agent 상태 정의
 """
-from typing import TypedDict, List
+from typing import Any, Dict, TypedDict, List
 from .types import MessageDict, PlanDict
 
 
-class AgentState(TypedDict):
+class _OptionalState(TypedDict, total=False):
+    """선택적 상태 키"""
+    reference_date: str  # 상대 날짜 해석 기준일 (YYYY-MM-DD, 없으면 오늘)
+    # 슬롯 → {"confidence", "source", "rule_id"} (plan 값이 어디서 왔는지)
+    slot_provenance: Dict[str, Dict[str, Any]]
+
+
+class AgentState(_OptionalState):
     """Agent 상태 정의"""
     messages: List[MessageDict]  # 대화 히스토리
     current_plan: PlanDict  # 현재 수집된 슬롯 정보
@@ -16,7 +16,7 @@ class SlotType(Enum):
 
 
 # 메시지 타입
-MessageDict = Dict[str, str]  # {"role": str, "content": str}
+MessageDict = Dict[str, str]  # {"role": str, "content": str, "slot": str (질문한 슬롯, 선택)}
 
 # Plan 타입
 PlanDict = Dict[str, Any]  # 슬롯 데이터
@@ -1,10 +1,15 @@
 """
 LangGraph 그래프 조립
 """
-from pathlib import Path
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import Optional, Sequence, Tuple
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph, END
+from langgraph.graph.state import CompiledStateGraph
 from .core.state import AgentState
-from .core.config import AgentConfig
+from .core.config import AgentConfig, load_config
 from .nodes.question_node import ask_user
 from .nodes.process_node import process_input
 from .nodes.router import should_continue
@@ -21,17 +26,14 @@ def create_graph(config: AgentConfig = None) -> StateGraph:
         StateGraph 인스턴스
     """
     if config is None:
-        # 스키마 파일에서 설정 로드 시도
-        schema_path = Path(__file__).parent.parent / 'data' / 'plan_schema.json'
-        if schema_path.exists():
-            config = AgentConfig.from_schema_file(schema_path)
-        else:
-            config = AgentConfig.default()
+        # 스키마 파일에서 설정 로드 (파일이 없으면 기본 설정, 레지스트리에 캐시됨)
+        config = load_config()
 
     workflow = StateGraph(AgentState)
 
     # 노드 추가
-    workflow.add_node('ask_user', ask_user)
+    # LangGraph가 'config' 인자에 RunnableConfig를 주입하므로 다른 이름으로 바인딩
+    workflow.add_node('ask_user', partial(ask_user, agent_config=config))
     workflow.add_node('process_input', process_input)
 
     # 엣지 추가
@@ -47,3 +49,63 @@ def create_graph(config: AgentConfig = None) -> StateGraph:
     )
 
     return workflow
+
+
+# 컴파일된 그래프 캐시: (config_hash, interrupt_before, interrupt_after) → 체크포인터 없이 컴파일한 그래프
+_COMPILED_CACHE_SIZE = 32
+_compiled_lock = threading.Lock()
+_compiled: "OrderedDict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], CompiledStateGraph]" = OrderedDict()
+
+
+def get_compiled_graph(
+    config: AgentConfig = None,
+    *,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+    interrupt_before: Sequence[str] = (),
+    interrupt_after: Sequence[str] = (),
+) -> CompiledStateGraph:
+    """
+    컴파일된 Agent 그래프 조회 (프로세스 단위 캐시)
+
+    그래프 조립과 compile은 설정과 인터럽트 지점별로 프로세스에서 한 번만 수행하고,
+    체크포인터는 캐시된 그래프를 얕게 복사해 연결합니다 (compile보다 수십 배 빠름).
+    캐시는 체크포인터를 붙잡지 않으므로, 에이전트를 버리면 그 세션 저장소도 함께 해제됩니다.
+
+    Args:
+        config: Agent 설정 (None인 경우 기본 설정 사용)
+        checkpointer: 대화 상태 저장소 (None인 경우 체크포인터 없이 실행)
+        interrupt_before: 실행 전에 멈출 노드 이름
+        interrupt_after: 실행 후에 멈출 노드 이름
+
+    Returns:
+        컴파일된 그래프 (같은 인자면 같은 구성, checkpointer가 다르면 별도 객체)
+    """
+    if config is None:
+        config = load_config()
+    key = (config.config_hash, tuple(interrupt_before), tuple(interrupt_after))
+
+    with _compiled_lock:
+        compiled = _compiled.get(key)
+        if compiled is not None:
+            _compiled.move_to_end(key)
+    if compiled is None:
+        # 잠금 밖에서 컴파일 (동시에 처음 요청되면 한쪽 결과만 남음)
+        compiled = create_graph(config).compile(
+            interrupt_before=list(interrupt_before) or None,
+            interrupt_after=list(interrupt_after) or None,
+        )
+        with _compiled_lock:
+            compiled = _compiled.setdefault(key, compiled)
+            _compiled.move_to_end(key)
+            while len(_compiled) > _COMPILED_CACHE_SIZE:
+                _compiled.popitem(last=False)
+
+    if checkpointer is None:
+        return compiled
+    return compiled.copy(update={"checkpointer": checkpointer})
+
+
+def clear_compiled_graphs() -> None:
+    """컴파일된 그래프 캐시 비우기 (설정 파일을 바꾼 뒤나 테스트에서 사용)"""
+    with _compiled_lock:
+        _compiled.clear()
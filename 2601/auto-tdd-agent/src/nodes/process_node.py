@@ -7,6 +7,7 @@ import os
 from ..core.state import AgentState
 from ..services.response_parser import ResponseParser
 from ..services.plan_manager import PlanManager
+from ..utils.validator import parse_date
 
 
 def process_input(state: AgentState) -> AgentState:
@@ -19,23 +20,35 @@ def process_input(state: AgentState) -> AgentState:
     Returns:
         업데이트된 상태
     """
-    # 마지막 사용자 메시지 추출
+    # 마지막 사용자 메시지와 그 직전 질문이 물어본 슬롯 추출
     user_message = None
-    for msg in reversed(state["messages"]):
-        if msg.get("role") == "user":
-            user_message = msg.get("content")
+    pending_slot = None
+    messages = state["messages"]
+    for index in range(len(messages) - 1, -1, -1):
+        if messages[index].get("role") == "user":
+            user_message = messages[index].get("content")
+            if index > 0 and messages[index - 1].get("role") == "assistant":
+                pending_slot = messages[index - 1].get("slot")
             break
 
     if user_message:
         # 응답 파싱 (환경 변수에 따라 LLM 사용 여부 결정)
         use_llm = os.environ.get("USE_LLM", "true").lower() == "true"
         parser = ResponseParser(use_llm=use_llm)
-        extracted_slots = parser.parse(user_message, state["current_plan"])
+        # 상대 날짜는 세션 기준일(없으면 오늘)에 대해 해석
+        extracted_slots = parser.parse_detailed(
+            user_message,
+            state["current_plan"],
+            reference_date=parse_date(state.get("reference_date")),
+            pending_slot=pending_slot,
+        )
 
-        # Plan 업데이트
+        # Plan 업데이트 (최근 발화의 값이 우선, 출처/신뢰도는 slot_provenance에 기록)
         plan_manager = PlanManager()
+        provenance = dict(state.get("slot_provenance") or {})
         state["current_plan"] = plan_manager.update(
-            state["current_plan"], extracted_slots
+            state["current_plan"], extracted_slots, provenance
         )
+        state["slot_provenance"] = provenance
 
     return state
@@ -4,26 +4,32 @@
 
 import os
 
+from ..core.config import AgentConfig
 from ..core.state import AgentState
 from ..services.question_generator import QuestionGenerator
 
 
-def ask_user(state: AgentState) -> AgentState:
+def ask_user(state: AgentState, agent_config: AgentConfig = None) -> AgentState:
     """
     사용자에게 질문하는 노드
 
     Args:
         state: 현재 상태
+        agent_config: Agent 설정 (질문할 슬롯 순서, None인 경우 기본 설정)
 
     Returns:
         업데이트된 상태
     """
     # 질문 생성 서비스 사용 (환경 변수에 따라 LLM 사용 여부 결정)
     use_llm = os.environ.get("USE_LLM", "true").lower() == "true"
-    generator = QuestionGenerator(use_llm=use_llm)
+    generator = QuestionGenerator(use_llm=use_llm, config=agent_config)
     question = generator.generate(state["current_plan"])
 
-    # 메시지 히스토리에 추가
-    state["messages"].append({"role": "assistant", "content": question})
+    # 메시지 히스토리에 추가 (다음 답변을 물어본 슬롯 우선으로 파싱하도록 슬롯 기록)
+    message = {"role": "assistant", "content": question}
+    slot = generator.next_slot(state["current_plan"])
+    if slot is not None:
+        message["slot"] = slot
+    state["messages"].append(message)
 
     return state
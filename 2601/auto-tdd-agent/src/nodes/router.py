@@ -5,7 +5,7 @@
 from langgraph.graph import END
 from ..core.state import AgentState
 from ..core.config import AgentConfig
-from ..services.plan_manager import PlanManager
+from ..core.plan import PlanRecord
 
 
 def should_continue(state: AgentState, config: AgentConfig = None) -> str:
@@ -26,20 +26,11 @@ def should_continue(state: AgentState, config: AgentConfig = None) -> str:
     if state.get("turn_count", 0) > config.max_turns:
         return END
 
-    # Plan 완성도 확인 (필수 슬롯 + 선택 슬롯 모두)
-    plan_manager = PlanManager(config)
-    current_plan = state.get("current_plan", {})
-
-    # 필수 슬롯 확인
-    required_complete = plan_manager.is_complete(current_plan)
-
-    # 선택 슬롯 확인
-    optional_complete = all(
-        slot in current_plan and current_plan[slot] for slot in config.optional_slots
-    )
+    # Plan 완성도 확인 (필수 슬롯 + 선택 슬롯 모두, 비트마스크 비교 한 번)
+    record = PlanRecord.from_plan(config, state.get("current_plan", {}))
 
     # 필수 + 선택 모두 완료되면 END
-    if required_complete and optional_complete:
+    if record.is_full():
         return END
 
     return "ask_user"
@@ -0,0 +1,16 @@
+"""
+다중 프로세스 서빙: thread_id 고정 라우팅 워커 풀과 HTTP 엔드포인트
+
+실행:
+    python -m src.serve --workers 4 --port 8000
+"""
+from .pool import WorkerError, WorkerPool
+from .app import create_app, dispatch, make_http_server
+
+__all__ = [
+    "WorkerError",
+    "WorkerPool",
+    "create_app",
+    "dispatch",
+    "make_http_server",
+]
@@ -0,0 +1,58 @@
+"""
+서빙 진입점
+
+워커를 먼저 fork한 뒤 HTTP 서버를 띄웁니다. uvicorn이 설치되어 있으면 ASGI 앱으로,
+없으면 표준 라이브러리 HTTP 서버로 실행합니다 (--server로 지정 가능).
+
+실행:
+    python -m src.serve --workers 4 --port 8000
+"""
+import argparse
+import importlib.util
+import os
+import signal
+import sys
+
+from .app import create_app, make_http_server
+from .pool import WorkerPool
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Planning Agent 다중 프로세스 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8000, help="포트")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    parser.add_argument("--threads", type=int, default=8, help="워커당 동시 요청 수")
+    parser.add_argument(
+        "--server", choices=("auto", "asgi", "http"), default="auto",
+        help="auto: uvicorn이 있으면 asgi, 없으면 http",
+    )
+    args = parser.parse_args(argv)
+
+    server = args.server
+    if server == "auto":
+        server = "asgi" if importlib.util.find_spec("uvicorn") else "http"
+
+    pool = WorkerPool(args.workers, threads_per_worker=args.threads).start()
+    print(f"워커 {len(pool)}개 시작 ({server}) - http://{args.host}:{args.port}")
+    try:
+        if server == "asgi":
+            import uvicorn
+
+            uvicorn.run(create_app(pool), host=args.host, port=args.port, lifespan="on")
+        else:
+            httpd = make_http_server(pool, args.host, args.port)
+            # SIGTERM도 Ctrl+C처럼 워커를 정리하고 종료
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            finally:
+                httpd.server_close()
+    finally:
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+HTTP 엔드포인트
+
+    GET    /health                       워커 상태
+    GET    /metrics                      워커별 동시 턴 제한 지표 (대기열 길이, 대기 시간)
+    POST   /threads/{thread_id}/run      {"message", "reference_date"?} → 상태
+    POST   /threads/{thread_id}/continue {"message"} → 상태 (대화가 없으면 404)
+    POST   /threads/{thread_id}/stream   {"message", "reference_date"?} → 노드별 갱신 (JSON Lines)
+    GET    /threads/{thread_id}/state    → 상태
+    DELETE /threads/{thread_id}          대화 삭제
+
+동시 턴 제한(ADMISSION_*)에 걸린 요청은 503과 Retry-After 헤더로 응답합니다.
+같은 라우팅을 ASGI 앱(create_app, uvicorn 등 ASGI 서버용)과 표준 라이브러리 HTTP 서버
+(make_http_server, 추가 의존성 없음) 두 가지로 제공합니다.
+"""
+import asyncio
+import itertools
+import json
+import math
+from concurrent.futures import Future, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import unquote
+
+from ..core.admission import AdmissionRejected
+from .pool import WorkerError, WorkerPool
+
+# 요청 본문 최대 크기 (바이트)
+MAX_BODY_BYTES = 1 << 20
+
+# (메서드, 동작) → (워커 작업, 메시지 필요 여부)
+_ROUTES = {
+    ("POST", "run"): ("run", True),
+    ("POST", "continue"): ("continue", True),
+    ("POST", "stream"): ("stream", True),
+    ("GET", "state"): ("state", False),
+    ("DELETE", None): ("reset", False),
+}
+
+_Result = Union[Future, Iterator[Dict[str, Any]], Any]
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def dispatch(pool: WorkerPool, method: str, path: str, body: bytes) -> Tuple[int, str, _Result]:
+    """
+    요청을 워커 작업으로 변환
+
+    Args:
+        pool: 시작된 워커 풀
+        method: HTTP 메서드
+        path: 요청 경로
+        body: 요청 본문
+
+    Returns:
+        (상태 코드, 작업 이름, 결과) - 결과는 단일 응답 작업이면 Future, stream이면
+        갱신 반복자, 그 외(오류, health, metrics)는 바로 보낼 JSON 값
+    """
+    parts = [part for part in path.split("/") if part]
+    if parts in (["health"], ["metrics"]):
+        if method != "GET":
+            return 405, "", {"error": "method not allowed"}
+        if parts == ["health"]:
+            return 200, "health", {"workers": pool.stats()}
+        return 200, "metrics", {"workers": pool.metrics()}
+    if len(parts) not in (2, 3) or parts[0] != "threads":
+        return 404, "", {"error": "not found"}
+
+    thread_id = unquote(parts[1])
+    action = parts[2] if len(parts) == 3 else None
+    route = _ROUTES.get((method, action))
+    if route is None:
+        known = any(key[1] == action for key in _ROUTES)
+        return (405, "", {"error": "method not allowed"}) if known else (404, "", {"error": "not found"})
+    op, needs_message = route
+
+    args: Dict[str, Any] = {}
+    if needs_message:
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return 400, op, {"error": "본문이 JSON이 아닙니다"}
+        message = payload.get("message") if isinstance(payload, dict) else None
+        if not isinstance(message, str) or not message:
+            return 400, op, {"error": "message가 필요합니다"}
+        args["message"] = message
+        if op != "continue" and payload.get("reference_date"):
+            args["reference_date"] = str(payload["reference_date"])
+
+    try:
+        if op == "stream":
+            return 200, op, pool.stream(thread_id, **args)
+        return 200, op, pool.submit(op, thread_id, **args)
+    except WorkerError as e:
+        return 503, op, {"error": str(e)}
+
+
+def outcome(op: str, future: Future) -> Tuple[int, Any]:
+    """
+    완료된 작업 Future를 (상태 코드, JSON 값)으로 변환
+
+    Args:
+        op: 워커 작업 이름
+        future: 완료된 Future
+
+    Returns:
+        (상태 코드, 응답 본문 값)
+    """
+    try:
+        result = future.result(0)
+    except Exception as e:
+        return _error(e)
+    if op == "continue" and result is None:
+        return 404, {"error": "대화가 없습니다"}
+    if op == "reset":
+        return 200, {"deleted": True}
+    return 200, result
+
+
+def _error(e: Exception) -> Tuple[int, Dict[str, Any]]:
+    """작업 예외 → (상태 코드, 본문) - 부하 차단과 워커 종료는 503"""
+    if isinstance(e, AdmissionRejected):
+        return 503, {"error": str(e), "reason": e.reason, "retry_after": e.retry_after}
+    if isinstance(e, WorkerError):
+        return 503, {"error": str(e)}
+    return 500, {"error": f"{type(e).__name__}: {e}"}
+
+
+def _retry_after(status: int, value: Any) -> Optional[str]:
+    """503 응답의 Retry-After 헤더 값 (정수 초)"""
+    if status == 503 and isinstance(value, dict) and "retry_after" in value:
+        return str(math.ceil(value["retry_after"]))
+    return None
+
+
+def _start_stream(updates: Iterator[Dict[str, Any]]) -> Tuple[int, Any, Optional[Iterator[bytes]]]:
+    """
+    첫 갱신을 받은 뒤 응답 시작 (부하 차단 등 턴 시작 전 오류는 상태 코드로 응답)
+
+    Returns:
+        (상태 코드, 오류 본문, JSON Lines 반복자) - 정상이면 반복자, 오류면 본문만
+    """
+    try:
+        first = next(updates)
+    except StopIteration:
+        return 200, None, iter(())
+    except Exception as e:
+        status, body = _error(e)
+        return status, body, None
+    return 200, None, _stream_lines(itertools.chain([first], updates))
+
+
+def _stream_lines(updates: Iterator[Dict[str, Any]]) -> Iterator[bytes]:
+    """노드별 갱신을 JSON Lines로 (중간에 실패하면 마지막 줄에 오류)"""
+    try:
+        for update in updates:
+            for node, value in update.items():
+                yield _encode({"node": node, "update": value}) + b"\n"
+    except Exception as e:
+        yield _encode({"error": f"{type(e).__name__}: {e}"}) + b"\n"
+
+
+def create_app(pool: WorkerPool):
+    """
+    ASGI 앱 생성
+
+    lifespan 시작 시 풀을 시작하고(이미 시작했으면 그대로) 종료 시 닫습니다.
+
+    Args:
+        pool: 워커 풀
+
+    Returns:
+        ASGI 앱 (async callable)
+    """
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    pool.start()
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await asyncio.get_running_loop().run_in_executor(None, pool.close)
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+            if len(body) > MAX_BODY_BYTES:
+                await _asgi_json(send, 413, {"error": "본문이 너무 큽니다"})
+                return
+
+        # /metrics는 워커 응답을 기다리고 작업 전송도 파이프가 차면 막히므로 이벤트 루프 밖에서 실행
+        loop = asyncio.get_running_loop()
+        status, op, result = await loop.run_in_executor(
+            None, dispatch, pool, scope["method"], scope["path"], body
+        )
+        if isinstance(result, Future):
+            try:
+                await asyncio.wrap_future(result)
+            except Exception:
+                pass  # outcome에서 상태 코드로 변환
+            status, result = outcome(op, result)
+        elif status == 200 and op == "stream":
+            status, error, lines = await loop.run_in_executor(None, _start_stream, result)
+            if lines is None:
+                await _asgi_json(send, status, error)
+                return
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/x-ndjson; charset=utf-8")],
+            })
+            while True:
+                line = await loop.run_in_executor(None, next, lines, None)
+                if line is None:
+                    break
+                await send({"type": "http.response.body", "body": line, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await _asgi_json(send, status, result)
+
+    return app
+
+
+async def _asgi_json(send, status: int, value: Any):
+    body = _encode(value)
+    headers: List[Tuple[bytes, bytes]] = [
+        (b"content-type", b"application/json; charset=utf-8"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    retry_after = _retry_after(status, value)
+    if retry_after:
+        headers.append((b"retry-after", retry_after.encode()))
+    await send({"type": "http.response.start", "status": status, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """표준 라이브러리 HTTP 서버 요청 처리기 (server.pool에 워커 풀)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 stderr에 쓰지 않음
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {"error": "본문이 너무 큽니다"})
+            return
+        body = self.rfile.read(length) if length else b""
+        path = self.path.split("?", 1)[0]
+
+        status, op, result = dispatch(self.server.pool, self.command, path, body)
+        if isinstance(result, Future):
+            wait([result])
+            status, result = outcome(op, result)
+        elif status == 200 and op == "stream":
+            status, error, lines = _start_stream(result)
+            if lines is None:
+                self._send_json(status, error)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for line in lines:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+            return
+        self._send_json(status, result)
+
+    def _send_json(self, status: int, value: Any):
+        body = _encode(value)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        retry_after = _retry_after(status, value)
+        if retry_after:
+            self.send_header("Retry-After", retry_after)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_http_server(pool: WorkerPool, host: str = "127.0.0.1", port: int = 8000) -> ThreadingHTTPServer:
+    """
+    표준 라이브러리 HTTP 서버 생성 (serve_forever()로 실행, 요청마다 스레드 하나)
+
+    Args:
+        pool: 시작된 워커 풀
+        host: 바인드 주소
+        port: 포트 (0이면 임의 포트)
+
+    Returns:
+        ThreadingHTTPServer
+    """
+    server = ThreadingHTTPServer((host, port), _Handler)
+    server.daemon_threads = True
+    server.pool = pool
+    return server
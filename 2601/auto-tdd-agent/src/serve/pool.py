@@ -0,0 +1,448 @@
+"""
+사전 fork 워커 풀
+
+워커 프로세스마다 PlanningAgent를 하나씩 두고, 요청은 thread_id 해시로 항상 같은 워커에
+보냅니다. 한 대화의 턴이 모두 같은 프로세스에서 실행되므로 세션 상태는 그 워커의 메모리
+체크포인터에만 있으면 되고, 공유 체크포인터 없이 코어 수만큼 확장됩니다.
+"""
+import itertools
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from ..agent import PlanningAgent, SessionNotFound
+from ..core.config import AgentConfig
+from ..graph import get_compiled_graph
+
+
+class WorkerError(RuntimeError):
+    """워커 프로세스가 종료되어 요청을 처리하지 못함"""
+
+
+# 워커 → 프론트 응답 종류
+_OK = "ok"
+_ERROR = "error"
+_ITEM = "item"
+_END = "end"
+
+# 부모 프로세스가 사라졌는지 확인하는 주기 (초)
+_PARENT_CHECK_INTERVAL = 1.0
+
+
+def _continue(agent: PlanningAgent, thread_id: str, args: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    # 저장된 대화가 없으면 None (HTTP 404)
+    try:
+        return agent.continue_conversation(args["message"], thread_id)
+    except SessionNotFound:
+        return None
+
+
+# 단일 응답 작업: op → (agent, thread_id, args) → 결과
+_OPS: Dict[str, Callable[[PlanningAgent, str, Dict[str, Any]], Any]] = {
+    "run": lambda agent, thread_id, args: agent.run(
+        args["message"], thread_id, args.get("reference_date")
+    ),
+    "continue": _continue,
+    "state": lambda agent, thread_id, args: agent.get_current_state(thread_id),
+    "reset": lambda agent, thread_id, args: agent.reset(thread_id),
+    "metrics": lambda agent, thread_id, args: agent.admission.metrics() if agent.admission else None,
+}
+
+
+def _worker_main(conn, config: Optional[AgentConfig], threads: int):
+    """
+    워커 프로세스 본체
+
+    요청을 스레드 풀에서 처리하므로 한 워커 안에서도 다른 thread_id의 턴은 동시에 실행되고,
+    같은 thread_id의 턴은 PlanningAgent의 세션 잠금으로 순서대로 실행됩니다.
+    metrics 요청은 스레드 풀을 거치지 않고 수신 루프에서 바로 응답합니다.
+    """
+    # Ctrl+C는 프론트 프로세스가 받아 워커를 정리
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    parent = os.getppid()
+    agent = PlanningAgent(config)
+    send_lock = threading.Lock()
+
+    def reply(request_id: int, kind: str, payload: Any):
+        with send_lock:
+            try:
+                conn.send((request_id, kind, payload))
+            except (OSError, EOFError):
+                raise
+            except Exception as e:
+                # 결과를 pickle할 수 없는 경우 오류로 대신 전달
+                conn.send((request_id, _ERROR, RuntimeError(f"{type(e).__name__}: {e}")))
+
+    def handle(request_id: int, op: str, thread_id: str, args: Dict[str, Any]):
+        try:
+            if op == "stream":
+                for update in agent.stream(args["message"], thread_id, args.get("reference_date")):
+                    reply(request_id, _ITEM, update)
+                reply(request_id, _END, None)
+            else:
+                reply(request_id, _OK, _OPS[op](agent, thread_id, args))
+        except (OSError, EOFError):
+            pass  # 프론트가 닫힘
+        except Exception as e:
+            try:
+                reply(request_id, _ERROR, e)
+            except (OSError, EOFError):
+                pass
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        while True:
+            try:
+                if not conn.poll(_PARENT_CHECK_INTERVAL):
+                    if os.getppid() != parent:
+                        break
+                    continue
+                message = conn.recv()
+            except (OSError, EOFError):
+                break
+            if message is None:
+                break
+            if message[1] == "metrics":
+                # 지표는 잠금 하나로 바로 읽으므로, 턴으로 꽉 찬 스레드 풀 뒤에서 기다리지 않음
+                handle(*message)
+            else:
+                executor.submit(handle, *message)
+    conn.close()
+
+
+class _Worker:
+    """프론트 프로세스가 보는 워커 하나 (프로세스, 연결, 응답 대기 중인 요청)"""
+
+    def __init__(self, index: int):
+        self.index = index
+        self.process = None
+        self.conn = None
+        self.send_lock = threading.Lock()
+        # request_id → Future (단일 응답) 또는 queue.Queue (스트림)
+        self.pending: Dict[int, Union[Future, queue.Queue]] = {}
+        self.handled = 0
+        self.restarts = 0
+
+
+class WorkerPool:
+    """
+    thread_id별 고정 라우팅 워커 풀
+
+    start()는 먼저 현재 프로세스에서 그래프를 컴파일해 두고 워커를 fork하므로, 워커는
+    컴파일된 그래프를 물려받아 바로 요청을 받습니다 (fork를 쓸 수 없는 플랫폼에서는 spawn으로
+    시작하고 워커가 직접 컴파일). 워커가 죽으면 처리 중이던 요청은 WorkerError로 실패하고
+    같은 자리에 새 워커를 띄웁니다. 그 워커에 있던 세션은 사라집니다 (CHECKPOINT_DB를
+    설정하면 워커마다 같은 파일을 쓰며 보존됨). 재시작은 응답 수신/HTTP 스레드가 도는 중에
+    일어나므로 fork하지 않고 forkserver(없으면 spawn)로 띄웁니다 - 여러 스레드가 있는
+    프로세스를 fork하면 다른 스레드가 잡고 있던 잠금을 물려받은 자식이 멈출 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        config: Optional[AgentConfig] = None,
+        threads_per_worker: int = 8,
+        start_method: Optional[str] = None,
+    ):
+        """
+        Args:
+            workers: 워커 프로세스 수 (None인 경우 CPU 코어 수)
+            config: Agent 설정 (None인 경우 기본 설정 사용)
+            threads_per_worker: 워커 하나가 동시에 처리하는 요청 수
+            start_method: multiprocessing 시작 방식 (None인 경우 가능하면 fork)
+
+        Raises:
+            ValueError: workers나 threads_per_worker가 1보다 작은 경우
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers < 1 or threads_per_worker < 1:
+            raise ValueError("workers와 threads_per_worker는 1 이상이어야 합니다")
+        if start_method is None:
+            start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+        self.config = config
+        self.threads_per_worker = threads_per_worker
+        self._context = multiprocessing.get_context(start_method)
+        # 재시작용 (스레드가 있는 프로세스에서 fork하지 않음)
+        restart_method = start_method
+        if restart_method == "fork":
+            methods = multiprocessing.get_all_start_methods()
+            restart_method = "forkserver" if "forkserver" in methods else "spawn"
+        self._restart_context = multiprocessing.get_context(restart_method)
+        self._workers = [_Worker(index) for index in range(workers)]
+        self._request_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._started = False
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def __enter__(self) -> 'WorkerPool':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # 수명 주기
+
+    def start(self) -> 'WorkerPool':
+        """그래프를 미리 컴파일한 뒤 워커 프로세스 시작 (이미 시작했으면 그대로 반환)"""
+        with self._lock:
+            if self._started:
+                return self
+            if self._closed:
+                raise RuntimeError("닫힌 워커 풀입니다")
+            # PlanningAgent와 같은 키로 컴파일해 두면 fork된 워커가 그대로 재사용
+            get_compiled_graph(self.config or AgentConfig.default(), interrupt_before=['ask_user'])
+            # 워커를 모두 fork한 뒤 응답 수신 스레드를 시작 (스레드가 있는 프로세스를 fork하지 않도록)
+            for worker in self._workers:
+                self._spawn(worker)
+            for worker in self._workers:
+                self._listen(worker)
+            self._started = True
+        return self
+
+    def close(self, timeout: float = 5.0):
+        """
+        워커를 종료하고 기다림 (응답을 기다리던 요청은 WorkerError로 실패)
+
+        Args:
+            timeout: 워커마다 정상 종료를 기다릴 시간 (초, 지나면 강제 종료)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        for worker in self._workers:
+            if worker.conn is None:
+                continue
+            try:
+                with worker.send_lock:
+                    worker.conn.send(None)
+            except (OSError, EOFError):
+                pass
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()
+            self._fail_pending(worker, "워커 풀이 닫혔습니다")
+
+    def _spawn(self, worker: _Worker, context=None):
+        """
+        워커 프로세스 시작 (풀 잠금 안에서 호출)
+
+        Args:
+            worker: 시작할 워커 자리
+            context: multiprocessing 컨텍스트 (None인 경우 start()의 시작 방식)
+        """
+        context = context or self._context
+        parent_conn, child_conn = context.Pipe()
+        process = context.Process(
+            target=_worker_main,
+            args=(child_conn, self.config, self.threads_per_worker),
+            name=f"planning-worker-{worker.index}",
+            daemon=True,
+        )
+        process.start()
+        # 자식 쪽 끝을 닫아야 워커가 죽었을 때 recv가 EOFError로 끝남
+        child_conn.close()
+        worker.process = process
+        worker.conn = parent_conn
+
+    def _listen(self, worker: _Worker):
+        thread = threading.Thread(
+            target=self._receive,
+            args=(worker, worker.conn),
+            name=f"planning-worker-{worker.index}-reader",
+            daemon=True,
+        )
+        thread.start()
+
+    def _receive(self, worker: _Worker, conn):
+        """워커 응답을 요청별 Future/큐로 전달하고, 워커가 죽으면 다시 띄움"""
+        while True:
+            try:
+                request_id, kind, payload = conn.recv()
+            except (OSError, EOFError):
+                break
+            with self._lock:
+                waiter = worker.pending.get(request_id)
+                if kind != _ITEM:
+                    worker.pending.pop(request_id, None)
+                    worker.handled += 1
+            if waiter is None:
+                continue
+            if isinstance(waiter, queue.Queue):
+                waiter.put((kind, payload))
+            elif kind == _ERROR:
+                waiter.set_exception(payload)
+            else:
+                waiter.set_result(payload)
+
+        with self._lock:
+            if self._closed or worker.conn is not conn:
+                return
+            self._fail_pending(worker, f"워커 {worker.index}가 종료되었습니다")
+            worker.process.join()
+            conn.close()
+            worker.restarts += 1
+            self._spawn(worker, self._restart_context)
+            self._listen(worker)
+
+    @staticmethod
+    def _fail_pending(worker: _Worker, reason: str):
+        pending, worker.pending = worker.pending, {}
+        for waiter in pending.values():
+            if isinstance(waiter, queue.Queue):
+                waiter.put((_ERROR, WorkerError(reason)))
+            elif not waiter.done():
+                waiter.set_exception(WorkerError(reason))
+
+    # 요청
+
+    def worker_for(self, thread_id: str) -> int:
+        """
+        thread_id를 맡는 워커 번호 (프로세스와 재시작에 관계없이 같은 값)
+
+        Args:
+            thread_id: 스레드 ID
+
+        Returns:
+            0 이상 len(pool) 미만의 워커 번호
+        """
+        return zlib.crc32(thread_id.encode("utf-8")) % len(self._workers)
+
+    def _send(
+        self,
+        worker: _Worker,
+        thread_id: str,
+        op: str,
+        args: Dict[str, Any],
+        waiter: Union[Future, queue.Queue],
+    ):
+        if not self._started:
+            raise RuntimeError("start()를 먼저 호출해야 합니다")
+        request_id = next(self._request_ids)
+        with self._lock:
+            if self._closed:
+                raise WorkerError("워커 풀이 닫혔습니다")
+            worker.pending[request_id] = waiter
+            conn = worker.conn
+        try:
+            with worker.send_lock:
+                conn.send((request_id, op, thread_id, args))
+        except (OSError, EOFError) as e:
+            with self._lock:
+                worker.pending.pop(request_id, None)
+            raise WorkerError(f"워커 {worker.index}에 보낼 수 없습니다: {e}") from e
+
+    def submit(self, op: str, thread_id: str, **args: Any) -> Future:
+        """
+        작업을 thread_id 담당 워커에 보냄
+
+        Args:
+            op: "run" (message, reference_date), "continue" (message), "state", "reset", "metrics"
+            thread_id: 스레드 ID
+            **args: 작업 인자
+
+        Returns:
+            결과 Future (continue는 대화가 없으면 None, 워커가 죽으면 WorkerError)
+
+        Raises:
+            ValueError: 알 수 없는 op
+        """
+        if op not in _OPS:
+            raise ValueError(f"알 수 없는 작업입니다: {op}")
+        future: Future = Future()
+        self._send(self._workers[self.worker_for(thread_id)], thread_id, op, args, future)
+        return future
+
+    def call(self, op: str, thread_id: str, timeout: Optional[float] = None, **args: Any) -> Any:
+        """submit 후 결과를 기다림 (워커에서 난 예외는 그대로 다시 발생)"""
+        return self.submit(op, thread_id, **args).result(timeout)
+
+    def stream(
+        self,
+        thread_id: str,
+        message: str,
+        reference_date: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        한 턴을 담당 워커에서 실행하며 노드별 상태 갱신을 차례로 반환 (PlanningAgent.stream)
+
+        Args:
+            thread_id: 스레드 ID
+            message: 사용자 메시지
+            reference_date: 새 대화일 때 상대 날짜 해석 기준일
+
+        Yields:
+            {노드 이름: 상태 갱신}
+        """
+        updates: queue.Queue = queue.Queue()
+        args = {"message": message, "reference_date": reference_date}
+        self._send(self._workers[self.worker_for(thread_id)], thread_id, "stream", args, updates)
+        while True:
+            kind, payload = updates.get()
+            if kind == _ITEM:
+                yield payload
+            elif kind == _END:
+                return
+            else:
+                raise payload
+
+    def metrics(self, timeout: Optional[float] = 5.0) -> List[Optional[Dict[str, Any]]]:
+        """
+        워커별 동시 턴 제한 지표 (AdmissionController.metrics)
+
+        Args:
+            timeout: 모든 워커의 응답을 기다릴 전체 시간 (초)
+
+        Returns:
+            워커 순서대로 지표 (제한이 꺼져 있거나 시간 안에 응답이 없는 워커는 None)
+        """
+        futures = []
+        for worker in self._workers:
+            future: Future = Future()
+            try:
+                self._send(worker, "", "metrics", {}, future)
+            except WorkerError:
+                future.set_result(None)
+            futures.append(future)
+        # 워커마다 timeout씩 기다리면 응답 없는 워커 수만큼 늘어나므로 한 번에 기다림
+        wait(futures, timeout)
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(0))
+            except Exception:
+                results.append(None)
+        return results
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        워커별 상태
+
+        Returns:
+            [{"index", "pid", "alive", "pending", "handled", "restarts"}, ...]
+        """
+        with self._lock:
+            return [
+                {
+                    "index": worker.index,
+                    "pid": worker.process.pid if worker.process else None,
+                    "alive": bool(worker.process and worker.process.is_alive()),
+                    "pending": len(worker.pending),
+                    "handled": worker.handled,
+                    "restarts": worker.restarts,
+                }
+                for worker in self._workers
+            ]
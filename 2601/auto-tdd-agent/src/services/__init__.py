@@ -4,9 +4,56 @@
 from .question_generator import QuestionGenerator
 from .response_parser import ResponseParser
 from .plan_manager import PlanManager
+from .rule_engine import RuleEngine, SlotRule, get_rule_engine
+from .extraction_result import ExtractionResult, SlotValue
+from .slot_tagger import SlotTagger, load_slot_tagger
+from .date_resolver import DateMatch, DateResolver, HolidayCalendar, load_date_resolver
+from .gazetteer import Gazetteer, build_index, load_gazetteer
+from .text_normalizer import Token, normalize_text, tokenize
+from .extraction_spec import (
+    ExtractionSpec,
+    ExtractionSpecRegistry,
+    get_extraction_spec_registry,
+    load_extraction_spec,
+)
 
 __all__ = [
     "QuestionGenerator",
     "ResponseParser",
     "PlanManager",
+    "RuleEngine",
+    "SlotRule",
+    "get_rule_engine",
+    "ExtractionResult",
+    "SlotValue",
+    "parse_batch",
+    "write_batch",
+    "SlotTagger",
+    "load_slot_tagger",
+    "DateMatch",
+    "DateResolver",
+    "HolidayCalendar",
+    "load_date_resolver",
+    "Gazetteer",
+    "build_index",
+    "load_gazetteer",
+    "Token",
+    "normalize_text",
+    "tokenize",
+    "ExtractionSpec",
+    "ExtractionSpecRegistry",
+    "get_extraction_spec_registry",
+    "load_extraction_spec",
 ]
+
+# python -m src.services.batch_parser 실행 시 모듈이 미리 import되어 있지 않도록 처음 사용할 때 import
+_LAZY = {"parse_batch": "batch_parser", "write_batch": "batch_parser"}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,184 @@
+"""
+대량 오프라인 파싱 (로그 재처리)
+
+규칙을 바꾼 뒤 과거 발화를 다시 파싱할 때 사용합니다. 입력을 청크 단위로 읽어
+프로세스 풀에 나눠 주고, 결과는 입력 순서대로 바로 내보냅니다. 각 워커는 시작할 때
+한 번만 규칙을 컴파일하며, 동시에 처리 중인 청크 수를 제한하므로 입력이 수천만 줄이어도
+메모리 사용량은 청크 크기 × 워커 수에 비례합니다.
+
+실행:
+    uv run python -m src.services.batch_parser utterances.txt parsed.jsonl --workers 4
+"""
+import argparse
+import datetime
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+from ..utils.validator import parse_date
+from .date_resolver import today
+from .extraction_spec import load_extraction_spec
+from .response_parser import ResponseParser
+
+# 기본 청크 크기 (워커와 주고받는 한 번의 작업 단위, 줄 수)
+DEFAULT_CHUNK_SIZE = 1000
+# 워커당 동시에 처리 중일 수 있는 청크 수 (워커가 쉬지 않을 만큼만 미리 보냄)
+_CHUNKS_PER_WORKER = 2
+
+# 워커 프로세스의 파서 (_init_worker에서 한 번 생성)
+_worker_parser: Optional[ResponseParser] = None
+
+
+def _make_parser(spec_path: Optional[Path]) -> ResponseParser:
+    """규칙 기반 파서 생성 (LLM 미사용)"""
+    return ResponseParser(use_llm=False, spec=load_extraction_spec(spec_path))
+
+
+def _init_worker(spec_path: Optional[Path]):
+    """워커 시작 시 규칙 컴파일"""
+    global _worker_parser
+    _worker_parser = _make_parser(spec_path)
+
+
+def _parse_chunk(
+    parser: ResponseParser, chunk: Sequence[str], reference_date: datetime.date
+) -> List[Dict[str, Any]]:
+    """청크의 발화를 순서대로 파싱"""
+    parse = parser.parse
+    return [parse(text, reference_date=reference_date) for text in chunk]
+
+
+def _parse_chunk_in_worker(chunk: Sequence[str], reference_date: datetime.date) -> List[Dict[str, Any]]:
+    return _parse_chunk(_worker_parser, chunk, reference_date)
+
+
+def _chunks(utterances: Iterable[str], chunk_size: int) -> Iterator[List[str]]:
+    """입력을 chunk_size 줄씩 나눔 (줄 끝 개행 제거)"""
+    iterator = iter(utterances)
+    while True:
+        chunk = [line.rstrip("\r\n") for line in itertools.islice(iterator, chunk_size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def parse_batch(
+    utterances: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    reference_date: Optional[datetime.date] = None,
+    spec_path: Optional[Path] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    발화를 규칙 기반으로 일괄 파싱
+
+    입력은 필요한 만큼만 읽으며, 결과는 입력 순서대로 하나씩 돌려줍니다.
+    결과를 끝까지 읽지 않고 멈추면 워커 프로세스를 정리합니다.
+
+    Args:
+        utterances: 발화 이터러블 (파일 객체처럼 줄 끝 개행이 있어도 됨)
+        workers: 워커 프로세스 수 (None인 경우 CPU 수, 1 이하이면 현재 프로세스에서 처리)
+        chunk_size: 워커에 한 번에 보내는 줄 수
+        reference_date: 상대 날짜 해석 기준일 (None인 경우 시작 시점의 오늘, 배치 전체에 고정)
+        spec_path: 추출 규칙 명세 경로 (None인 경우 data/extraction_rules.json)
+
+    Returns:
+        발화별 슬롯 딕셔너리 이터레이터
+
+    Raises:
+        ValueError: chunk_size가 1보다 작음
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size는 1 이상이어야 합니다: {chunk_size}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # 자정을 넘겨도 같은 배치 안의 "내일"은 같은 날짜로 해석
+    reference_date = reference_date or today()
+
+    if workers <= 1:
+        parser = _make_parser(spec_path)
+        for chunk in _chunks(utterances, chunk_size):
+            yield from _parse_chunk(parser, chunk, reference_date)
+        return
+
+    pool = multiprocessing.get_context().Pool(workers, _init_worker, (spec_path,))
+    try:
+        # Pool.imap은 입력 전체를 미리 읽으므로, 처리 중인 청크 수를 직접 제한
+        pending = deque()
+        max_pending = workers * _CHUNKS_PER_WORKER
+        for chunk in _chunks(utterances, chunk_size):
+            pending.append(pool.apply_async(_parse_chunk_in_worker, (chunk, reference_date)))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+        pool.close()
+        pool.join()
+    finally:
+        # 결과를 끝까지 읽지 않고 멈추거나 예외가 나면 남은 작업을 버리고 워커 종료
+        pool.terminate()
+
+
+def write_batch(
+    utterances: Iterable[str],
+    output: TextIO,
+    **options: Any,
+) -> int:
+    """
+    일괄 파싱 결과를 JSON Lines로 기록 (입력 한 줄 → 출력 한 줄)
+
+    Args:
+        utterances: 발화 이터러블
+        output: 출력 스트림
+        **options: parse_batch 옵션 (workers, chunk_size, reference_date, spec_path)
+
+    Returns:
+        기록한 줄 수
+    """
+    count = 0
+    for slots in parse_batch(utterances, **options):
+        output.write(json.dumps(slots, ensure_ascii=False))
+        output.write("\n")
+        count += 1
+    return count
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    일괄 파싱 CLI (입력/출력 경로가 "-"이면 표준 입출력)
+    """
+    parser = argparse.ArgumentParser(description="발화 파일을 규칙 기반으로 일괄 파싱")
+    parser.add_argument("input", help="한 줄에 발화 하나인 텍스트 파일")
+    parser.add_argument("output", nargs="?", default="-", help="JSON Lines 출력 파일")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--reference-date", help="상대 날짜 기준일 (YYYY-MM-DD)")
+    parser.add_argument("--rules", type=Path, default=None, help="추출 규칙 명세 경로")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        count = write_batch(
+            source,
+            target,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            reference_date=parse_date(args.reference_date),
+            spec_path=args.rules,
+        )
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f"{count}줄 파싱 완료", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,490 @@
+"""
+날짜 표현 해석기
+
+"2026-03-15", "3월 15일"뿐 아니라 "내일", "다음 주 금요일", "3일 후", "3월 중순",
+"설 연휴"처럼 상대적이거나 자연어로 된 날짜 표현을 기준일(세션 기준일 또는 오늘)에
+대해 결정적으로 해석합니다. 공휴일 표(data/holidays.json)는 한 번만 읽고,
+연도별 공휴일 날짜와 표현별 해석 결과는 캐시합니다.
+"""
+import datetime
+import hashlib
+import json
+import re
+import time
+from calendar import monthrange
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# 기본 공휴일 표 경로
+DEFAULT_CALENDAR_PATH = Path(__file__).parent.parent.parent / "data" / "holidays.json"
+
+_WEEKDAYS = {"월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6}
+_RELATIVE_DAYS = {"오늘": 0, "내일": 1, "모레": 2, "글피": 3}
+_RELATIVE_WEEKS = {"이번": 0, "다음": 1, "담": 1, "다다음": 2}
+_RELATIVE_MONTHS = {"이번": 0, "다음": 1, "담": 1, "다다음": 2}
+_RELATIVE_YEARS = {"올해": 0, "내년": 1, "내후년": 2}
+# 월 초/중순/말은 해당 구간의 첫날로 해석
+_MONTH_PARTS = {"초": 1, "초순": 1, "중순": 11, "하순": 21, "말": 21}
+
+# 표현 종류별 신뢰도 (모호할수록 낮음)
+_CONFIDENCE = {
+    "absolute": 1.0,
+    "relative_day": 0.95,
+    "month_day": 0.9,
+    "month_relative_day": 0.9,
+    "offset": 0.9,
+    "week_day": 0.9,
+    "holiday": 0.85,
+    "weekend": 0.8,
+    "weekday": 0.7,
+    "month_part": 0.6,
+    "day": 0.6,
+    "week": 0.5,
+    "month": 0.5,
+}
+
+
+# (오늘 날짜, 다음 자정의 epoch 초): date.today()는 현지 시각 변환이 있어 매 호출마다 하지 않음
+_today_cache: Tuple[Optional[datetime.date], float] = (None, 0.0)
+
+
+def today() -> datetime.date:
+    """
+    오늘 날짜 (자정까지 캐시)
+
+    Returns:
+        현지 기준 오늘 날짜
+    """
+    global _today_cache
+    date, expires = _today_cache
+    if date is None or time.time() >= expires:
+        date = datetime.date.today()
+        midnight = datetime.datetime.combine(date + datetime.timedelta(1), datetime.time.min)
+        _today_cache = (date, midnight.timestamp())
+    return date
+
+
+def _alternation(words) -> str:
+    """긴 단어부터 시도하는 정규식 대안 묶음"""
+    return "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+def _add_months(date: datetime.date, months: int) -> datetime.date:
+    """월 더하기 (없는 날은 그 달의 마지막 날로)"""
+    index = date.month - 1 + months
+    year, month = date.year + index // 12, index % 12 + 1
+    return datetime.date(year, month, min(date.day, monthrange(year, month)[1]))
+
+
+def _parse_month_day(value: str) -> Tuple[int, int]:
+    """"MM-DD" → (월, 일)"""
+    month, day = value.split("-")
+    return int(month), int(day)
+
+
+class DateMatch(NamedTuple):
+    """해석된 날짜 표현"""
+    value: datetime.date
+    start: int
+    end: int
+    confidence: float
+    kind: str  # 표현 종류 ("absolute", "relative_day", "holiday", ...)
+
+    def isoformat(self) -> str:
+        return self.value.isoformat()
+
+
+class HolidayCalendar:
+    """
+    공휴일 표
+
+    양력 고정 공휴일은 매년 같은 날짜로, 음력 공휴일(설날/추석 등)은 연도별 양력
+    날짜 표로 선언합니다. 연도별 공휴일 날짜는 처음 조회할 때 계산해 캐시합니다.
+    """
+
+    def __init__(self, holidays: Sequence[Mapping[str, Any]], source_hash: str = ""):
+        """
+        Args:
+            holidays: holidays.json의 holidays 항목 목록
+            source_hash: 원본 파일 해시 (명세 해시에 포함)
+        """
+        self.source_hash = source_hash
+        self._fixed: Dict[str, Tuple[int, int]] = {}
+        self._lunar: Dict[str, Dict[int, Tuple[int, int]]] = {}
+        self._blocks: Dict[str, Tuple[int, int]] = {}
+        self._aliases: Dict[str, str] = {}
+        self._block_aliases: Dict[str, str] = {}
+        self._years: Dict[int, Mapping[str, datetime.date]] = {}
+
+        for entry in holidays:
+            name = entry["name"]
+            if "date" in entry:
+                self._fixed[name] = _parse_month_day(entry["date"])
+            else:
+                self._lunar[name] = {
+                    int(year): _parse_month_day(md) for year, md in entry["lunar"].items()
+                }
+            before, after = entry.get("block", (0, 0))
+            self._blocks[name] = (int(before), int(after))
+            self._aliases[name] = name
+            for alias in entry.get("aliases", ()):
+                self._aliases[alias] = name
+            # "설"처럼 짧은 별칭은 "설 연휴"로 쓰일 때만 공휴일로 인식
+            for alias in entry.get("block_aliases", ()):
+                self._block_aliases[alias] = name
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'HolidayCalendar':
+        """
+        공휴일 표 파일 로드
+
+        Args:
+            path: holidays.json 경로
+
+        Returns:
+            HolidayCalendar 인스턴스
+        """
+        raw = Path(path).read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+        return cls(data.get("holidays", []), hashlib.sha256(raw).hexdigest()[:16])
+
+    @property
+    def names_pattern(self) -> str:
+        """공휴일 이름/별칭 정규식 (짧은 별칭은 뒤에 "연휴"가 올 때만)"""
+        parts = [_alternation(self._aliases)]
+        if self._block_aliases:
+            parts.append(f"(?:{_alternation(self._block_aliases)})(?=\\s*연휴)")
+        return "|".join(parts)
+
+    def canonical(self, name: str) -> Optional[str]:
+        """
+        별칭을 정식 공휴일 이름으로 변환
+
+        Args:
+            name: 공휴일 이름 또는 별칭
+
+        Returns:
+            정식 이름 또는 모르는 이름이면 None
+        """
+        return self._aliases.get(name) or self._block_aliases.get(name)
+
+    def holidays_in(self, year: int) -> Mapping[str, datetime.date]:
+        """
+        연도별 공휴일 날짜 (연도당 한 번 계산)
+
+        Args:
+            year: 연도
+
+        Returns:
+            정식 이름 → 날짜 (음력 표에 없는 연도의 음력 공휴일은 제외)
+        """
+        table = self._years.get(year)
+        if table is None:
+            table = {}
+            for name, (month, day) in self._fixed.items():
+                table[name] = datetime.date(year, month, day)
+            for name, by_year in self._lunar.items():
+                if year in by_year:
+                    table[name] = datetime.date(year, *by_year[year])
+            self._years[year] = table
+        return table
+
+    def next_occurrence(
+        self,
+        name: str,
+        reference: datetime.date,
+        year: Optional[int] = None,
+        block: bool = False,
+    ) -> Optional[datetime.date]:
+        """
+        기준일 이후 가장 가까운 공휴일 날짜
+
+        Args:
+            name: 공휴일 이름 또는 별칭
+            reference: 기준일
+            year: 연도 지정 ("내년 추석"), None인 경우 기준일 이후 첫 번째
+            block: True이면 연휴 시작일
+
+        Returns:
+            날짜 또는 알 수 없는 경우 None
+        """
+        canonical = self.canonical(name)
+        if canonical is None:
+            return None
+        before, after = self._blocks[canonical] if block else (0, 0)
+        years = (year,) if year is not None else (reference.year, reference.year + 1)
+        for y in years:
+            day = self.holidays_in(y).get(canonical)
+            # 연휴가 이미 끝난 경우 다음 해
+            if day is not None and (year is not None or day + datetime.timedelta(after) >= reference):
+                return day + datetime.timedelta(before)
+        return None
+
+
+def _strip_groups(pattern: str) -> str:
+    """이름 있는 그룹을 캡처하지 않는 그룹으로 (RuleEngine 규칙 패턴용)"""
+    return re.sub(r"\(\?P<\w+>", "(?:", pattern)
+
+
+class DateResolver:
+    """
+    자연어 날짜 표현 해석기
+
+    표현 종류별 정규식을 구체적인 것부터 순서대로 두고, 발화 검색용으로는 이를
+    캡처 그룹 없이 합친 pattern을 제공합니다. 찾은 표현의 해석 결과는
+    (표현, 기준일)별로 캐시되므로 같은 답변을 다시 계산하지 않습니다.
+
+    "15일"처럼 기간과 구별되지 않는 표현("day")은 pattern에 넣지 않고,
+    출발일을 물어본 직후의 답변 규칙에서 patterns["day"]로 따로 사용합니다.
+    """
+
+    def __init__(self, calendar: Optional[HolidayCalendar] = None):
+        """
+        Args:
+            calendar: 공휴일 표 (None인 경우 공휴일 표현은 해석하지 않음)
+        """
+        self.calendar = calendar or HolidayCalendar([])
+        weeks = _alternation(_RELATIVE_WEEKS)
+        months = _alternation(_RELATIVE_MONTHS)
+        years = _alternation(_RELATIVE_YEARS)
+        parts = _alternation(_MONTH_PARTS)
+        weekday = "[" + "".join(_WEEKDAYS) + "]"
+        unit = r"(?P<n>\d{1,3})\s*(?P<unit>일|주|개월|달)\s*(?:후|뒤)"
+
+        kinds = [
+            ("absolute", r"(?P<y>\d{4})\s*[-./년]\s*(?P<m>\d{1,2})\s*[-./월]\s*(?P<d>\d{1,2})일?"),
+            ("month_day", rf"(?:(?P<year>{years})\s*)?(?P<m>\d{{1,2}})월\s*(?P<d>\d{{1,2}})일"),
+            ("month_relative_day", rf"(?P<month>{months})\s*달\s*(?P<d>\d{{1,2}})일"),
+            ("offset", unit),
+            ("month_part", rf"(?:(?P<year>{years})\s*)?(?P<m>\d{{1,2}})월\s*(?P<part>{parts})?"),
+            ("week_day", rf"(?P<week>{weeks})\s*주\s*(?P<wd>{weekday})요일"),
+            ("weekend", rf"(?:(?P<week>{weeks})\s*)?주말"),
+            ("week", rf"(?P<week>{weeks})\s*주"),
+            ("month", rf"(?P<month>{months})\s*달\s*(?P<part>{parts})?"),
+            ("relative_day", _alternation(_RELATIVE_DAYS)),
+            ("weekday", rf"(?P<wd>{weekday})요일"),
+        ]
+        names = self.calendar.names_pattern
+        if names:
+            kinds.append((
+                "holiday",
+                rf"(?:(?P<year>{years})\s*)?(?P<name>{names})(?:\s*(?P<block>연휴))?",
+            ))
+        # 출발일 질문에 대한 답변에서만 날짜로 보는 종류
+        answer_kinds = [("day", r"(?P<d>\d{1,2})일")]
+
+        self._kinds: List[Tuple[str, "re.Pattern", Callable]] = [
+            (kind, re.compile(pattern), getattr(self, f"_resolve_{kind}"))
+            for kind, pattern in kinds + answer_kinds
+        ]
+        # 종류별 검색 패턴 (캡처 그룹 없음)
+        self.patterns: Mapping[str, str] = MappingProxyType({
+            kind: _strip_groups(pattern) for kind, pattern in kinds + answer_kinds
+        })
+        # 발화에서 표현을 찾는 패턴 (구체적인 종류부터, 답변 전용 종류 제외)
+        self.pattern = "|".join(self.patterns[kind] for kind, _ in kinds)
+        self._search = re.compile(self.pattern)
+        self._resolve_cached = lru_cache(maxsize=1024)(self._resolve_expression)
+        self._value_cached = lru_cache(maxsize=1024)(self._resolve_iso)
+
+    def resolve(
+        self, expression: str, reference: Optional[datetime.date] = None
+    ) -> Optional[DateMatch]:
+        """
+        날짜 표현 하나 해석
+
+        Args:
+            expression: 날짜 표현 전체 (예: "다음 주 금요일")
+            reference: 기준일 (None인 경우 오늘)
+
+        Returns:
+            DateMatch (구간은 expression 기준) 또는 해석할 수 없으면 None
+        """
+        return self._resolve_cached(expression.strip(), reference or today())
+
+    def resolve_value(self, expression: str, reference: Optional[datetime.date] = None) -> Optional[str]:
+        """
+        날짜 표현을 YYYY-MM-DD 문자열로 해석 (RuleEngine 규칙의 resolve 함수)
+
+        Args:
+            expression: 날짜 표현
+            reference: 기준일 (None인 경우 오늘)
+
+        Returns:
+            YYYY-MM-DD 문자열 또는 None
+        """
+        return self._value_cached(expression, reference or today())
+
+    def confidence(self, expression: str, reference: Optional[datetime.date] = None) -> Optional[float]:
+        """
+        날짜 표현의 종류별 신뢰도 (RuleEngine 규칙의 score 함수)
+
+        Args:
+            expression: 날짜 표현
+            reference: 기준일 (None인 경우 오늘)
+
+        Returns:
+            신뢰도 또는 해석할 수 없으면 None
+        """
+        match = self._resolve_cached(expression.strip(), reference or today())
+        return match.confidence if match else None
+
+    def find_all(self, text: str, reference: Optional[datetime.date] = None) -> List[DateMatch]:
+        """
+        발화의 모든 날짜 표현 해석
+
+        Args:
+            text: 입력 텍스트
+            reference: 기준일 (None인 경우 오늘)
+
+        Returns:
+            위치 순서의 DateMatch 목록 (해석할 수 없는 표현 제외)
+        """
+        reference = reference or today()
+        results = []
+        for match in self._search.finditer(text):
+            resolved = self._resolve_cached(match.group(), reference)
+            if resolved is not None:
+                results.append(resolved._replace(start=match.start(), end=match.end()))
+        return results
+
+    def find(self, text: str, reference: Optional[datetime.date] = None) -> Optional[DateMatch]:
+        """
+        발화에서 신뢰도가 가장 높은 날짜 (같으면 먼저 나온 것)
+
+        Args:
+            text: 입력 텍스트
+            reference: 기준일 (None인 경우 오늘)
+
+        Returns:
+            DateMatch 또는 None
+        """
+        best = None
+        for match in self.find_all(text, reference):
+            if best is None or match.confidence > best.confidence:
+                best = match
+        return best
+
+    def _resolve_iso(self, expression: str, reference: datetime.date) -> Optional[str]:
+        match = self._resolve_cached(expression.strip(), reference)
+        return match.value.isoformat() if match else None
+
+    def _resolve_expression(self, expression: str, reference: datetime.date) -> Optional[DateMatch]:
+        for kind, regex, resolve in self._kinds:
+            match = regex.fullmatch(expression)
+            if match is None:
+                continue
+            try:
+                value = resolve(match, reference)
+            except ValueError:
+                value = None  # 2월 30일처럼 없는 날짜
+            if value is None:
+                return None
+            return DateMatch(value, 0, len(expression), _CONFIDENCE[kind], kind)
+        return None
+
+    # 종류별 해석 함수 (match: 종류별 정규식의 전체 매치, reference: 기준일)
+
+    def _resolve_absolute(self, match, reference):
+        return datetime.date(int(match["y"]), int(match["m"]), int(match["d"]))
+
+    def _resolve_month_day(self, match, reference):
+        return self._in_year(match["year"], reference, int(match["m"]), int(match["d"]))
+
+    def _resolve_month_part(self, match, reference):
+        day = _MONTH_PARTS.get(match["part"], 1)
+        month = int(match["m"])
+        if match["year"] is None and month == reference.month:
+            # 이번 달이면 이미 지난 구간 시작일 대신 기준일
+            return max(datetime.date(reference.year, month, day), reference)
+        return self._in_year(match["year"], reference, month, day, by_month=True)
+
+    def _resolve_month_relative_day(self, match, reference):
+        # "다음 달 3일": 그 달의 그 날 (이번 달의 이미 지난 날은 출발일이 될 수 없으므로 None)
+        first = _add_months(reference.replace(day=1), _RELATIVE_MONTHS[match["month"]])
+        date = first.replace(day=int(match["d"]))
+        return date if date >= reference else None
+
+    def _resolve_offset(self, match, reference):
+        n, unit = int(match["n"]), match["unit"]
+        if unit == "일":
+            return reference + datetime.timedelta(days=n)
+        if unit == "주":
+            return reference + datetime.timedelta(weeks=n)
+        return _add_months(reference, n)
+
+    def _resolve_week_day(self, match, reference):
+        return self._monday(match["week"], reference) + datetime.timedelta(_WEEKDAYS[match["wd"]])
+
+    def _resolve_weekend(self, match, reference):
+        if match["week"] is None:
+            return reference + datetime.timedelta((5 - reference.weekday()) % 7)
+        return self._monday(match["week"], reference) + datetime.timedelta(5)
+
+    def _resolve_week(self, match, reference):
+        return max(self._monday(match["week"], reference), reference)
+
+    def _resolve_month(self, match, reference):
+        first = _add_months(reference.replace(day=1), _RELATIVE_MONTHS[match["month"]])
+        return max(first.replace(day=_MONTH_PARTS.get(match["part"], 1)), reference)
+
+    def _resolve_relative_day(self, match, reference):
+        return reference + datetime.timedelta(_RELATIVE_DAYS[match.group()])
+
+    def _resolve_weekday(self, match, reference):
+        return reference + datetime.timedelta((_WEEKDAYS[match["wd"]] - reference.weekday()) % 7)
+
+    def _resolve_day(self, match, reference):
+        # 이번 달 그 날이 지났으면 다음 달
+        day = int(match["d"])
+        if day < reference.day:
+            reference = _add_months(reference.replace(day=1), 1)
+        return reference.replace(day=day)
+
+    def _resolve_holiday(self, match, reference):
+        year = match["year"]
+        return self.calendar.next_occurrence(
+            match["name"],
+            reference,
+            year=reference.year + _RELATIVE_YEARS[year] if year else None,
+            block=match["block"] is not None,
+        )
+
+    @staticmethod
+    def _monday(week: str, reference: datetime.date) -> datetime.date:
+        """기준일이 속한 주(월요일 시작)에서 week만큼 떨어진 주의 월요일"""
+        return reference + datetime.timedelta(7 * _RELATIVE_WEEKS[week] - reference.weekday())
+
+    @staticmethod
+    def _in_year(
+        year: Optional[str], reference: datetime.date, month: int, day: int, by_month: bool = False
+    ) -> datetime.date:
+        """
+        연도가 생략된 날짜의 연도 결정
+
+        "올해/내년"이 없으면 기준일 이후가 되도록 올해 또는 내년으로 해석합니다
+        (여행 출발일은 과거일 수 없음).
+        """
+        if year is not None:
+            return datetime.date(reference.year + _RELATIVE_YEARS[year], month, day)
+        if by_month:
+            passed = month < reference.month
+        else:
+            passed = (month, day) < (reference.month, reference.day)
+        return datetime.date(reference.year + (1 if passed else 0), month, day)
+
+
+@lru_cache(maxsize=8)
+def load_date_resolver(calendar_path: Optional[Path] = None) -> DateResolver:
+    """
+    공휴일 표로 만든 공유 DateResolver 반환 (경로별 한 번 생성)
+
+    Args:
+        calendar_path: 공휴일 표 경로 (None인 경우 data/holidays.json)
+
+    Returns:
+        DateResolver 인스턴스
+    """
+    return DateResolver(HolidayCalendar.from_file(Path(calendar_path or DEFAULT_CALENDAR_PATH)))
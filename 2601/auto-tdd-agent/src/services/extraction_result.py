@@ -0,0 +1,120 @@
+"""
+슬롯 추출 결과 (신뢰도/출처 포함)
+
+파서가 돌려주는 슬롯 값마다 신뢰도, 출처(규칙/LLM/캐시/로컬 모델), 규칙 ID, 일치 구간을
+붙여 둡니다. PlanManager는 이를 plan 값의 출처로 기록하고, 라우터/평가기는 값을 다시
+확인할지, 출처별 정확도가 어떤지를 판단할 수 있습니다.
+"""
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+# 값의 출처
+SOURCE_RULE = "rule"  # 규칙 엔진 (rule_id에 규칙 ID)
+SOURCE_LLM = "llm"  # LLM 응답
+SOURCE_CACHE = "cache"  # 같은 입력의 이전 LLM 결과 재사용
+SOURCE_MODEL = "model"  # LLM 결과로 학습한 로컬 슬롯 태거 (slot_tagger)
+
+# LLM 값의 신뢰도 (LLM은 구간/근거를 돌려주지 않으므로 고정값)
+LLM_CONFIDENCE = 0.7
+
+
+class SlotValue(NamedTuple):
+    """추출된 슬롯 값 하나"""
+    value: Any
+    confidence: float  # 0.0 ~ 1.0 (규칙별/날짜 표현 종류별로 선언)
+    source: str  # SOURCE_RULE, SOURCE_LLM, SOURCE_CACHE, SOURCE_MODEL
+    rule_id: Optional[str] = None
+    span: Optional[Tuple[int, int]] = None  # 정규화된 발화 기준 (시작, 끝)
+
+    def provenance(self) -> Dict[str, Any]:
+        """
+        상태에 저장할 출처 정보 (값 제외, JSON 직렬화 가능)
+
+        Returns:
+            {"confidence", "source", "rule_id"}
+        """
+        return {"confidence": self.confidence, "source": self.source, "rule_id": self.rule_id}
+
+
+class ExtractionResult(Mapping):
+    """
+    슬롯 이름 → SlotValue 매핑
+
+    Mapping 인터페이스로 슬롯별 SlotValue를 조회하고, to_dict()로 기존 파서와
+    같은 슬롯 → 값 딕셔너리를 얻습니다.
+    """
+
+    __slots__ = ("_slots",)
+
+    def __init__(self, slots: Optional[Mapping[str, SlotValue]] = None):
+        """
+        Args:
+            slots: 슬롯 이름 → SlotValue
+        """
+        self._slots: Dict[str, SlotValue] = dict(slots or {})
+
+    @classmethod
+    def from_values(
+        cls, values: Mapping[str, Any], source: str, confidence: float = LLM_CONFIDENCE
+    ) -> 'ExtractionResult':
+        """
+        근거 없는 값 딕셔너리에서 생성 (LLM 응답 등, 빈 값 제외)
+
+        Args:
+            values: 슬롯 이름 → 값
+            source: 출처
+            confidence: 모든 값에 붙일 신뢰도
+
+        Returns:
+            ExtractionResult 인스턴스
+        """
+        return cls({
+            slot: SlotValue(value, confidence, source)
+            for slot, value in values.items() if value
+        })
+
+    def __getitem__(self, slot: str) -> SlotValue:
+        return self._slots[slot]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __repr__(self) -> str:
+        return f"ExtractionResult({self._slots!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        슬롯 → 값 딕셔너리 (ResponseParser.parse의 반환 형식)
+
+        Returns:
+            슬롯 이름 → 값
+        """
+        return {slot: item.value for slot, item in self._slots.items()}
+
+    def with_source(self, source: str) -> 'ExtractionResult':
+        """
+        출처만 바꾼 결과 (예: 캐시에서 꺼낸 LLM 결과)
+
+        Args:
+            source: 새 출처
+
+        Returns:
+            ExtractionResult 인스턴스
+        """
+        return ExtractionResult({
+            slot: item._replace(source=source) for slot, item in self._slots.items()
+        })
+
+    def uncertain(self, threshold: float) -> List[str]:
+        """
+        신뢰도가 기준보다 낮은 슬롯 (확인 질문/재질문 후보)
+
+        Args:
+            threshold: 신뢰도 기준
+
+        Returns:
+            슬롯 이름 목록 (추출 순서)
+        """
+        return [slot for slot, item in self._slots.items() if item.confidence < threshold]
@@ -0,0 +1,316 @@
+"""
+추출 규칙/질문 템플릿 명세
+
+data/extraction_rules.json(plan_schema.json 옆)에 선언된 슬롯별 추출 패턴,
+정규화 타입, 로케일별 질문 템플릿을 한 번만 읽어 불변 명세로 만듭니다.
+슬롯이나 로케일을 추가할 때 코드를 바꿀 필요가 없고, 호출마다 명세를 해석하지 않습니다.
+"""
+from pathlib import Path
+import hashlib
+import json
+import re
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ..core.env_config import EnvConfig
+from ..core.file_watch import FileWatch
+from ..utils.validator import get_type_normalizer
+from .date_resolver import DEFAULT_CALENDAR_PATH, load_date_resolver
+from .gazetteer import load_gazetteer
+from .rule_engine import DEFAULT_CONFIDENCE, SlotRule
+
+# 기본 명세 파일 경로
+DEFAULT_RULES_PATH = Path(__file__).parent.parent.parent / "data" / "extraction_rules.json"
+
+
+@dataclass(frozen=True)
+class ExtractionSpec:
+    """
+    추출 규칙 명세 (불변)
+
+    spec_hash로 비교/해시하므로 컴파일된 RuleEngine이나 질문 캐시의 키로 사용할 수 있습니다.
+    """
+    rules: Tuple[SlotRule, ...] = field(default=(), compare=False)
+    # 슬롯 → 로케일 → 질문
+    questions: Mapping[str, Mapping[str, str]] = field(default_factory=dict, compare=False)
+    # 메시지 키 → 로케일 → 문장 ("complete", "unknown_slot")
+    messages: Mapping[str, Mapping[str, str]] = field(default_factory=dict, compare=False)
+    default_locale: str = field(default="ko", compare=False)
+    spec_hash: str = ""
+
+    def __hash__(self) -> int:
+        return hash(self.spec_hash)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], base_dir: Optional[Path] = None) -> 'ExtractionSpec':
+        """
+        명세 딕셔너리에서 생성 (패턴/정규화 함수/지명 사전은 여기서 한 번만 해석)
+
+        Args:
+            data: extraction_rules.json 형식의 딕셔너리
+            base_dir: gazetteer 규칙의 상대 경로 기준 (None인 경우 data 디렉토리)
+
+        Returns:
+            ExtractionSpec 인스턴스
+
+        Raises:
+            ValueError: 규칙에 pattern/keywords/gazetteer/resolver가 없거나 알 수 없는 정규화/해석기 타입,
+                confidence가 0~1 범위 밖, 또는 gazetteer 규칙이 아닌데 ambiguous가 있는 경우
+        """
+        slots = data.get("slots", {})
+        base_dir = Path(base_dir or DEFAULT_RULES_PATH.parent)
+
+        rules = []
+        source_hashes = []
+        for entry in data.get("rules", []):
+            rule_id = entry.get("id", "?")
+            slot = entry["slot"]
+            gazetteer = None
+            resolve = None
+            score = None
+            normalize_type = slots.get(slot, {}).get("normalize")
+
+            if "resolver" in entry:
+                # 기준일에 대해 해석하는 날짜 표현 (값은 해석기가 정규화)
+                if entry["resolver"] != "date":
+                    raise ValueError(f"{rule_id}: 알 수 없는 해석기 {entry['resolver']}")
+                resolver = load_date_resolver(
+                    base_dir / entry["calendar"] if "calendar" in entry else DEFAULT_CALENDAR_PATH
+                )
+                source_hashes.append(resolver.calendar.source_hash)
+                if "kinds" in entry:
+                    # 일부 표현 종류만 사용 (예: 출발일 답변의 "15일")
+                    unknown = set(entry["kinds"]) - resolver.patterns.keys()
+                    if unknown:
+                        raise ValueError(f"{rule_id}: 알 수 없는 날짜 표현 종류 {sorted(unknown)}")
+                    pattern = "|".join(resolver.patterns[kind] for kind in entry["kinds"])
+                else:
+                    pattern = resolver.pattern
+                resolve = resolver.resolve_value
+                score = resolver.confidence
+                normalize_type = None
+            elif "gazetteer" in entry:
+                # 지식 베이스의 지명 사전 (정식 명칭으로 변환된 값)
+                gazetteer = load_gazetteer(base_dir / entry["gazetteer"])
+                source_hashes.append(gazetteer.source_hash)
+                pattern = ""
+            elif "pattern" in entry:
+                pattern = entry["pattern"]
+            elif entry.get("keywords"):
+                # 키워드 목록은 나열 순서대로 시도하는 하나의 캡처 그룹으로 컴파일
+                pattern = "(" + "|".join(re.escape(k) for k in entry["keywords"]) + ")"
+            else:
+                raise ValueError(f"{rule_id}: pattern, keywords, gazetteer 또는 resolver가 필요합니다")
+
+            ambiguous = frozenset(entry.get("ambiguous", ()))
+            context = re.compile(entry["ambiguous_context"]).match if "ambiguous_context" in entry else None
+            if ambiguous and gazetteer is None:
+                raise ValueError(f"{rule_id}: ambiguous는 gazetteer 규칙에만 쓸 수 있습니다")
+
+            confidence = float(entry.get("confidence", DEFAULT_CONFIDENCE))
+            if not 0.0 <= confidence <= 1.0:
+                raise ValueError(f"{rule_id}: confidence는 0과 1 사이여야 합니다 ({confidence})")
+
+            rules.append(SlotRule(
+                rule_id=rule_id,
+                slot=slot,
+                pattern=pattern,
+                template=entry.get("template", "{0}"),
+                reject=frozenset(entry.get("reject", ())),
+                fallback=bool(entry.get("fallback", False)),
+                targeted=bool(entry.get("targeted", False)),
+                normalize=get_type_normalizer(normalize_type) if normalize_type else None,
+                gazetteer=gazetteer,
+                resolve=resolve,
+                confidence=confidence,
+                score=score,
+                ambiguous=ambiguous,
+                context=context,
+            ))
+
+        questions = {
+            slot: MappingProxyType(dict(spec.get("questions", {})))
+            for slot, spec in slots.items()
+        }
+        messages = {
+            key: MappingProxyType(dict(texts))
+            for key, texts in data.get("messages", {}).items()
+        }
+        # 지명 사전/공휴일 표 내용이 바뀌어도 다른 명세가 되도록 원본 해시를 포함
+        canonical = json.dumps([data, source_hashes], sort_keys=True, ensure_ascii=False)
+
+        return cls(
+            rules=tuple(rules),
+            questions=MappingProxyType(questions),
+            messages=MappingProxyType(messages),
+            default_locale=data.get("default_locale", "ko"),
+            spec_hash=hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16],
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> 'ExtractionSpec':
+        """
+        명세 파일 로드
+
+        매번 파일을 읽으므로 핫 패스에서는 load_extraction_spec()을 사용하세요.
+
+        Args:
+            path: 명세 파일 경로
+
+        Returns:
+            ExtractionSpec 인스턴스
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), base_dir=Path(path).parent)
+
+    def resolve_locale(self, locale: Optional[str] = None) -> str:
+        """
+        사용할 로케일 결정 (인자 → 환경 변수 → 명세 기본값)
+
+        Args:
+            locale: 요청한 로케일
+
+        Returns:
+            로케일 코드
+        """
+        return locale or EnvConfig.AGENT_LOCALE or self.default_locale
+
+    def question(self, slot: str, locale: Optional[str] = None) -> str:
+        """
+        슬롯 질문 조회
+
+        Args:
+            slot: 슬롯 이름
+            locale: 로케일 (없는 로케일이면 기본 로케일)
+
+        Returns:
+            질문 문자열 (질문이 없는 슬롯이면 unknown_slot 메시지)
+        """
+        texts = self.questions.get(slot)
+        if texts:
+            text = texts.get(self.resolve_locale(locale)) or texts.get(self.default_locale)
+            if text:
+                return text
+        return self.message("unknown_slot", locale)
+
+    def message(self, key: str, locale: Optional[str] = None) -> str:
+        """
+        공통 메시지 조회
+
+        Args:
+            key: 메시지 키
+            locale: 로케일 (없는 로케일이면 기본 로케일)
+
+        Returns:
+            메시지 문자열 (정의되지 않았으면 빈 문자열)
+        """
+        texts = self.messages.get(key, {})
+        return texts.get(self.resolve_locale(locale)) or texts.get(self.default_locale, "")
+
+
+class _Entry:
+    """레지스트리 내부 항목: 현재 명세와 파일 감시기"""
+
+    __slots__ = ("spec", "watch")
+
+    def __init__(self, spec: ExtractionSpec, watch: FileWatch):
+        self.spec = spec
+        self.watch = watch
+
+
+class ExtractionSpecRegistry:
+    """
+    명세 파일별 ExtractionSpec 레지스트리
+
+    파일마다 한 번만 로드한 공유 인스턴스를 반환하고,
+    파일이 바뀌면 새 인스턴스로 교체합니다 (기존 인스턴스는 그대로 유효).
+    """
+
+    def __init__(self, check_interval: Optional[float] = None):
+        """
+        Args:
+            check_interval: 파일 변경 확인 주기 (초, None인 경우 환경 변수 값 사용)
+        """
+        self.check_interval = (
+            EnvConfig.RELOAD_CHECK_INTERVAL if check_interval is None else check_interval
+        )
+        self._entries: Dict[Path, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Optional[Path] = None) -> ExtractionSpec:
+        """
+        명세 조회 (필요 시 로드/리로드)
+
+        Args:
+            path: 명세 파일 경로 (None인 경우 data/extraction_rules.json)
+
+        Returns:
+            공유 ExtractionSpec 인스턴스
+        """
+        key = Path(path or DEFAULT_RULES_PATH)
+        entry = self._entries.get(key)
+        if entry is not None and not entry.watch.changed():
+            return entry.spec
+
+        with self._lock:
+            # 다른 스레드가 먼저 리로드했을 수 있으므로 다시 확인
+            current = self._entries.get(key)
+            if current is not None and current is not entry:
+                return current.spec
+
+            watch = FileWatch(key, self.check_interval)
+            watch.mark()
+            try:
+                spec = ExtractionSpec.from_file(key)
+            except (json.JSONDecodeError, OSError, KeyError, ValueError, re.error):
+                # 쓰는 도중이거나 잘못된 파일이면 이전 명세 유지
+                if entry is None:
+                    raise
+                spec = entry.spec
+
+            # 내용이 같으면 기존 인스턴스를 유지해 키로 쓰는 캐시가 깨지지 않게 함
+            if entry is not None and entry.spec == spec:
+                spec = entry.spec
+            self._entries[key] = _Entry(spec, watch)
+            return spec
+
+    def invalidate(self, path: Optional[Path] = None):
+        """
+        캐시 무효화 (다음 조회 시 다시 로드)
+
+        Args:
+            path: 명세 파일 경로 (None인 경우 전체)
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(path), None)
+
+
+_registry = ExtractionSpecRegistry()
+
+
+def get_extraction_spec_registry() -> ExtractionSpecRegistry:
+    """
+    프로세스 공유 ExtractionSpecRegistry 반환
+
+    Returns:
+        ExtractionSpecRegistry 인스턴스
+    """
+    return _registry
+
+
+def load_extraction_spec(path: Optional[Path] = None) -> ExtractionSpec:
+    """
+    추출 규칙 명세 로드 (공유 레지스트리 사용)
+
+    Args:
+        path: 명세 파일 경로 (None인 경우 data/extraction_rules.json)
+
+    Returns:
+        ExtractionSpec 인스턴스
+    """
+    return _registry.get(path)
@@ -0,0 +1,579 @@
+"""
+지명 사전 (gazetteer)
+
+knowledge_base.json의 destinations(정식 명칭 + 별칭)를 배열 기반의 압축 트라이로
+색인하여, 발화에서 가장 긴 지명을 찾고 별칭을 정식 명칭으로 바꿉니다
+(예: "제주", "Jeju" → "제주도").
+
+트라이는 CSR 형식의 평탄한 배열 네 개(노드별 간선 시작 위치, 간선 글자, 간선 대상,
+노드 값)로 표현되므로 수만 개 지명에도 파이썬 객체가 노드 수만큼 생기지 않고,
+배열 바이트를 그대로 저장한 이진 색인으로 빠르게 로드할 수 있습니다.
+"""
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+import hashlib
+import json
+import re
+import struct
+import sys
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from ..core.env_config import EnvConfig
+from ..core.file_watch import FileWatch
+
+# 기본 지식 베이스/색인 파일 경로
+DEFAULT_KNOWLEDGE_BASE_PATH = Path(__file__).parent.parent.parent / "data" / "knowledge_base.json"
+DEFAULT_INDEX_PATH = DEFAULT_KNOWLEDGE_BASE_PATH.with_name("gazetteer.idx")
+
+# 이진 색인 형식: 매직, 버전, 노드/간선/이름 수, 원본 해시, 이후 배열 바이트 (리틀 엔디언)
+_MAGIC = b"GZTR"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHxxIII16s")
+
+# ASCII 대문자만 소문자로 (길이가 바뀌는 유니코드 대소문자 변환은 위치를 어긋나게 함)
+_ASCII_FOLD = {code: code + 32 for code in range(ord("A"), ord("Z") + 1)}
+_HAS_ASCII_UPPER = re.compile("[A-Z]").search
+
+
+def fold_case(text: str) -> str:
+    """
+    ASCII 대소문자 무시용 변환 (글자 위치 보존)
+
+    Args:
+        text: 입력 텍스트
+
+    Returns:
+        ASCII 대문자를 소문자로 바꾼 텍스트
+    """
+    # translate는 글자마다 dict를 조회하므로 대문자가 있을 때만 수행
+    return text.translate(_ASCII_FOLD) if _HAS_ASCII_UPPER(text) else text
+
+
+def _cased(char: str, in_class: bool = False) -> str:
+    """영문 소문자는 대문자와 함께 매치하는 정규식 조각으로"""
+    if "a" <= char <= "z":
+        both = char + char.upper()
+        return both if in_class else f"[{both}]"
+    return re.escape(char)
+
+
+def _is_ascii_alnum(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+# 한글 지명 앞에 붙어 있어도 되는 앞 단어의 끝 글자 (조사/어미, 예: "이번엔제주도")
+_LEADING_PARTICLES = frozenset("에엔는은를을도로와과랑고서나면")
+# 한글 지명 바로 뒤에 올 수 있는 조사와 지명 복합어 꼬리 (예: "부산으로", "부산역", "부산가고")
+# 그 밖의 한글이 이어지면 더 긴 단어의 일부로 보고 지명으로 인정하지 않음 ("남해안", "부여하는")
+_TRAILING_SUFFIXES = (
+    "으로", "에서", "까지", "부터", "이랑", "하고", "여행", "공항", "시내", "근처", "일대", "지역", "방면",
+    "에", "엔", "로", "은", "는", "이", "가", "을", "를", "도", "의", "와", "과", "랑", "만",
+    "행", "쪽", "역", "항", "요", "서", "나", "야",
+)
+
+
+class Gazetteer:
+    """
+    배열 기반 트라이 지명 사전
+
+    노드 i의 간선은 labels[first_edge[i]:first_edge[i + 1]]에 글자 코드 순으로 정렬되어 있어
+    이분 탐색으로 다음 노드를 찾습니다. values[i]는 노드 i에서 끝나는 키의 정식 명칭
+    번호이며, 키가 끝나지 않는 노드는 -1입니다.
+    """
+
+    __slots__ = (
+        "_first_edge", "_labels", "_targets", "_values", "_prefix", "_loose_prefix", "names", "source_hash",
+    )
+
+    def __init__(
+        self,
+        first_edge: array,
+        labels: array,
+        targets: array,
+        values: array,
+        names: Sequence[str],
+        source_hash: str = "",
+    ):
+        """
+        Args:
+            first_edge: 노드별 간선 시작 위치 (길이: 노드 수 + 1)
+            labels: 간선 글자 코드
+            targets: 간선 대상 노드
+            values: 노드별 정식 명칭 번호 (-1: 키 끝이 아님)
+            names: 정식 명칭 목록
+            source_hash: 원본 지식 베이스 해시 (색인 최신 여부 확인용)
+        """
+        self._first_edge = first_edge
+        self._labels = labels
+        self._targets = targets
+        self._values = values
+        self.names: Tuple[str, ...] = tuple(names)
+        self.source_hash = source_hash
+
+        self._prefix = self._compile_prefix()
+        self._loose_prefix = self._compile_loose_prefix()
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, Sequence[str]]], source_hash: str = "") -> 'Gazetteer':
+        """
+        (정식 명칭, 별칭 목록)에서 사전 생성
+
+        같은 별칭이 여러 지명에 있으면 먼저 나온 지명이 우선합니다.
+
+        Args:
+            entries: (정식 명칭, 별칭 목록) 목록
+            source_hash: 원본 해시
+
+        Returns:
+            Gazetteer 인스턴스
+        """
+        children: List[Dict[int, int]] = [{}]
+        node_values = [-1]
+        names: List[str] = []
+
+        for name, aliases in entries:
+            index = len(names)
+            names.append(name)
+            for key in (name, *aliases):
+                key = fold_case(key.strip())
+                if not key:
+                    continue
+                node = 0
+                for char in key:
+                    code = ord(char)
+                    child = children[node].get(code)
+                    if child is None:
+                        child = len(children)
+                        children[node][code] = child
+                        children.append({})
+                        node_values.append(-1)
+                    node = child
+                if node_values[node] == -1:
+                    node_values[node] = index
+
+        # dict 트라이를 CSR 배열로 평탄화
+        first_edge = array("I", [0])
+        labels = array("I")
+        targets = array("I")
+        for edges in children:
+            for code in sorted(edges):
+                labels.append(code)
+                targets.append(edges[code])
+            first_edge.append(len(labels))
+
+        return cls(first_edge, labels, targets, array("i", node_values), names, source_hash)
+
+    @classmethod
+    def from_knowledge_base(cls, path: Path) -> 'Gazetteer':
+        """
+        knowledge_base.json의 destinations에서 사전 생성
+
+        Args:
+            path: 지식 베이스 파일 경로
+
+        Returns:
+            Gazetteer 인스턴스
+        """
+        raw = Path(path).read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+        entries = [
+            (entry["name"], entry.get("aliases", ()))
+            for entry in data.get("destinations", [])
+        ]
+        return cls.build(entries, source_hash=hashlib.sha256(raw).hexdigest()[:16])
+
+    def _compile_prefix(self) -> Optional["re.Pattern"]:
+        """
+        지명 앞 두 글자로 시작 후보 위치를 찾는 정규식 생성
+
+        "부[산여]|괌|..."처럼 첫 글자 리터럴로 시작하는 대안 묶음이라 정규식 엔진이
+        첫 글자 집합으로 빠르게 건너뛰고, 두 번째 글자까지 맞는 위치만 트라이를 탐색합니다.
+        영문은 "[jJ][eE]"처럼 대소문자를 모두 넣어 fold_case 전 텍스트에도 쓸 수 있습니다.
+        """
+        first_edge, labels, targets, values = (
+            self._first_edge, self._labels, self._targets, self._values
+        )
+        alternatives = []
+        for i in range(first_edge[0], first_edge[1]):
+            root = targets[i]
+            head = _cased(chr(labels[i]))
+            seconds = labels[first_edge[root]:first_edge[root + 1]]
+            if values[root] >= 0 or not seconds:
+                alternatives.append(head)  # 한 글자 지명
+            else:
+                alternatives.append(
+                    head + "[" + "".join(_cased(chr(code), in_class=True) for code in seconds) + "]"
+                )
+        return re.compile("|".join(alternatives)) if alternatives else None
+
+    def _compile_loose_prefix(self) -> Optional["re.Pattern"]:
+        """
+        "[첫 글자들][둘째 글자들]|[한 글자 지명들]" 형태의 느슨한 시작 후보 검색식
+
+        prefix보다 넓게 맞지만 (예: 첫 글자와 둘째 글자가 서로 다른 지명에서 온 "부산"의 "부" +
+        "제주"의 "주") 대안이 두 개뿐이라, 여러 규칙을 합친 후보 위치 검색식에 넣어도 위치마다
+        시도하는 비용이 작습니다. 맞은 위치는 prefix로 다시 확인합니다.
+        """
+        first_edge, labels, targets, values = (
+            self._first_edge, self._labels, self._targets, self._values
+        )
+        heads, singles, seconds = set(), set(), set()
+        for i in range(first_edge[0], first_edge[1]):
+            root = targets[i]
+            head = _cased(chr(labels[i]), in_class=True)
+            codes = labels[first_edge[root]:first_edge[root + 1]]
+            if values[root] >= 0 or not codes:
+                singles.add(head)
+            else:
+                heads.add(head)
+                seconds.update(_cased(chr(code), in_class=True) for code in codes)
+        alternatives = []
+        if heads:
+            alternatives.append("[" + "".join(sorted(heads)) + "][" + "".join(sorted(seconds)) + "]")
+        if singles:
+            alternatives.append("[" + "".join(sorted(singles)) + "]")
+        return re.compile("|".join(alternatives)) if alternatives else None
+
+    @property
+    def prefix(self) -> Optional["re.Pattern"]:
+        """지명 시작 후보 위치를 찾는 정규식 (영문 대소문자 무관, 지명이 없으면 None)"""
+        return self._prefix
+
+    @property
+    def loose_prefix(self) -> Optional["re.Pattern"]:
+        """prefix보다 넓지만 대안이 적은 시작 후보 검색식 (지명이 없으면 None)"""
+        return self._loose_prefix
+
+    def first_chars(self) -> FrozenSet[str]:
+        """
+        지명 첫 글자 집합 (re.escape된 문자 클래스 조각)
+
+        Returns:
+            첫 글자 조각 집합 (영문은 소문자/대문자 모두 포함)
+        """
+        chars = set()
+        for code in self._labels[self._first_edge[0]:self._first_edge[1]]:
+            char = chr(code)
+            chars.add(re.escape(char))
+            if "a" <= char <= "z":
+                chars.add(char.upper())
+        return frozenset(chars)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _step(self, node: int, char: str) -> int:
+        """node에서 char 간선을 따라간 노드 (-1: 간선 없음)"""
+        lo = self._first_edge[node]
+        hi = self._first_edge[node + 1]
+        code = ord(char)
+        i = bisect_left(self._labels, code, lo, hi)
+        if i < hi and self._labels[i] == code:
+            return self._targets[i]
+        return -1
+
+    def lookup(self, name: str) -> Optional[str]:
+        """
+        지명/별칭을 정식 명칭으로 변환
+
+        Args:
+            name: 지명 또는 별칭
+
+        Returns:
+            정식 명칭 또는 사전에 없으면 None
+        """
+        node = 0
+        for char in fold_case(name.strip()):
+            node = self._step(node, char)
+            if node < 0:
+                return None
+        value = self._values[node]
+        return self.names[value] if value >= 0 else None
+
+    def longest_match(
+        self, text: str, start: int = 0, endpos: Optional[int] = None
+    ) -> Optional[Tuple[int, str]]:
+        """
+        start 위치에서 시작하는 가장 긴 지명
+
+        영문 지명은 단어 중간에서 시작하거나 끝나지 않아야 합니다 ("Jejudo" 안의 "Jeju" 제외).
+        한글 지명은 앞 글자가 한글이면 조사여야 하고, 뒤에 한글이 이어지면 조사나 지명 복합어
+        꼬리("역", "여행" 등)로 시작해야 합니다 ("세종대왕", "의미를 부여하는" 제외).
+
+        Args:
+            text: fold_case된 입력 텍스트
+            start: 시작 위치
+            endpos: 탐색 끝 위치 (None인 경우 텍스트 끝)
+
+        Returns:
+            (끝 위치, 정식 명칭) 또는 없으면 None
+        """
+        if start > 0:
+            before = text[start - 1]
+            if _is_ascii_alnum(before) and _is_ascii_alnum(text[start]):
+                return None
+            if _is_hangul(before) and before not in _LEADING_PARTICLES and _is_hangul(text[start]):
+                return None
+
+        first_edge = self._first_edge
+        labels = self._labels
+        targets = self._targets
+        values = self._values
+        length = len(text) if endpos is None else endpos
+        best = None
+        node = 0
+        pos = start
+        while pos < length:
+            # _step을 인라인 (핫 루프)
+            lo = first_edge[node]
+            hi = first_edge[node + 1]
+            code = ord(text[pos])
+            i = bisect_left(labels, code, lo, hi)
+            if i == hi or labels[i] != code:
+                break
+            node = targets[i]
+            pos += 1
+            value = values[node]
+            if value >= 0 and (pos >= length or self._bounded(text, pos)):
+                best = (pos, self.names[value])
+        return best
+
+    @staticmethod
+    def _bounded(text: str, pos: int) -> bool:
+        """pos 바로 앞에서 지명이 끝날 수 있는지 (영문은 단어 경계, 한글은 조사/복합어 꼬리)"""
+        char = text[pos]
+        last = text[pos - 1]
+        if _is_ascii_alnum(char):
+            return not _is_ascii_alnum(last)
+        if _is_hangul(char) and _is_hangul(last):
+            return text.startswith(_TRAILING_SUFFIXES, pos)
+        return True
+
+    def find_all(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        발화에서 겹치지 않는 지명을 왼쪽부터 가장 길게 찾기
+
+        위치마다 트라이를 최대 (가장 긴 지명 길이)만큼만 내려가므로
+        발화 길이에 선형입니다. 앞 두 글자가 지명과 맞지 않는 위치는 정규식 검색으로 건너뜁니다.
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            (시작, 끝, 정식 명칭) 목록
+        """
+        if self._prefix is None:
+            return []
+        folded = fold_case(text)
+        search = self._prefix.search
+
+        matches = []
+        pos = 0
+        while True:
+            hit = search(folded, pos)
+            if hit is None:
+                return matches
+            pos = hit.start()
+            found = self.longest_match(folded, pos)
+            if found is None:
+                pos += 1
+                continue
+            end, name = found
+            matches.append((pos, end, name))
+            pos = end
+
+    def to_bytes(self) -> bytes:
+        """
+        이진 색인으로 직렬화
+
+        Returns:
+            헤더 + 배열 바이트 + 정식 명칭(UTF-8, NUL 구분)
+        """
+        arrays = [self._first_edge, self._labels, self._targets, self._values]
+        if sys.byteorder == "big":
+            arrays = [array(a.typecode, a) for a in arrays]
+            for a in arrays:
+                a.byteswap()
+
+        header = _HEADER.pack(
+            _MAGIC, _VERSION,
+            len(self._values), len(self._labels), len(self.names),
+            self.source_hash.encode("ascii").ljust(16, b"\0"),
+        )
+        names = "\0".join(self.names).encode("utf-8")
+        return header + b"".join(a.tobytes() for a in arrays) + names
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Gazetteer':
+        """
+        이진 색인에서 로드
+
+        Args:
+            data: to_bytes()로 만든 바이트
+
+        Returns:
+            Gazetteer 인스턴스
+
+        Raises:
+            ValueError: 형식이나 버전이 맞지 않는 경우
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("지명 색인이 너무 짧습니다")
+        magic, version, nodes, edges, name_count, source_hash = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("지명 색인 형식이 아닙니다")
+
+        view = memoryview(data)
+        offset = _HEADER.size
+        parsed = []
+        for typecode, count in (("I", nodes + 1), ("I", edges), ("I", edges), ("i", nodes)):
+            a = array(typecode)
+            size = a.itemsize * count
+            a.frombytes(view[offset:offset + size])
+            if len(a) != count:
+                raise ValueError("지명 색인이 손상되었습니다")
+            if sys.byteorder == "big":
+                a.byteswap()
+            parsed.append(a)
+            offset += size
+
+        blob = bytes(view[offset:]).decode("utf-8")
+        names = blob.split("\0") if name_count else []
+        if len(names) != name_count:
+            raise ValueError("지명 색인이 손상되었습니다")
+
+        return cls(*parsed, names, source_hash.rstrip(b"\0").decode("ascii"))
+
+    def save(self, path: Path):
+        """
+        이진 색인 파일 저장 (임시 파일에 쓴 뒤 교체)
+
+        Args:
+            path: 색인 파일 경로
+        """
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(self.to_bytes())
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> 'Gazetteer':
+        """
+        이진 색인 파일 로드
+
+        Args:
+            path: 색인 파일 경로
+
+        Returns:
+            Gazetteer 인스턴스
+        """
+        return cls.from_bytes(Path(path).read_bytes())
+
+
+def build_index(
+    knowledge_base_path: Optional[Path] = None, index_path: Optional[Path] = None
+) -> Gazetteer:
+    """
+    지식 베이스에서 사전을 만들고 이진 색인으로 저장
+
+    Args:
+        knowledge_base_path: 지식 베이스 경로 (None인 경우 data/knowledge_base.json)
+        index_path: 색인 경로 (None인 경우 지식 베이스 옆 gazetteer.idx)
+
+    Returns:
+        생성한 Gazetteer
+    """
+    kb_path = Path(knowledge_base_path or DEFAULT_KNOWLEDGE_BASE_PATH)
+    gazetteer = Gazetteer.from_knowledge_base(kb_path)
+    gazetteer.save(Path(index_path or kb_path.with_name(DEFAULT_INDEX_PATH.name)))
+    return gazetteer
+
+
+def _load_fresh(kb_path: Path, index_path: Path) -> Gazetteer:
+    """색인의 원본 해시가 지식 베이스와 같으면 색인을, 아니면 지식 베이스로 다시 생성"""
+    raw = kb_path.read_bytes()
+    source_hash = hashlib.sha256(raw).hexdigest()[:16]
+    try:
+        gazetteer = Gazetteer.load(index_path)
+        if gazetteer.source_hash == source_hash:
+            return gazetteer
+    except (OSError, ValueError):
+        pass  # 색인이 없거나 손상된 경우 다시 생성
+
+    gazetteer = Gazetteer.from_knowledge_base(kb_path)
+    try:
+        gazetteer.save(index_path)
+    except OSError:
+        pass  # 읽기 전용 배포 환경에서는 메모리 사전만 사용
+    return gazetteer
+
+
+class _Entry:
+    """캐시 항목: 현재 사전과 지식 베이스 감시기"""
+
+    __slots__ = ("gazetteer", "watch")
+
+    def __init__(self, gazetteer: Gazetteer, watch: FileWatch):
+        self.gazetteer = gazetteer
+        self.watch = watch
+
+
+_entries: Dict[Path, _Entry] = {}
+_lock = threading.Lock()
+
+
+def load_gazetteer(knowledge_base_path: Optional[Path] = None) -> Gazetteer:
+    """
+    지명 사전 로드 (프로세스 공유, 지식 베이스가 바뀌면 다시 로드)
+
+    지식 베이스 옆의 gazetteer.idx가 같은 원본에서 만들어졌으면 JSON 파싱과 트라이 생성 없이
+    색인을 로드하고, 그렇지 않으면 사전을 만들고 색인을 갱신합니다.
+
+    Args:
+        knowledge_base_path: 지식 베이스 경로 (None인 경우 data/knowledge_base.json)
+
+    Returns:
+        Gazetteer 인스턴스
+    """
+    kb_path = Path(knowledge_base_path or DEFAULT_KNOWLEDGE_BASE_PATH)
+    entry = _entries.get(kb_path)
+    if entry is not None and not entry.watch.changed():
+        return entry.gazetteer
+
+    with _lock:
+        current = _entries.get(kb_path)
+        if current is not None and current is not entry:
+            return current.gazetteer
+
+        watch = FileWatch(kb_path, EnvConfig.RELOAD_CHECK_INTERVAL)
+        watch.mark()
+        try:
+            gazetteer = _load_fresh(kb_path, kb_path.with_name(DEFAULT_INDEX_PATH.name))
+        except (json.JSONDecodeError, OSError, KeyError):
+            if entry is None:
+                raise
+            gazetteer = entry.gazetteer
+        _entries[kb_path] = _Entry(gazetteer, watch)
+        return gazetteer
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    이진 색인 생성 CLI
+
+    실행:
+        uv run python -m src.services.gazetteer [knowledge_base.json] [gazetteer.idx]
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+    gazetteer = build_index(*(Path(a) for a in args[:2]))
+    print(f"지명 {len(gazetteer)}개 색인 완료 (원본 해시 {gazetteer.source_hash})")
+
+
+if __name__ == "__main__":
+    main()
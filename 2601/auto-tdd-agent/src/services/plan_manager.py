@@ -1,12 +1,20 @@
 """
 Plan 상태 관리 서비스
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Optional
 from ..core.config import AgentConfig
+from ..core.plan import PlanRecord
+from .extraction_result import ExtractionResult
 
 
 class PlanManager:
-    """Plan 업데이트 관리 서비스"""
+    """
+    Plan 업데이트 관리 서비스
+
+    조회 메서드는 dict plan과 PlanRecord를 모두 받습니다.
+    같은 plan을 여러 번 확인할 때는 to_record()로 한 번 변환해 넘기면
+    이후 확인은 비트 연산만으로 처리됩니다.
+    """
 
     def __init__(self, config: AgentConfig = None):
         """
@@ -15,31 +23,90 @@ class PlanManager:
         """
         self.config = config or AgentConfig.default()
 
+    def to_record(self, plan: Optional[Mapping[str, Any]]) -> PlanRecord:
+        """
+        plan을 PlanRecord로 변환
+
+        Args:
+            plan: dict plan 또는 PlanRecord
+
+        Returns:
+            PlanRecord 인스턴스
+        """
+        return PlanRecord.from_plan(self.config, plan)
+
     def update(
         self,
         current_plan: Dict[str, Any],
-        extracted_slots: Dict[str, Any]
+        extracted_slots: Mapping[str, Any],
+        provenance: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         현재 plan을 추출된 슬롯으로 업데이트
 
+        가장 최근 사용자 발화의 값이 항상 기존 값을 대신합니다 (사용자의 정정은 신뢰도와
+        관계없이 반영). extracted_slots가 ExtractionResult이고 provenance가 있으면 새 값의
+        출처 정보를 기록하되, 기존 값과 같은 값이면 (예: LLM이 현재 plan을 그대로 돌려준
+        경우) 더 높은 신뢰도의 출처를 유지합니다. 신뢰도는 uncertain_slots에서 확인 질문
+        후보를 고를 때만 사용합니다.
+
         Args:
             current_plan: 현재 plan
-            extracted_slots: 추출된 슬롯 정보
+            extracted_slots: 추출된 슬롯 정보 (dict 또는 ExtractionResult)
+            provenance: 슬롯 → 출처 정보 (SlotValue.provenance(), 제자리에서 갱신)
 
         Returns:
             업데이트된 plan
         """
-        updated_plan = current_plan.copy()
-
-        # 새로운 슬롯 정보 병합
-        for key, value in extracted_slots.items():
-            if value:  # 값이 있는 경우만 업데이트
-                updated_plan[key] = value
+        updated_plan = dict(current_plan)
+
+        if not isinstance(extracted_slots, ExtractionResult):
+            # 새로운 슬롯 정보 병합
+            for key, value in extracted_slots.items():
+                if value:  # 값이 있는 경우만 업데이트
+                    updated_plan[key] = value
+                    if provenance is not None:
+                        provenance.pop(key, None)  # 출처를 알 수 없는 값
+            return updated_plan
+
+        for key, item in extracted_slots.items():
+            if not item.value:
+                continue
+            if provenance is not None:
+                previous = provenance.get(key)
+                if not (
+                    previous is not None and updated_plan.get(key) == item.value
+                    and item.confidence < previous["confidence"]
+                ):
+                    provenance[key] = item.provenance()
+            updated_plan[key] = item.value
 
         return updated_plan
 
-    def is_complete(self, plan: Dict[str, Any]) -> bool:
+    def uncertain_slots(
+        self,
+        plan: Mapping[str, Any],
+        provenance: Mapping[str, Mapping[str, Any]],
+        threshold: float
+    ) -> List[str]:
+        """
+        채워졌지만 신뢰도가 기준보다 낮은 슬롯 (확인 질문 후보, 스키마 순서)
+
+        Args:
+            plan: 현재 plan
+            provenance: 슬롯 → 출처 정보
+            threshold: 신뢰도 기준
+
+        Returns:
+            슬롯 이름 목록
+        """
+        return [
+            slot for slot in self.config.all_slots
+            if plan.get(slot) and slot in provenance
+            and provenance[slot]["confidence"] < threshold
+        ]
+
+    def is_complete(self, plan: Mapping[str, Any]) -> bool:
         """
         Plan이 완성되었는지 확인
 
@@ -49,12 +116,9 @@ class PlanManager:
         Returns:
             완성 여부
         """
-        return all(
-            slot in plan and plan[slot]
-            for slot in self.config.required_slots
-        )
+        return self.to_record(plan).is_complete()
 
-    def get_missing_slots(self, plan: Dict[str, Any]) -> List[str]:
+    def get_missing_slots(self, plan: Mapping[str, Any]) -> List[str]:
         """
         누락된 필수 슬롯 목록 반환
 
@@ -64,32 +128,18 @@ class PlanManager:
         Returns:
             누락된 슬롯 목록
         """
-        missing = []
-
-        for slot in self.config.required_slots:
-            if slot not in plan or not plan[slot]:
-                missing.append(slot)
-
-        return missing
+        return self.to_record(plan).missing_required()
 
-    def get_next_slot_to_collect(self, plan: Dict[str, Any]) -> str:
+    def get_next_slot_to_collect(self, plan: Mapping[str, Any]) -> str:
         """
         다음에 수집할 슬롯 결정
 
+        필수 슬롯 우선, 그 다음 선택 슬롯 (스키마 순서)
+
         Args:
             plan: 현재 plan
 
         Returns:
             다음 슬롯 이름 또는 None
         """
-        # 필수 슬롯 우선
-        for slot in self.config.required_slots:
-            if slot not in plan or not plan[slot]:
-                return slot
-
-        # 선택 슬롯
-        for slot in self.config.optional_slots:
-            if slot not in plan or not plan[slot]:
-                return slot
-
-        return None
+        return self.to_record(plan).next_slot()
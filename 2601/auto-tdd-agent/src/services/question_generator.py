@@ -2,28 +2,46 @@
 질문 생성 서비스
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
+from ..core.config import AgentConfig
+from ..core.plan import PlanRecord, next_slot_for_mask
 from ..utils.prompt_loader import PromptLoader
 from ..utils.llm_client import get_llm_client
+from ..utils.rate_limiter import PRIORITY_LOW
+from .extraction_spec import ExtractionSpec, load_extraction_spec
 
 
 class QuestionGenerator:
     """질문 생성 서비스"""
 
-    def __init__(self, use_llm: bool = False):
+    def __init__(
+        self,
+        use_llm: bool = False,
+        config: AgentConfig = None,
+        spec: ExtractionSpec = None,
+        locale: Optional[str] = None,
+    ):
         """
         초기화
 
         Args:
             use_llm: LLM 사용 여부 (False인 경우 규칙 기반)
+            config: Agent 설정 (None인 경우 기본 설정 사용)
+            spec: 질문 템플릿이 담긴 추출 규칙 명세 (None인 경우 data/extraction_rules.json)
+            locale: 질문 로케일 (None인 경우 환경 변수 또는 명세 기본값)
         """
+        self.config = config or AgentConfig.default()
+        self.spec = spec or load_extraction_spec()
+        self.locale = self.spec.resolve_locale(locale)
         self.prompt_loader = PromptLoader()
         self.use_llm = use_llm
         self.llm = None
 
         if use_llm:
             try:
-                self.llm = get_llm_client()
+                # 한도에 가까워지면 응답 파싱이 먼저 호출하도록 낮은 우선순위
+                self.llm = get_llm_client(priority=PRIORITY_LOW)
             except ValueError as e:
                 print(f"경고: LLM 초기화 실패 - {e}")
                 print("규칙 기반 모드로 전환합니다.")
@@ -44,6 +62,18 @@ class QuestionGenerator:
         else:
             return self._generate_with_rules(current_plan)
 
+    def next_slot(self, current_plan: Dict[str, Any]) -> Optional[str]:
+        """
+        다음 질문이 물어볼 슬롯 (답변을 그 슬롯 우선으로 파싱하기 위해 메시지에 기록)
+
+        Args:
+            current_plan: 현재 수집된 plan
+
+        Returns:
+            슬롯 이름 또는 모두 수집되었으면 None
+        """
+        return PlanRecord.from_plan(self.config, current_plan).next_slot()
+
     def _generate_with_llm(self, current_plan: Dict[str, Any]) -> str:
         """
         LLM을 사용하여 질문 생성
@@ -54,10 +84,11 @@ class QuestionGenerator:
         Returns:
             생성된 질문
         """
-        prompt = self.prompt_loader.load_question_prompt(current_plan)
+        # 고정 system 프리픽스 + 가변 user 메시지
+        messages = self.prompt_loader.load_question_messages(current_plan)
 
         try:
-            response = self.llm.invoke(prompt)
+            response = self.llm.invoke(messages)
             # IPC 클라이언트는 문자열을 반환, ChatOpenAI는 객체를 반환
             if isinstance(response, str):
                 return response.strip()
@@ -78,22 +109,9 @@ class QuestionGenerator:
         Returns:
             생성된 질문
         """
-        # 수집되지 않은 필수 슬롯 확인
-        required_slots = ["destination", "start_date", "duration"]
-
-        for slot in required_slots:
-            if slot not in current_plan:
-                return self._generate_slot_question(slot)
-
-        # 모든 필수 슬롯이 수집되면 선택 슬롯 확인
-        optional_slots = ["budget", "companions", "purpose"]
-
-        for slot in optional_slots:
-            if slot not in current_plan:
-                return self._generate_slot_question(slot)
-
-        # 모든 정보가 수집되면 완료 메시지
-        return "여행 계획이 완료되었습니다."
+        # 질문은 채워진 슬롯 집합에만 의존하므로 비트마스크를 캐시 키로 사용
+        record = PlanRecord.from_plan(self.config, current_plan)
+        return _rule_question(self.config, self.spec, self.locale, record.mask)
 
     def _generate_slot_question(self, slot: str) -> str:
         """
@@ -103,15 +121,29 @@ class QuestionGenerator:
             slot: 슬롯 이름
 
         Returns:
-            질문 문자열
+            질문 문자열 (명세의 질문 템플릿)
         """
-        questions = {
-            "destination": "어디로 여행을 가고 싶으신가요?",
-            "start_date": "언제 출발하실 예정인가요?",
-            "duration": "여행 기간은 며칠인가요?",
-            "budget": "예산은 얼마 정도 생각하고 계신가요?",
-            "companions": "누구와 함께 가시나요?",
-            "purpose": "여행의 목적은 무엇인가요?",
-        }
-
-        return questions.get(slot, "추가 정보를 알려주세요.")
+        return self.spec.question(slot, self.locale)
+
+
+@lru_cache(maxsize=1024)
+def _rule_question(config: AgentConfig, spec: ExtractionSpec, locale: str, mask: int) -> str:
+    """
+    채워진 슬롯 비트마스크에 대한 규칙 기반 질문
+
+    Args:
+        config: Agent 설정
+        spec: 질문 템플릿이 담긴 추출 규칙 명세
+        locale: 질문 로케일
+        mask: 채워진 슬롯 비트마스크
+
+    Returns:
+        질문 문자열
+    """
+    # 수집되지 않은 슬롯 중 스키마 순서상 첫 번째 (필수 슬롯 우선)
+    slot = next_slot_for_mask(config, mask)
+    if slot is not None:
+        return spec.question(slot, locale)
+
+    # 모든 정보가 수집되면 완료 메시지
+    return spec.message("complete", locale)
@@ -2,37 +2,97 @@
 응답 파싱 서비스
 """
 
-import re
+import datetime
 import json
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+from ..core.env_config import EnvConfig
 from ..utils.prompt_loader import PromptLoader
 from ..utils.llm_client import get_llm_client
+from ..utils.rate_limiter import PRIORITY_HIGH
+from .extraction_result import SOURCE_CACHE, SOURCE_LLM, ExtractionResult
+from .extraction_spec import ExtractionSpec
+from .rule_engine import get_rule_engine
+from .slot_tagger import SlotTagger, load_slot_tagger
+
+# 같은 (모델, 프롬프트 버전, 응답, plan)에 대한 LLM 결과 캐시 크기 (temperature 0이므로 결과가 같음)
+_LLM_CACHE_SIZE = 256
+_llm_cache: "OrderedDict[Tuple[str, str, str, str], ExtractionResult]" = OrderedDict()
+_llm_cache_lock = threading.Lock()
+_parse_log_lock = threading.Lock()
+
+
+def _model_identity(llm: Any) -> str:
+    """
+    LLM 캐시 키용 모델 식별자
+
+    한도 래퍼(RateLimitedLLM)는 안쪽 클라이언트 기준이며, 모델 이름이나 IPC 소켓 경로를
+    알 수 없는 클라이언트는 객체마다 다른 식별자를 씁니다.
+    """
+    inner = getattr(llm, "llm", llm)
+    name = getattr(inner, "model_name", None) or getattr(inner, "socket_path", None)
+    if isinstance(name, str):
+        return f"{type(inner).__qualname__}:{name}"
+    return f"{type(inner).__qualname__}@{id(inner):x}"
+
+
+def _record_llm_parse(user_response: str, current_plan: Optional[Dict[str, Any]], values: Dict[str, Any]):
+    """LLM 파싱 결과를 슬롯 태거 학습 데이터로 기록 (LLM_PARSE_LOG가 설정된 경우)"""
+    record = {"utterance": user_response, "plan": current_plan or {}, "slots": values}
+    line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+    with _parse_log_lock:
+        try:
+            with open(EnvConfig.LLM_PARSE_LOG, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            print(f"경고: LLM 파싱 기록 실패 - {e}")
 
 
 class ResponseParser:
     """응답 파싱 서비스"""
 
-    def __init__(self, use_llm: bool = False):
+    def __init__(
+        self,
+        use_llm: bool = False,
+        spec: ExtractionSpec = None,
+        tagger: Optional[SlotTagger] = None,
+    ):
         """
         초기화
 
         Args:
             use_llm: LLM 사용 여부 (False인 경우 규칙 기반)
+            spec: 추출 규칙 명세 (None인 경우 data/extraction_rules.json)
+            tagger: LLM 전에 시도할 로컬 슬롯 태거 (None인 경우 SLOT_TAGGER_PATH의 모델, 없으면 사용 안 함)
         """
         self.prompt_loader = PromptLoader()
+        self.rule_engine = get_rule_engine(spec)
         self.use_llm = use_llm
         self.llm = None
+        self.tagger = tagger
+        if tagger is None and use_llm and EnvConfig.SLOT_TAGGER_PATH:
+            try:
+                self.tagger = load_slot_tagger(Path(EnvConfig.SLOT_TAGGER_PATH))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"경고: 슬롯 태거 로드 실패 - {e}")
+        self.tagger_min_confidence = EnvConfig.SLOT_TAGGER_MIN_CONFIDENCE
 
         if use_llm:
             try:
-                self.llm = get_llm_client(temperature=0.0)
+                self.llm = get_llm_client(temperature=0.0, priority=PRIORITY_HIGH)
             except ValueError as e:
                 print(f"경고: LLM 초기화 실패 - {e}")
                 print("규칙 기반 모드로 전환합니다.")
                 self.use_llm = False
 
     def parse(
-        self, user_response: str, current_plan: Dict[str, Any] = None
+        self,
+        user_response: str,
+        current_plan: Dict[str, Any] = None,
+        reference_date: Optional[datetime.date] = None,
+        pending_slot: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         사용자 응답에서 슬롯 정보 추출
@@ -40,32 +100,125 @@ class ResponseParser:
         Args:
             user_response: 사용자 응답
             current_plan: 현재 수집된 plan (선택적)
+            reference_date: "내일", "다음 주 금요일" 등의 해석 기준일 (None인 경우 오늘)
+            pending_slot: 직전 질문이 물어본 슬롯 (답변을 이 슬롯 우선으로 해석)
 
         Returns:
             추출된 슬롯 정보 딕셔너리
         """
+        return self.parse_detailed(
+            user_response, current_plan, reference_date, pending_slot
+        ).to_dict()
+
+    def parse_detailed(
+        self,
+        user_response: str,
+        current_plan: Dict[str, Any] = None,
+        reference_date: Optional[datetime.date] = None,
+        pending_slot: Optional[str] = None,
+    ) -> ExtractionResult:
+        """
+        사용자 응답에서 슬롯 정보 추출 (값마다 신뢰도/출처/구간 포함)
+
+        Args:
+            user_response: 사용자 응답
+            current_plan: 현재 수집된 plan (선택적)
+            reference_date: "내일", "다음 주 금요일" 등의 해석 기준일 (None인 경우 오늘)
+            pending_slot: 직전 질문이 물어본 슬롯 (답변을 이 슬롯 우선으로 해석)
+
+        Returns:
+            ExtractionResult (규칙 값은 규칙 ID와 구간, LLM 값은 고정 신뢰도,
+            로컬 태거 값은 태그 확률)
+        """
+        # 붙여 넣은 긴 텍스트가 워커를 붙잡지 않도록 입력 크기 제한
+        if len(user_response) > EnvConfig.MAX_INPUT_CHARS:
+            user_response = user_response[:EnvConfig.MAX_INPUT_CHARS]
+
         if self.use_llm and self.llm:
-            return self._parse_with_llm(user_response, current_plan)
+            if pending_slot:
+                # 질문한 슬롯만 답한 응답은 LLM을 호출하지 않음
+                answer = self.rule_engine.extract_answer_detailed(
+                    user_response, pending_slot, reference_date
+                )
+                if answer is not None:
+                    return answer
+            if self.tagger is not None:
+                local = self._parse_with_tagger(user_response, reference_date, pending_slot)
+                if local is not None:
+                    return local
+            return self._parse_with_llm(user_response, current_plan, reference_date, pending_slot)
         else:
-            return self._parse_with_rules(user_response)
+            return self._parse_with_rules(user_response, reference_date, pending_slot)
+
+    def _parse_with_tagger(
+        self,
+        user_response: str,
+        reference_date: Optional[datetime.date] = None,
+        pending_slot: Optional[str] = None,
+    ) -> Optional[ExtractionResult]:
+        """
+        로컬 슬롯 태거로 응답 파싱 (확실하지 않으면 None을 돌려 LLM으로 넘김)
+
+        태거는 발화에 그대로 나오는 값만 학습하므로 날짜처럼 정규화되는 슬롯은 "O"로
+        태그합니다. 찾은 값이 모두 확실해도 "O" 토큰 중 불확실한 것이 있거나, 규칙 엔진이
+        태거가 돌려주지 않은 슬롯의 후보를 찾으면 값을 놓친 것으로 보고 LLM을 호출합니다.
+
+        Args:
+            user_response: 사용자 응답
+            reference_date: 상대 날짜 해석 기준일 (None인 경우 오늘)
+            pending_slot: 직전 질문이 물어본 슬롯
+
+        Returns:
+            ExtractionResult 또는 None (LLM 호출 필요)
+        """
+        threshold = self.tagger_min_confidence
+        local, outside = self.tagger.extract_with_outside(user_response)
+        if not local or local.uncertain(threshold) or outside < threshold:
+            return None
+        candidates = self.rule_engine.extract_candidates(user_response, reference_date, pending_slot)
+        if any(slot not in local for slot in candidates):
+            return None
+        return local
 
     def _parse_with_llm(
-        self, user_response: str, current_plan: Dict[str, Any] = None
-    ) -> Dict[str, Any]:
+        self,
+        user_response: str,
+        current_plan: Dict[str, Any] = None,
+        reference_date: Optional[datetime.date] = None,
+        pending_slot: Optional[str] = None,
+    ) -> ExtractionResult:
         """
-        LLM을 사용하여 응답 파싱
+        LLM을 사용하여 응답 파싱 (같은 모델/파서 프롬프트/응답/plan의 이전 결과는 캐시에서 재사용)
+
+        LLM 호출이나 응답 해석에 실패하면 같은 기준일/질문 슬롯으로 규칙 파싱합니다.
 
         Args:
             user_response: 사용자 응답
             current_plan: 현재 수집된 plan (선택적)
+            reference_date: 규칙 파싱으로 넘어갈 때의 상대 날짜 해석 기준일
+            pending_slot: 규칙 파싱으로 넘어갈 때의 직전 질문 슬롯
 
         Returns:
             추출된 슬롯 정보
         """
-        prompt = self.prompt_loader.load_parser_prompt(user_response, current_plan)
+        template = self.prompt_loader.get_template("slot_updater")
+        key = (
+            _model_identity(self.llm),
+            template.content_hash if template is not None else "",
+            user_response,
+            json.dumps(current_plan or {}, sort_keys=True, ensure_ascii=False, default=str),
+        )
+        with _llm_cache_lock:
+            cached = _llm_cache.get(key)
+            if cached is not None:
+                _llm_cache.move_to_end(key)
+                return cached.with_source(SOURCE_CACHE)
+
+        # 고정 system 프리픽스 + 가변 user 메시지
+        messages = self.prompt_loader.load_parser_messages(user_response, current_plan)
 
         try:
-            response = self.llm.invoke(prompt)
+            response = self.llm.invoke(messages)
             # IPC 클라이언트는 문자열을 반환, ChatOpenAI는 객체를 반환
             if isinstance(response, str):
                 content = response.strip()
@@ -83,234 +236,44 @@ class ResponseParser:
 
             # JSON 파싱
             try:
-                return json.loads(content)
+                values = json.loads(content)
             except json.JSONDecodeError:
                 print(f"경고: JSON 파싱 실패 - {content}")
-                return self._parse_with_rules(user_response)
+                return self._parse_with_rules(user_response, reference_date, pending_slot)
         except Exception as e:
             print(f"경고: LLM 호출 실패 - {e}")
-            return self._parse_with_rules(user_response)
-
-    def _parse_with_rules(self, user_response: str) -> Dict[str, Any]:
+            return self._parse_with_rules(user_response, reference_date, pending_slot)
+
+        if not isinstance(values, dict):
+            print(f"경고: 슬롯 객체가 아닌 응답 - {content}")
+            return self._parse_with_rules(user_response, reference_date, pending_slot)
+
+        if EnvConfig.LLM_PARSE_LOG:
+            _record_llm_parse(user_response, current_plan, values)
+
+        result = ExtractionResult.from_values(values, SOURCE_LLM)
+        with _llm_cache_lock:
+            _llm_cache[key] = result
+            if len(_llm_cache) > _LLM_CACHE_SIZE:
+                _llm_cache.popitem(last=False)
+        return result
+
+    def _parse_with_rules(
+        self,
+        user_response: str,
+        reference_date: Optional[datetime.date] = None,
+        pending_slot: Optional[str] = None,
+    ) -> ExtractionResult:
         """
         규칙 기반으로 응답 파싱
 
         Args:
             user_response: 사용자 응답
+            reference_date: 상대 날짜 해석 기준일 (None인 경우 오늘)
+            pending_slot: 직전 질문이 물어본 슬롯 (None인 경우 모든 슬롯 동등)
 
         Returns:
             추출된 슬롯 정보
         """
-        extracted = {}
-
-        # 목적지 추출
-        destination = self._extract_destination(user_response)
-        if destination:
-            extracted["destination"] = destination
-
-        # 날짜 추출
-        start_date = self._extract_date(user_response)
-        if start_date:
-            extracted["start_date"] = start_date
-
-        # 기간 추출
-        duration = self._extract_duration(user_response)
-        if duration:
-            extracted["duration"] = duration
-
-        # 예산 추출
-        budget = self._extract_budget(user_response)
-        if budget:
-            extracted["budget"] = budget
-
-        # 동반자 추출
-        companions = self._extract_companions(user_response)
-        if companions:
-            extracted["companions"] = companions
-
-        # 여행 목적 추출
-        purpose = self._extract_purpose(user_response)
-        if purpose:
-            extracted["purpose"] = purpose
-
-        return extracted
-
-    def _extract_destination(self, text: str) -> str:
-        """
-        목적지 추출
-
-        Args:
-            text: 입력 텍스트
-
-        Returns:
-            추출된 목적지 또는 None
-        """
-        # 간단한 패턴 매칭 (실제로는 LLM 사용 권장)
-        patterns = [
-            r"(제주도?|부산|서울|강릉|경주|전주|여수|속초|대구|광주|인천|대전)",
-            r"([가-힣]{2,})(?:로|에|으로)\s*(?:가|여행)",  # 최소 2글자 이상
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                destination = match.group(1)
-                # "일", "월" 같은 단일 글자나 시간 관련 단어 제외
-                if len(destination) >= 2 and destination not in [
-                    "오늘",
-                    "내일",
-                    "모레",
-                ]:
-                    return destination
-
-        return None
-
-    def _extract_date(self, text: str) -> str:
-        """
-        날짜 추출
-
-        Args:
-            text: 입력 텍스트
-
-        Returns:
-            YYYY-MM-DD 형식의 날짜 또는 None
-        """
-        # YYYY-MM-DD 형식
-        pattern = r"(\d{4})-(\d{1,2})-(\d{1,2})"
-        match = re.search(pattern, text)
-
-        if match:
-            year, month, day = match.groups()
-            return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-
-        # "3월 15일" 형식 (현재 연도 기준)
-        pattern = r"(\d{1,2})월\s*(\d{1,2})일"
-        match = re.search(pattern, text)
-
-        if match:
-            month, day = match.groups()
-            # 현재는 2026년으로 가정
-            return f"2026-{month.zfill(2)}-{day.zfill(2)}"
-
-        return None
-
-    def _extract_duration(self, text: str) -> str:
-        """
-        기간 추출
-
-        Args:
-            text: 입력 텍스트
-
-        Returns:
-            추출된 기간 또는 None
-        """
-        # "3박 4일" 형식
-        pattern = r"(\d+)박\s*(\d+)일"
-        match = re.search(pattern, text)
-
-        if match:
-            nights, days = match.groups()
-            return f"{nights}박 {days}일"
-
-        # "3일" 형식
-        pattern = r"(\d+)일"
-        match = re.search(pattern, text)
-
-        if match:
-            days = match.group(1)
-            return f"{days}일"
-
-        return None
-
-    def _extract_budget(self, text: str) -> str:
-        """
-        예산 추출
-
-        Args:
-            text: 입력 텍스트
-
-        Returns:
-            추출된 예산 또는 None
-        """
-        # "50만원" 또는 "50만 원" 형식 (공백 유무 모두 처리)
-        pattern = r"(\d+)\s*만\s*원?"
-        match = re.search(pattern, text)
-
-        if match:
-            amount = match.group(1)
-            return f"{amount}만원"
-
-        # "100만원" 형식 (공백 없음)
-        pattern = r"(\d+만원)"
-        match = re.search(pattern, text)
-
-        if match:
-            return match.group(1)
-
-        return None
-
-    def _extract_companions(self, text: str) -> str:
-        """
-        동반자 추출
-
-        Args:
-            text: 입력 텍스트
-
-        Returns:
-            추출된 동반자 정보 또는 None
-        """
-        # 동반자 관련 키워드 패턴
-        patterns = [
-            r"(혼자|혼자서|나 혼자|혼자 여행)",
-            r"(친구\s*\d*명?|친구랑|친구와|친구들?)",
-            r"(가족|부모님|아이들?|아들|딸|형제|자매)",
-            r"(연인|남자친구|여자친구|배우자|부부)",
-            r"(동료|회사\s*동료|직장\s*동료)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-
-        return None
-
-    def _extract_purpose(self, text: str) -> str:
-        """
-        여행 목적 추출
-
-        Args:
-            text: 입력 텍스트
-
-        Returns:
-            추출된 여행 목적 또는 None
-        """
-        # 여행 목적 키워드 패턴
-        # 주의: "여행"은 일반적인 단어이므로 별도로 처리
-        patterns = [
-            r"(휴양|휴식|쉬|힐링|재충전)",
-            r"(관광|구경|볼거리|관람|탐방)",
-            r"(먹방|맛집|음식|미식|먹을거리)",
-            r"(액티비티|체험|모험|스포츠|서핑|등산|자전거)",
-            r"(문화|역사|박물관|미술관|전시|공연)",
-            r"(쇼핑|쇼핑하|구매|사고\s*싶)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-
-        # "여행"은 다른 목적 키워드가 없을 때만 매칭 (최후의 수단)
-        # "여행"이 문장 중간에 있고 "계획", "준비" 등과 함께 있으면 제외
-        if re.search(r"여행", text):
-            # "계획", "준비", "가자", "갈" 등이 있으면 greeting으로 간주
-            if re.search(r"(계획|준비|도와|가자|갈|가고|갈거|여행을|여행 계획)", text):
-                return None
-            # 순수하게 "휴양 여행", "관광 여행" 등으로 쓰인 경우만 허용
-            if re.search(r"(휴양\s*여행|관광\s*여행|먹방\s*여행|문화\s*여행)", text):
-                match = re.search(r"(휴양|관광|먹방|문화)", text)
-                if match:
-                    return match.group(1)
-
-        return None
+        # 모든 슬롯 규칙을 한 번의 스캔으로 처리 (질문한 슬롯이 있으면 그 슬롯 먼저)
+        return self.rule_engine.extract_detailed(user_response, reference_date, pending_slot)
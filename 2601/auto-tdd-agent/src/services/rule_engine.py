@@ -0,0 +1,1096 @@
+"""
+규칙 기반 슬롯 추출 엔진
+
+모든 슬롯 패턴을 하나의 정규식으로 미리 컴파일해 두고 발화를 한 번만
+스캔하여 슬롯 태그가 붙은 후보 구간을 모은 뒤, 한 번의 순회로 충돌을 해소합니다.
+기본 규칙은 data/extraction_rules.json에 선언되어 있습니다 (extraction_spec 참고).
+"""
+
+import datetime
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Tuple,
+)
+
+from ..core.env_config import EnvConfig
+from .date_resolver import today
+from .extraction_result import SOURCE_RULE, ExtractionResult, SlotValue
+from .gazetteer import fold_case
+from .text_normalizer import normalize_text
+
+if TYPE_CHECKING:
+    from .extraction_spec import ExtractionSpec
+    from .gazetteer import Gazetteer
+
+try:  # Python 3.11+
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
+# 신뢰도를 선언하지 않은 규칙의 신뢰도
+DEFAULT_CONFIDENCE = 0.9
+
+
+@dataclass(frozen=True)
+class SlotRule:
+    """
+    슬롯 추출 규칙
+
+    template은 패턴의 캡처 그룹을 위치 인자로 받는 str.format 템플릿입니다
+    (예: "{0}박 {1}일", "{0}-{1:0>2}-{2:0>2}"). normalize는 템플릿 결과에 적용할
+    슬롯 타입 정규화 함수입니다 (예: "100만원" → 금액 형식 정규화).
+    gazetteer가 있으면 pattern 대신 지명 사전의 가장 긴 일치를 후보로 사용합니다.
+    resolve는 선택된 후보 값을 기준일에 대해 해석하는 함수입니다
+    (예: "다음 주 금요일" → "2026-10-30", None을 돌려주면 후보를 버림).
+    targeted 규칙은 직전 질문이 그 슬롯을 물었을 때의 답변에만 적용되는 완화된
+    패턴입니다 (예: 기간 질문 뒤의 "4").
+    ambiguous는 일반 명사와 겹치는 지명 표기이며 (예: "공주", "파리"), 이런 표기는 바로 뒤가
+    context 패턴과 맞을 때만 후보로 인정합니다 (예: "공주로", "파리 여행").
+    confidence는 이 규칙으로 뽑은 값의 신뢰도이고, score가 있으면 resolve 전 후보 값과
+    기준일로 값마다 신뢰도를 계산합니다 (예: 날짜 표현 종류별 신뢰도).
+    """
+    rule_id: str
+    slot: str
+    pattern: str
+    template: str = "{0}"
+    reject: FrozenSet[str] = frozenset()  # 이 값으로 추출되면 버림
+    fallback: bool = False  # 다른 규칙으로 슬롯을 못 찾았을 때만 스캔
+    targeted: bool = False  # 그 슬롯을 물어본 직후의 답변에서만 스캔
+    normalize: Optional[Callable[[str], Any]] = None
+    gazetteer: Optional["Gazetteer"] = None
+    resolve: Optional[Callable[[Any, datetime.date], Any]] = None
+    confidence: float = DEFAULT_CONFIDENCE
+    score: Optional[Callable[[Any, datetime.date], Optional[float]]] = None
+    ambiguous: FrozenSet[str] = frozenset()  # 뒤에 context가 있어야 인정하는 지명 표기
+    context: Optional[Callable[..., Any]] = None  # ambiguous 표기 뒤를 확인하는 정규식 match
+
+
+class Candidate(NamedTuple):
+    """스캔 중 발견된 슬롯 후보 구간"""
+    slot: str
+    value: Any
+    rule_id: str
+    start: int
+    end: int
+    priority: int  # 같은 슬롯 안에서 규칙 우선순위 (낮을수록 우선)
+    confidence: float  # 규칙 신뢰도 (score가 있는 규칙은 resolve 시 다시 계산)
+
+
+_new_candidate = tuple.__new__
+
+_CATEGORY_CLASSES = {
+    _sre_parse.CATEGORY_DIGIT: r"\d",
+    _sre_parse.CATEGORY_SPACE: r"\s",
+    _sre_parse.CATEGORY_WORD: r"\w",
+}
+
+
+def _first_chars(pattern: str) -> Optional[FrozenSet[str]]:
+    """
+    패턴이 매치를 시작할 수 있는 첫 글자 집합 계산
+
+    Args:
+        pattern: 정규식 패턴
+
+    Returns:
+        문자 클래스 조각 집합 (예: {"\\d", "혼"}) 또는 계산할 수 없으면 None
+    """
+    result = _first_of_sequence(_sre_parse.parse(pattern))
+    if result is None:
+        return None
+    fragments, nullable = result
+    if nullable or not fragments:
+        return None  # 빈 문자열에 매치될 수 있는 패턴
+    return frozenset(fragments)
+
+
+def _required_chars(pattern: str) -> List[FrozenSet[str]]:
+    """
+    매치에 반드시 포함되는 글자 집합들 계산
+
+    최상위 항목 중 빈 매치가 불가능한 항목은 각각 자기 첫 글자 집합 중 하나를
+    반드시 소비합니다. 범위/카테고리가 없는 좁은 집합만 작은 순서로 돌려줍니다.
+
+    Args:
+        pattern: 정규식 패턴
+
+    Returns:
+        문자 클래스 조각 집합 목록 (작은 집합부터)
+    """
+    required = []
+    for op, av in _sre_parse.parse(pattern):
+        result = _first_of_item(op, av)
+        if result is None or result[1]:
+            continue
+        fragments = frozenset(result[0])
+        if fragments and all(_is_literal_fragment(f) for f in fragments):
+            required.append(fragments)
+    return sorted(required, key=len)
+
+
+def _top_level_branches(pattern: str) -> List[str]:
+    """
+    패턴을 최상위 대안(|)으로 나눔 (괄호/문자 클래스/이스케이프 안의 |는 무시)
+
+    Args:
+        pattern: 정규식 패턴
+
+    Returns:
+        대안 패턴 목록 (대안이 없으면 패턴 하나)
+    """
+    branches, depth, start, i = [], 0, 0, 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            if pattern.startswith("]", i + 1) or pattern.startswith("^]", i + 1):
+                i += 1 + (pattern[i + 1] == "^")  # 맨 앞의 "]"는 글자
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            branches.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    branches.append(pattern[start:])
+    return branches
+
+
+def _required_tail(pattern: str) -> Optional[str]:
+    """
+    맨 앞 그룹 뒤에 오는 패턴 꼬리 (전체 매치가 있으면 꼬리도 반드시 어딘가에 매치됨)
+
+    fallback 목적지 규칙처럼 "(지명 후보)(?:조사)\\s*(?:가|여행)" 꼴의 패턴은 앞 그룹이
+    넓어 finditer가 한글 위치마다 시도하지만, 꼬리는 드물게 맞으므로 꼬리 검색을 먼저 하면
+    대부분의 발화를 C 수준에서 바로 거를 수 있습니다. 꼬리가 앞 문맥에 의존하면
+    (후방 탐색/역참조/앵커) 따로 검색한 결과가 달라질 수 있으므로 쓰지 않습니다.
+
+    Args:
+        pattern: 정규식 패턴
+
+    Returns:
+        꼬리 패턴 또는 쓸 수 없으면 None
+    """
+    if not pattern.startswith("("):
+        return None
+    depth, i = 0, 0
+    in_class = False
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            i += 2
+            continue
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            if pattern.startswith("]", i + 1) or pattern.startswith("^]", i + 1):
+                i += 1 + (pattern[i + 1] == "^")  # 맨 앞의 "]"는 글자
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                break
+        i += 1
+    tail = pattern[i + 1:]
+    if not tail or len(_top_level_branches(pattern)) > 1:
+        return None
+    if re.search(r"\(\?<[=!]|\\[\dAbBZ]|[\^$]", tail):
+        return None
+    try:
+        if re.compile(tail).groups:
+            return None
+    except re.error:
+        return None
+    return tail if _first_chars(tail) is not None else None
+
+
+def _narrow_rule(rule: SlotRule, char: str) -> Optional[SlotRule]:
+    """
+    글자 하나로 시작할 수 있는 최상위 대안만 남긴 규칙
+
+    날짜 표현처럼 대안이 많은 규칙은 한 위치에서 모든 대안을 차례로 시도하므로, 그 위치의
+    첫 글자로 시작할 수 없는 대안을 미리 빼 둡니다. 빠진 대안은 그 위치에서 어차피 맞지 않고
+    남은 대안의 순서는 그대로이므로 결과는 같습니다. 캡처 그룹이 있는 패턴은 그룹 번호가
+    바뀌므로 그대로 둡니다.
+
+    Args:
+        rule: 정규식 규칙
+        char: 후보 위치의 글자
+
+    Returns:
+        좁힌 규칙 (좁힐 수 없으면 rule 그대로, 그 글자로 시작할 수 있는 대안이 없으면 None)
+    """
+    branches = _top_level_branches(rule.pattern)
+    if len(branches) < 2 or re.compile(rule.pattern).groups:
+        return rule
+    kept = []
+    for branch in branches:
+        first = _first_chars(branch)
+        if first is None or re.match(_char_class(first), char):
+            kept.append(branch)
+    if not kept:
+        return None
+    if len(kept) == len(branches):
+        return rule
+    return replace(rule, pattern="|".join(kept))
+
+
+def _is_literal_fragment(fragment: str) -> bool:
+    """re.escape된 글자 하나인지 (범위/카테고리가 아닌지)"""
+    return len(fragment) == 1 or (
+        len(fragment) == 2 and fragment[0] == "\\" and not fragment[1].isalnum()
+    )
+
+
+def _char_class(fragments: FrozenSet[str]) -> str:
+    """문자 클래스 조각 집합을 정규식 문자 클래스로 변환"""
+    return "[" + "".join(sorted(fragments)) + "]"
+
+
+def _first_of_sequence(items) -> Optional[Tuple[set, bool]]:
+    """연속 항목의 (첫 글자 조각 집합, 빈 매치 가능 여부)"""
+    fragments = set()
+    for op, av in items:
+        result = _first_of_item(op, av)
+        if result is None:
+            return None
+        item_fragments, nullable = result
+        fragments |= item_fragments
+        if not nullable:
+            return fragments, False
+    return fragments, True
+
+
+def _first_of_item(op, av) -> Optional[Tuple[set, bool]]:
+    """단일 항목의 (첫 글자 조각 집합, 빈 매치 가능 여부)"""
+    if op is _sre_parse.LITERAL:
+        return {re.escape(chr(av))}, False
+    if op is _sre_parse.IN:
+        fragments = set()
+        for item_op, item_av in av:
+            if item_op is _sre_parse.LITERAL:
+                fragments.add(re.escape(chr(item_av)))
+            elif item_op is _sre_parse.RANGE:
+                fragments.add(f"{re.escape(chr(item_av[0]))}-{re.escape(chr(item_av[1]))}")
+            elif item_op is _sre_parse.CATEGORY and item_av in _CATEGORY_CLASSES:
+                fragments.add(_CATEGORY_CLASSES[item_av])
+            else:
+                return None  # 부정 클래스 등은 범위가 너무 넓음
+        return fragments, False
+    if op is _sre_parse.SUBPATTERN:
+        return _first_of_sequence(av[-1])
+    if op is _sre_parse.BRANCH:
+        fragments, nullable = set(), False
+        for alternative in av[1]:
+            result = _first_of_sequence(alternative)
+            if result is None:
+                return None
+            fragments |= result[0]
+            nullable = nullable or result[1]
+        return fragments, nullable
+    if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+        low, _high, item = av
+        result = _first_of_sequence(item)
+        if result is None:
+            return None
+        return result[0], result[1] or low == 0
+    if op is _sre_parse.AT or op is _sre_parse.ASSERT_NOT:
+        return set(), True  # 앵커와 부정 탐색은 글자를 소비하지 않음
+    return None
+
+
+# 역추적 위험 검사에서 두 글자 집합이 겹치는지 확인할 때 시험하는 대표 글자
+_PROBE_CHARS = " \t\n0_aZ가힣.,!?~-"
+
+
+def find_backtracking_risks(pattern: str) -> List[str]:
+    """
+    입력 길이에 대해 지수/다항 시간 역추적을 일으킬 수 있는 구조 찾기
+
+    무한 반복 안의 무한 반복(예: "(a+)+"), 빈 매치 가능한 항목만 사이에 두고
+    같은 글자를 받을 수 있는 무한 반복이 이어지는 경우(예: "\\s*(?:요)?\\s*"),
+    그리고 패턴이 무한 반복으로 시작하는 경우(예: "(\\d+)일")를 찾습니다.
+    마지막 경우는 한 번의 시도는 선형이지만 검색이 같은 글자 연속의 모든 위치에서
+    다시 시도하므로 제곱 시간이 됩니다 ("\\d{1,3}"처럼 상한을 두면 안전).
+    정적 근사이므로 위험하지 않은 패턴을 보수적으로 표시할 수 있습니다.
+
+    Args:
+        pattern: 정규식 패턴
+
+    Returns:
+        위험 설명 목록 (안전하면 빈 목록)
+    """
+    risks: List[str] = []
+    parsed = _sre_parse.parse(pattern)
+    _check_leading(parsed, risks)
+    _check_sequence(parsed, risks, nested=False)
+    return risks
+
+
+def _check_leading(items, risks: List[str]) -> bool:
+    """
+    매치 시작 위치에서 처음 시도되는 무한 반복 검사
+
+    Returns:
+        뒤 항목도 시작 위치에서 시도될 수 있으면 True (앞 항목이 모두 빈 매치 가능)
+    """
+    for op, av in items:
+        if op is _sre_parse.AT:
+            if av in (_sre_parse.AT_BEGINNING, _sre_parse.AT_BEGINNING_STRING):
+                return False  # 시작 위치가 고정된 패턴
+            continue
+        if op in (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+            continue
+        if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            low, high, body = av
+            if high == _sre_parse.MAXREPEAT:
+                risks.append(f"패턴을 시작하는 무한 반복: {_repeat_repr(op, av)}")
+                return False
+            if not _check_leading(body, risks) and low > 0:
+                return False
+            continue
+        if op is _sre_parse.SUBPATTERN:
+            if not _check_leading(av[-1], risks):
+                return False
+            continue
+        if op is _sre_parse.BRANCH:
+            nullable = False
+            for alternative in av[1]:
+                nullable = _check_leading(alternative, risks) or nullable
+            if not nullable:
+                return False
+            continue
+        return False
+    return True
+
+
+def _check_sequence(items, risks: List[str], nested: bool):
+    """연속 항목 검사 (nested: 바깥에 무한 반복이 있는지)"""
+    previous = None  # 직전 무한 반복의 첫 글자 조각 (사이 항목이 모두 빈 매치 가능할 때만 유지)
+    for op, av in items:
+        if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            low, high, body = av
+            unbounded = high == _sre_parse.MAXREPEAT
+            _check_sequence(body, risks, nested or unbounded)
+            if unbounded:
+                if nested:
+                    risks.append(f"중첩된 무한 반복: {_repeat_repr(op, av)}")
+                first = _first_of_sequence(body)
+                fragments = None if first is None else frozenset(first[0])
+                if previous is not None and _chars_overlap(previous, fragments):
+                    risks.append(f"겹치는 글자를 받는 인접한 무한 반복: {_repeat_repr(op, av)}")
+                previous = fragments if fragments is not None else frozenset()
+                continue
+            if low == 0:
+                continue  # 빈 매치 가능한 선택 항목은 인접 관계를 끊지 않음
+        elif op is _sre_parse.SUBPATTERN:
+            _check_sequence(av[-1], risks, nested)
+        elif op is _sre_parse.BRANCH:
+            for alternative in av[1]:
+                _check_sequence(alternative, risks, nested)
+        elif op in (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+            _check_sequence(av[1], risks, nested)
+            continue  # 전방/후방 탐색은 글자를 소비하지 않음
+        result = _first_of_item(op, av)
+        if result is None or not result[1]:
+            previous = None
+
+
+def _chars_overlap(first: FrozenSet[str], second: Optional[FrozenSet[str]]) -> bool:
+    """두 첫 글자 조각 집합이 같은 글자를 받을 수 있는지 (모르면 겹친다고 봄)"""
+    if not first or second is None or not second:
+        return True
+    first_class, second_class = re.compile(_char_class(first)), re.compile(_char_class(second))
+    probes = set(_PROBE_CHARS)
+    for fragment in first | second:
+        if _is_literal_fragment(fragment):
+            probes.add(fragment[-1])
+    return any(first_class.match(c) and second_class.match(c) for c in probes)
+
+
+def _repeat_repr(op, av) -> str:
+    """위험 설명에 넣을 반복 항목 표기 (예: "[\\s]{0,}")"""
+    low, high, body = av
+    first = _first_of_sequence(body)
+    chars = _char_class(frozenset(first[0])) if first and first[0] else "(...)"
+    high = "" if high == _sre_parse.MAXREPEAT else high
+    lazy = "?" if op is _sre_parse.MIN_REPEAT else ""
+    return f"{chars}{{{low},{high}}}{lazy}"
+
+
+class _CompiledRules:
+    """하나의 결합 정규식과 그룹 번호 → 규칙 매핑"""
+
+    __slots__ = ("rules", "regex", "by_group")
+
+    def __init__(self, rules: Sequence[Tuple[int, SlotRule]]):
+        parts = []
+        by_group = {}
+        group = 1
+
+        for priority, rule in rules:
+            compiled = re.compile(rule.pattern)
+            if compiled.groupindex:
+                raise ValueError(f"{rule.rule_id}: 이름 있는 그룹은 사용할 수 없습니다")
+            # 규칙 전체를 감싸는 그룹 번호와 내부 캡처 그룹 범위
+            first, last = group, group + compiled.groups
+            if last == first:
+                first, last = first - 1, first  # 캡처 그룹이 없으면 전체 매치를 값으로
+            # "{0}" 템플릿은 format 호출 없이 그룹 값을 그대로 사용
+            formatter = None if rule.template == "{0}" and last - first == 1 else rule.template.format
+            by_group[group] = (rule, priority, first, last, formatter)
+            parts.append(f"({rule.pattern})")
+            group += 1 + compiled.groups
+
+        self.rules = tuple(rules)
+        self.regex = re.compile("|".join(parts)) if parts else None
+        self.by_group = by_group
+
+    def candidate(self, match: "re.Match") -> Optional[Candidate]:
+        """
+        매치 결과를 후보로 변환
+
+        Args:
+            match: 결합 정규식의 매치 결과
+
+        Returns:
+            후보 또는 reject 값이면 None
+        """
+        rule, priority, first, last, formatter = self.by_group[match.lastindex]
+        if formatter is None:
+            value = match.group(last)
+        else:
+            value = formatter(*match.groups()[first:last])
+        if value in rule.reject:
+            return None
+        if rule.normalize is not None:
+            value = rule.normalize(value)
+        start, end = match.span()
+        return Candidate(rule.slot, value, rule.rule_id, start, end, priority, rule.confidence)
+
+
+# 첫 글자 집합이 이보다 넓은 규칙(예: 날짜 표현)은 후보 위치를 규칙 패턴 자체로 찾음
+_WIDE_FIRST_CHARS = 16
+# 긴 입력을 나눠 스캔할 때 이웃 구간과 겹치는 길이 (한 표현의 최대 길이로 가정)
+_WINDOW_OVERLAP = 64
+
+
+class _Scanner:
+    """
+    첫 글자 인덱스를 사용하는 단일 패스 스캐너
+
+    CPython의 정규식 엔진은 그룹으로 시작하는 대안 묶음에 대해 첫 글자 검색
+    최적화를 하지 못해 모든 위치에서 모든 대안을 시도합니다. 그래서 규칙들의
+    첫 글자 집합을 합친 문자 클래스로 후보 위치만 찾고, 각 위치에서는 그 글자로
+    시작할 수 있는 규칙만 규칙 순서대로 시도합니다. 연속된 정규식 규칙은 하나의
+    결합 정규식으로 시도하므로, 결과는 전체 결합 정규식으로 finditer한 것과 같습니다.
+
+    첫 글자 집합이 넓은 규칙(예: 날짜 표현)이나 지명 사전은 흔한 음절로 시작하므로
+    첫 글자만으로 후보 위치를 찾으면 파이썬 수준의 시도가 너무 많아집니다. 이런 규칙은
+    "첫 글자 전방 탐색 + 규칙 패턴", 지명 사전은 "지명 앞 두 글자" 대안으로 후보 위치
+    검색식에 넣어 실제로 맞을 수 있는 위치만 C 수준에서 찾습니다.
+    """
+
+    __slots__ = ("_all", "_rules", "_classes", "_prefix", "_guards", "_dispatch")
+
+    def __init__(self, rules: Sequence[Tuple[int, SlotRule]]):
+        regex_rules = [entry for entry in rules if entry[1].gazetteer is None]
+        self._all = _CompiledRules(regex_rules)
+        self._rules = tuple(rules)
+        self._dispatch: Dict[str, tuple] = {}
+
+        if len(rules) == 1 and regex_rules:
+            # 정규식 규칙이 하나뿐이면 정규식 엔진의 finditer로 전체 스캔
+            self._classes = None
+            self._prefix = None
+            # 꼬리 패턴이나 필수 글자 집합이 없는 입력은 스캔하지 않음
+            # (예: fallback 목적지 규칙은 "로/에/으로" 뒤에 "가/여행"이 와야 함)
+            tail = _required_tail(rules[0][1].pattern)
+            if tail is not None:
+                self._guards = (re.compile(tail),)
+            else:
+                self._guards = tuple(
+                    re.compile(_char_class(g)) for g in _required_chars(rules[0][1].pattern)
+                )
+            return
+        self._guards = ()
+
+        # 규칙별 첫 글자 클래스 (None: 첫 글자를 알 수 없어 모든 위치에서 시도)
+        self._classes = []
+        firsts = []
+        narrow = set()
+        exact = []  # 실제로 맞을 수 있는 위치만 찾는 검색식 대안
+        for _, rule in rules:
+            if rule.gazetteer is not None:
+                first = rule.gazetteer.first_chars()
+                if rule.gazetteer.loose_prefix is not None:
+                    # 앞 두 글자는 위치마다 prefix로 다시 확인하므로 대안이 적은 느슨한 검색식 사용
+                    exact.append(f"(?:{rule.gazetteer.loose_prefix.pattern})")
+            else:
+                first = _first_chars(rule.pattern)
+                if first is None:
+                    exact.append(f"(?:{rule.pattern})")
+                elif len(first) > _WIDE_FIRST_CHARS:
+                    exact.append(f"(?={_char_class(first)})(?:{rule.pattern})")
+                else:
+                    narrow.update(first)
+            firsts.append(first)
+            self._classes.append(re.compile(_char_class(first)) if first else None)
+
+        parts = ([_char_class(frozenset(narrow))] if narrow else []) + exact
+        if not parts:
+            self._prefix = None
+        elif not exact:
+            self._prefix = re.compile(parts[0])
+        elif all(firsts):
+            # "[모든 첫 글자](?<=(?=대안들).)": 정규식 엔진이 첫 글자 집합으로 빠르게 건너뛰고
+            # 첫 글자가 맞는 위치에서만 대안들을 시도하도록 문자 클래스를 맨 앞에 둠
+            union = frozenset().union(*firsts)
+            self._prefix = re.compile(f"{_char_class(union)}(?<=(?={'|'.join(parts)}).)")
+        else:
+            self._prefix = re.compile("|".join(parts))
+
+    @property
+    def empty(self) -> bool:
+        return not self._rules
+
+    def finds(self, text: str, pos: int = 0, endpos: Optional[int] = None) -> bool:
+        """
+        규칙이 시작할 수 있는 위치가 있는지 확인 (후보 검색식만 실행)
+
+        Args:
+            text: 입력 텍스트
+            pos: 확인 시작 위치
+            endpos: 확인 끝 위치 (None인 경우 텍스트 끝)
+
+        Returns:
+            후보 위치가 하나라도 있으면 True (실제 매치 여부는 확인하지 않음)
+        """
+        if endpos is None:
+            endpos = len(text)
+        if not self._rules or pos >= endpos:
+            return False
+        for guard in self._guards:
+            if guard.search(text) is None:
+                return False
+        if self._classes is None:
+            return self._all.regex.search(text, pos, endpos) is not None
+        return self._prefix is not None and self._prefix.search(text, pos, endpos) is not None
+
+    def _segments_for(self, char: str) -> tuple:
+        """
+        글자 하나로 시작할 수 있는 규칙을 규칙 순서대로 묶은 시도 단위 (글자별 캐시)
+
+        연속된 정규식 규칙은 하나의 _CompiledRules로, 지명 사전 규칙은
+        (우선순위, 규칙, 앞 두 글자 확인 함수, 가장 긴 일치 함수)로 둡니다.
+        정규식 규칙은 그 글자로 시작할 수 있는 대안만 남깁니다 (_narrow_rule).
+        """
+        segments = self._dispatch.get(char)
+        if segments is None:
+            segments = []
+            pending = []
+            for entry, cls in zip(self._rules, self._classes):
+                if cls is not None and not cls.match(char):
+                    continue
+                if entry[1].gazetteer is None:
+                    rule = _narrow_rule(entry[1], char)
+                    if rule is not None:
+                        pending.append((entry[0], rule))
+                    continue
+                if pending:
+                    segments.append(_CompiledRules(pending))
+                    pending = []
+                gazetteer = entry[1].gazetteer
+                if gazetteer.prefix is not None:
+                    segments.append((*entry, gazetteer.prefix.match, gazetteer.longest_match))
+            if pending:
+                segments.append(_CompiledRules(pending))
+            segments = tuple(segments)
+            self._dispatch[char] = segments
+        return segments
+
+    def scan(self, text: str, pos: int = 0, endpos: Optional[int] = None) -> List[Candidate]:
+        """
+        텍스트를 한 번 스캔하여 후보 수집
+
+        같은 위치에서는 규칙 순서상 앞선 규칙이 이기고, 후보끼리는 겹치지 않습니다.
+
+        Args:
+            text: 입력 텍스트
+            pos: 스캔 시작 위치
+            endpos: 스캔 끝 위치 (None인 경우 텍스트 끝)
+
+        Returns:
+            위치 순서의 후보 목록
+        """
+        if not self._rules:
+            return []
+        for guard in self._guards:
+            if guard.search(text) is None:
+                return []
+        if endpos is None:
+            endpos = len(text)
+
+        candidates = []
+        if self._classes is None:
+            for match in self._all.regex.finditer(text, pos, endpos):
+                candidate = self._all.candidate(match)
+                if candidate is not None:
+                    candidates.append(candidate)
+            return candidates
+        if self._prefix is None:
+            return candidates
+
+        folded = None
+        search = self._prefix.search
+        dispatch = self._dispatch
+        hit = search(text, pos, endpos)
+        while hit is not None:
+            start = hit.start()
+            char = text[start]
+            pos = start + 1
+
+            for segment in dispatch.get(char) or self._segments_for(char):
+                if segment.__class__ is _CompiledRules:
+                    match = segment.regex.match(text, start, endpos)
+                    if match is None:
+                        continue
+                    # 매치가 끝난 위치부터 다시 검색하므로 후보끼리 겹치지 않음
+                    pos = match.end()
+                    rule, priority, first, last, formatter = segment.by_group[match.lastindex]
+                    if formatter is None:
+                        value = match.group(last)
+                    else:
+                        value = formatter(*match.groups()[first:last])
+                else:
+                    priority, rule, bigram, longest_match = segment
+                    # 다른 규칙의 첫 글자로 찾은 위치일 수 있으므로 앞 두 글자를 C 수준에서 먼저 확인
+                    if bigram(text, start, endpos) is None:
+                        continue
+                    if folded is None:
+                        # 지명 사전은 ASCII 대소문자를 무시 (글자 위치는 그대로)
+                        folded = fold_case(text)
+                    found = longest_match(folded, start, endpos)
+                    if found is None:
+                        continue
+                    end, value = found
+                    if rule.ambiguous and folded[start:end] in rule.ambiguous and (
+                        rule.context is None or rule.context(folded, end, endpos) is None
+                    ):
+                        continue
+                    pos = end
+                if value not in rule.reject:
+                    if rule.normalize is not None:
+                        value = rule.normalize(value)
+                    # NamedTuple 생성자를 거치지 않고 튜플로 바로 생성 (핫 루프)
+                    candidates.append(_new_candidate(
+                        Candidate,
+                        (rule.slot, value, rule.rule_id, start, pos, priority, rule.confidence),
+                    ))
+                break
+
+            hit = search(text, pos, endpos)
+        return candidates
+
+
+class RuleEngine:
+    """
+    단일 패스 슬롯 추출 엔진
+
+    규칙 목록의 순서가 곧 우선순위입니다. 같은 위치에서 여러 규칙이 맞으면
+    앞선 규칙이 그 구간을 차지하므로, 더 구체적인 규칙(예: "3월 15일")을
+    덜 구체적인 규칙(예: "15일")보다 앞에 두어 충돌을 해소합니다.
+    지명 사전 규칙도 같은 스캔 안에서 규칙 순서에 따라 시도됩니다.
+    입력은 먼저 normalize_text로 정규화하므로 ("삼박사일" → "3박4일") 규칙은
+    아라비아 숫자 형식만 다루면 되고, 후보 구간은 정규화된 텍스트 기준입니다.
+
+    직전 질문이 물어본 슬롯(expected_slot)을 알면 그 슬롯의 규칙과 targeted 규칙만
+    먼저 스캔하고, 답변의 나머지 부분에 다른 규칙이 시작할 위치가 있을 때만
+    전체 규칙을 스캔합니다.
+
+    window보다 긴 입력은 겹치는 구간으로 나눠 구간마다 스캔하므로, 규칙 패턴이
+    한 시작 위치에서 구간 끝까지 시도하더라도 비용은 입력 길이에 비례합니다.
+    역추적이 폭발할 수 있는 패턴(find_backtracking_risks)은 컴파일 시 거부합니다.
+
+    extract_detailed는 값마다 규칙 신뢰도, 규칙 ID, 구간을 붙여 돌려줍니다.
+    """
+
+    def __init__(self, rules: Sequence[SlotRule], window: Optional[int] = None):
+        """
+        Args:
+            rules: 우선순위 순서의 추출 규칙 목록
+            window: 한 번에 스캔하는 최대 문자 수 (None인 경우 EXTRACTION_WINDOW_CHARS)
+
+        Raises:
+            ValueError: 역추적 위험이 있는 패턴
+        """
+        self.rules: Tuple[SlotRule, ...] = tuple(rules)
+        self.window = max(window or EnvConfig.EXTRACTION_WINDOW_CHARS, 2 * _WINDOW_OVERLAP)
+        for rule in self.rules:
+            risks = find_backtracking_risks(rule.pattern) if rule.pattern else ()
+            if risks:
+                raise ValueError(f"{rule.rule_id}: 역추적 위험 패턴 ({risks[0]})")
+
+        slot_priority: Dict[str, int] = {}
+        primary, fallback = [], []
+        by_slot: Dict[str, List[Tuple[int, SlotRule]]] = {}
+        for rule in self.rules:
+            priority = slot_priority.get(rule.slot, 0)
+            slot_priority[rule.slot] = priority + 1
+            # 답변 스캔에서는 그 슬롯의 모든 규칙을 순서대로 시도
+            by_slot.setdefault(rule.slot, []).append((priority, rule))
+            if not rule.targeted:
+                (fallback if rule.fallback else primary).append((priority, rule))
+
+        self.slots: Tuple[str, ...] = tuple(slot_priority)
+        self._primary = _Scanner(primary)
+        self._fallback = _Scanner(fallback)
+        self._expected = {slot: _Scanner(entries) for slot, entries in by_slot.items()}
+        self._fallback_slots = frozenset(rule.slot for _, rule in fallback)
+        self._resolvers: Dict[str, SlotRule] = {
+            rule.rule_id: rule for rule in self.rules if rule.resolve is not None
+        }
+        self._resolver_slots = tuple(
+            {rule.slot: None for rule in self.rules if rule.resolve is not None}
+        )
+
+    def scan(self, text: str) -> List[Candidate]:
+        """
+        모든 후보 구간 수집 (fallback 규칙 제외)
+
+        Args:
+            text: 입력 텍스트
+
+        Returns:
+            위치 순서의 후보 목록 (구간은 정규화된 텍스트 기준)
+        """
+        return self._scan(self._primary, normalize_text(text))
+
+    def _scan(self, scanner: _Scanner, text: str) -> List[Candidate]:
+        """
+        스캐너로 스캔 (긴 입력은 겹치는 구간으로 나눠 스캔)
+
+        각 구간은 잘라 낸 문자열로 독립적으로 스캔하고, 구간 끝의 겹침 영역에서 시작한
+        후보는 다음 구간에서 온전히 다시 찾습니다. 잘라 낸 문자열이므로 ^/$ 앵커와
+        후방 탐색은 구간 경계를 입력의 시작/끝으로 봅니다.
+
+        Args:
+            scanner: 스캐너
+            text: 정규화된 입력 텍스트
+
+        Returns:
+            위치 순서의 후보 목록
+        """
+        length = len(text)
+        if length <= self.window:
+            return scanner.scan(text)
+
+        candidates: List[Candidate] = []
+        start = 0
+        while start < length:
+            end = min(start + self.window, length)
+            safe = length if end == length else end - _WINDOW_OVERLAP
+            for candidate in scanner.scan(text[start:end]):
+                if start + candidate.start >= safe:
+                    break
+                candidates.append(candidate._replace(
+                    start=start + candidate.start, end=start + candidate.end
+                ))
+            if end == length:
+                break
+            start = max(safe, candidates[-1].end if candidates else 0)
+        return candidates
+
+    def extract_candidates(
+        self,
+        text: str,
+        reference_date: Optional[datetime.date] = None,
+        expected_slot: Optional[str] = None,
+    ) -> Dict[str, Candidate]:
+        """
+        슬롯별 최종 후보 선택
+
+        Args:
+            text: 입력 텍스트
+            reference_date: 상대 표현 해석 기준일 (None인 경우 오늘)
+            expected_slot: 직전 질문이 물어본 슬롯 (None인 경우 모든 슬롯을 동등하게 스캔)
+
+        Returns:
+            슬롯 이름 → 선택된 후보
+        """
+        text = normalize_text(text)
+        answer = None
+        if expected_slot is not None:
+            answer = self._scan_answer(text, expected_slot)
+            if answer is not None and not self._has_more(text, answer):
+                # 질문한 슬롯만 답한 응답: 전체 스캔 생략
+                best = {expected_slot: answer}
+                if expected_slot in self._resolver_slots:
+                    self._resolve_values(best, reference_date)
+                return best
+
+        best: Dict[str, Candidate] = {}
+        for candidate in (
+            self._primary.scan(text) if len(text) <= self.window else self._scan(self._primary, text)
+        ):
+            current = best.get(candidate.slot)
+            # 같은 슬롯이면 규칙 우선순위, 그 다음 먼저 나온 후보
+            if current is None or candidate.priority < current.priority:
+                best[candidate.slot] = candidate
+
+        if self._fallback_slots and not self._fallback_slots <= best.keys():
+            self._resolve_fallback(text, best)
+        if answer is not None:
+            self._prefer_answer(best, answer)
+
+        for slot in self._resolver_slots:
+            if slot in best:
+                self._resolve_values(best, reference_date)
+                break
+
+        return best
+
+    def extract_answer(
+        self, text: str, slot: str, reference_date: Optional[datetime.date] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        질문한 슬롯에 대한 답변으로만 해석 (LLM 호출 전 빠른 경로)
+
+        Args:
+            text: 입력 텍스트
+            slot: 직전 질문이 물어본 슬롯
+            reference_date: 상대 표현 해석 기준일 (None인 경우 오늘)
+
+        Returns:
+            슬롯 이름 → 값 (슬롯을 못 찾았거나 답변에 다른 정보가 더 있을 수 있으면 None)
+        """
+        best = self._answer_candidates(text, slot, reference_date)
+        return {name: c.value for name, c in best.items()} if best else None
+
+    def extract_answer_detailed(
+        self, text: str, slot: str, reference_date: Optional[datetime.date] = None
+    ) -> Optional[ExtractionResult]:
+        """
+        extract_answer와 같지만 값마다 신뢰도/규칙 ID/구간을 포함
+
+        Args:
+            text: 입력 텍스트
+            slot: 직전 질문이 물어본 슬롯
+            reference_date: 상대 표현 해석 기준일 (None인 경우 오늘)
+
+        Returns:
+            ExtractionResult 또는 None (extract_answer와 같은 조건)
+        """
+        best = self._answer_candidates(text, slot, reference_date)
+        return _to_result(best) if best else None
+
+    def _answer_candidates(
+        self, text: str, slot: str, reference_date: Optional[datetime.date]
+    ) -> Optional[Dict[str, Candidate]]:
+        """질문한 슬롯만 답한 응답의 후보 (아니면 None)"""
+        text = normalize_text(text)
+        answer = self._scan_answer(text, slot)
+        if answer is None or self._has_more(text, answer):
+            return None
+        best = {slot: answer}
+        if slot in self._resolver_slots:
+            self._resolve_values(best, reference_date)
+        return best
+
+    def _scan_answer(self, text: str, slot: str) -> Optional[Candidate]:
+        """
+        질문한 슬롯의 규칙(targeted 포함)만으로 스캔
+
+        Args:
+            text: 입력 텍스트
+            slot: 직전 질문이 물어본 슬롯
+
+        Returns:
+            우선순위가 가장 높은 후보 (없거나 알 수 없는 슬롯, 구간보다 긴 입력이면 None)
+        """
+        scanner = self._expected.get(slot)
+        if scanner is None or len(text) > self.window:
+            # 구간보다 긴 입력은 짧은 답변이 아니며, 구간별 스캔에서는 ^/$ 앵커가
+            # 구간 경계에도 맞으므로 답변 규칙을 적용하지 않음
+            return None
+        best = None
+        for candidate in scanner.scan(text):
+            if best is None or candidate.priority < best.priority:
+                best = candidate
+        return best
+
+    def _has_more(self, text: str, answer: Candidate) -> bool:
+        """
+        답변 후보 구간 밖에 다른 규칙이 시작할 수 있는 위치가 있는지
+
+        Args:
+            text: 입력 텍스트
+            answer: 질문한 슬롯의 후보
+
+        Returns:
+            전체 스캔이 필요하면 True
+        """
+        if len(text) > self.window:
+            return True  # 긴 입력은 구간별 전체 스캔
+        for scanner in (self._primary, self._fallback):
+            if scanner.finds(text, 0, answer.start) or scanner.finds(text, answer.end):
+                return True
+        return False
+
+    @staticmethod
+    def _prefer_answer(best: Dict[str, Candidate], answer: Candidate):
+        """
+        전체 스캔 결과에 질문한 슬롯의 후보를 반영
+
+        답변 구간을 더 길게 덮는 다른 슬롯 후보가 있으면 (예: 기간 질문에 "3월 15일")
+        전체 스캔 해석을 유지하고, 아니면 답변 후보가 이기며 겹치는 다른 후보는 버립니다.
+
+        Args:
+            best: 전체 스캔의 슬롯별 후보 (제자리에서 갱신)
+            answer: 질문한 슬롯의 후보
+        """
+        overlapping = [
+            slot for slot, c in best.items()
+            if slot != answer.slot and c.start < answer.end and answer.start < c.end
+        ]
+        length = answer.end - answer.start
+        for slot in overlapping:
+            candidate = best[slot]
+            if candidate.end - candidate.start > length:
+                return
+        for slot in overlapping:
+            del best[slot]
+        best[answer.slot] = answer
+
+    def extract(
+        self,
+        text: str,
+        reference_date: Optional[datetime.date] = None,
+        expected_slot: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        슬롯 값 추출
+
+        Args:
+            text: 입력 텍스트
+            reference_date: 상대 표현 해석 기준일 (None인 경우 오늘)
+            expected_slot: 직전 질문이 물어본 슬롯 (None인 경우 모든 슬롯을 동등하게 스캔)
+
+        Returns:
+            슬롯 이름 → 값
+        """
+        return {
+            slot: c.value
+            for slot, c in self.extract_candidates(text, reference_date, expected_slot).items()
+        }
+
+    def extract_detailed(
+        self,
+        text: str,
+        reference_date: Optional[datetime.date] = None,
+        expected_slot: Optional[str] = None,
+    ) -> ExtractionResult:
+        """
+        extract와 같지만 값마다 신뢰도/규칙 ID/구간을 포함
+
+        Args:
+            text: 입력 텍스트
+            reference_date: 상대 표현 해석 기준일 (None인 경우 오늘)
+            expected_slot: 직전 질문이 물어본 슬롯 (None인 경우 모든 슬롯을 동등하게 스캔)
+
+        Returns:
+            ExtractionResult (출처는 모두 SOURCE_RULE)
+        """
+        return _to_result(self.extract_candidates(text, reference_date, expected_slot))
+
+    def _resolve_values(self, best: Dict[str, Candidate], reference_date: Optional[datetime.date]):
+        """
+        resolve 함수가 있는 규칙의 후보 값을 기준일에 대해 해석
+
+        Args:
+            best: 슬롯별 선택된 후보 (제자리에서 갱신)
+            reference_date: 기준일 (None인 경우 오늘)
+        """
+        for slot in self._resolver_slots:
+            candidate = best.get(slot)
+            if candidate is None:
+                continue
+            rule = self._resolvers.get(candidate.rule_id)
+            if rule is None:
+                continue
+            if reference_date is None:
+                reference_date = today()
+            value = rule.resolve(candidate.value, reference_date)
+            if value is None:
+                del best[slot]
+                continue
+            confidence = candidate.confidence
+            if rule.score is not None:
+                # 해석 전 표현으로 신뢰도 계산 (예: "다음 주"는 "10월 30일"보다 낮음)
+                confidence = rule.score(candidate.value, reference_date) or confidence
+            best[slot] = _new_candidate(Candidate, (slot, value) + candidate[2:6] + (confidence,))
+
+    def _resolve_fallback(self, text: str, best: Dict[str, Candidate]):
+        """
+        fallback 규칙으로 빈 슬롯 채우기
+
+        이미 다른 슬롯 후보가 차지한 구간과 겹치는 후보는 버립니다.
+
+        Args:
+            text: 입력 텍스트
+            best: 슬롯별 선택된 후보 (제자리에서 갱신)
+        """
+        candidates = self._scan(self._fallback, text)
+        if not candidates:
+            return
+        claimed = [(c.start, c.end) for c in best.values()]
+        for candidate in candidates:
+            if candidate.slot in best:
+                continue
+            if any(candidate.start < end and start < candidate.end for start, end in claimed):
+                continue
+            best[candidate.slot] = candidate
+
+
+def _to_result(best: Dict[str, Candidate]) -> ExtractionResult:
+    """슬롯별 후보를 ExtractionResult로 변환"""
+    return ExtractionResult({
+        slot: SlotValue(c.value, c.confidence, SOURCE_RULE, c.rule_id, (c.start, c.end))
+        for slot, c in best.items()
+    })
+
+
+@lru_cache(maxsize=8)
+def _compile_for_spec(spec: "ExtractionSpec") -> RuleEngine:
+    # 명세는 spec_hash로 해시되므로 규칙 목록 전체를 해시하지 않음
+    return RuleEngine(spec.rules)
+
+
+def get_rule_engine(spec: Optional["ExtractionSpec"] = None) -> RuleEngine:
+    """
+    추출 규칙 명세로 컴파일된 공유 엔진 반환
+
+    명세 파일이 바뀌지 않는 한 같은 엔진을 반환하므로 컴파일은 명세당 한 번입니다.
+
+    Args:
+        spec: 추출 규칙 명세 (None인 경우 data/extraction_rules.json)
+
+    Returns:
+        RuleEngine 인스턴스
+    """
+    if spec is None:
+        # extraction_spec이 SlotRule을 가져오므로 순환 import를 피해 지연 import
+        from .extraction_spec import load_extraction_spec
+        spec = load_extraction_spec()
+    return _compile_for_spec(spec)
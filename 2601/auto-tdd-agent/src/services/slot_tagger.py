@@ -0,0 +1,418 @@
+"""
+LLM 파싱 결과로 학습하는 로컬 슬롯 태거
+
+기록된 (발화, plan, LLM 슬롯) 쌍에서 슬롯 값이 발화에 그대로 나오는 경우만 골라
+토큰 단위 BIO 태그로 바꾸고, 글자 n-gram/주변 토큰 특징의 평균 퍼셉트론으로
+학습합니다. ResponseParser에서 규칙과 LLM 사이의 단계로 사용하며, 모든 값과
+"O"로 태그한 토큰의 신뢰도가 기준 이상이고 규칙 엔진이 태거가 놓친 슬롯의 후보를
+보지 못했을 때만 LLM 호출을 생략합니다. 정규화되어 발화에 그대로 나오지 않는 값
+(예: 날짜)은 학습할 수 없으므로 태거만으로 확정하지 않습니다.
+
+학습:
+    uv run python -m src.services.slot_tagger outputs/llm_parses.jsonl data/slot_tagger.json
+"""
+import json
+import math
+import random
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from .extraction_result import SOURCE_MODEL, ExtractionResult, SlotValue
+from .text_normalizer import Token, normalize_text, tokenize
+
+_OUTSIDE = "O"
+_DIGITS = re.compile(r"\d+")
+_FORMAT_VERSION = 1
+# 신뢰도 보정에 떼어 두는 예제 비율 (10개 중 1개, 예제가 적으면 학습 예제로 보정)
+_CALIBRATION_EVERY = 10
+# 점수 배율 후보 (0.5 ~ 256, √2 간격)
+_SCALES = tuple(2 ** (k / 2) for k in range(-2, 17))
+
+
+class TrainingStats(NamedTuple):
+    """학습 결과 요약"""
+    used: int  # 학습에 사용한 기록 수
+    skipped: int  # 값이 발화에 그대로 나오지 않아 제외한 기록 수
+    labels: Tuple[str, ...]
+    scale: float  # 보정된 점수 배율
+
+
+def _shape(word: str) -> str:
+    """숫자 연속을 "9"로 바꾼 형태 (예: "100만원" → "9만원")"""
+    return _DIGITS.sub("9", word)
+
+
+def _features(tokens: Sequence[Token], index: int, previous: str) -> List[str]:
+    """토큰 하나의 특징 목록"""
+    token = tokens[index]
+    stem = token.stem
+    padded = f"<{stem}>"
+    features = [
+        "b",
+        "s=" + stem,
+        "p=" + token.particle,
+        "sh=" + _shape(stem),
+        "f1=" + stem[:1],
+        "l1=" + stem[-1:],
+        "l2=" + stem[-2:],
+        "pl=" + previous,
+    ]
+    features.extend("g=" + padded[i:i + 2] for i in range(len(padded) - 1))
+    if index > 0:
+        before = tokens[index - 1]
+        features.append("-1s=" + before.stem)
+        features.append("-1p=" + before.particle)
+    else:
+        features.append("-1s=<s>")
+    if index + 1 < len(tokens):
+        after = tokens[index + 1]
+        features.append("+1s=" + after.stem)
+        features.append("+1sh=" + _shape(after.stem))
+    else:
+        features.append("+1s=</s>")
+    return features
+
+
+def _span_value(text: str, tokens: Sequence[Token], first: int, last: int) -> str:
+    """토큰 구간의 값 (마지막 토큰의 조사 제외)"""
+    return text[tokens[first].start:tokens[last].start + len(tokens[last].stem)]
+
+
+def align(utterance: str, slots: Mapping[str, Any]) -> Optional[Tuple[Tuple[Token, ...], List[str]]]:
+    """
+    LLM 슬롯 값을 발화의 토큰 구간에 맞춰 BIO 태그 생성
+
+    Args:
+        utterance: 원본 발화
+        slots: 슬롯 이름 → LLM 값
+
+    Returns:
+        (토큰, 태그 목록) 또는 값이 발화에 그대로 나오지 않는 슬롯이 있으면 None
+        (학습하면 그 표현을 "O"로 배우게 되므로 기록 전체를 제외)
+    """
+    text = normalize_text(utterance)
+    tokens = tokenize(utterance)
+    labels = [_OUTSIDE] * len(tokens)
+    for slot, value in slots.items():
+        if not value:
+            continue
+        if not isinstance(value, str):
+            return None
+        value = normalize_text(value)
+        start = text.find(value)
+        if start < 0:
+            return None
+        end = start + len(value)
+        covered = [i for i, t in enumerate(tokens) if t.start < end and start < t.end]
+        if not covered or any(labels[i] != _OUTSIDE for i in covered):
+            return None
+        if _span_value(text, tokens, covered[0], covered[-1]) != value:
+            return None  # 토큰 경계와 맞지 않는 값 (예: 토큰 일부)
+        labels[covered[0]] = "B-" + slot
+        for i in covered[1:]:
+            labels[i] = "I-" + slot
+    return tokens, labels
+
+
+class SlotTagger:
+    """
+    평균 퍼셉트론 BIO 슬롯 태거
+
+    왼쪽부터 한 토큰씩 태그를 정하며 (직전 태그가 특징), 각 토큰의 태그 점수에
+    배율(scale)을 곱해 softmax한 확률을 신뢰도로 사용합니다. 퍼셉트론 점수는 확률이
+    아니므로 배율은 학습 때 떼어 둔 예제의 정답 태그 로그 우도가 가장 높은 값으로
+    보정합니다. 구간의 신뢰도는 구간 토큰 중 최솟값입니다.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Dict[str, Dict[str, float]]] = None,
+        labels: Sequence[str] = (),
+        scale: float = 1.0,
+    ):
+        """
+        Args:
+            weights: 특징 → 태그 → 가중치
+            labels: 태그 목록 ("O", "B-슬롯", "I-슬롯")
+            scale: softmax 전에 점수에 곱하는 배율
+        """
+        self.weights: Dict[str, Dict[str, float]] = weights or {}
+        self.labels: Tuple[str, ...] = tuple(labels) or (_OUTSIDE,)
+        self.scale = scale
+
+    def _scores(self, features: Iterable[str]) -> Dict[str, float]:
+        scores = dict.fromkeys(self.labels, 0.0)
+        weights = self.weights
+        for feature in features:
+            row = weights.get(feature)
+            if row:
+                for label, weight in row.items():
+                    scores[label] += weight
+        return scores
+
+    def _allowed(self, label: str, previous: str) -> bool:
+        """I-슬롯 태그는 같은 슬롯의 B/I 태그 뒤에만"""
+        return not label.startswith("I-") or (previous != _OUTSIDE and previous[2:] == label[2:])
+
+    def tag(self, tokens: Sequence[Token]) -> List[Tuple[str, float]]:
+        """
+        토큰별 (태그, 신뢰도)
+
+        Args:
+            tokens: tokenize() 결과
+
+        Returns:
+            토큰 순서의 (태그, 확률) 목록
+        """
+        result = []
+        previous = _OUTSIDE
+        for index in range(len(tokens)):
+            scores = self._scores(_features(tokens, index, previous))
+            allowed = {label: s for label, s in scores.items() if self._allowed(label, previous)}
+            best = max(allowed, key=allowed.get)
+            top = allowed[best]
+            scale = self.scale
+            total = sum(math.exp(scale * (s - top)) for s in allowed.values())
+            result.append((best, 1.0 / total))
+            previous = best
+        return result
+
+    def extract(self, utterance: str) -> ExtractionResult:
+        """
+        발화에서 슬롯 값 추출
+
+        같은 슬롯의 구간이 여러 개면 신뢰도가 가장 높은 구간을 사용합니다.
+
+        Args:
+            utterance: 원본 발화
+
+        Returns:
+            ExtractionResult (출처 SOURCE_MODEL, 구간은 정규화된 텍스트 기준)
+        """
+        return self.extract_with_outside(utterance)[0]
+
+    def extract_with_outside(self, utterance: str) -> Tuple[ExtractionResult, float]:
+        """
+        extract와 같지만 "O"로 태그한 토큰의 최소 신뢰도를 함께 반환
+
+        값을 놓쳤는지(슬롯 토큰을 "O"로 태그했는지)는 추출된 값의 신뢰도로 알 수 없으므로
+        LLM 생략 여부를 정할 때 함께 확인합니다.
+
+        Args:
+            utterance: 원본 발화
+
+        Returns:
+            (ExtractionResult, "O" 토큰 신뢰도의 최솟값 - "O" 토큰이 없으면 1.0)
+        """
+        text = normalize_text(utterance)
+        tokens = tokenize(utterance)
+        spans: Dict[str, SlotValue] = {}
+        tags = self.tag(tokens)
+        outside = min((c for label, c in tags if label == _OUTSIDE), default=1.0)
+        index = 0
+        while index < len(tags):
+            label, confidence = tags[index]
+            if not label.startswith("B-"):
+                index += 1
+                continue
+            slot = label[2:]
+            last = index
+            while last + 1 < len(tags) and tags[last + 1][0] == "I-" + slot:
+                last += 1
+                confidence = min(confidence, tags[last][1])
+            value = _span_value(text, tokens, index, last)
+            current = spans.get(slot)
+            if current is None or confidence > current.confidence:
+                start = tokens[index].start
+                spans[slot] = SlotValue(value, confidence, SOURCE_MODEL, None, (start, start + len(value)))
+            index = last + 1
+        return ExtractionResult(spans), outside
+
+    @classmethod
+    def train(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        epochs: int = 10,
+        seed: int = 0,
+    ) -> Tuple['SlotTagger', TrainingStats]:
+        """
+        기록된 LLM 파싱 결과로 학습
+
+        Args:
+            records: {"utterance": 발화, "slots": LLM 슬롯} 딕셔너리들 ("plan"은 사용하지 않음)
+            epochs: 학습 반복 횟수
+            seed: 예제 순서를 섞는 난수 시드
+
+        Returns:
+            (SlotTagger, TrainingStats)
+        """
+        examples = []
+        skipped = 0
+        labels = {_OUTSIDE: None}
+        for record in records:
+            aligned = align(record["utterance"], record.get("slots") or {})
+            if aligned is None:
+                skipped += 1
+                continue
+            examples.append(aligned)
+            labels.update(dict.fromkeys(aligned[1]))
+
+        tagger = cls({}, tuple(labels))
+        if len(examples) >= 2 * _CALIBRATION_EVERY:
+            held_out = examples[::_CALIBRATION_EVERY]
+            training = [e for i, e in enumerate(examples) if i % _CALIBRATION_EVERY]
+        else:
+            held_out = training = examples
+        # 평균 퍼셉트론: 가중치 합을 마지막 갱신 시점과 함께 지연 누적
+        totals: Dict[Tuple[str, str], float] = {}
+        stamps: Dict[Tuple[str, str], int] = {}
+        step = 0
+        weights = tagger.weights
+
+        def update(feature: str, label: str, delta: float):
+            key = (feature, label)
+            row = weights.setdefault(feature, {})
+            weight = row.get(label, 0.0)
+            totals[key] = totals.get(key, 0.0) + (step - stamps.get(key, 0)) * weight
+            stamps[key] = step
+            row[label] = weight + delta
+
+        rng = random.Random(seed)
+        for _ in range(epochs):
+            rng.shuffle(training)
+            for tokens, truth in training:
+                previous = _OUTSIDE
+                for index, gold in enumerate(truth):
+                    step += 1
+                    features = _features(tokens, index, previous)
+                    scores = tagger._scores(features)
+                    guess = max(scores, key=scores.get)
+                    if guess != gold:
+                        for feature in features:
+                            update(feature, gold, 1.0)
+                            update(feature, guess, -1.0)
+                    previous = gold
+
+        averaged: Dict[str, Dict[str, float]] = {}
+        for feature, row in weights.items():
+            for label, weight in row.items():
+                key = (feature, label)
+                total = totals.get(key, 0.0) + (step - stamps.get(key, 0)) * weight
+                value = round(total / max(step, 1), 4)
+                if value:
+                    averaged.setdefault(feature, {})[label] = value
+        tagger.weights = averaged
+        tagger.scale = tagger._calibrate(held_out)
+        return tagger, TrainingStats(len(examples), skipped, tagger.labels, tagger.scale)
+
+    def _calibrate(self, examples: Sequence[Tuple[Sequence[Token], Sequence[str]]]) -> float:
+        """정답 태그의 로그 우도가 가장 높은 점수 배율"""
+        # (허용된 태그 점수들, 정답 태그 점수) - 배율과 무관하므로 한 번만 계산
+        rows = []
+        for tokens, truth in examples:
+            previous = _OUTSIDE
+            for index, gold in enumerate(truth):
+                scores = self._scores(_features(tokens, index, previous))
+                rows.append((
+                    [s for label, s in scores.items() if self._allowed(label, previous)],
+                    scores[gold],
+                ))
+                previous = gold
+        if not rows:
+            return 1.0
+
+        def log_likelihood(scale: float) -> float:
+            total = 0.0
+            for allowed, gold in rows:
+                top = max(allowed)
+                total += scale * (gold - top) - math.log(
+                    sum(math.exp(scale * (s - top)) for s in allowed)
+                )
+            return total
+
+        return max(_SCALES, key=log_likelihood)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON으로 저장할 딕셔너리"""
+        return {
+            "version": _FORMAT_VERSION,
+            "labels": list(self.labels),
+            "scale": self.scale,
+            "weights": self.weights,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> 'SlotTagger':
+        """
+        to_dict() 결과에서 생성
+
+        Raises:
+            ValueError: 지원하지 않는 형식 버전
+        """
+        if data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 슬롯 태거 형식: {data.get('version')}")
+        return cls(data["weights"], data["labels"], data.get("scale", 1.0))
+
+    def save(self, path: Path):
+        """모델을 JSON 파일로 저장"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+
+@lru_cache(maxsize=4)
+def load_slot_tagger(path: Path) -> SlotTagger:
+    """
+    저장된 슬롯 태거 로드 (경로별 한 번)
+
+    Args:
+        path: 모델 JSON 경로
+
+    Returns:
+        SlotTagger 인스턴스
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return SlotTagger.from_dict(json.load(f))
+
+
+def read_records(path: Path) -> Iterable[Dict[str, Any]]:
+    """
+    LLM 파싱 기록(JSON Lines) 읽기 (깨진 줄은 건너뜀)
+
+    Args:
+        path: 기록 파일 경로
+
+    Yields:
+        {"utterance", "plan", "slots"} 딕셔너리
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("utterance"), str):
+                yield record
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """
+    학습 CLI
+
+    실행:
+        uv run python -m src.services.slot_tagger records.jsonl model.json [epochs]
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+    if len(args) < 2:
+        print("사용법: python -m src.services.slot_tagger records.jsonl model.json [epochs]")
+        return
+    epochs = int(args[2]) if len(args) > 2 else 10
+    tagger, stats = SlotTagger.train(read_records(Path(args[0])), epochs=epochs)
+    tagger.save(Path(args[1]))
+    print(f"학습 {stats.used}건, 제외 {stats.skipped}건, 태그 {len(stats.labels)}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+발화 정규화/토큰화
+
+추출기가 발화를 스캔하기 전에 한 번만 적용하는 공통 전처리입니다.
+전각 숫자/기호(NFKC), 연속 공백, 한자어 수사("백만원", "삼박사일"), 숫자와 자리 단위를
+섞은 금액("2백만원"), 고유어 수량 표현("이틀", "두 명")을 아라비아 숫자 형식으로 바꿔 규칙 패턴이
+숫자 형식 하나만 다루면 되게 합니다. 같은 입력은 LRU 캐시로 다시 계산하지 않으며,
+시뮬레이터와 평가기에서도 같은 정규화를 사용합니다.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+_SINO_DIGITS = {"일": 1, "이": 2, "삼": 3, "사": 4, "오": 5, "육": 6, "칠": 7, "팔": 8, "구": 9}
+_SINO_MULTIPLIERS = {"십": 10, "백": 100, "천": 1000}
+_NATIVE_COUNTS = {
+    "한": 1, "두": 2, "세": 3, "네": 4, "다섯": 5,
+    "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10,
+}
+# 통째로 바꾸는 단어 (고유어 날수, 불규칙한 달 이름, 인원)
+_WORDS = {
+    "하루": "1일", "이틀": "2일", "사흘": "3일", "나흘": "4일", "닷새": "5일",
+    "엿새": "6일", "이레": "7일", "여드레": "8일", "아흐레": "9일", "열흘": "10일",
+    "보름": "15일", "시월": "10월", "유월": "6월",
+    "둘이서": "2명이서", "셋이서": "3명이서", "넷이서": "4명이서",
+}
+# 한자어 수사 뒤에 와야 하는 단위 ("이번", "구경", "사고"처럼 수사로 시작하는 단어 제외)
+_SINO_UNITS = r"박|일|월|명|만|억|원|개월|주일|주간|주\s*(?:후|뒤)|시간"
+# 단위 뒤에 한글이 이어질 때 허용하는 것: 다음 수사/단위("삼박사일", "백만원")나 조사/수량 꼬리
+# (그 밖의 한글이 이어지면 "오일장", "삼일절", "이월되나요"처럼 단어의 일부로 봄)
+_SINO_UNIT_FOLLOWERS = (
+    r"[일이삼사오육칠팔구십백천만억원]|으로|에서|까지|부터|정도|동안|짜리|이내|이상|이하|내외"
+    r"|[에로은는을를와과랑도의요쯤간째씩]"
+)
+# 수사로 시작하지만 수량이 아닌 단어
+_NOT_NUMERALS = ("일일이", "일일히")
+
+_SPACES = re.compile(r"\s+")
+_WORD_PATTERN = re.compile(
+    r"(?<![가-힣])(" + "|".join(sorted(_WORDS, key=len, reverse=True)) + ")"
+)
+_NATIVE_PATTERN = re.compile(
+    r"(?<![가-힣])(" + "|".join(sorted(_NATIVE_COUNTS, key=len, reverse=True)) + r")\s*(?=명)"
+)
+# 단어 첫머리이거나 앞 단위에 바로 붙은 수사 (예: "삼박사일"의 "사", "일억오천만원"의 "오천")
+# 숫자 바로 뒤의 자리 단위("2백만원")는 _MIXED_PATTERN이 먼저 처리하므로 여기서는 제외
+_SINO_PATTERN = re.compile(
+    r"(?:(?<![\d가-힣])|(?<=[박월억]))(?!" + "|".join(_NOT_NUMERALS) + r")([일이삼사오육칠팔구십백천]+)"
+    r"(?=(?:" + _SINO_UNITS + r")(?:[^가-힣]|$|" + _SINO_UNIT_FOLLOWERS + r"))"
+)
+# 숫자와 자리 단위를 섞어 쓴 금액 (예: "2백만원", "1천5백만원", "3천원")
+_MIXED_PATTERN = re.compile(r"(?<![\d.])((?:\d+[십백천])+\d*)(?=\s*[만억원])")
+_MIXED_PART = re.compile(r"(\d+)([십백천]?)")
+
+# 토큰 끝에서 떼어 내는 조사/어미 (긴 것부터, 명사 끝 글자와 헷갈리는 한 글자 조사 제외)
+_PARTICLES = tuple(sorted((
+    "이에요", "입니다", "에서는", "에서도", "으로", "에서", "에게", "한테", "까지", "부터",
+    "이랑", "이요", "예요", "하고", "처럼", "이나", "로", "에", "랑", "와", "과",
+    "은", "는", "을", "를", "요",
+), key=len, reverse=True))
+_TOKEN_PATTERN = re.compile(r"\w+")
+# 이보다 긴 입력은 캐시하지 않음 (붙여 넣은 긴 텍스트가 캐시 메모리를 차지하지 않도록)
+_CACHE_MAX_CHARS = 1024
+
+
+class Token(NamedTuple):
+    """정규화된 발화의 토큰 (위치는 정규화된 텍스트 기준)"""
+    text: str  # 토큰 전체 (예: "제주도로")
+    stem: str  # 조사/어미를 뗀 부분 (예: "제주도")
+    particle: str  # 뗀 조사/어미 (없으면 "")
+    start: int
+    end: int
+
+
+def _sino_value(numeral: str) -> Optional[int]:
+    """
+    한자어 수사를 정수로 변환
+
+    Args:
+        numeral: 한자어 수사 (예: "이천오백")
+
+    Returns:
+        정수 또는 올바른 수사가 아니면 None (예: "삼사", "십백")
+    """
+    total, digit, last = 0, None, 10_000
+    for char in numeral:
+        if char in _SINO_DIGITS:
+            if digit is not None:
+                return None
+            digit = _SINO_DIGITS[char]
+            continue
+        multiplier = _SINO_MULTIPLIERS[char]
+        if multiplier >= last:
+            return None
+        total += (1 if digit is None else digit) * multiplier
+        digit, last = None, multiplier
+    return total + (digit or 0)
+
+
+def _replace_sino(match: "re.Match") -> str:
+    value = _sino_value(match.group(1))
+    return match.group(1) if value is None else str(value)
+
+
+def _replace_mixed(match: "re.Match") -> str:
+    # "1천5백" → 1500 (자리 단위가 작아지는 순서가 아니면 그대로 둠)
+    total, last = 0, 10_000
+    for digits, unit in _MIXED_PART.findall(match.group(1)):
+        multiplier = _SINO_MULTIPLIERS.get(unit, 1)
+        if multiplier >= last:
+            return match.group(1)
+        total += int(digits) * multiplier
+        last = multiplier
+    return str(total)
+
+
+def normalize_text(text: str) -> str:
+    """
+    발화 정규화 (같은 입력은 캐시, 긴 입력 제외)
+
+    Args:
+        text: 원본 발화
+
+    Returns:
+        정규화된 발화 (예: "삼박사일　백만원" → "3박4일 100만원")
+    """
+    if len(text) > _CACHE_MAX_CHARS:
+        return _normalize(text)
+    return _normalize_cached(text)
+
+
+def _normalize(text: str) -> str:
+    text = _SPACES.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+    if text.isascii():
+        return text
+    text = _WORD_PATTERN.sub(lambda m: _WORDS[m.group(1)], text)
+    text = _NATIVE_PATTERN.sub(lambda m: str(_NATIVE_COUNTS[m.group(1)]), text)
+    text = _MIXED_PATTERN.sub(_replace_mixed, text)
+    return _SINO_PATTERN.sub(_replace_sino, text)
+
+
+_normalize_cached = lru_cache(maxsize=4096)(_normalize)
+
+
+def tokenize(text: str) -> Tuple[Token, ...]:
+    """
+    발화를 정규화한 뒤 토큰으로 분리하고 끝의 조사/어미를 떼어 냄 (같은 입력은 캐시)
+
+    조사 분리는 목록 기반 근사이며, 어간이 두 글자 이상 남을 때만 뗍니다.
+
+    Args:
+        text: 원본 발화
+
+    Returns:
+        토큰 튜플
+    """
+    if len(text) > _CACHE_MAX_CHARS:
+        return _tokenize(text)
+    return _tokenize_cached(text)
+
+
+def _tokenize(text: str) -> Tuple[Token, ...]:
+    normalized = normalize_text(text)
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(normalized):
+        word = match.group()
+        stem, particle = word, ""
+        for suffix in _PARTICLES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+                stem, particle = word[:-len(suffix)], suffix
+                break
+        tokens.append(Token(word, stem, particle, match.start(), match.end()))
+    return tuple(tokens)
+
+
+_tokenize_cached = lru_cache(maxsize=4096)(_tokenize)
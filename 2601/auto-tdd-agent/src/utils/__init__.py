@@ -2,11 +2,37 @@
 유틸리티 모듈
 """
 from .prompt_loader import PromptLoader
-from .validator import PlanValidator
+from .prompt_registry import PromptRegistry, PromptTemplate, get_prompt_registry
+from .validator import (
+    PlanValidator,
+    PlanValidationResult,
+    compile_slot_validators,
+    get_type_normalizer,
+)
 from .llm_client import get_llm_client
+from .rate_limiter import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    RateLimiter,
+    RateLimitedLLM,
+    estimate_tokens,
+    get_rate_limiter,
+)
 
 __all__ = [
     "PromptLoader",
+    "PromptRegistry",
+    "PromptTemplate",
+    "get_prompt_registry",
     "PlanValidator",
+    "PlanValidationResult",
+    "compile_slot_validators",
+    "get_type_normalizer",
     "get_llm_client",
+    "PRIORITY_HIGH",
+    "PRIORITY_LOW",
+    "RateLimiter",
+    "RateLimitedLLM",
+    "estimate_tokens",
+    "get_rate_limiter",
 ]
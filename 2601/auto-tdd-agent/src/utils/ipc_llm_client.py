@@ -6,8 +6,10 @@ IPC 기반 LLM 클라이언트
 import json
 import socket
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
+from ..core.types import MessageDict
+from .prompt_loader import messages_to_text
 
 SOCKET_PATH = "/tmp/opencode_llm_socket"
 
@@ -18,12 +20,14 @@ class IPCLLMClient:
     def __init__(self, socket_path: str = SOCKET_PATH):
         self.socket_path = socket_path
 
-    def invoke(self, prompt: str, temperature: float = 0.7) -> str:
+    def invoke(
+        self, prompt: Union[str, List[MessageDict]], temperature: float = 0.7
+    ) -> str:
         """
         Assistant에게 LLM 요청 보내고 응답 받기
 
         Args:
-            prompt: LLM에 보낼 프롬프트
+            prompt: LLM에 보낼 프롬프트 또는 {"role", "content"} 메시지 목록
             temperature: 생성 온도
 
         Returns:
@@ -32,8 +36,13 @@ class IPCLLMClient:
         print(f"[DEBUG] IPC Client: invoke() called")
         print(f"[DEBUG] IPC Client: socket path = {self.socket_path}")
 
-        # 요청 데이터 준비
-        request = {"type": "llm_request", "prompt": prompt, "temperature": temperature}
+        # 요청 데이터 준비 (서버 호환을 위해 메시지 목록은 합친 문자열도 함께 전송)
+        request = {"type": "llm_request", "temperature": temperature}
+        if isinstance(prompt, str):
+            request["prompt"] = prompt
+        else:
+            request["messages"] = list(prompt)
+            request["prompt"] = messages_to_text(request["messages"])
         print(f"[DEBUG] IPC Client: request prepared: {request}")
 
         # 소켓 연결
@@ -7,22 +7,26 @@ from typing import Optional, Union
 from langchain_openai import ChatOpenAI
 from ..core.env_config import EnvConfig
 from .ipc_llm_client import IPCLLMClient, get_ipc_llm_client
+from .rate_limiter import PRIORITY_HIGH, RateLimitedLLM, get_rate_limiter
 
 
 def get_llm_client(
     temperature: Optional[float] = None,
-) -> Union[ChatOpenAI, IPCLLMClient]:
+    priority: str = PRIORITY_HIGH,
+) -> Union[ChatOpenAI, IPCLLMClient, RateLimitedLLM]:
     """
     LLM 클라이언트 생성
 
     USE_IPC_LLM 환경 변수가 설정된 경우 IPC 클라이언트를 사용하고,
-    그렇지 않으면 GLM API 클라이언트를 사용합니다.
+    그렇지 않으면 GLM API 클라이언트를 사용합니다. LLM_MAX_RPM/LLM_MAX_TPM이 설정되면
+    GLM 클라이언트를 프로세스 간 공유 한도(RateLimitedLLM)로 감쌉니다.
 
     Args:
         temperature: 생성 온도 (None인 경우 환경 변수 값 사용)
+        priority: 호출 위치의 한도 우선순위 (PRIORITY_HIGH 또는 PRIORITY_LOW)
 
     Returns:
-        ChatOpenAI 또는 IPCLLMClient 인스턴스
+        ChatOpenAI, IPCLLMClient 또는 RateLimitedLLM 인스턴스
     """
     # IPC 모드 확인 (EnvConfig 또는 환경 변수)
     use_ipc = (
@@ -38,9 +42,11 @@ def get_llm_client(
 
     config = EnvConfig.get_llm_config()
 
-    return ChatOpenAI(
+    llm = ChatOpenAI(
         model=config["model"],
         api_key=config["api_key"],
         base_url=config["base_url"],
         temperature=temperature if temperature is not None else config["temperature"],
     )
+    limiter = get_rate_limiter()
+    return RateLimitedLLM(llm, limiter, priority) if limiter else llm
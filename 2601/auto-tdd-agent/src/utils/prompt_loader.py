@@ -3,81 +3,188 @@
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
-import yaml
+from typing import Dict, Any, List, Optional
+from ..core.env_config import EnvConfig
+from ..core.types import MessageDict
+from .prompt_registry import PromptRegistry, PromptTemplate, get_prompt_registry
+
+# 템플릿 파일이 없을 때 사용하는 기본 system 프롬프트
+DEFAULT_QUESTION_SYSTEM = """당신은 여행 계획을 도와주는 친절한 AI 어시스턴트입니다.
+사용자 메시지로 현재 수집된 여행 계획 정보가 주어집니다.
+그 정보를 바탕으로 사용자에게 다음에 물어볼 질문을 생성하세요.
+아직 수집되지 않은 필수 정보를 우선적으로 물어보세요."""
+
+DEFAULT_PARSER_SYSTEM = """사용자 응답에서 여행 계획 정보를 추출하세요.
+JSON 형식으로 추출된 정보를 반환하세요. 예:
+{"destination": "제주도", "start_date": "2026-03-15"}
 
+정보가 없으면 빈 객체 {}를 반환하세요."""
+
+
+def messages_to_text(messages: List[MessageDict]) -> str:
+    """
+    메시지 목록을 단일 프롬프트 문자열로 합침
+
+    메시지 목록을 받지 못하는 클라이언트용입니다.
+
+    Args:
+        messages: {"role", "content"} 메시지 목록
+
+    Returns:
+        합쳐진 프롬프트 문자열
+    """
+    return "\n\n".join(msg["content"].rstrip("\n") for msg in messages)
+
+
+def clip_text(text: str, limit: int) -> str:
+    """
+    프롬프트에 넣을 텍스트 길이 제한 (앞부분과 끝부분을 남기고 가운데 생략)
+
+    Args:
+        text: 원본 텍스트
+        limit: 최대 문자 수
+
+    Returns:
+        limit 이하 길이의 텍스트 (잘리지 않았으면 원본 그대로)
+    """
+    if len(text) <= limit:
+        return text
+    marker = " … "
+    head = (limit - len(marker)) * 3 // 4
+    tail = limit - len(marker) - head
+    return text[:head] + marker + (text[-tail:] if tail > 0 else "")
 
-class PromptLoader:
-    """프롬프트 템플릿 로더"""
 
-    def __init__(self, prompts_dir: Optional[Path] = None):
+class PromptLoader:
+    """
+    프롬프트 템플릿 로더
+
+    프롬프트는 고정된 system 메시지와 짧은 가변 user 메시지로 나뉩니다.
+    system 메시지는 템플릿 버전이 같으면 바이트 단위로 동일하므로
+    프로바이더 측 프리픽스 캐시가 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        prompts_dir: Optional[Path] = None,
+        registry: Optional[PromptRegistry] = None,
+    ):
         """
         Args:
             prompts_dir: 프롬프트 디렉토리 경로 (기본값: 프로젝트 루트의 prompts/)
+            registry: 템플릿 레지스트리 (None인 경우 디렉토리별 공유 레지스트리 사용)
         """
         if prompts_dir is None:
             prompts_dir = Path(__file__).parent.parent.parent / "prompts"
         self.prompts_dir = prompts_dir
+        self.registry = registry or get_prompt_registry(prompts_dir)
 
-    def load_question_prompt(self, current_plan: Dict[str, Any]) -> str:
+    def get_template(self, name: str) -> Optional[PromptTemplate]:
         """
-        질문 생성 프롬프트 로드
+        컴파일된 템플릿 조회
+
+        Args:
+            name: 템플릿 이름 (예: "question_generator")
+
+        Returns:
+            PromptTemplate 또는 파일이 없으면 None
+        """
+        return self.registry.get(name)
+
+    def load_question_messages(self, current_plan: Dict[str, Any]) -> List[MessageDict]:
+        """
+        질문 생성 메시지 로드
 
         Args:
             current_plan: 현재 수집된 plan
 
         Returns:
-            포맷팅된 프롬프트 문자열
+            [system, user] 메시지 목록
         """
-        prompt_file = self.prompts_dir / "question_generator.yaml"
+        template = self.registry.get("question_generator")
 
-        if not prompt_file.exists():
+        if template is None:
             # 기본 프롬프트 반환
-            return f"""현재 수집된 여행 계획 정보:
-{current_plan}
+            return _build_messages(
+                DEFAULT_QUESTION_SYSTEM,
+                f"현재 수집된 여행 계획 정보:\n{current_plan}",
+            )
 
-위 정보를 바탕으로 사용자에게 다음에 물어볼 질문을 생성하세요.
-아직 수집되지 않은 필수 정보를 우선적으로 물어보세요."""
+        return _build_messages(
+            template.system, template.render_user(current_plan=current_plan)
+        )
 
-        with open(prompt_file, "r", encoding="utf-8") as f:
-            template = yaml.safe_load(f)
+    def load_parser_messages(
+        self, user_response: str, current_plan: Dict[str, Any] = None
+    ) -> List[MessageDict]:
+        """
+        파싱 메시지 로드
 
-        if "user_template" in template:
-            return template["user_template"].format(current_plan=current_plan)
+        Args:
+            user_response: 사용자 응답
+            current_plan: 현재 수집된 plan (선택적)
 
-        return str(template)
+        Returns:
+            [system, user] 메시지 목록
+        """
+        template = self.registry.get("slot_updater")
+        user_response = clip_text(user_response, EnvConfig.MAX_PROMPT_INPUT_CHARS)
+
+        if template is None:
+            # 기본 프롬프트 반환
+            return _build_messages(
+                DEFAULT_PARSER_SYSTEM,
+                f"다음 사용자 응답에서 여행 계획 정보를 추출하세요:\n\"{user_response}\"",
+            )
+
+        return _build_messages(
+            template.system,
+            template.render_user(
+                user_response=user_response, current_plan=current_plan or {}
+            ),
+        )
+
+    def load_question_prompt(self, current_plan: Dict[str, Any]) -> str:
+        """
+        질문 생성 프롬프트 로드 (단일 문자열)
+
+        Args:
+            current_plan: 현재 수집된 plan
+
+        Returns:
+            system과 user 메시지를 합친 프롬프트 문자열
+        """
+        return messages_to_text(self.load_question_messages(current_plan))
 
     def load_parser_prompt(
         self, user_response: str, current_plan: Dict[str, Any] = None
     ) -> str:
         """
-        파싱 프롬프트 로드
+        파싱 프롬프트 로드 (단일 문자열)
 
         Args:
             user_response: 사용자 응답
             current_plan: 현재 수집된 plan (선택적)
 
         Returns:
-            포맷팅된 프롬프트 문자열
+            system과 user 메시지를 합친 프롬프트 문자열
         """
-        prompt_file = self.prompts_dir / "slot_updater.yaml"
+        return messages_to_text(self.load_parser_messages(user_response, current_plan))
 
-        if not prompt_file.exists():
-            # 기본 프롬프트 반환
-            return f"""다음 사용자 응답에서 여행 계획 정보를 추출하세요:
-"{user_response}"
-
-JSON 형식으로 추출된 정보를 반환하세요. 예:
-{{"destination": "제주도", "start_date": "2026-03-15"}}
 
-정보가 없으면 빈 객체 {{}}를 반환하세요."""
+def _build_messages(system: Optional[str], user: str) -> List[MessageDict]:
+    """
+    system/user 메시지 목록 생성
 
-        with open(prompt_file, "r", encoding="utf-8") as f:
-            template = yaml.safe_load(f)
-
-        if "user_template" in template:
-            return template["user_template"].format(
-                user_response=user_response, current_plan=current_plan or {}
-            )
+    Args:
+        system: 고정 system 프롬프트 (없으면 생략)
+        user: 가변 user 프롬프트
 
-        return str(template)
+    Returns:
+        메시지 목록
+    """
+    messages = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": user})
+    return messages
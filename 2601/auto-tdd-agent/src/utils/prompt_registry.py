@@ -0,0 +1,231 @@
+"""
+프롬프트 템플릿 레지스트리
+
+YAML 템플릿을 한 번만 파싱하여 미리 컴파일된 렌더러로 보관하고,
+파일 mtime을 주기적으로 확인해 변경 시 원자적으로 교체합니다.
+"""
+
+import hashlib
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from string import Formatter
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+import yaml
+
+from ..core.env_config import EnvConfig
+from ..core.file_watch import FileWatch
+
+
+class CompiledFormat:
+    """
+    미리 파싱된 str.format 템플릿
+
+    템플릿 문자열을 리터럴/필드 조각으로 한 번만 분해해 두고,
+    렌더링 시에는 조각을 이어 붙이기만 합니다.
+    """
+
+    __slots__ = ("source", "fields", "_parts", "_simple")
+
+    def __init__(self, source: str):
+        """
+        Args:
+            source: str.format 형식의 템플릿 문자열
+        """
+        self.source = source
+        parts = []
+        fields = set()
+        simple = True
+
+        for literal, field_name, spec, conversion in Formatter().parse(source):
+            if literal:
+                parts.append((literal, None, None, None))
+            if field_name is None:
+                continue
+            # 속성/인덱스 접근이나 중첩 포맷은 str.format에 맡김
+            if not field_name.isidentifier() or "{" in (spec or ""):
+                simple = False
+            fields.add(field_name)
+            parts.append((None, field_name, spec or "", conversion))
+
+        self.fields: FrozenSet[str] = frozenset(fields)
+        self._parts: Tuple = tuple(parts)
+        self._simple = simple
+
+    def render(self, **kwargs: Any) -> str:
+        """
+        템플릿 렌더링
+
+        Args:
+            **kwargs: 템플릿 필드 값
+
+        Returns:
+            렌더링된 문자열
+        """
+        if not self._simple:
+            return self.source.format(**kwargs)
+
+        out = []
+        for literal, name, spec, conversion in self._parts:
+            if name is None:
+                out.append(literal)
+                continue
+            value = kwargs[name]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            elif conversion == "s":
+                value = str(value)
+            out.append(format(value, spec))
+        return "".join(out)
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """컴파일된 프롬프트 템플릿 (버전별 불변 객체)"""
+    name: str
+    system: Optional[str]
+    user: Optional[CompiledFormat]
+    content_hash: str  # 파일 내용 해시 (다운스트림 캐시 키)
+    raw: Any  # yaml.safe_load 결과
+
+    def render_user(self, **kwargs: Any) -> str:
+        """
+        user_template 렌더링
+
+        Args:
+            **kwargs: 템플릿 필드 값
+
+        Returns:
+            렌더링된 사용자 프롬프트
+        """
+        if self.user is None:
+            return str(self.raw)
+        return self.user.render(**kwargs)
+
+
+class _Entry:
+    """레지스트리 내부 항목: 현재 템플릿 버전과 파일 감시기"""
+
+    __slots__ = ("template", "watch")
+
+    def __init__(self, template: Optional[PromptTemplate], watch: FileWatch):
+        self.template = template
+        self.watch = watch
+
+
+class PromptRegistry:
+    """프롬프트 템플릿 레지스트리"""
+
+    def __init__(self, prompts_dir: Path, check_interval: Optional[float] = None):
+        """
+        Args:
+            prompts_dir: 프롬프트 디렉토리 경로
+            check_interval: 파일 변경 확인 주기 (초, None인 경우 환경 변수 값 사용)
+        """
+        self.prompts_dir = Path(prompts_dir)
+        self.check_interval = (
+            EnvConfig.RELOAD_CHECK_INTERVAL if check_interval is None else check_interval
+        )
+        self._entries: Dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[PromptTemplate]:
+        """
+        템플릿 조회 (필요 시 로드/리로드)
+
+        Args:
+            name: 템플릿 이름 (확장자 제외, 예: "question_generator")
+
+        Returns:
+            PromptTemplate 또는 파일이 없으면 None
+        """
+        entry = self._entries.get(name)
+        if entry is not None and not entry.watch.changed():
+            return entry.template
+
+        with self._lock:
+            # 다른 스레드가 먼저 리로드했을 수 있으므로 다시 확인
+            current = self._entries.get(name)
+            if current is not None and current is not entry:
+                return current.template
+
+            watch = FileWatch(self.prompts_dir / f"{name}.yaml", self.check_interval)
+            try:
+                template = self._load(name, watch)
+            except yaml.YAMLError:
+                # 쓰는 도중의 파일 등 파싱 실패 시 이전 버전 유지
+                if entry is None:
+                    raise
+                template = entry.template
+            # 딕셔너리 항목 교체는 원자적이므로 읽는 쪽은 이전/새 버전 중 하나만 봄
+            self._entries[name] = _Entry(template, watch)
+            return template
+
+    def invalidate(self, name: Optional[str] = None):
+        """
+        캐시 무효화 (다음 조회 시 다시 로드)
+
+        Args:
+            name: 템플릿 이름 (None인 경우 전체)
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def _load(self, name: str, watch: FileWatch) -> Optional[PromptTemplate]:
+        """
+        템플릿 파일 로드 및 컴파일
+
+        Args:
+            name: 템플릿 이름
+            watch: 파일 감시기
+
+        Returns:
+            PromptTemplate 또는 파일이 없으면 None
+        """
+        if watch.mark() is None:
+            return None
+
+        try:
+            data = watch.path.read_bytes()
+        except OSError:
+            return None
+
+        raw = yaml.safe_load(data.decode("utf-8"))
+        fields = raw if isinstance(raw, dict) else {}
+
+        user_template = fields.get("user_template")
+        return PromptTemplate(
+            name=name,
+            system=fields.get("system"),
+            user=CompiledFormat(user_template) if user_template is not None else None,
+            content_hash=hashlib.sha256(data).hexdigest()[:16],
+            raw=raw,
+        )
+
+
+_registries: Dict[Path, PromptRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_prompt_registry(prompts_dir: Path) -> PromptRegistry:
+    """
+    디렉토리별 공유 PromptRegistry 반환
+
+    Args:
+        prompts_dir: 프롬프트 디렉토리 경로
+
+    Returns:
+        프로세스 내에서 공유되는 PromptRegistry 인스턴스
+    """
+    key = Path(prompts_dir).resolve()
+    registry = _registries.get(key)
+    if registry is None:
+        with _registries_lock:
+            registry = _registries.setdefault(key, PromptRegistry(key))
+    return registry
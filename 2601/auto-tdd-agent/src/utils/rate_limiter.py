@@ -0,0 +1,352 @@
+"""
+LLM 호출 속도 제한 (프로세스 간 공유 토큰 버킷)
+
+워커 프로세스가 각자 GLM을 호출하면 합쳐서 계정의 분당 요청 수(RPM)와 분당 토큰 수(TPM)
+한도를 넘어 429와 재시도가 이어집니다. RateLimiter는 요청 수와 토큰 수 버킷을 한 SQLite
+파일에 두고, 같은 호스트의 모든 프로세스가 BEGIN IMMEDIATE 잠금 아래에서 함께 차감합니다.
+
+우선순위는 버킷 여유분으로 구분합니다. 높은 우선순위(응답 파싱)는 버킷을 끝까지 쓰고,
+낮은 우선순위(질문 생성)는 버킷에 reserve 비율 이상이 남아 있을 때만 가져가므로 한도에
+가까워지면 파싱 호출이 먼저 통과합니다.
+"""
+import asyncio
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from ..core.env_config import EnvConfig
+
+PRIORITY_HIGH = "high"
+PRIORITY_LOW = "low"
+
+# 버킷 용량: 이 시간(초) 동안의 한도만큼 몰아서 쓸 수 있음
+_BURST_SECONDS = 10.0
+# 한 번에 기다리는 최대 시간 (다른 프로세스가 돌려준 토큰을 다시 확인하는 주기)
+_MAX_SLEEP = 0.5
+# 응답 토큰 예상치 (호출 전 차감, 호출 후 실제 사용량으로 정산)
+_COMPLETION_TOKENS = 256
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS buckets ("
+    "name TEXT PRIMARY KEY, level REAL NOT NULL, updated REAL NOT NULL) WITHOUT ROWID"
+)
+_SELECT = "SELECT name, level, updated FROM buckets"
+_UPSERT = (
+    "INSERT INTO buckets (name, level, updated) VALUES (?, ?, ?) "
+    "ON CONFLICT(name) DO UPDATE SET level = excluded.level, updated = excluded.updated"
+)
+
+
+def estimate_tokens(messages: Union[str, Sequence[Any]], completion: int = _COMPLETION_TOKENS) -> int:
+    """
+    호출 전 토큰 수 예상 (프롬프트 글자 수 기준, 한글은 대략 글자당 1토큰으로 넉넉하게)
+
+    Args:
+        messages: 프롬프트 문자열 또는 메시지 목록 (dict의 content나 객체의 content)
+        completion: 응답 토큰 예상치
+
+    Returns:
+        예상 토큰 수
+    """
+    if isinstance(messages, str):
+        return len(messages) + completion
+    total = 0
+    for message in messages:
+        content = message.get("content", "") if isinstance(message, dict) else getattr(message, "content", message)
+        total += len(content) if isinstance(content, str) else len(str(content))
+    return total + completion
+
+
+class RateLimiter:
+    """
+    요청 수 + 토큰 수 토큰 버킷 (SQLite 파일로 프로세스 간 공유)
+
+    acquire(tokens)는 두 버킷 모두에 여유가 생길 때까지 기다린 뒤 요청 1개와 tokens개를
+    차감합니다. 호출 후 settle(예상, 실제)로 토큰 차이를 돌려주거나 더 차감합니다.
+    버킷 상태는 파일에 있으므로 같은 경로를 쓰는 모든 프로세스가 한 한도를 나눠 씁니다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        low_priority_reserve: float = 0.2,
+        timeout: float = 30.0,
+        busy_timeout_ms: int = 5000,
+    ):
+        """
+        Args:
+            path: 버킷 SQLite 파일 경로 (같은 한도를 나눠 쓸 프로세스가 같은 경로 사용)
+            requests_per_minute: 분당 요청 수 한도 (0이면 제한 없음)
+            tokens_per_minute: 분당 토큰 수 한도 (0이면 제한 없음)
+            low_priority_reserve: 낮은 우선순위 호출이 남겨 둬야 하는 버킷 비율 (0~1)
+            timeout: acquire 기본 기한 (초)
+            busy_timeout_ms: 다른 프로세스가 버킷을 쓰는 중일 때 기다리는 최대 시간
+
+        Raises:
+            ValueError: 한도가 음수이거나 low_priority_reserve가 0~1 밖인 경우
+        """
+        if requests_per_minute < 0 or tokens_per_minute < 0:
+            raise ValueError("한도는 0 이상이어야 합니다")
+        if not 0.0 <= low_priority_reserve < 1.0:
+            raise ValueError("low_priority_reserve는 0 이상 1 미만이어야 합니다")
+        self.path = str(path)
+        self.timeout = timeout
+        self.low_priority_reserve = low_priority_reserve
+        # (이름, 초당 보충량, 용량) - 용량이 1보다 작으면 요청이 통과하지 못하므로 최소 1
+        self._buckets: List[Tuple[str, float, float]] = [
+            (name, per_minute / 60.0, max(1.0, per_minute / 60.0 * _BURST_SECONDS))
+            for name, per_minute in (("requests", requests_per_minute), ("tokens", tokens_per_minute))
+            if per_minute > 0
+        ]
+
+        self._conn = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None, cached_statements=16
+        )
+        self._conn.execute(f"PRAGMA busy_timeout = {int(busy_timeout_ms)}")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute(_SCHEMA)
+        self._lock = threading.Lock()  # 연결 사용
+
+        self._stats_lock = threading.Lock()
+        self.acquired = 0
+        self.timeouts = 0
+        self.waited = 0.0  # 기다린 시간 합계 (초)
+
+    # 버킷 연산
+
+    def _refilled(self, now: float) -> Dict[str, float]:
+        """저장된 잔량에 지난 시간만큼 보충한 값 (연결 잠금 안에서 호출)"""
+        stored = {name: (level, updated) for name, level, updated in self._conn.execute(_SELECT)}
+        levels = {}
+        for name, rate, capacity in self._buckets:
+            level, updated = stored.get(name, (capacity, now))
+            levels[name] = min(capacity, level + max(0.0, now - updated) * rate)
+        return levels
+
+    def _take(self, tokens: int, reserve: float) -> float:
+        """
+        두 버킷을 보충한 뒤 여유가 있으면 차감
+
+        Returns:
+            0.0 (차감함) 또는 다시 시도하기까지 기다릴 시간 (초)
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                levels = self._refilled(now)
+                wait = 0.0
+                for name, rate, capacity in self._buckets:
+                    level = levels[name]
+                    cost = 1.0 if name == "requests" else float(tokens)
+                    # 용량보다 큰 호출은 버킷이 가득 찼을 때 통과 (이후 잠시 음수)
+                    need = min(capacity, cost + reserve * capacity)
+                    if level < need:
+                        wait = max(wait, (need - level) / rate)
+                if wait == 0.0:
+                    for name in levels:
+                        levels[name] -= 1.0 if name == "requests" else float(tokens)
+                self._conn.executemany(_UPSERT, [(name, level, now) for name, level in levels.items()])
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def _reserve_for(self, priority: str) -> float:
+        return self.low_priority_reserve if priority == PRIORITY_LOW else 0.0
+
+    def _deadline_wait(self, wait: float, deadline: float, started: float) -> float:
+        """다음 시도까지 잘 시간 (기한이 지나면 TimeoutError)"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            with self._stats_lock:
+                self.timeouts += 1
+                self.waited += time.monotonic() - started
+            raise TimeoutError(f"LLM 호출 한도 대기 시간 초과 ({self.path})")
+        return min(wait, _MAX_SLEEP, remaining)
+
+    def _acquired(self, started: float):
+        with self._stats_lock:
+            self.acquired += 1
+            self.waited += time.monotonic() - started
+
+    def acquire(self, tokens: int = 0, *, priority: str = PRIORITY_HIGH, timeout: Optional[float] = None):
+        """
+        요청 1개와 토큰 tokens개를 받을 때까지 대기
+
+        Args:
+            tokens: 차감할 토큰 수 (예상치)
+            priority: PRIORITY_HIGH 또는 PRIORITY_LOW
+            timeout: 기한 (초, None인 경우 생성 시 timeout)
+
+        Raises:
+            TimeoutError: 기한 안에 한도를 받지 못한 경우
+        """
+        started = time.monotonic()
+        deadline = started + (self.timeout if timeout is None else timeout)
+        reserve = self._reserve_for(priority)
+        while True:
+            wait = self._take(tokens, reserve)
+            if wait == 0.0:
+                self._acquired(started)
+                return
+            time.sleep(self._deadline_wait(wait, deadline, started))
+
+    async def aacquire(self, tokens: int = 0, *, priority: str = PRIORITY_HIGH, timeout: Optional[float] = None):
+        """acquire의 async 버전 (기다리는 동안 이벤트 루프를 막지 않음)"""
+        started = time.monotonic()
+        deadline = started + (self.timeout if timeout is None else timeout)
+        reserve = self._reserve_for(priority)
+        loop = asyncio.get_running_loop()
+        while True:
+            # 다른 프로세스가 잠금을 쥐고 있으면 busy_timeout만큼 막힐 수 있으므로 스레드에서 실행
+            wait = await loop.run_in_executor(None, self._take, tokens, reserve)
+            if wait == 0.0:
+                self._acquired(started)
+                return
+            await asyncio.sleep(self._deadline_wait(wait, deadline, started))
+
+    def settle(self, estimated: int, actual: Optional[int]):
+        """
+        호출 후 토큰 정산 (예상보다 적게 쓰면 돌려주고 많이 쓰면 더 차감)
+
+        Args:
+            estimated: acquire에 넘긴 예상 토큰 수
+            actual: 실제 사용 토큰 수 (None인 경우 정산하지 않음)
+        """
+        if actual is None or actual == estimated:
+            return
+        capacity = next((b[2] for b in self._buckets if b[0] == "tokens"), None)
+        if capacity is None:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                level = min(capacity, self._refilled(now)["tokens"] + (estimated - actual))
+                self._conn.execute(_UPSERT, ("tokens", level, now))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def levels(self) -> Dict[str, float]:
+        """
+        현재 버킷 잔량 (보충 반영)
+
+        Returns:
+            {"requests": 남은 요청 수, "tokens": 남은 토큰 수} (제한이 없는 버킷은 빠짐)
+        """
+        with self._lock:
+            return self._refilled(time.time())
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        이 프로세스의 누적 지표
+
+        Returns:
+            {"acquired", "timeouts", "waited" (초), "levels"}
+        """
+        with self._stats_lock:
+            stats = {"acquired": self.acquired, "timeouts": self.timeouts, "waited": self.waited}
+        stats["levels"] = self.levels()
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimitedLLM:
+    """
+    LLM 클라이언트 래퍼: 호출 전에 한도를 받고, 호출 후 실제 토큰 사용량으로 정산
+
+    invoke/ainvoke 외의 속성은 감싼 클라이언트로 넘깁니다.
+    """
+
+    def __init__(self, llm: Any, limiter: RateLimiter, priority: str = PRIORITY_HIGH):
+        """
+        Args:
+            llm: invoke(messages)를 제공하는 LLM 클라이언트
+            limiter: 공유 RateLimiter
+            priority: 이 호출 위치의 우선순위
+        """
+        self.llm = llm
+        self.limiter = limiter
+        self.priority = priority
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.llm, name)
+
+    @staticmethod
+    def _usage(response: Any) -> Optional[int]:
+        usage = getattr(response, "usage_metadata", None)
+        if isinstance(usage, dict) and usage.get("total_tokens") is not None:
+            return int(usage["total_tokens"])
+        return None
+
+    def invoke(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        """한도를 받은 뒤 호출 (기한 초과 시 TimeoutError)"""
+        estimated = estimate_tokens(messages)
+        self.limiter.acquire(estimated, priority=self.priority)
+        response = self.llm.invoke(messages, *args, **kwargs)
+        self.limiter.settle(estimated, self._usage(response))
+        return response
+
+    async def ainvoke(self, messages: Any, *args: Any, **kwargs: Any) -> Any:
+        """invoke의 async 버전"""
+        estimated = estimate_tokens(messages)
+        await self.limiter.aacquire(estimated, priority=self.priority)
+        response = await self.llm.ainvoke(messages, *args, **kwargs)
+        self.limiter.settle(estimated, self._usage(response))
+        return response
+
+
+_shared: Optional[RateLimiter] = None
+_shared_pid: Optional[int] = None
+_shared_lock = threading.Lock()
+
+
+def default_rate_limit_path() -> Path:
+    """
+    기본 버킷 파일 경로 (임시 디렉터리, API 키별로 하나라 같은 계정의 프로세스가 공유)
+
+    Returns:
+        SQLite 파일 경로
+    """
+    account = hashlib.sha256(f"{EnvConfig.GLM_BASE_URL}|{EnvConfig.GLM_API_KEY}".encode("utf-8"))
+    return Path(tempfile.gettempdir()) / f"auto-tdd-llm-{account.hexdigest()[:12]}.sqlite"
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    LLM_MAX_RPM/LLM_MAX_TPM 환경 설정에 따른 프로세스 공유 RateLimiter 반환
+
+    fork된 워커에서는 부모의 SQLite 연결을 쓰지 않도록 프로세스마다 새로 엽니다.
+
+    Returns:
+        RateLimiter (두 한도가 모두 0이면 None, 제한 없음)
+    """
+    global _shared, _shared_pid
+    if EnvConfig.LLM_MAX_RPM <= 0 and EnvConfig.LLM_MAX_TPM <= 0:
+        return None
+    with _shared_lock:
+        if _shared is None or _shared_pid != os.getpid():
+            _shared = RateLimiter(
+                EnvConfig.LLM_RATE_LIMIT_DB or default_rate_limit_path(),
+                requests_per_minute=EnvConfig.LLM_MAX_RPM,
+                tokens_per_minute=EnvConfig.LLM_MAX_TPM,
+                low_priority_reserve=EnvConfig.LLM_LOW_PRIORITY_RESERVE,
+                timeout=EnvConfig.LLM_RATE_LIMIT_TIMEOUT,
+            )
+            _shared_pid = os.getpid()
+        return _shared
@@ -1,9 +1,255 @@
 """
 데이터 검증 로직
+
+AgentConfig.slot_types를 슬롯별 검증/정규화 함수로 한 번만 컴파일해 두고
+(설정 해시 기준 캐시), 값마다 타입 문자열을 분기하지 않습니다.
 """
+import datetime
 import re
-from typing import Any
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple
 from ..core.config import AgentConfig
+from ..core.plan import PlanRecord, iter_bits
+
+_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+_LOOSE_DATE_PATTERN = re.compile(r'^\s*(\d{4})\s*[-./년]\s*(\d{1,2})\s*[-./월]\s*(\d{1,2})\s*일?\s*$')
+_MONEY_TOKEN_PATTERN = re.compile(r'\d+(?:\.\d+)?|[억만천백십]')
+_MONEY_ALLOWED_PATTERN = re.compile(r'^[\d.,\s억천백십만원정도쯤약대이하내외]+$')
+# 쉼표가 들어간 숫자 (숫자 사이의 쉼표만, 문장 부호로 쓴 쉼표는 제외)와 올바른 세 자리 묶음
+_MONEY_COMMA_NUMBER_PATTERN = re.compile(r'\d[\d,]*,\d+')
+_MONEY_GROUPED_PATTERN = re.compile(r'\d{1,3}(?:,\d{3})+')
+# 만/억 그룹 안에서 앞 숫자에 곱하는 자리 단위와, 그룹을 닫는 큰 단위
+_MONEY_DIGIT_UNITS = {"십": 10, "백": 100, "천": 1_000}
+_MONEY_GROUP_UNITS = {"만": 10_000, "억": 100_000_000}
+
+
+def parse_date(value: Any) -> Optional[datetime.date]:
+    """
+    날짜 값 파싱 (존재하는 날짜인지까지 확인)
+
+    Args:
+        value: date 객체 또는 YYYY-MM-DD / YYYY.M.D / YYYY년 M월 D일 문자열
+
+    Returns:
+        datetime.date 또는 파싱 실패 시 None
+    """
+    if isinstance(value, datetime.date):
+        return value
+    if not isinstance(value, str):
+        return None
+
+    match = _DATE_PATTERN.match(value) or _LOOSE_DATE_PATTERN.match(value)
+    if not match:
+        return None
+
+    year, month, day = match.groups()
+    try:
+        return datetime.date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def parse_budget(value: Any) -> Optional[int]:
+    """
+    예산 값을 원 단위 정수로 파싱
+
+    단위 앞에 숫자가 없으면 1로 봅니다 ("만원" → 10000, "천만원" → 10000000).
+    쉼표는 세 자리 묶음일 때만 허용합니다 ("1,5"는 15가 아니라 파싱 실패).
+
+    Args:
+        value: 숫자 또는 "50만원", "1억 5천만원", "300,000원" 형식 문자열
+
+    Returns:
+        원 단위 금액 또는 파싱 실패 시 None
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value >= 0 else None
+    if not isinstance(value, str) or not _MONEY_ALLOWED_PATTERN.match(value):
+        return None
+
+    for number in _MONEY_COMMA_NUMBER_PATTERN.findall(value):
+        if not _MONEY_GROUPED_PATTERN.fullmatch(number):
+            return None
+
+    tokens = _MONEY_TOKEN_PATTERN.findall(value.replace(",", ""))
+    if not tokens:
+        return None
+
+    # 자리 단위(십/백/천)는 앞 숫자에 곱해 그룹에 더하고, 큰 단위(만/억)가 그룹을 닫음
+    # ("1천5백만" → (1000 + 500) × 만)
+    total = 0.0
+    group = 0.0
+    number = None
+    has_digit_unit = False
+    last_group_unit = None
+    for token in tokens:
+        if token[0].isdigit():
+            if number is not None:
+                group += number
+            number = float(token)
+        elif token in _MONEY_DIGIT_UNITS:
+            group += (1 if number is None else number) * _MONEY_DIGIT_UNITS[token]
+            number = None
+            has_digit_unit = True
+        else:
+            group += number or 0
+            total += (group or 1) * _MONEY_GROUP_UNITS[token]
+            group, number, has_digit_unit = 0.0, None, False
+            last_group_unit = token
+
+    group += number or 0
+    # "1억5천"처럼 억 뒤에 만 없이 자리 단위로 끝나면 만 단위를 생략한 것으로 봄
+    if has_digit_unit and last_group_unit == "억":
+        group *= _MONEY_GROUP_UNITS["만"]
+    return int(total + group)
+
+
+def format_budget(amount: int) -> str:
+    """
+    원 단위 금액을 "100만원" 형식 문자열로 변환
+
+    Args:
+        amount: 원 단위 금액
+
+    Returns:
+        만/억 단위 문자열 (만 단위로 나누어떨어지지 않으면 원 단위)
+    """
+    if amount % 10_000:
+        return f"{amount:,}원"
+
+    man = amount // 10_000
+    eok, man = divmod(man, 10_000)
+    if not eok:
+        return f"{man}만원"
+    if not man:
+        return f"{eok}억원"
+    return f"{eok}억 {man}만원"
+
+
+def _is_non_empty_string(value: Any) -> bool:
+    return isinstance(value, str) and len(value) > 0
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float))
+
+
+def _is_date(value: Any) -> bool:
+    # 정규화 전 저장 형식(YYYY-MM-DD)만 허용하고 실제 존재하는 날짜인지 확인
+    if not isinstance(value, str) or not _DATE_PATTERN.match(value):
+        return False
+    return parse_date(value) is not None
+
+
+def _is_money(value: Any) -> bool:
+    return parse_budget(value) is not None
+
+
+def _normalize_string(value: Any) -> Any:
+    return " ".join(value.split()) if isinstance(value, str) else value
+
+
+def _normalize_date(value: Any) -> Any:
+    date = parse_date(value)
+    return date.isoformat() if date else value
+
+
+def _normalize_number(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            number = float(value.replace(",", ""))
+        except ValueError:
+            return value
+        return int(number) if number.is_integer() else number
+    return value
+
+
+def _normalize_money(value: Any) -> Any:
+    if isinstance(value, str):
+        # 규칙 엔진이 발화마다 같은 금액 표현을 다시 정규화하므로 문자열은 캐시
+        return _normalize_money_text(value)
+    amount = parse_budget(value)
+    return format_budget(amount) if amount is not None else value
+
+
+@lru_cache(maxsize=1024)
+def _normalize_money_text(value: str) -> str:
+    amount = parse_budget(value)
+    return format_budget(amount) if amount is not None else value
+
+
+def _accept(value: Any) -> bool:
+    return True
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# 타입 이름 → (검증 함수, 정규화 함수)
+_TYPE_RULES: Dict[str, Tuple[Callable[[Any], bool], Callable[[Any], Any]]] = {
+    'string': (_is_non_empty_string, _normalize_string),
+    'date': (_is_date, _normalize_date),
+    'number': (_is_number, _normalize_number),
+    'money': (_is_money, _normalize_money),
+}
+
+
+def get_type_normalizer(type_name: str) -> Callable[[Any], Any]:
+    """
+    슬롯 타입 이름에 해당하는 정규화 함수 반환
+
+    Args:
+        type_name: 타입 이름 ("string", "date", "number", "money")
+
+    Returns:
+        정규화 함수
+
+    Raises:
+        ValueError: 알 수 없는 타입 이름
+    """
+    try:
+        return _TYPE_RULES[type_name][1]
+    except KeyError:
+        raise ValueError(f"알 수 없는 정규화 타입: {type_name}") from None
+
+
+@dataclass(frozen=True)
+class CompiledSlot:
+    """컴파일된 슬롯 검증기"""
+    name: str
+    type_name: Optional[str]
+    validate: Callable[[Any], bool]
+    normalize: Callable[[Any], Any]
+
+
+class PlanValidationResult(NamedTuple):
+    """plan 하나의 검증 결과"""
+    valid: bool
+    invalid_slots: Tuple[str, ...]  # 타입 검증 실패 슬롯
+    missing_slots: Tuple[str, ...]  # 누락된 필수 슬롯
+
+
+@lru_cache(maxsize=32)
+def compile_slot_validators(config: AgentConfig) -> Mapping[str, CompiledSlot]:
+    """
+    slot_types를 슬롯별 검증기로 컴파일 (설정별 캐시)
+
+    Args:
+        config: Agent 설정
+
+    Returns:
+        슬롯 이름 → CompiledSlot
+    """
+    compiled = {}
+    for slot, type_name in config.slot_types.items():
+        validate, normalize = _TYPE_RULES.get(type_name, (_accept, _identity))
+        compiled[slot] = CompiledSlot(slot, type_name, validate, normalize)
+    return MappingProxyType(compiled)
 
 
 class PlanValidator:
@@ -15,6 +261,7 @@ class PlanValidator:
             config: Agent 설정
         """
         self.config = config
+        self.slots = compile_slot_validators(config)
 
     def validate_slot_type(self, slot_name: str, value: Any) -> bool:
         """
@@ -27,17 +274,27 @@ class PlanValidator:
         Returns:
             검증 성공 여부
         """
-        expected_type = self.config.slot_types.get(slot_name)
-
-        if expected_type == 'date':
-            return self._is_valid_date(value)
-        elif expected_type == 'string':
-            return isinstance(value, str) and len(value) > 0
-        elif expected_type == 'number':
-            return isinstance(value, (int, float))
+        compiled = self.slots.get(slot_name)
 
         # 타입이 정의되지 않은 경우 통과
-        return True
+        if compiled is None:
+            return True
+
+        return compiled.validate(value)
+
+    def normalize_slot(self, slot_name: str, value: Any) -> Any:
+        """
+        슬롯 값 정규화 (예: "2026.3.5" → "2026-03-05", "100 만 원" → "100만원")
+
+        Args:
+            slot_name: 슬롯 이름
+            value: 정규화할 값
+
+        Returns:
+            정규화된 값 (정규화할 수 없으면 원래 값)
+        """
+        compiled = self.slots.get(slot_name)
+        return compiled.normalize(value) if compiled else value
 
     def _is_valid_date(self, value: str) -> bool:
         """
@@ -47,14 +304,9 @@ class PlanValidator:
             value: 검증할 날짜 문자열
 
         Returns:
-            유효한 날짜 형식인지 여부
+            YYYY-MM-DD 형식이고 실제 존재하는 날짜인지 여부
         """
-        if not isinstance(value, str):
-            return False
-
-        # YYYY-MM-DD 형식 검증
-        pattern = r'^\d{4}-\d{2}-\d{2}$'
-        return bool(re.match(pattern, value))
+        return _is_date(value)
 
     def validate_plan_completeness(self, plan: dict) -> tuple[bool, list]:
         """
@@ -66,11 +318,59 @@ class PlanValidator:
         Returns:
             (완성 여부, 누락된 필수 슬롯 목록)
         """
-        missing_slots = []
+        record = PlanRecord.from_plan(self.config, plan)
+        return record.is_complete(), record.missing_required()
+
+    def validate_plan(self, plan: Mapping[str, Any]) -> PlanValidationResult:
+        """
+        Plan 전체 검증 (타입 + 완성도)
+
+        Args:
+            plan: 검증할 plan
+
+        Returns:
+            검증 결과
+        """
+        return next(self.validate_many((plan,)))
+
+    def validate_many(
+        self, plans: Iterable[Mapping[str, Any]]
+    ) -> Iterator[PlanValidationResult]:
+        """
+        여러 plan 일괄 검증
+
+        입력을 스트리밍으로 처리하므로 저장된 대량의 plan에도 메모리가 일정합니다.
+
+        Args:
+            plans: 검증할 plan들 (dict 또는 PlanRecord)
+
+        Yields:
+            plan별 검증 결과 (입력 순서)
+        """
+        # 루프 안에서 속성 조회를 피하기 위해 지역 변수로 바인딩
+        validators = {slot: compiled.validate for slot, compiled in self.slots.items()}
+        get_validator = validators.get
+        config = self.config
+        slot_index = config.slot_index
+        required_mask = config.required_mask
+        all_slots = config.all_slots
+
+        for plan in plans:
+            invalid = []
+            filled = 0
+            for slot, value in plan.items():
+                if not value:
+                    continue
+                index = slot_index.get(slot)
+                if index is not None:
+                    filled |= 1 << index
+                validate = get_validator(slot)
+                if validate is not None and not validate(value):
+                    invalid.append(slot)
 
-        for slot in self.config.required_slots:
-            if slot not in plan or not plan[slot]:
-                missing_slots.append(slot)
+            missing_mask = required_mask & ~filled
+            missing = ()
+            if missing_mask:
+                missing = tuple(all_slots[i] for i in iter_bits(missing_mask))
 
-        is_complete = len(missing_slots) == 0
-        return is_complete, missing_slots
+            yield PlanValidationResult(not invalid and not missing, tuple(invalid), missing)
@@ -6,7 +6,8 @@ from .evaluator import (
     EvaluationResult,
     evaluate_plan,
     plans_match,
-    classify_failure
+    classify_failure,
+    audit_plans
 )
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     "evaluate_plan",
     "plans_match",
     "classify_failure",
+    "audit_plans",
 ]
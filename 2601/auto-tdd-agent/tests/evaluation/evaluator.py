@@ -1,9 +1,13 @@
 """
 Evaluator: 평가 로직 및 실패 분류
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Mapping, Optional
+
+from src.core.config import AgentConfig, load_config
+from src.services.text_normalizer import normalize_text
+from src.utils.validator import PlanValidator
 
 
 class FailureCategory(Enum):
@@ -26,13 +30,16 @@ class EvaluationResult:
     turn_count: int
     failure_category: Optional[FailureCategory] = None
     failure_detail: Optional[str] = None
+    # 슬롯 → {"confidence", "source", "rule_id"} (최종 plan 값의 출처)
+    provenance: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
 
 def evaluate_plan(
     final_plan: Dict[str, Any],
     ground_truth: Dict[str, Any],
     turn_history: List[Dict[str, str]],
-    max_turns: int = 15
+    max_turns: int = 15,
+    provenance: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> EvaluationResult:
     """
     최종 plan을 ground_truth와 비교하여 평가
@@ -42,11 +49,13 @@ def evaluate_plan(
         ground_truth: 기대되는 정답 plan
         turn_history: 턴별 질문/응답 히스토리
         max_turns: 최대 허용 턴 수
+        provenance: 최종 plan 슬롯별 출처 정보 (상태의 slot_provenance)
 
     Returns:
         평가 결과
     """
     turn_count = len(turn_history)
+    provenance = provenance or {}
 
     # 턴 수 초과 확인
     if turn_count > max_turns:
@@ -56,7 +65,8 @@ def evaluate_plan(
             ground_truth=ground_truth,
             turn_count=turn_count,
             failure_category=FailureCategory.TURN_OVERFLOW,
-            failure_detail=f"최대 턴 수({max_turns})를 초과했습니다: {turn_count}턴"
+            failure_detail=f"최대 턴 수({max_turns})를 초과했습니다: {turn_count}턴",
+            provenance=provenance
         )
 
     # Plan 비교
@@ -65,7 +75,8 @@ def evaluate_plan(
             success=True,
             final_plan=final_plan,
             ground_truth=ground_truth,
-            turn_count=turn_count
+            turn_count=turn_count,
+            provenance=provenance
         )
 
     # 실패 원인 분류
@@ -79,7 +90,8 @@ def evaluate_plan(
         ground_truth=ground_truth,
         turn_count=turn_count,
         failure_category=failure_cat,
-        failure_detail=failure_detail
+        failure_detail=failure_detail,
+        provenance=provenance
     )
 
 
@@ -98,11 +110,27 @@ def plans_match(plan: Dict[str, Any], ground_truth: Dict[str, Any]) -> bool:
     for key, value in ground_truth.items():
         if key not in plan:
             return False
-        if plan[key] != value:
+        if not values_match(plan[key], value):
             return False
     return True
 
 
+def values_match(value: Any, expected: Any) -> bool:
+    """
+    슬롯 값 비교 (문자열은 파서와 같은 정규화 후 비교)
+
+    Args:
+        value: 수집된 값
+        expected: 정답 값
+
+    Returns:
+        일치 여부 (예: "3박  4일"과 "3박 4일", "３박"과 "3박"은 일치)
+    """
+    if isinstance(value, str) and isinstance(expected, str):
+        return normalize_text(value) == normalize_text(expected)
+    return value == expected
+
+
 def classify_failure(
     final_plan: Dict[str, Any],
     ground_truth: Dict[str, Any],
@@ -134,7 +162,7 @@ def classify_failure(
     # 잘못된 값 확인
     wrong_values = []
     for key, expected_value in ground_truth.items():
-        if key in final_plan and final_plan[key] != expected_value:
+        if key in final_plan and not values_match(final_plan[key], expected_value):
             wrong_values.append(f"{key}: {final_plan[key]} (기대값: {expected_value})")
 
     if wrong_values:
@@ -152,3 +180,69 @@ def classify_failure(
         )
 
     return (FailureCategory.UNKNOWN, "알 수 없는 실패 원인")
+
+
+def accuracy_by_source(results: Iterable[EvaluationResult]) -> Dict[str, Dict[str, int]]:
+    """
+    슬롯 값의 출처별 정확도 집계
+
+    정답에 있는 슬롯 중 최종 plan에 채워진 슬롯만 셉니다. 규칙 값은 규칙 ID별로
+    ("rule:destination.generic"), 출처 정보가 없는 값은 "unknown"으로 묶습니다.
+
+    Args:
+        results: 평가 결과들
+
+    Returns:
+        {출처: {"correct": 건수, "total": 건수}}
+    """
+    summary: Dict[str, Dict[str, int]] = {}
+    for result in results:
+        for slot, expected in result.ground_truth.items():
+            if slot not in result.final_plan:
+                continue
+            info = result.provenance.get(slot)
+            if info is None:
+                key = "unknown"
+            elif info.get("rule_id"):
+                key = f"{info['source']}:{info['rule_id']}"
+            else:
+                key = info["source"]
+            counts = summary.setdefault(key, {"correct": 0, "total": 0})
+            counts["total"] += 1
+            if values_match(result.final_plan[slot], expected):
+                counts["correct"] += 1
+    return summary
+
+
+def audit_plans(
+    plans: Iterable[Mapping[str, Any]],
+    config: Optional[AgentConfig] = None
+) -> Dict[str, Any]:
+    """
+    저장된 plan들을 스키마 기준으로 일괄 검증하여 집계
+
+    입력을 스트리밍으로 처리하므로 대량의 로그에도 사용할 수 있습니다.
+
+    Args:
+        plans: 검증할 plan들
+        config: Agent 설정 (None인 경우 plan_schema.json)
+
+    Returns:
+        {"total", "valid", "invalid_slots": {슬롯: 건수}, "missing_slots": {슬롯: 건수}}
+    """
+    validator = PlanValidator(config or load_config())
+    summary = {"total": 0, "valid": 0, "invalid_slots": {}, "missing_slots": {}}
+    invalid_counts = summary["invalid_slots"]
+    missing_counts = summary["missing_slots"]
+
+    for result in validator.validate_many(plans):
+        summary["total"] += 1
+        if result.valid:
+            summary["valid"] += 1
+            continue
+        for slot in result.invalid_slots:
+            invalid_counts[slot] = invalid_counts.get(slot, 0) + 1
+        for slot in result.missing_slots:
+            missing_counts[slot] = missing_counts.get(slot, 0) + 1
+
+    return summary
@@ -17,21 +17,31 @@ class StepResult:
     current_plan: Dict[str, Any] = None
     is_complete: bool = False
     error: Optional[str] = None
+    slot_provenance: Dict[str, Dict[str, Any]] = None  # 슬롯 값의 출처 정보
 
 
 class LangGraphAdapter:
     """LangGraph와 테스트를 연결하는 어댑터"""
 
-    def __init__(self, graph: StateGraph):
+    def __init__(self, graph: Optional[StateGraph] = None):
         """
         Args:
-            graph: LangGraph StateGraph 인스턴스
+            graph: LangGraph StateGraph 인스턴스 (None인 경우 캐시된 기본 설정 그래프 사용)
         """
         self.checkpointer = MemorySaver()
-        self.compiled_graph = graph.compile(
-            checkpointer=self.checkpointer,
-            interrupt_after=["ask_user"],  # ask_user 노드 실행 후 중단
-        )
+        if graph is None:
+            # 테스트 케이스마다 다시 컴파일하지 않고 프로세스 캐시의 그래프에 체크포인터만 연결
+            from src.graph import get_compiled_graph
+
+            self.compiled_graph = get_compiled_graph(
+                checkpointer=self.checkpointer,
+                interrupt_after=["ask_user"],
+            )
+        else:
+            self.compiled_graph = graph.compile(
+                checkpointer=self.checkpointer,
+                interrupt_after=["ask_user"],  # ask_user 노드 실행 후 중단
+            )
         self.thread_id = "test_thread"
         self.config = {"configurable": {"thread_id": self.thread_id}}
 
@@ -63,6 +73,7 @@ class LangGraphAdapter:
                 agent_question=agent_question,
                 current_plan=result.get("current_plan", {}),
                 is_complete=False,
+                slot_provenance=result.get("slot_provenance", {}),
             )
         except Exception as e:
             return StepResult(error=str(e))
@@ -95,7 +106,9 @@ class LangGraphAdapter:
 
             if is_complete:
                 return StepResult(
-                    current_plan=result.get("current_plan", {}), is_complete=True
+                    current_plan=result.get("current_plan", {}),
+                    is_complete=True,
+                    slot_provenance=result.get("slot_provenance", {}),
                 )
 
             # Agent의 다음 질문 추출
@@ -106,6 +119,7 @@ class LangGraphAdapter:
                 user_response=user_response,
                 current_plan=result.get("current_plan", {}),
                 is_complete=False,
+                slot_provenance=result.get("slot_provenance", {}),
             )
         except Exception as e:
             return StepResult(error=str(e))
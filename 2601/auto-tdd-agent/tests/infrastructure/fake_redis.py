@@ -0,0 +1,380 @@
+"""
+테스트용 RESP 서버
+
+RedisCheckpointer가 쓰는 명령(해시/집합/만료/SCAN/WATCH·MULTI·EXEC)만 구현한 인프로세스
+Redis 대역입니다. 실제 TCP 소켓으로 통신하므로 클라이언트의 파이프라이닝과 연결 풀까지
+그대로 검증됩니다.
+"""
+import re
+import socketserver
+import threading
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class _Error(Exception):
+    pass
+
+
+_WRONGTYPE = "WRONGTYPE Operation against a key holding the wrong kind of value"
+
+
+def _glob(pattern: bytes) -> "re.Pattern":
+    """Redis glob 패턴(*, ?, [...], 역슬래시 이스케이프)을 정규식으로"""
+    parts, i = [], 0
+    while i < len(pattern):
+        char = pattern[i:i + 1]
+        if char == b"\\" and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1:i + 2]))
+            i += 1
+        elif char == b"*":
+            parts.append(b".*")
+        elif char == b"?":
+            parts.append(b".")
+        elif char == b"[":
+            end = pattern.find(b"]", i + 1)
+            if end < 0:
+                parts.append(re.escape(char))
+            else:
+                parts.append(pattern[i:end + 1])
+                i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return re.compile(b"".join(parts) + b"\\Z", re.DOTALL)
+
+
+def _encode(value: Any) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, _Error):
+        return b"-%s\r\n" % str(value).encode("utf-8")
+    if isinstance(value, bool):
+        return b":%d\r\n" % int(value)
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode("utf-8")
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    if isinstance(value, list):
+        return b"*%d\r\n" % len(value) + b"".join(_encode(item) for item in value)
+    raise TypeError(type(value))
+
+
+class _Store:
+    """키 공간 (모든 명령은 lock 안에서 실행)"""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.data: Dict[bytes, Any] = {}
+        self.expires: Dict[bytes, float] = {}
+        # WATCH 확인용 키별 변경 번호
+        self.versions: Dict[bytes, int] = {}
+        self.commands = 0
+
+    def touch(self, key: bytes):
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def get(self, key: bytes, kind: type) -> Optional[Any]:
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self.delete(key)
+        value = self.data.get(key)
+        if value is not None and not isinstance(value, kind):
+            raise _Error(_WRONGTYPE)
+        return value
+
+    def create(self, key: bytes, kind: type) -> Any:
+        value = self.get(key, kind)
+        if value is None:
+            value = self.data[key] = kind()
+        return value
+
+    def delete(self, key: bytes) -> bool:
+        self.expires.pop(key, None)
+        if self.data.pop(key, None) is None:
+            return False
+        self.touch(key)
+        return True
+
+    def prune(self, key: bytes):
+        """비어 있는 해시/집합은 키째 삭제 (Redis와 같은 동작)"""
+        if key in self.data and not self.data[key]:
+            self.delete(key)
+
+    def execute(self, name: str, args: List[bytes]) -> Any:
+        self.commands += 1
+        handler = getattr(self, "cmd_" + name.lower(), None)
+        if handler is None:
+            raise _Error(f"ERR unknown command '{name}'")
+        try:
+            return handler(*args)
+        except TypeError:
+            raise _Error(f"ERR wrong number of arguments for '{name.lower()}' command")
+
+    # 일반
+
+    def cmd_ping(self):
+        return "PONG"
+
+    def cmd_auth(self, *args):
+        return "OK"
+
+    def cmd_select(self, db):
+        return "OK"
+
+    def cmd_flushdb(self):
+        for key in list(self.data):
+            self.delete(key)
+        return "OK"
+
+    def cmd_dbsize(self):
+        return sum(1 for key in list(self.data) if self.get(key, object) is not None)
+
+    def cmd_del(self, *keys):
+        return sum(self.delete(key) for key in keys)
+
+    def cmd_exists(self, *keys):
+        return sum(self.get(key, object) is not None for key in keys)
+
+    def cmd_expire(self, key, seconds):
+        if self.get(key, object) is None:
+            return 0
+        self.expires[key] = time.monotonic() + int(seconds)
+        self.touch(key)
+        return 1
+
+    def cmd_ttl(self, key):
+        if self.get(key, object) is None:
+            return -2
+        deadline = self.expires.get(key)
+        return -1 if deadline is None else max(0, round(deadline - time.monotonic()))
+
+    def cmd_scan(self, cursor, *options):
+        # 커서는 정렬된 키 목록의 위치 (스캔 중 키가 바뀌면 Redis처럼 누락/중복 가능)
+        pattern, count = None, 10
+        for name, value in zip(options[::2], options[1::2]):
+            if name.upper() == b"MATCH":
+                pattern = _glob(value)
+            elif name.upper() == b"COUNT":
+                count = int(value)
+        keys = sorted(self.data)
+        start = int(cursor)
+        batch = keys[start:start + count]
+        end = start + len(batch)
+        found = [
+            key for key in batch
+            if self.get(key, object) is not None and (pattern is None or pattern.match(key))
+        ]
+        return [b"0" if end >= len(keys) else str(end).encode(), found]
+
+    # 해시
+
+    def cmd_hset(self, key, *pairs):
+        if not pairs or len(pairs) % 2:
+            raise TypeError
+        table = self.create(key, dict)
+        added = sum(field not in table for field in pairs[::2])
+        table.update(zip(pairs[::2], pairs[1::2]))
+        self.touch(key)
+        return added
+
+    def cmd_hsetnx(self, key, field, value):
+        table = self.create(key, dict)
+        if field in table:
+            return 0
+        table[field] = value
+        self.touch(key)
+        return 1
+
+    def cmd_hget(self, key, field):
+        return (self.get(key, dict) or {}).get(field)
+
+    def cmd_hmget(self, key, *fields):
+        table = self.get(key, dict) or {}
+        return [table.get(field) for field in fields]
+
+    def cmd_hgetall(self, key):
+        table = self.get(key, dict) or {}
+        return [item for pair in table.items() for item in pair]
+
+    def cmd_hkeys(self, key):
+        return list(self.get(key, dict) or {})
+
+    def cmd_hlen(self, key):
+        return len(self.get(key, dict) or {})
+
+    def cmd_hdel(self, key, *fields):
+        table = self.get(key, dict) or {}
+        removed = sum(table.pop(field, None) is not None for field in fields)
+        if removed:
+            self.touch(key)
+            self.prune(key)
+        return removed
+
+    def cmd_hincrby(self, key, field, amount):
+        table = self.create(key, dict)
+        try:
+            value = int(table.get(field, b"0")) + int(amount)
+        except ValueError:
+            raise _Error("ERR hash value is not an integer")
+        table[field] = str(value).encode("ascii")
+        self.touch(key)
+        return value
+
+    # 집합
+
+    def cmd_sadd(self, key, *members):
+        members_set: Set[bytes] = self.create(key, set)
+        added = sum(member not in members_set for member in members)
+        members_set.update(members)
+        if added:
+            self.touch(key)
+        return added
+
+    def cmd_srem(self, key, *members):
+        members_set = self.get(key, set) or set()
+        removed = sum(member in members_set for member in members)
+        members_set.difference_update(members)
+        if removed:
+            self.touch(key)
+            self.prune(key)
+        return removed
+
+    def cmd_smembers(self, key):
+        return sorted(self.get(key, set) or ())
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """연결 하나 (WATCH/MULTI 상태는 연결별)"""
+
+    def setup(self):
+        super().setup()
+        self.watched: Dict[bytes, int] = {}
+        self.queued: Optional[List[Tuple[str, List[bytes]]]] = None
+        self.aborted = False
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def handle(self):
+        store: _Store = self.server.store
+        while True:
+            try:
+                command = self._read_command()
+            except (OSError, ValueError):
+                return
+            if not command:
+                return
+            name, args = command[0].decode("utf-8").upper(), command[1:]
+            try:
+                reply = self._dispatch(store, name, args)
+            except _Error as e:
+                reply = e
+            try:
+                self.wfile.write(_encode(reply))
+            except OSError:
+                return
+
+    def _dispatch(self, store: _Store, name: str, args: List[bytes]) -> Any:
+        if name == "MULTI":
+            if self.queued is not None:
+                raise _Error("ERR MULTI calls can not be nested")
+            self.queued, self.aborted = [], False
+            return "OK"
+        if name == "DISCARD":
+            if self.queued is None:
+                raise _Error("ERR DISCARD without MULTI")
+            self.queued, self.watched = None, {}
+            return "OK"
+        if name == "EXEC":
+            if self.queued is None:
+                raise _Error("ERR EXEC without MULTI")
+            queued, self.queued = self.queued, None
+            watched, self.watched = self.watched, {}
+            if self.aborted:
+                raise _Error("EXECABORT Transaction discarded because of previous errors.")
+            with store.lock:
+                if any(store.versions.get(key, 0) != version for key, version in watched.items()):
+                    return None
+                results = []
+                for queued_name, queued_args in queued:
+                    try:
+                        results.append(store.execute(queued_name, queued_args))
+                    except _Error as e:
+                        results.append(e)
+                return results
+        if self.queued is not None:
+            if name in ("WATCH",):
+                raise _Error("ERR WATCH inside MULTI is not allowed")
+            if not hasattr(store, "cmd_" + name.lower()):
+                self.aborted = True
+                raise _Error(f"ERR unknown command '{name}'")
+            self.queued.append((name, args))
+            return "QUEUED"
+        if name == "WATCH":
+            with store.lock:
+                for key in args:
+                    # 만료된 키는 여기서 지워 감시 시점의 상태를 확정
+                    store.get(key, object)
+                    self.watched.setdefault(key, store.versions.get(key, 0))
+            return "OK"
+        if name == "UNWATCH":
+            self.watched = {}
+            return "OK"
+        with store.lock:
+            return store.execute(name, args)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class FakeRedisServer:
+    """
+    127.0.0.1의 빈 포트에서 도는 테스트용 RESP 서버
+
+    Example:
+        with FakeRedisServer() as server:
+            client = RespClient(port=server.port)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.store = _Store()
+        self._server = _Server((host, port), _Handler)
+        self._server.store = self.store
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    def start(self) -> 'FakeRedisServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> 'FakeRedisServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
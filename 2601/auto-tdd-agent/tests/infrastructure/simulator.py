@@ -4,6 +4,8 @@ ScenarioSimulator: 테스트 케이스 기반 사용자 응답 시뮬레이션
 import re
 from typing import Dict, Any, Optional, List
 
+from src.services.text_normalizer import normalize_text
+
 
 class ScenarioSimulator:
     """규칙 기반 사용자 시뮬레이터"""
@@ -64,7 +66,8 @@ class ScenarioSimulator:
             "purpose": r"(목적|이유|왜)",
         }
 
-        question_lower = question.lower()
+        # 파서와 같은 정규화 (전각 문자, 연속 공백)
+        question_lower = normalize_text(question).lower()
         for slot, pattern in patterns.items():
             if re.search(pattern, question_lower):
                 return slot
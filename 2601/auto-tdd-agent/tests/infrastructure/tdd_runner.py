@@ -13,7 +13,9 @@ os.environ["USE_IPC_LLM"] = "false"
 
 from tests.infrastructure.simulator import ScenarioSimulator
 from tests.infrastructure.adapter import LangGraphAdapter, StepResult
-from tests.evaluation.evaluator import evaluate_plan, EvaluationResult
+from tests.evaluation.evaluator import (
+    evaluate_plan, EvaluationResult, accuracy_by_source, audit_plans
+)
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -56,13 +58,8 @@ def run_single_tc(tc: Dict[str, Any], max_turns: int = 15) -> EvaluationResult:
     Returns:
         평가 결과
     """
-    # Agent 그래프 생성
-    from src.graph import create_graph
-
-    graph = create_graph()
-
-    # 어댑터 및 시뮬레이터 초기화
-    adapter = LangGraphAdapter(graph)
+    # 어댑터 및 시뮬레이터 초기화 (컴파일된 그래프는 프로세스 캐시에서 재사용)
+    adapter = LangGraphAdapter()
     simulator = ScenarioSimulator(tc)
 
     # 대화 히스토리
@@ -122,7 +119,10 @@ def run_single_tc(tc: Dict[str, Any], max_turns: int = 15) -> EvaluationResult:
 
     # 평가
     final_plan = step_result.current_plan or {}
-    result = evaluate_plan(final_plan, tc["ground_truth"], turn_history, max_turns)
+    result = evaluate_plan(
+        final_plan, tc["ground_truth"], turn_history, max_turns,
+        provenance=step_result.slot_provenance,
+    )
 
     # 로그 저장
     save_log(tc["id"], result, turn_history)
@@ -146,6 +146,7 @@ def save_log(tc_id: str, result: EvaluationResult, turn_history: List[Dict[str,
         "success": result.success,
         "turn_count": result.turn_count,
         "final_plan": result.final_plan,
+        "provenance": result.provenance,
         "ground_truth": result.ground_truth,
         "failure_category": result.failure_category.value
         if result.failure_category
@@ -211,6 +212,19 @@ def main():
     print(f"성공: {success_count}/{total_count}")
     print(f"실패: {total_count - success_count}/{total_count}")
 
+    # 최종 plan 스키마 검증
+    audit = audit_plans(r.final_plan for _, r in results if r)
+    print(f"스키마 검증 통과: {audit['valid']}/{audit['total']}")
+    for slot, count in audit["invalid_slots"].items():
+        print(f"  - 잘못된 형식 {slot}: {count}건")
+
+    # 슬롯 값 출처별 정확도
+    by_source = accuracy_by_source(r for _, r in results if r)
+    if by_source:
+        print("출처별 정확도:")
+        for source, counts in sorted(by_source.items()):
+            print(f"  - {source}: {counts['correct']}/{counts['total']}")
+
     # 실패 케이스별 분류
     if success_count < total_count:
         print("\n실패 케이스:")
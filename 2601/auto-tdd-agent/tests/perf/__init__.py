@@ -0,0 +1,3 @@
+"""
+성능 테스트 및 벤치마크 모듈
+"""
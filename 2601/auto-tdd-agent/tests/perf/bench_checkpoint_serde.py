@@ -0,0 +1,147 @@
+"""
+체크포인트 직렬화 벤치마크
+
+실제 대화 턴에서 만들어진 체크포인트를 LangGraph 기본 직렬화기(msgpack), 기본 + zlib,
+CompactSerializer(압축 없음/압축)로 직렬화해 크기와 인코딩/디코딩 시간을 비교하고,
+SqliteCheckpointer의 턴당 쓰기 지연과 파일 크기를 직렬화기별로 측정합니다.
+
+실행:
+    uv run python -m tests.perf.bench_checkpoint_serde
+"""
+
+import os
+import tempfile
+import time
+import timeit
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from langgraph.checkpoint.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.agent import PlanningAgent
+from src.checkpoint import CompactSerializer, EvictingMemorySaver, SqliteCheckpointer
+
+# 체크포인트를 만들 대화 (사용자 발화 순서)
+_CONVERSATION = [
+    "제주도로 여행 가고 싶어요",
+    "3월 15일에 출발해요",
+    "3박 4일이요",
+    "예산은 100만원 정도요",
+    "친구 2명이랑 가요",
+]
+
+
+class _ZlibSerializer(SerializerProtocol):
+    """기본 직렬화기 결과를 zlib으로 압축 (비교용)"""
+
+    def __init__(self):
+        self.inner = JsonPlusSerializer()
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        kind, data = self.inner.dumps_typed(obj)
+        return kind + "+zlib", zlib.compress(data, 6)
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        kind, payload = data
+        return self.inner.loads_typed((kind[:-len("+zlib")], zlib.decompress(payload)))
+
+
+def _serializers() -> Dict[str, SerializerProtocol]:
+    return {
+        "msgpack": JsonPlusSerializer(),
+        "msgpack+zlib": _ZlibSerializer(),
+        "compact": CompactSerializer(compress_threshold=None),
+        "compact+압축": CompactSerializer(),
+    }
+
+
+def sample_checkpoints() -> List[dict]:
+    """대화를 진행하며 턴마다 저장된 마지막 체크포인트"""
+    saver = EvictingMemorySaver()
+    agent = PlanningAgent(checkpointer=saver)
+    config = {"configurable": {"thread_id": "bench"}}
+    agent.run(_CONVERSATION[0], thread_id="bench", reference_date="2026-03-01")
+    checkpoints = [saver.get_tuple(config).checkpoint]
+    for utterance in _CONVERSATION[1:]:
+        agent.continue_conversation(utterance, thread_id="bench")
+        checkpoints.append(saver.get_tuple(config).checkpoint)
+    return checkpoints
+
+
+def measure_codecs(number: int = 200, repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    직렬화기별 평균 크기와 체크포인트당 인코딩/디코딩 시간
+
+    Returns:
+        이름 → {"bytes", "encode_us", "decode_us"}
+    """
+    checkpoints = sample_checkpoints()
+    results = {}
+    for name, serializer in _serializers().items():
+        encoded = [serializer.dumps_typed(checkpoint) for checkpoint in checkpoints]
+        assert [serializer.loads_typed(item) for item in encoded] == checkpoints
+
+        def encode():
+            for checkpoint in checkpoints:
+                serializer.dumps_typed(checkpoint)
+
+        def decode():
+            for item in encoded:
+                serializer.loads_typed(item)
+
+        scale = 1e6 / (number * len(checkpoints))
+        results[name] = {
+            "bytes": sum(len(data) for _, data in encoded) / len(encoded),
+            "encode_us": min(timeit.repeat(encode, number=number, repeat=repeat)) * scale,
+            "decode_us": min(timeit.repeat(decode, number=number, repeat=repeat)) * scale,
+        }
+    return results
+
+
+def measure_sqlite(sessions: int = 300) -> Dict[str, Dict[str, float]]:
+    """
+    직렬화기별 SqliteCheckpointer 턴당 put 지연과 파일 크기
+
+    Returns:
+        이름 → {"put_us", "file_kib"}
+    """
+    checkpoints = sample_checkpoints()
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, serializer in _serializers().items():
+            path = Path(directory) / f"{name}.db"
+            saver = SqliteCheckpointer(path, serde=serializer)
+            started = time.perf_counter()
+            for index in range(sessions):
+                config = {"configurable": {"thread_id": f"t{index}", "checkpoint_ns": ""}}
+                for checkpoint in checkpoints:
+                    config = saver.put(config, checkpoint, {"source": "loop"}, {})
+            elapsed = time.perf_counter() - started
+            saver._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            saver.close()
+            results[name] = {
+                "put_us": elapsed / (sessions * len(checkpoints)) * 1e6,
+                "file_kib": os.path.getsize(path) / 1024,
+            }
+    return results
+
+
+def main():
+    """벤치마크 실행"""
+    print("=" * 60)
+    print("체크포인트 직렬화")
+    print("=" * 60)
+    for name, result in measure_codecs().items():
+        print(
+            f"{name:14s} {result['bytes']:7.0f} B  인코딩 {result['encode_us']:7.1f} µs  "
+            f"디코딩 {result['decode_us']:7.1f} µs"
+        )
+    print("-" * 60)
+    for name, result in measure_sqlite().items():
+        print(f"{name:14s} SQLite put {result['put_us']:7.1f} µs/턴  파일 {result['file_kib']:7.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+체크포인터 턴당 쓰기 지연 벤치마크
+
+MemorySaver, EvictingMemorySaver, SqliteCheckpointer의 put 한 번(대화 한 턴의 체크포인트 저장) 지연을
+단일 세션과 동시 세션(group commit)에서 비교하고, TieredCheckpointer로 대기 중인 세션을
+디스크로 내렸을 때의 메모리 보관량과 재개(디스크 → 메모리) 지연을 측정합니다.
+
+실행:
+    uv run python -m tests.perf.bench_checkpointer
+"""
+
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from langgraph.checkpoint.base import BaseCheckpointSaver, empty_checkpoint
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.checkpoint import EvictingMemorySaver, SqliteCheckpointer, TieredCheckpointer
+
+# 실제 대화 턴과 비슷한 크기의 채널 값
+_CHANNEL_VALUES = {
+    "messages": [
+        {"role": "user", "content": "제주도로 3월 15일에 3박 4일로 가려고 해요"},
+        {"role": "assistant", "content": "예산은 어느 정도 생각하고 계신가요?"},
+    ] * 4,
+    "current_plan": {"destination": "제주도", "start_date": "2026-03-15", "duration": "3박 4일"},
+    "turn_count": 4,
+}
+
+
+def _session(saver: BaseCheckpointSaver, thread_id: str, turns: int, latencies: List[float]):
+    """한 세션의 턴을 순서대로 저장하며 put 지연(초)을 기록"""
+    config = {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    versions: dict = {}
+    for step in range(turns):
+        # 매 턴 모든 채널이 바뀐 것으로 표시 (MemorySaver는 바뀐 채널 값만 직렬화)
+        versions = {
+            channel: saver.get_next_version(versions.get(channel), None)
+            for channel in _CHANNEL_VALUES
+        }
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = dict(_CHANNEL_VALUES, turn_count=step)
+        checkpoint["channel_versions"] = versions
+        started = time.perf_counter()
+        config = saver.put(config, checkpoint, {"source": "loop", "step": step}, versions)
+        latencies.append(time.perf_counter() - started)
+
+
+def measure_saver(saver: BaseCheckpointSaver, sessions: int = 1, turns: int = 200) -> Dict[str, float]:
+    """
+    동시 세션들의 턴당 쓰기 지연 측정
+
+    Args:
+        saver: 측정할 체크포인터
+        sessions: 동시에 쓰는 세션(스레드) 수
+        turns: 세션당 턴 수
+
+    Returns:
+        {"p50_us", "p99_us", "throughput"} (throughput: 초당 저장한 체크포인트 수)
+    """
+    latencies: List[float] = []
+    threads = [
+        threading.Thread(target=_session, args=(saver, f"t{i}", turns, latencies))
+        for i in range(sessions)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "p50_us": statistics.median(latencies) * 1e6,
+        "p99_us": latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+        "throughput": len(latencies) / elapsed,
+    }
+
+
+def measure(sessions: int = 8, turns: int = 200) -> Dict[str, Dict[str, float]]:
+    """
+    체크포인터별 단일 세션/동시 세션 비교
+
+    Returns:
+        설정 이름 → measure_saver 결과 (SQLite는 "commits", EvictingMemorySaver는 "bytes" 포함)
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        factories: Dict[str, Callable[[int], BaseCheckpointSaver]] = {
+            "memory": lambda n: MemorySaver(),
+            "evicting": lambda n: EvictingMemorySaver(history=2),
+            "sqlite": lambda n: SqliteCheckpointer(Path(directory) / f"bench{n}.db"),
+        }
+        for name, factory in factories.items():
+            for count in (1, sessions):
+                saver = factory(count)
+                result = measure_saver(saver, count, turns)
+                if isinstance(saver, SqliteCheckpointer):
+                    result["commits"] = saver.commit_count
+                    saver.close()
+                if isinstance(saver, EvictingMemorySaver):
+                    result["bytes"] = saver.memory_usage()["bytes"]
+                results[f"{name} x{count}"] = result
+    return results
+
+
+def measure_parked(sessions: int = 2000, turns: int = 3) -> Dict[str, float]:
+    """
+    대기 세션을 디스크로 내린 뒤의 메모리 보관량과 재개 지연
+
+    Args:
+        sessions: 대기 세션 수
+        turns: 세션당 턴 수
+
+    Returns:
+        {"hot_bytes_before", "hot_bytes_after", "rehydrate_us"}
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        saver = TieredCheckpointer(Path(directory) / "parked.db", history=1)
+        for index in range(sessions):
+            _session(saver, f"p{index}", turns, [])
+        before = saver.hot.memory_usage()["bytes"]
+        saver.hot.evict_all()
+        after = saver.hot.memory_usage()["bytes"]
+
+        started = time.perf_counter()
+        for index in range(sessions):
+            saver.get_tuple({"configurable": {"thread_id": f"p{index}"}})
+        rehydrate_us = (time.perf_counter() - started) / sessions * 1e6
+        saver.close()
+    return {"hot_bytes_before": before, "hot_bytes_after": after, "rehydrate_us": rehydrate_us}
+
+
+def main():
+    """벤치마크 실행"""
+    print("=" * 60)
+    print("체크포인터 턴당 쓰기 지연")
+    print("=" * 60)
+    for name, result in measure().items():
+        line = (
+            f"{name:12s} p50 {result['p50_us']:9.1f} µs  p99 {result['p99_us']:9.1f} µs  "
+            f"{result['throughput']:9.0f} 턴/초"
+        )
+        if "commits" in result:
+            line += f"  커밋 {result['commits']}회"
+        if "bytes" in result:
+            line += f"  보관 {result['bytes'] / 1024:.0f} KiB"
+        print(line)
+
+    parked = measure_parked()
+    print(
+        f"대기 세션 디스크 이동: 메모리 {parked['hot_bytes_before'] / 1024:.0f} KiB → "
+        f"{parked['hot_bytes_after'] / 1024:.0f} KiB, 재개 {parked['rehydrate_us']:.1f} µs/세션"
+    )
+
+
+if __name__ == "__main__":
+    main()
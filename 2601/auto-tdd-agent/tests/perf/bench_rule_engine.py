@@ -0,0 +1,98 @@
+"""
+규칙 기반 파싱 마이크로벤치마크
+
+기존 파서(_extract_* 메서드 순차 호출)와 RuleEngine(단일 패스)의
+발화당 처리 시간을 비교합니다.
+
+실행:
+    uv run python -m tests.perf.bench_rule_engine
+"""
+
+import timeit
+from typing import Callable, List, Sequence
+
+from src.services.rule_engine import get_rule_engine
+from tests.perf.legacy_rule_parser import LegacyRuleParser
+
+# 시뮬레이터/로그에서 자주 보이는 형태의 발화
+SAMPLE_UTTERANCES: List[str] = [
+    "여행 계획을 도와주세요.",
+    "제주도로 가고 싶어요",
+    "제주도",
+    "2026-03-15",
+    "2026-03-15에 출발할 예정이에요",
+    "3월 15일에 출발할 거예요",
+    "3박 4일",
+    "3박 4일로 계획하고 있어요",
+    "5일 정도요",
+    "100만원",
+    "예산은 50만원 정도 생각하고 있어요",
+    "50 만 원이요",
+    "친구 2명",
+    "가족이랑 같이 가요",
+    "혼자 여행이에요",
+    "남자친구와 함께요",
+    "휴양",
+    "맛집 투어가 목적이에요",
+    "박물관이랑 미술관 구경하고 싶어요",
+    "제주도로 3월 15일에 3박 4일로 가려고 해요",
+    "부산으로 친구들이랑 2박 3일 먹방 여행 가요, 예산은 30만원",
+    "강릉에 가족과 함께 힐링하러 갈래요",
+    "양양으로 서핑 여행 가요",
+    "잘 모르겠어요",
+    "음... 그건 잘 모르겠어요.",
+    "정말 기대돼요! 빨리 가고 싶어요",
+]
+
+
+def _best_of(func: Callable[[str], object], utterances: Sequence[str], number: int, repeat: int) -> float:
+    """발화당 평균 처리 시간 (마이크로초, 반복 중 최솟값)"""
+    def run():
+        for text in utterances:
+            func(text)
+
+    best = min(timeit.repeat(run, number=number, repeat=repeat))
+    return best / (number * len(utterances)) * 1e6
+
+
+def measure(number: int = 200, repeat: int = 5) -> dict:
+    """
+    기존 파서와 RuleEngine 처리 시간 측정
+
+    Args:
+        number: 반복당 코퍼스 실행 횟수
+        repeat: 반복 횟수 (최솟값 사용)
+
+    Returns:
+        {"legacy_us", "engine_us", "speedup"}
+    """
+    legacy = LegacyRuleParser()
+    engine = get_rule_engine()
+
+    # 측정 중 부하 변화가 양쪽에 같이 반영되도록 번갈아 측정
+    legacy_us = engine_us = float("inf")
+    for _ in range(repeat):
+        legacy_us = min(legacy_us, _best_of(legacy.parse, SAMPLE_UTTERANCES, number, 1))
+        engine_us = min(engine_us, _best_of(engine.extract, SAMPLE_UTTERANCES, number, 1))
+
+    return {
+        "legacy_us": legacy_us,
+        "engine_us": engine_us,
+        "speedup": legacy_us / engine_us,
+    }
+
+
+def main():
+    """벤치마크 실행"""
+    result = measure()
+    print("=" * 60)
+    print("규칙 기반 파싱 마이크로벤치마크")
+    print("=" * 60)
+    print(f"발화 수: {len(SAMPLE_UTTERANCES)}")
+    print(f"기존 파서:   {result['legacy_us']:8.2f} µs/발화")
+    print(f"RuleEngine: {result['engine_us']:8.2f} µs/발화")
+    print(f"속도 향상:   {result['speedup']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
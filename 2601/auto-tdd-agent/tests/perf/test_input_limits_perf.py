@@ -0,0 +1,68 @@
+"""
+입력 크기/적대적 입력 성능 테스트
+
+한 메시지가 워커를 붙잡지 않도록, 매우 큰 입력과 역추적을 노린 입력도
+정해진 시간 안에 파싱되는지 확인합니다.
+"""
+import time
+
+import pytest
+
+from src.services.response_parser import ResponseParser
+from src.services.rule_engine import get_rule_engine
+from tests.perf.bench_rule_engine import SAMPLE_UTTERANCES
+
+# 로컬 측정: 1MB 입력 파서 50ms 이하, 200k자 엔진 직접 호출 0.5초 이하 (공유 CI 잡음을 감안해 여유를 둠)
+PARSER_BUDGET_SECONDS = 0.5
+ENGINE_BUDGET_SECONDS = 2.0
+SIZE = 1_000_000
+
+
+def _itinerary(size: int) -> str:
+    """샘플 발화를 이어 붙인 긴 여행 일정 텍스트"""
+    text = " ".join(SAMPLE_UTTERANCES)
+    return (text * (size // len(text) + 1))[:size]
+
+
+ADVERSARIAL_INPUTS = {
+    "digits": lambda n: "1" * n,
+    "spaces": lambda n: "1박" + " " * n + "x",
+    "hangul": lambda n: "가" * n,
+    "hangul_then_particle": lambda n: "가" * n + "로 가요",
+    "numerals": lambda n: "일" * n,
+    "fullwidth_digits": lambda n: "３" * n,
+    "repeated_phrase": lambda n: "가고 싶어요 " * (n // 7),
+    "itinerary": _itinerary,
+}
+
+
+def _elapsed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("name", sorted(ADVERSARIAL_INPUTS))
+def test_parser_bounded_on_huge_input(name):
+    """1MB 적대적 입력도 파서가 시간 예산 안에 처리하는지 테스트"""
+    text = ADVERSARIAL_INPUTS[name](SIZE)
+    parser = ResponseParser()
+
+    for slot in (None, "destination", "duration"):
+        assert _elapsed(parser.parse, text, pending_slot=slot) < PARSER_BUDGET_SECONDS, slot
+
+
+@pytest.mark.parametrize("name", ["digits", "hangul", "itinerary"])
+def test_engine_linear_on_huge_input(name):
+    """입력 크기 제한 없이 엔진을 직접 호출해도 구간별 스캔으로 선형 시간인지 테스트"""
+    engine = get_rule_engine()
+    text = ADVERSARIAL_INPUTS[name](SIZE // 5)
+
+    assert _elapsed(engine.extract, text) < ENGINE_BUDGET_SECONDS
+
+
+def test_huge_input_keeps_leading_information():
+    """입력 크기 제한 후에도 앞부분의 정보는 추출되는지 테스트"""
+    result = ResponseParser().parse("제주도로 3박 4일 " + "가" * SIZE)
+
+    assert result == {"destination": "제주도", "duration": "3박 4일"}
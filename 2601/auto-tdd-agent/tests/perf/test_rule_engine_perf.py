@@ -0,0 +1,14 @@
+"""
+RuleEngine 성능 회귀 테스트
+"""
+from tests.perf.bench_rule_engine import measure
+
+
+def test_engine_faster_than_legacy_parser():
+    """단일 패스 엔진이 기존 순차 파서보다 확실히 빠른지 테스트
+
+    공유 CI 환경의 잡음을 감안해 기준을 느슨하게 둡니다 (로컬 측정은 1.6~1.9배).
+    """
+    result = measure(number=50, repeat=5)
+
+    assert result["speedup"] >= 1.5, result
@@ -0,0 +1,156 @@
+"""
+AdmissionController (동시 턴 수 제한, 우선순위 대기열, 부하 차단) 테스트
+"""
+import pickle
+import threading
+import time
+
+import pytest
+
+from src.agent import PlanningAgent
+from src.core.admission import AdmissionController, AdmissionRejected
+
+
+def _wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.001)
+
+
+class _Holder:
+    """admit 블록 안에서 release될 때까지 자리를 잡고 있는 스레드"""
+
+    def __init__(self, controller: AdmissionController, resume: bool = False, timeout=None):
+        self.release = threading.Event()
+        self.admitted = threading.Event()
+        self.error = None
+        self.thread = threading.Thread(target=self._run, args=(controller, resume, timeout))
+        self.thread.start()
+
+    def _run(self, controller, resume, timeout):
+        try:
+            with controller.admit(resume=resume, timeout=timeout):
+                self.admitted.set()
+                self.release.wait()
+        except AdmissionRejected as e:
+            self.error = e
+
+    def finish(self):
+        self.release.set()
+        self.thread.join()
+
+
+def test_limits_in_flight_and_queues_the_rest():
+    """max_in_flight까지만 실행하고 나머지는 대기 후 차례로 실행"""
+    controller = AdmissionController(2, max_queue=4)
+    holders = [_Holder(controller) for _ in range(3)]
+
+    _wait_until(lambda: controller.metrics()["queued"] == 1)
+    assert sum(h.admitted.is_set() for h in holders) == 2
+
+    running = [h for h in holders if h.admitted.is_set()]
+    waiting = next(h for h in holders if not h.admitted.is_set())
+    running[0].finish()
+    assert waiting.admitted.wait(5)
+
+    for holder in holders:
+        holder.finish()
+    metrics = controller.metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["admitted"] == 3
+    assert metrics["wait_max"] > 0
+
+
+def test_resume_turns_go_first():
+    """대기 중인 진행 대화 턴은 먼저 온 새 대화 턴보다 먼저 실행"""
+    controller = AdmissionController(1, max_queue=4)
+    running = _Holder(controller)
+    assert running.admitted.wait(5)
+
+    new_turn = _Holder(controller)
+    _wait_until(lambda: controller.metrics()["queued_new"] == 1)
+    resume_turn = _Holder(controller, resume=True)
+    _wait_until(lambda: controller.metrics()["queued_resume"] == 1)
+
+    running.finish()
+    assert resume_turn.admitted.wait(5)
+    assert not new_turn.admitted.is_set()
+    resume_turn.finish()
+    assert new_turn.admitted.wait(5)
+    new_turn.finish()
+
+
+def test_full_queue_rejects_new_and_sheds_for_resume():
+    """대기열이 가득 차면 새 대화는 거절, 진행 대화는 가장 늦은 새 대화를 밀어냄"""
+    controller = AdmissionController(1, max_queue=1)
+    running = _Holder(controller)
+    assert running.admitted.wait(5)
+    queued = _Holder(controller)
+    _wait_until(lambda: controller.metrics()["queued"] == 1)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        with controller.admit():
+            pass
+    assert rejected.value.reason == "queue_full"
+    assert rejected.value.retry_after >= 1.0
+
+    resume_turn = _Holder(controller, resume=True)
+    queued.thread.join(5)
+    assert queued.error is not None and queued.error.reason == "shed"
+
+    running.finish()
+    assert resume_turn.admitted.wait(5)
+    resume_turn.finish()
+    assert controller.metrics()["rejected"] == {"queue_full": 1, "timeout": 0, "shed": 1}
+
+
+def test_queue_deadline():
+    """기한 안에 자리를 받지 못하면 timeout으로 거절하고 대기열에서 빠짐"""
+    controller = AdmissionController(1, max_queue=2)
+    running = _Holder(controller)
+    assert running.admitted.wait(5)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        with controller.admit(timeout=0.05):
+            pass
+    assert rejected.value.reason == "timeout"
+    assert controller.metrics()["queued"] == 0
+    running.finish()
+
+
+def test_rejection_pickles():
+    """워커 프로세스에서 프론트로 전달할 수 있도록 pickle 가능"""
+    error = pickle.loads(pickle.dumps(AdmissionRejected("timeout", 2.5)))
+    assert (error.reason, error.retry_after) == ("timeout", 2.5)
+
+
+def test_invalid_limits():
+    """max_in_flight는 1 이상, max_queue는 0 이상"""
+    with pytest.raises(ValueError):
+        AdmissionController(0)
+    with pytest.raises(ValueError):
+        AdmissionController(1, max_queue=-1)
+
+
+def test_agent_rejects_without_changing_state():
+    """거절된 continue_conversation은 사용자 응답을 저장하지 않음"""
+    controller = AdmissionController(1)
+    agent = PlanningAgent(admission=controller)
+    agent.run("부산으로 여행 가고 싶어요", thread_id="a")
+    before = agent.get_current_state("a")["messages"]
+
+    running = _Holder(controller)
+    assert running.admitted.wait(5)
+    try:
+        with pytest.raises(AdmissionRejected):
+            agent.continue_conversation("3월 15일부터", thread_id="a")
+        with pytest.raises(AdmissionRejected):
+            list(agent.stream("제주도", thread_id="b"))
+    finally:
+        running.finish()
+
+    assert agent.get_current_state("a")["messages"] == before
+    assert agent.get_current_state("b") == {}
+    agent.continue_conversation("3월 15일부터", thread_id="a")
+    assert controller.metrics()["admitted"] == 3
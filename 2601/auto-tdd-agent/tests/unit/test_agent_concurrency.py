@@ -0,0 +1,97 @@
+"""
+PlanningAgent 동시 사용 / SessionLocks 테스트
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.agent import PlanningAgent
+from src.core.session_locks import SessionLocks
+
+
+def _wait_until(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "시간 초과"
+        time.sleep(0.001)
+
+
+def test_session_locks_fifo_order():
+    """같은 키는 hold를 부른 순서대로 하나씩 실행"""
+    locks = SessionLocks()
+    order = []
+    release = threading.Event()
+
+    def first():
+        with locks.hold("a"):
+            release.wait()
+            order.append(0)
+
+    def later(index: int):
+        with locks.hold("a"):
+            order.append(index)
+
+    threads = [threading.Thread(target=first)]
+    threads[0].start()
+    _wait_until(lambda: locks.pending("a") == 1)
+    for index in range(1, 6):
+        thread = threading.Thread(target=later, args=(index,))
+        thread.start()
+        threads.append(thread)
+        _wait_until(lambda: locks.pending("a") == index + 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert order == [0, 1, 2, 3, 4, 5]
+    assert len(locks) == 0
+
+
+def test_session_locks_other_keys_run_in_parallel():
+    """다른 키는 서로 기다리지 않음"""
+    locks = SessionLocks()
+    release = threading.Event()
+    entered_b = threading.Event()
+
+    def hold_a():
+        with locks.hold("a"):
+            release.wait()
+
+    def hold_b():
+        with locks.hold("b"):
+            entered_b.set()
+
+    thread_a = threading.Thread(target=hold_a)
+    thread_a.start()
+    _wait_until(lambda: locks.pending("a") == 1)
+    thread_b = threading.Thread(target=hold_b)
+    thread_b.start()
+    assert entered_b.wait(5)
+    release.set()
+    thread_a.join()
+    thread_b.join()
+
+
+def test_shared_agent_concurrent_turns():
+    """한 Agent를 여러 스레드가 공유: 같은 세션의 턴은 유실 없이 직렬화, 세션끼리는 독립"""
+    agent = PlanningAgent()
+    sessions = [f"s{i}" for i in range(4)]
+    turns = 4
+    for thread_id in sessions:
+        agent.run("여행 계획을 도와주세요", thread_id=thread_id, reference_date="2026-03-01")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(agent.continue_conversation, f"{thread_id} 답변 {turn}", thread_id)
+            for thread_id in sessions
+            for turn in range(turns)
+        ]
+        for future in futures:
+            future.result()
+
+    for thread_id in sessions:
+        state = agent.get_current_state(thread_id)
+        contents = [m["content"] for m in state["messages"] if m["role"] == "user"]
+        assert sorted(contents[1:]) == [f"{thread_id} 답변 {turn}" for turn in range(turns)]
+        assert state["turn_count"] == turns
+    assert len(agent._session_locks) == 0
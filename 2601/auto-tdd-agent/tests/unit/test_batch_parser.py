@@ -0,0 +1,68 @@
+"""
+일괄 파싱 단위 테스트
+"""
+import datetime
+import io
+import itertools
+import json
+import subprocess
+import sys
+import pytest
+from src.services.batch_parser import main, parse_batch, write_batch
+from src.services.response_parser import ResponseParser
+from tests.perf.bench_rule_engine import SAMPLE_UTTERANCES
+
+REFERENCE_DATE = datetime.date(2026, 1, 1)
+
+
+def test_batch_matches_single_parse():
+    """일괄 파싱 결과가 발화별 parse 결과와 같은 순서로 같은지 테스트"""
+    parser = ResponseParser()
+    expected = [parser.parse(text, reference_date=REFERENCE_DATE) for text in SAMPLE_UTTERANCES]
+
+    inline = list(parse_batch(SAMPLE_UTTERANCES, workers=1, chunk_size=3, reference_date=REFERENCE_DATE))
+    pooled = list(parse_batch(SAMPLE_UTTERANCES, workers=2, chunk_size=3, reference_date=REFERENCE_DATE))
+
+    assert inline == expected
+    assert pooled == expected
+
+
+def test_batch_reads_input_lazily():
+    """결과를 읽은 만큼만 입력을 소비하는지 테스트 (끝없는 입력에서도 멈춤)"""
+    consumed = itertools.count()
+
+    def endless():
+        for _ in consumed:
+            yield "제주도로 3박 4일\n"
+
+    results = list(itertools.islice(parse_batch(endless(), workers=2, chunk_size=10), 25))
+
+    assert results[0] == {"destination": "제주도", "duration": "3박 4일"}
+    # 읽은 청크 + 워커당 미리 보낸 청크까지만 소비
+    assert next(consumed) <= 25 + 2 * 2 * 10 + 10
+
+
+def test_write_batch_jsonl(tmp_path):
+    """입력 한 줄마다 JSON 한 줄을 기록하는지 테스트 (빈 줄 포함)"""
+    source = tmp_path / "utterances.txt"
+    target = tmp_path / "parsed.jsonl"
+    source.write_text("100만원 정도요\n\n혼자 가요\n", encoding="utf-8")
+
+    main([str(source), str(target), "--workers", "1", "--reference-date", "2026-01-01"])
+
+    lines = target.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"budget": "100만원"}, {}, {"companions": "혼자"},
+    ]
+    with pytest.raises(ValueError):
+        write_batch(["혼자"], io.StringIO(), chunk_size=0)
+
+
+def test_module_runs_without_runpy_warning():
+    """python -m으로 실행할 때 패키지가 이 모듈을 미리 import하지 않는지 테스트"""
+    result = subprocess.run(
+        [sys.executable, "-W", "error::RuntimeWarning", "-m", "src.services.batch_parser", "--help"],
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "RuntimeWarning" not in result.stderr
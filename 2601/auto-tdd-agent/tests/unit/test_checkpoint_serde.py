@@ -0,0 +1,99 @@
+"""
+CompactSerializer 테스트
+"""
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.types import Send
+
+from src.checkpoint import CompactSerializer, SqliteCheckpointer
+from src.checkpoint.serde import decode, encode
+
+STATE = {
+    "messages": [
+        {"role": "user", "content": "제주도로 여행 가고 싶어요"},
+        {"role": "assistant", "content": "언제 출발하실 예정인가요?", "slot": "start_date"},
+        {"role": "narrator", "content": "알 수 없는 역할"},
+    ],
+    "current_plan": {"start_date": "2026-03-15", "destination": "제주도"},
+    "slot_provenance": {"destination": {"confidence": 0.95, "source": "rule", "rule_id": "destination.gazetteer"}},
+    "turn_count": 3,
+    "versions": ["00000000000000000000000000000006.0.6027629371069441"] * 3,
+    "odd_version": "00000000000000000000000000000001.0.5",
+    "numbers": [0, -1, 63, -64, 1024, -(2 ** 70), 2 ** 70, 1.5, float("inf")],
+    "flags": (True, False, None),
+    "raw": b"\x00\xff",
+    "empty": {},
+}
+
+
+def test_roundtrip_values():
+    """지원하는 모든 값이 같은 값으로 복원됨"""
+    assert decode(encode(STATE)) == STATE
+    restored = decode(encode(STATE))
+    assert isinstance(restored["flags"], tuple)
+    assert restored["messages"][1]["slot"] == "start_date"
+
+
+def test_smaller_than_default_serializer():
+    """체크포인트 형태의 값이 기본 직렬화기보다 작음"""
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {
+        key: STATE[key] for key in ("messages", "current_plan", "slot_provenance", "turn_count")
+    }
+    versions = {
+        channel: "00000000000000000000000000000004.0.9837446027202932"
+        for channel in checkpoint["channel_values"]
+    }
+    checkpoint["channel_versions"] = versions
+    checkpoint["versions_seen"] = {"ask_user": versions, "process_input": versions}
+
+    compact = CompactSerializer(compress_threshold=None).dumps_typed(checkpoint)
+    default = JsonPlusSerializer().dumps_typed(checkpoint)
+    assert compact[0] == "compact"
+    assert len(compact[1]) * 2 < len(default[1])
+    assert CompactSerializer().loads_typed(compact) == checkpoint
+
+
+def test_compression_above_threshold():
+    """기준 크기 이상이면 압축하고, 압축 형식도 복원됨"""
+    serializer = CompactSerializer(compress_threshold=64, compression="zlib")
+    value = {"messages": [{"role": "user", "content": "같은 말 반복 " * 50}]}
+    kind, data = serializer.dumps_typed(value)
+    assert kind == "compact+zlib"
+    assert serializer.loads_typed((kind, data)) == value
+    assert serializer.dumps_typed({"turn_count": 1})[0] == "compact"
+
+
+def test_fallback_for_unsupported_and_legacy_values():
+    """지원하지 않는 값은 기본 직렬화기로, 기존 형식도 그대로 읽음"""
+    serializer = CompactSerializer()
+    value = [Send("ask_user", {"turn_count": 1})]
+    kind, data = serializer.dumps_typed(value)
+    assert kind != "compact"
+    assert serializer.loads_typed((kind, data)) == value
+
+    legacy = JsonPlusSerializer().dumps_typed(STATE["current_plan"])
+    assert serializer.loads_typed(legacy) == STATE["current_plan"]
+
+    with pytest.raises(TypeError):
+        encode({1, 2})
+    with pytest.raises(ValueError):
+        CompactSerializer(compression="lz4")
+
+
+def test_sqlite_reads_rows_written_by_default_serializer(tmp_path):
+    """기본 직렬화기로 쓴 기존 DB를 압축 형식 체크포인터로 열어도 읽힘"""
+    db = tmp_path / "c.db"
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"current_plan": {"destination": "제주도"}}
+    config = {"configurable": {"thread_id": "t", "checkpoint_ns": ""}}
+    with SqliteCheckpointer(db, serde=JsonPlusSerializer()) as legacy:
+        legacy.put(config, checkpoint, {"step": 0}, {})
+
+    with SqliteCheckpointer(db) as saver:
+        assert isinstance(saver.serde, CompactSerializer)
+        restored = saver.get_tuple(config)
+        assert restored.checkpoint["channel_values"] == checkpoint["channel_values"]
+        saver.put(restored.config, checkpoint | {"id": checkpoint["id"] + "1"}, {"step": 1}, {})
+        assert saver.get_tuple(config).metadata["step"] == 1
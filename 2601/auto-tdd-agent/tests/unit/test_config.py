@@ -0,0 +1,117 @@
+"""
+AgentConfig / ConfigRegistry 단위 테스트
+"""
+import dataclasses
+import json
+import os
+import pickle
+import pytest
+from src.core.config import AgentConfig, ConfigRegistry, load_config
+
+
+def _write_schema(path, **overrides):
+    """테스트용 스키마 파일 작성"""
+    schema = {
+        "required_slots": ["destination", "start_date"],
+        "optional_slots": ["budget"],
+        "slot_types": {"destination": "string", "start_date": "date", "budget": "string"},
+    }
+    schema.update(overrides)
+    path.write_text(json.dumps(schema, ensure_ascii=False), encoding="utf-8")
+
+
+def _touch_later(path):
+    """mtime을 확실히 바꿔 변경으로 감지되게 함"""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_config_is_frozen():
+    """설정이 불변인지 테스트"""
+    config = AgentConfig.default()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.max_turns = 3
+    with pytest.raises(TypeError):
+        config.slot_types["destination"] = "number"
+    assert isinstance(config.required_slots, tuple)
+
+
+def test_default_config_is_shared():
+    """기본 설정이 공유 인스턴스인지 테스트"""
+    assert AgentConfig.default() is AgentConfig.default()
+
+
+def test_config_hash_and_equality():
+    """같은 내용이면 같은 해시, 다른 내용이면 다른 해시인지 테스트"""
+    a = AgentConfig(required_slots=["destination"], optional_slots=["budget"])
+    b = AgentConfig(required_slots=("destination",), optional_slots=("budget",))
+    c = AgentConfig(required_slots=["destination"], optional_slots=["purpose"])
+
+    assert a == b and hash(a) == hash(b) and a.config_hash == b.config_hash
+    assert a.config_hash != c.config_hash
+    assert len({a, b, c}) == 2
+
+
+def test_derived_slot_sets():
+    """파생 슬롯 집합이 미리 계산되는지 테스트"""
+    config = AgentConfig.default()
+
+    assert config.required_set == {"destination", "start_date", "duration"}
+    assert config.optional_set == {"budget", "companions", "purpose"}
+    assert config.all_slots == config.required_slots + config.optional_slots
+    assert config.all_set == config.required_set | config.optional_set
+
+
+def test_config_pickle_roundtrip():
+    """프로세스 간 전달을 위해 pickle 가능한지 테스트"""
+    config = AgentConfig.default()
+    restored = pickle.loads(pickle.dumps(config))
+
+    assert restored == config
+    assert restored.config_hash == config.config_hash
+
+
+def test_registry_returns_shared_instance(tmp_path):
+    """같은 스키마 파일은 한 번만 로드되는지 테스트"""
+    schema_path = tmp_path / "plan_schema.json"
+    _write_schema(schema_path)
+    registry = ConfigRegistry(check_interval=60)
+
+    first = registry.get(schema_path)
+
+    assert registry.get(schema_path) is first
+    assert first.required_slots == ("destination", "start_date")
+
+
+def test_registry_hot_reload(tmp_path):
+    """스키마 파일이 바뀌면 새 설정으로 교체되는지 테스트"""
+    schema_path = tmp_path / "plan_schema.json"
+    _write_schema(schema_path)
+    registry = ConfigRegistry(check_interval=0)
+    old = registry.get(schema_path)
+
+    _write_schema(schema_path, max_turns=5)
+    _touch_later(schema_path)
+    new = registry.get(schema_path)
+
+    assert new is not old
+    assert new.max_turns == 5
+    assert new.config_hash != old.config_hash
+
+
+def test_registry_keeps_instance_when_content_unchanged(tmp_path):
+    """mtime만 바뀌고 내용이 같으면 기존 인스턴스를 유지하는지 테스트"""
+    schema_path = tmp_path / "plan_schema.json"
+    _write_schema(schema_path)
+    registry = ConfigRegistry(check_interval=0)
+    old = registry.get(schema_path)
+
+    _touch_later(schema_path)
+
+    assert registry.get(schema_path) is old
+
+
+def test_load_config_missing_file_uses_default(tmp_path):
+    """스키마 파일이 없으면 기본 설정을 사용하는지 테스트"""
+    assert load_config(tmp_path / "missing.json") is AgentConfig.default()
@@ -0,0 +1,95 @@
+"""
+DateResolver 단위 테스트
+"""
+import datetime
+import pytest
+from src.services.date_resolver import DateResolver, HolidayCalendar, load_date_resolver
+from src.services.rule_engine import get_rule_engine
+
+# 2026-10-19 (월요일)
+REFERENCE = datetime.date(2026, 10, 19)
+
+
+@pytest.fixture
+def resolver():
+    """기본 공휴일 표를 쓰는 해석기 fixture"""
+    return load_date_resolver()
+
+
+@pytest.mark.parametrize("expression, expected", [
+    ("2026-03-15", "2026-03-15"),
+    ("2027.1.5", "2027-01-05"),
+    ("내일", "2026-10-20"),
+    ("모레", "2026-10-21"),
+    ("3일 후", "2026-10-22"),
+    ("2주 뒤", "2026-11-02"),
+    ("1개월 후", "2026-11-19"),
+    ("이번 주 금요일", "2026-10-23"),
+    ("다음 주 금요일", "2026-10-30"),
+    ("다음 주말", "2026-10-31"),
+    ("금요일", "2026-10-23"),
+    ("다음 달 중순", "2026-11-11"),
+    ("다음달 3일", "2026-11-03"),
+    ("이번 달 25일", "2026-10-25"),
+    ("10월 말", "2026-10-21"),
+])
+def test_relative_expressions(resolver, expression, expected):
+    """상대/자연어 날짜 표현 해석 테스트"""
+    assert resolver.resolve_value(expression, REFERENCE) == expected
+
+
+def test_year_rolls_forward(resolver):
+    """연도가 없는 날짜는 기준일 이후로 해석하는지 테스트"""
+    assert resolver.resolve_value("3월 15일", REFERENCE) == "2027-03-15"
+    assert resolver.resolve_value("12월 24일", REFERENCE) == "2026-12-24"
+    assert resolver.resolve_value("올해 3월 15일", REFERENCE) == "2026-03-15"
+    assert resolver.resolve_value("3월 중순", REFERENCE) == "2027-03-11"
+
+
+def test_holidays(resolver):
+    """공휴일과 연휴 시작일 해석 테스트"""
+    assert resolver.resolve_value("크리스마스", REFERENCE) == "2026-12-25"
+    assert resolver.resolve_value("추석", REFERENCE) == "2027-09-15"
+    assert resolver.resolve_value("설 연휴", REFERENCE) == "2027-02-06"
+    assert resolver.resolve_value("추석 연휴", datetime.date(2026, 9, 25)) == "2026-09-24"
+    # "설"은 "연휴"와 함께일 때만 공휴일
+    assert resolver.find("설악산 가요", REFERENCE) is None
+
+
+def test_invalid_dates_rejected(resolver):
+    """없는 날짜와 음력 표가 없는 연도는 해석하지 않는지 테스트"""
+    assert resolver.resolve_value("2026-02-30", REFERENCE) is None
+    assert resolver.resolve_value("2월 30일", REFERENCE) is None
+    assert resolver.resolve_value("추석", datetime.date(2031, 1, 1)) is None
+
+
+def test_find_returns_span_and_confidence(resolver):
+    """발화에서 찾은 표현의 구간과 신뢰도 테스트"""
+    match = resolver.find("음 다음 주 금요일에 떠나요", REFERENCE)
+
+    assert match.value == datetime.date(2026, 10, 30)
+    assert (match.start, match.end) == (2, 10)
+    assert match.kind == "week_day"
+    assert resolver.find("2026-11-02", REFERENCE).confidence > match.confidence
+
+
+def test_calendar_without_holidays():
+    """공휴일 표 없이도 날짜 표현을 해석하는지 테스트"""
+    resolver = DateResolver(HolidayCalendar([]))
+
+    assert resolver.resolve_value("내일", REFERENCE) == "2026-10-20"
+    assert resolver.resolve_value("추석", REFERENCE) is None
+
+
+def test_day_only_for_answers(resolver):
+    """"15일"은 답변 규칙에서만 날짜로 해석되는지 테스트"""
+    assert resolver.resolve_value("25일", REFERENCE) == "2026-10-25"
+    assert resolver.resolve_value("15일", REFERENCE) == "2026-11-15"
+    assert resolver.find("15일 동안 있어요", REFERENCE) is None
+    assert "day" in resolver.patterns
+
+
+def test_month_relative_day_is_one_expression():
+    """"다음달 3일"의 "3일"은 그 달의 날짜로 쓰이고 기간으로 다시 추출되지 않는지 테스트"""
+    assert get_rule_engine().extract("다음달 3일에 출발", REFERENCE) == {"start_date": "2026-11-03"}
+    assert get_rule_engine().extract("이번 달 3일에 출발", REFERENCE) == {}
@@ -0,0 +1,137 @@
+"""
+EvictingMemorySaver 테스트
+"""
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.agent import PlanningAgent, SessionNotFound
+from src.checkpoint import EvictingMemorySaver, create_checkpointer
+from src.core.env_config import EnvConfig
+
+
+class _Clock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _put(saver: EvictingMemorySaver, thread_id: str, step: int, parent: dict = None) -> dict:
+    config = parent or {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"messages": ["안녕하세요"] * (step + 1)}
+    return saver.put(config, checkpoint, {"step": step}, {})
+
+
+def test_history_depth_keeps_latest_checkpoints():
+    """스레드별로 최근 history개의 체크포인트만 남음"""
+    saver = EvictingMemorySaver(history=2)
+    config = None
+    configs = []
+    for step in range(5):
+        config = _put(saver, "a", step, config)
+        configs.append(config)
+    saver.put_writes(config, [("messages", "대기 중")], task_id="task")
+
+    assert [t.metadata["step"] for t in saver.list({"configurable": {"thread_id": "a"}})] == [4, 3]
+    assert saver.get_tuple(configs[0]) is None
+    latest = saver.get_tuple({"configurable": {"thread_id": "a"}})
+    assert latest.config == configs[-1]
+    assert latest.pending_writes == [("task", "messages", "대기 중")]
+    assert saver.pruned_checkpoints == 3
+
+
+def test_lru_session_limit():
+    """세션 수 한도를 넘으면 가장 오래전에 사용한 세션을 버림"""
+    saver = EvictingMemorySaver(max_sessions=2)
+    _put(saver, "a", 0)
+    _put(saver, "b", 0)
+    saver.get_tuple({"configurable": {"thread_id": "a"}})  # a를 최근 사용으로
+    _put(saver, "c", 0)
+
+    assert saver.get_tuple({"configurable": {"thread_id": "b"}}) is None
+    assert saver.get_tuple({"configurable": {"thread_id": "a"}}) is not None
+    assert saver.memory_usage()["sessions"] == 2
+    assert saver.evicted_sessions == 1
+
+
+def test_idle_ttl():
+    """유휴 시간이 TTL을 넘은 세션은 정리됨"""
+    clock = _Clock()
+    saver = EvictingMemorySaver(ttl=60, clock=clock)
+    _put(saver, "a", 0)
+    clock.now = 30
+    _put(saver, "b", 0)
+    clock.now = 70
+
+    assert saver.evict_expired() == 1
+    assert saver.get_tuple({"configurable": {"thread_id": "a"}}) is None
+    assert saver.get_tuple({"configurable": {"thread_id": "b"}}) is not None
+
+
+def test_memory_usage_tracks_bytes():
+    """보관 바이트 수가 저장/정리/삭제에 따라 바뀜"""
+    saver = EvictingMemorySaver(history=1)
+    assert saver.memory_usage() == {"sessions": 0, "checkpoints": 0, "writes": 0, "bytes": 0}
+
+    config = _put(saver, "a", 0)
+    first = saver.memory_usage()["bytes"]
+    assert first > 0
+    config = _put(saver, "a", 5, config)
+    usage = saver.memory_usage()
+    assert usage["checkpoints"] == 1
+    assert usage["bytes"] > first  # 더 긴 메시지 이력 하나만 남음
+
+    saver.put_writes(config, [("messages", "대기 중")], task_id="task")
+    assert saver.memory_usage()["writes"] == 1
+
+    saver.delete_thread("a")
+    assert saver.memory_usage() == {"sessions": 0, "checkpoints": 0, "writes": 0, "bytes": 0}
+
+
+def test_invalid_limits():
+    """잘못된 한도는 거부"""
+    with pytest.raises(ValueError):
+        EvictingMemorySaver(history=0)
+    with pytest.raises(ValueError):
+        EvictingMemorySaver(ttl=0)
+
+
+def test_agent_resumes_with_single_checkpoint():
+    """최신 체크포인트 하나만 남겨도 대화를 이어감"""
+    saver = EvictingMemorySaver(history=1)
+    agent = PlanningAgent(checkpointer=saver)
+    agent.run("제주도로 여행 가고 싶어요", thread_id="t1", reference_date="2026-03-01")
+    result = agent.continue_conversation("3월 15일에 3박 4일", thread_id="t1")
+
+    assert result["current_plan"]["destination"] == "제주도"
+    assert result["current_plan"]["duration"]
+    assert saver.memory_usage()["checkpoints"] == 1
+
+
+def test_default_checkpointer_has_no_limits(monkeypatch):
+    """기본 설정의 메모리 저장소는 세션을 축출하지 않음 (제한은 설정한 경우에만)"""
+    for name in ("CHECKPOINT_DB", "CHECKPOINT_REDIS_URL"):
+        monkeypatch.setattr(EnvConfig, name, "")
+    saver = create_checkpointer()
+
+    assert isinstance(saver, EvictingMemorySaver)
+    assert (saver.max_sessions, saver.ttl, saver.history) == (None, None, None)
+
+
+def test_continue_expired_session_raises():
+    """만료된 세션을 이어가면 KeyError 대신 SessionNotFound"""
+    clock = _Clock()
+    saver = EvictingMemorySaver(ttl=60, clock=clock)
+    agent = PlanningAgent(checkpointer=saver)
+    agent.run("제주도로 여행 가고 싶어요", thread_id="t1", reference_date="2026-03-01")
+    clock.now = 120
+    assert saver.evict_expired() == 1
+
+    with pytest.raises(SessionNotFound, match="만료"):
+        agent.continue_conversation("3월 15일에 출발해요", thread_id="t1")
+    with pytest.raises(SessionNotFound):
+        agent.continue_conversation("안녕하세요", thread_id="없음")
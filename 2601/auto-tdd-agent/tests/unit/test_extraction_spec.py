@@ -0,0 +1,111 @@
+"""
+ExtractionSpec 단위 테스트
+"""
+import json
+import pytest
+from src.core.config import AgentConfig
+from src.services.extraction_spec import (
+    ExtractionSpec,
+    ExtractionSpecRegistry,
+    load_extraction_spec,
+)
+from src.services.question_generator import QuestionGenerator
+from src.services.response_parser import ResponseParser
+from src.services.rule_engine import get_rule_engine
+
+
+@pytest.fixture
+def pet_spec_data():
+    """반려동물 슬롯이 추가된 명세 fixture"""
+    return {
+        "default_locale": "ko",
+        "slots": {
+            "destination": {"questions": {"ko": "어디로 가세요?", "en": "Where to?"}},
+            "pet": {"questions": {"ko": "반려동물과 함께 가시나요?", "en": "Any pets?"}},
+            "budget": {"normalize": "money", "questions": {"ko": "예산은요?"}},
+        },
+        "messages": {"complete": {"ko": "완료!", "en": "Done!"}},
+        "rules": [
+            {"id": "pet.keyword", "slot": "pet", "keywords": ["강아지", "고양이"]},
+            {"id": "destination.city", "slot": "destination", "keywords": ["부산"]},
+            {"id": "budget.won", "slot": "budget", "pattern": "(\\d{1,7})\\s*만\\s*원",
+             "template": "{0}만원"},
+        ],
+    }
+
+
+def test_default_spec_loaded_once():
+    """기본 명세와 컴파일된 엔진을 공유하는지 테스트"""
+    spec = load_extraction_spec()
+
+    assert load_extraction_spec() is spec
+    assert get_rule_engine() is get_rule_engine(spec)
+    assert spec.question("destination") == "어디로 여행을 가고 싶으신가요?"
+    assert spec.message("complete", "en") == "Your travel plan is complete."
+
+
+def test_new_slot_without_code_change(pet_spec_data):
+    """명세와 스키마만으로 새 슬롯을 묻고 추출하는지 테스트"""
+    spec = ExtractionSpec.from_dict(pet_spec_data)
+    config = AgentConfig(required_slots=["destination", "pet"])
+
+    generator = QuestionGenerator(config=config, spec=spec)
+    parser = ResponseParser(spec=spec)
+
+    assert generator.generate({"destination": "부산"}) == "반려동물과 함께 가시나요?"
+    assert parser.parse("강아지랑 부산 가요") == {"pet": "강아지", "destination": "부산"}
+    assert generator.generate({"destination": "부산", "pet": "강아지"}) == "완료!"
+
+
+def test_locale_fallback(pet_spec_data):
+    """로케일별 질문과 없는 로케일의 기본값 대체 테스트"""
+    spec = ExtractionSpec.from_dict(pet_spec_data)
+
+    assert QuestionGenerator(spec=spec, locale="en").generate({}) == "Where to?"
+    assert spec.question("budget", "en") == "예산은요?"
+    assert spec.question("unknown", "ko") == ""
+
+
+def test_slot_normalizer_applied(pet_spec_data):
+    """슬롯에 선언된 정규화 타입이 추출 값에 적용되는지 테스트"""
+    engine = get_rule_engine(ExtractionSpec.from_dict(pet_spec_data))
+
+    assert engine.extract("예산은 20000 만원") == {"budget": "2억원"}
+
+
+def test_invalid_rule_rejected():
+    """pattern/keywords가 없거나 정규화 타입/신뢰도가 잘못된 규칙 거부 테스트"""
+    with pytest.raises(ValueError):
+        ExtractionSpec.from_dict({"rules": [{"id": "bad", "slot": "pet"}]})
+    with pytest.raises(ValueError):
+        ExtractionSpec.from_dict({
+            "slots": {"pet": {"normalize": "color"}},
+            "rules": [{"id": "pet", "slot": "pet", "keywords": ["개"]}],
+        })
+    with pytest.raises(ValueError):
+        ExtractionSpec.from_dict({
+            "rules": [{"id": "when", "slot": "start_date", "resolver": "date", "kinds": ["hour"]}],
+        })
+    with pytest.raises(ValueError):
+        ExtractionSpec.from_dict({
+            "rules": [{"id": "pet", "slot": "pet", "keywords": ["개"], "confidence": 1.5}],
+        })
+
+
+def test_registry_reloads_changed_file(tmp_path, pet_spec_data):
+    """명세 파일이 바뀌면 다시 로드하고, 깨진 파일이면 이전 명세를 유지하는지 테스트"""
+    path = tmp_path / "extraction_rules.json"
+    path.write_text(json.dumps(pet_spec_data), encoding="utf-8")
+    registry = ExtractionSpecRegistry(check_interval=0)
+
+    first = registry.get(path)
+    assert registry.get(path) is first
+
+    pet_spec_data["rules"][0]["keywords"].append("앵무새")
+    path.write_text(json.dumps(pet_spec_data, ensure_ascii=False), encoding="utf-8")
+    second = registry.get(path)
+    assert second is not first
+    assert get_rule_engine(second).extract("앵무새") == {"pet": "앵무새"}
+
+    path.write_text("{ broken", encoding="utf-8")
+    assert registry.get(path) is second
@@ -0,0 +1,108 @@
+"""
+Gazetteer 단위 테스트
+"""
+import json
+import time
+import pytest
+from src.services.gazetteer import Gazetteer, fold_case, load_gazetteer
+
+
+@pytest.fixture
+def gazetteer():
+    """작은 지명 사전 fixture"""
+    return Gazetteer.build([
+        ("제주도", ["제주", "제주섬", "Jeju", "Jejudo"]),
+        ("보령", ["대천", "대천해수욕장"]),
+        ("부산", ["Busan"]),
+        ("괌", []),
+    ])
+
+
+def test_alias_maps_to_canonical_name(gazetteer):
+    """별칭이 정식 명칭으로 바뀌는지 테스트"""
+    assert gazetteer.lookup("제주섬") == "제주도"
+    assert gazetteer.lookup("제주도") == "제주도"
+    assert gazetteer.lookup("제") is None
+    assert len(gazetteer) == 4
+
+
+def test_longest_match(gazetteer):
+    """겹치는 별칭 중 가장 긴 지명을 찾는지 테스트"""
+    assert gazetteer.find_all("대천해수욕장이랑 괌") == [(0, 6, "보령"), (9, 10, "괌")]
+    assert gazetteer.find_all("대천으로 가요") == [(0, 2, "보령")]
+
+
+def test_ascii_case_and_word_boundary(gazetteer):
+    """영문 지명은 대소문자를 무시하고 단어 중간에서는 찾지 않는지 테스트"""
+    assert gazetteer.find_all("JEJU trip") == [(0, 4, "제주도")]
+    assert gazetteer.find_all("Jejudo 가요") == [(0, 6, "제주도")]
+    assert gazetteer.find_all("Busanese food") == []
+    assert fold_case("Busan 여행") == "busan 여행"
+
+
+def test_hangul_word_boundary():
+    """한글 지명은 더 긴 단어 안에서는 찾지 않고, 조사나 복합어 꼬리는 허용하는지 테스트"""
+    gazetteer = Gazetteer.build([
+        ("도쿄", ["동경"]), ("부여", []), ("세종", []), ("남해", []), ("부산", []),
+    ])
+
+    assert gazetteer.find_all("오래 동경하던 곳") == []
+    assert gazetteer.find_all("의미를 부여하는 여행") == []
+    assert gazetteer.find_all("세종대왕 동상") == []
+    assert gazetteer.find_all("남해안 드라이브") == []
+    assert gazetteer.find_all("해운대부산") == []
+    assert gazetteer.find_all("동경으로 가요") == [(0, 2, "도쿄")]
+    assert gazetteer.find_all("부산역 부산여행 부산가고") == [(0, 2, "부산"), (4, 6, "부산"), (9, 11, "부산")]
+    assert gazetteer.find_all("이번엔부산") == [(3, 5, "부산")]
+
+
+def test_binary_round_trip(gazetteer):
+    """이진 색인으로 저장/로드해도 같은 결과인지, 손상된 색인은 거부하는지 테스트"""
+    data = Gazetteer.build([("부산", ["Busan"])], source_hash="abc").to_bytes()
+    loaded = Gazetteer.from_bytes(data)
+
+    assert loaded.source_hash == "abc"
+    assert loaded.find_all("busan") == [(0, 5, "부산")]
+    assert Gazetteer.from_bytes(gazetteer.to_bytes()).find_all("제주섬") == [(0, 3, "제주도")]
+    with pytest.raises(ValueError):
+        Gazetteer.from_bytes(data[:40])
+    with pytest.raises(ValueError):
+        Gazetteer.from_bytes(b"XXXX" + data[4:])
+
+
+def test_load_builds_and_refreshes_index(tmp_path):
+    """색인이 없으면 만들고, 지식 베이스가 바뀌면 다시 만드는지 테스트"""
+    kb_path = tmp_path / "knowledge_base.json"
+    kb_path.write_text(json.dumps(
+        {"destinations": [{"name": "부산", "aliases": []}]}, ensure_ascii=False
+    ), encoding="utf-8")
+
+    first = load_gazetteer(kb_path)
+    index_path = tmp_path / "gazetteer.idx"
+    assert index_path.exists()
+    assert Gazetteer.load(index_path).source_hash == first.source_hash
+
+    kb_path.write_text(json.dumps(
+        {"destinations": [{"name": "부산", "aliases": ["해운대"]}]}, ensure_ascii=False
+    ), encoding="utf-8")
+    Gazetteer.build([]).save(index_path)  # 오래된 색인
+    from src.services import gazetteer as module
+    module._entries.clear()
+
+    second = load_gazetteer(kb_path)
+    assert second.lookup("해운대") == "부산"
+    assert Gazetteer.load(index_path).source_hash == second.source_hash
+
+
+def test_large_gazetteer_scales():
+    """수만 개 지명에서도 조회 비용이 입력 길이에 비례하는지 테스트"""
+    names = [(f"지명{i:05d}", [f"place{i:05d}"]) for i in range(20000)]
+    gazetteer = Gazetteer.from_bytes(Gazetteer.build(names).to_bytes())
+    text = "이번에 place12345 말고 지명00042로 가요"
+
+    assert gazetteer.find_all(text) == [(4, 14, "지명12345"), (18, 25, "지명00042")]
+    started = time.perf_counter()
+    for _ in range(1000):
+        gazetteer.find_all(text)
+    # 로컬 측정은 호출당 수 마이크로초, 느린 CI를 감안한 상한
+    assert (time.perf_counter() - started) / 1000 < 0.001
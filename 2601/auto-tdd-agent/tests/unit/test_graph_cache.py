@@ -0,0 +1,61 @@
+"""
+컴파일된 그래프 캐시 (get_compiled_graph) 테스트
+"""
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.agent import PlanningAgent
+from src.core.config import AgentConfig
+from src.graph import clear_compiled_graphs, get_compiled_graph
+
+
+def test_same_key_compiles_once():
+    """같은 설정과 인터럽트면 같은 컴파일 결과를 재사용"""
+    clear_compiled_graphs()
+    config = AgentConfig.default()
+
+    first = get_compiled_graph(config, interrupt_before=["ask_user"])
+    second = get_compiled_graph(config, interrupt_before=("ask_user",))
+
+    assert first is second
+    assert first.checkpointer is None
+
+
+def test_equal_configs_share_entry_and_different_keys_do_not():
+    """내용이 같은 설정은 같은 항목, 설정이나 인터럽트가 다르면 별도 항목"""
+    clear_compiled_graphs()
+    a = AgentConfig(required_slots=["destination"], optional_slots=["budget"])
+    b = AgentConfig(required_slots=("destination",), optional_slots=("budget",))
+    c = AgentConfig(required_slots=["destination"], optional_slots=["purpose"])
+
+    assert get_compiled_graph(a) is get_compiled_graph(b)
+    assert get_compiled_graph(a) is not get_compiled_graph(c)
+    assert get_compiled_graph(a) is not get_compiled_graph(a, interrupt_after=["ask_user"])
+
+
+def test_checkpointer_variants_are_separate():
+    """체크포인터마다 별도 그래프이고 인터럽트 설정은 그대로 유지"""
+    config = AgentConfig.default()
+    saver_a, saver_b = MemorySaver(), MemorySaver()
+
+    graph_a = get_compiled_graph(config, checkpointer=saver_a, interrupt_before=["ask_user"])
+    graph_b = get_compiled_graph(config, checkpointer=saver_b, interrupt_before=["ask_user"])
+
+    assert graph_a is not graph_b
+    assert graph_a.checkpointer is saver_a
+    assert graph_b.checkpointer is saver_b
+    assert graph_a.interrupt_before_nodes == ["ask_user"]
+    # 캐시 원본은 체크포인터 없이 남음
+    assert get_compiled_graph(config, interrupt_before=["ask_user"]).checkpointer is None
+
+
+def test_agents_reuse_compiled_graph_and_stay_isolated():
+    """에이전트마다 다시 컴파일하지 않아도 대화 상태는 에이전트별로 분리"""
+    clear_compiled_graphs()
+    first = PlanningAgent()
+    second = PlanningAgent()
+
+    assert first.compiled.nodes["ask_user"] is second.compiled.nodes["ask_user"]
+
+    first.run("부산으로 여행 가고 싶어요", thread_id="t")
+    assert first.get_current_state("t")["messages"]
+    assert not second.get_current_state("t")
@@ -2,6 +2,7 @@
 PlanManager 단위 테스트
 """
 import pytest
+from src.services.extraction_result import ExtractionResult, SlotValue
 from src.services.plan_manager import PlanManager
 
 
@@ -101,3 +102,39 @@ def test_get_next_slot_when_all_complete():
     next_slot = manager.get_next_slot_to_collect(plan)
 
     assert next_slot is None
+
+
+def test_plan_update_latest_turn_wins():
+    """나중 발화의 값은 신뢰도가 낮아도 기존 값을 대신하고, 같은 값이면 높은 신뢰도 출처를 유지하는지 테스트"""
+    manager = PlanManager()
+    provenance = {}
+    plan = manager.update({}, ExtractionResult({
+        'destination': SlotValue('부여', 0.95, 'rule', 'destination.gazetteer'),
+    }), provenance)
+
+    # 규칙 값(0.95)을 LLM이 파싱한 사용자의 정정(0.7)이 대신함
+    correction = ExtractionResult({'destination': SlotValue('제주도', 0.7, 'llm')})
+    plan = manager.update(plan, correction, provenance)
+    assert plan['destination'] == '제주도'
+    assert provenance['destination'] == {'confidence': 0.7, 'source': 'llm', 'rule_id': None}
+    assert manager.uncertain_slots(plan, provenance, 0.8) == ['destination']
+
+    confirmed = ExtractionResult({'destination': SlotValue('제주도', 0.95, 'rule', 'destination.gazetteer')})
+    plan = manager.update(plan, confirmed, provenance)
+    echoed = ExtractionResult({'destination': SlotValue('제주도', 0.7, 'llm')})
+    plan = manager.update(plan, echoed, provenance)
+    assert plan['destination'] == '제주도'
+    assert provenance['destination']['confidence'] == 0.95
+
+
+def test_uncertain_slots():
+    """신뢰도가 낮은 채워진 슬롯을 스키마 순서로 돌려주는지 테스트"""
+    manager = PlanManager()
+    provenance = {}
+    plan = manager.update({}, ExtractionResult({
+        'duration': SlotValue('4일', 0.7, 'rule', 'duration.answer_number'),
+        'destination': SlotValue('어딘가', 0.4, 'rule', 'destination.generic'),
+        'budget': SlotValue('100만원', 0.95, 'rule', 'budget.man_won'),
+    }), provenance)
+
+    assert manager.uncertain_slots(plan, provenance, 0.8) == ['destination', 'duration']
@@ -0,0 +1,90 @@
+"""
+PlanRecord 단위 테스트
+"""
+import pytest
+from langgraph.graph import END
+from src.core.config import AgentConfig
+from src.core.plan import PlanRecord
+from src.nodes.router import should_continue
+from src.services.plan_manager import PlanManager
+
+
+def test_record_mask_follows_slot_order(sample_config):
+    """슬롯 비트가 필수 → 선택 순서로 매겨지는지 테스트"""
+    record = PlanRecord(sample_config, {"destination": "제주도", "budget": "50만원"})
+
+    assert record.mask == 0b001001
+    assert record.is_complete() is False
+    assert record.missing_required() == ["start_date", "duration"]
+    assert record.next_slot() == "start_date"
+
+
+def test_record_empty_values_are_unfilled(sample_config):
+    """빈 값은 채워지지 않은 슬롯으로 취급되는지 테스트"""
+    record = PlanRecord(sample_config, {"destination": "", "start_date": None})
+
+    assert record.mask == 0
+    assert "destination" not in record
+    assert record.to_dict() == {}
+
+
+def test_record_dict_view(sample_config, sample_plan):
+    """dict 호환 뷰가 원래 plan과 같은지 테스트"""
+    plan = dict(sample_plan, note="메모")
+    record = PlanRecord(sample_config, plan)
+
+    assert record.is_complete() is True
+    assert dict(record) == plan
+    assert record.to_dict() == plan
+    assert record["destination"] == "제주도"
+    assert record.get("budget") is None
+    assert len(record) == 4
+    with pytest.raises(KeyError):
+        record["budget"]
+
+
+def test_record_set_and_clear(sample_config):
+    """슬롯 설정/해제 시 비트마스크가 갱신되는지 테스트"""
+    record = PlanRecord(sample_config)
+    for slot in sample_config.all_slots:
+        record.set(slot, "값")
+
+    assert record.is_full() is True
+    assert record.next_slot() is None
+
+    record.set("companions", "")
+    assert record.is_full() is False
+    assert record.next_slot() == "companions"
+
+
+def test_plan_manager_accepts_record(sample_plan):
+    """PlanManager가 PlanRecord도 받는지 테스트"""
+    manager = PlanManager()
+    record = manager.to_record(sample_plan)
+
+    assert manager.to_record(record) is record
+    assert manager.is_complete(record) is True
+    assert manager.get_next_slot_to_collect(record) == "budget"
+    assert manager.update(record, {"budget": "50만원"})["budget"] == "50만원"
+
+
+def test_router_ends_when_all_slots_filled(sample_config):
+    """필수 + 선택 슬롯이 모두 채워지면 라우터가 종료하는지 테스트"""
+    full_plan = {slot: "값" for slot in sample_config.all_slots}
+    state = {"messages": [], "current_plan": full_plan, "turn_count": 1}
+
+    assert should_continue(state, sample_config) == END
+
+    state["current_plan"] = dict(full_plan, purpose="")
+    assert should_continue(state, sample_config) == "ask_user"
+
+
+def test_custom_config_slot_indices():
+    """스키마에 따라 슬롯 인덱스가 정해지는지 테스트"""
+    config = AgentConfig(required_slots=["a", "b"], optional_slots=["c"])
+    record = PlanRecord(config, {"c": 1, "a": 1})
+
+    assert config.required_mask == 0b011
+    assert config.optional_mask == 0b100
+    assert record.mask == 0b101
+    assert record.next_slot() == "b"
@@ -0,0 +1,119 @@
+"""
+PromptLoader / PromptRegistry 단위 테스트
+"""
+import os
+import pytest
+import yaml
+from src.core.env_config import EnvConfig
+from src.utils.prompt_loader import PromptLoader, clip_text
+from src.utils.prompt_registry import CompiledFormat, PromptRegistry
+
+
+def _write_template(path, user_template, system="시스템 프롬프트"):
+    """테스트용 YAML 템플릿 작성"""
+    path.write_text(
+        yaml.safe_dump({"system": system, "user_template": user_template}, allow_unicode=True),
+        encoding="utf-8",
+    )
+
+
+def test_compiled_format_matches_str_format():
+    """컴파일된 렌더러가 str.format과 같은 결과를 내는지 테스트"""
+    source = "계획: {current_plan}\n응답: \"{user_response}\"\n예시: {{\"a\": 1}} {n:03d} {s!r}"
+    kwargs = {"current_plan": {"destination": "제주도"}, "user_response": "3박 4일", "n": 7, "s": "x"}
+
+    assert CompiledFormat(source).render(**kwargs) == source.format(**kwargs)
+
+
+def test_registry_caches_parsed_template(tmp_path):
+    """같은 템플릿을 반복 조회하면 파싱된 객체를 재사용하는지 테스트"""
+    _write_template(tmp_path / "question_generator.yaml", "plan={current_plan}")
+    registry = PromptRegistry(tmp_path, check_interval=60)
+
+    first = registry.get("question_generator")
+    second = registry.get("question_generator")
+
+    assert first is second
+    assert first.system == "시스템 프롬프트"
+
+
+def test_registry_hot_reload_on_mtime_change(tmp_path):
+    """파일이 바뀌면 새 버전으로 교체되고 해시가 달라지는지 테스트"""
+    prompt_file = tmp_path / "slot_updater.yaml"
+    _write_template(prompt_file, "v1 {user_response}")
+    registry = PromptRegistry(tmp_path, check_interval=0)
+
+    old = registry.get("slot_updater")
+    _write_template(prompt_file, "v2 {user_response} {current_plan}")
+    st = os.stat(prompt_file)
+    os.utime(prompt_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    new = registry.get("slot_updater")
+
+    assert new is not old
+    assert new.content_hash != old.content_hash
+    assert new.render_user(user_response="a", current_plan={}) == "v2 a {}"
+
+
+def test_registry_keeps_previous_version_on_broken_yaml(tmp_path):
+    """리로드 중 YAML이 깨져 있으면 이전 버전을 유지하는지 테스트"""
+    prompt_file = tmp_path / "slot_updater.yaml"
+    _write_template(prompt_file, "v1 {user_response}")
+    registry = PromptRegistry(tmp_path, check_interval=0)
+    old = registry.get("slot_updater")
+
+    prompt_file.write_text("user_template: [깨진", encoding="utf-8")
+
+    assert registry.get("slot_updater") is old
+
+
+def test_loader_falls_back_without_template_file(tmp_path):
+    """템플릿 파일이 없으면 기본 프롬프트를 사용하는지 테스트"""
+    loader = PromptLoader(prompts_dir=tmp_path)
+    prompt = loader.load_parser_prompt("제주도로 가요")
+
+    assert "제주도로 가요" in prompt
+
+
+def test_question_messages_have_stable_system_prefix():
+    """system 메시지가 plan과 무관하게 바이트 단위로 동일한지 테스트"""
+    loader = PromptLoader()
+    first = loader.load_question_messages({})
+    second = loader.load_question_messages({"destination": "제주도", "duration": "3박 4일"})
+
+    assert [m["role"] for m in first] == ["system", "user"]
+    assert first[0]["content"].encode() == second[0]["content"].encode()
+    assert "제주도" in second[1]["content"]
+    assert "제주도" not in second[0]["content"]
+
+
+def test_parser_messages_keep_variable_data_in_user_message():
+    """가변 데이터(사용자 응답, plan)는 user 메시지에만 들어가는지 테스트"""
+    loader = PromptLoader()
+    messages = loader.load_parser_messages("부산으로 갈래요", {"duration": "2박 3일"})
+    system, user = messages[0]["content"], messages[1]["content"]
+
+    assert "부산으로 갈래요" in user and "2박 3일" in user
+    assert "부산으로 갈래요" not in system
+    # system은 포맷팅되지 않으므로 JSON 예시의 중괄호가 그대로 유지됨
+    assert '{"destination": "제주도", "start_date": "2026-03-15"}' in system
+    assert len(user) < len(system)
+
+
+def test_single_string_prompt_includes_system_text():
+    """단일 문자열 프롬프트는 system과 user 내용을 모두 포함하는지 테스트"""
+    loader = PromptLoader()
+    prompt = loader.load_question_prompt({"destination": "제주도"})
+
+    assert "다음에 물어볼 질문" in prompt
+    assert "제주도" in prompt
+
+
+def test_parser_prompt_clips_long_response():
+    """긴 사용자 응답은 프롬프트에 제한 길이만큼만 들어가는지 테스트"""
+    response = "제주도 " + "가" * 100_000 + " 3박 4일"
+    messages = PromptLoader().load_parser_messages(response)
+
+    assert len(messages[-1]["content"]) < EnvConfig.MAX_PROMPT_INPUT_CHARS + 500
+    assert "제주도" in messages[-1]["content"] and "3박 4일" in messages[-1]["content"]
+    assert clip_text("짧은 응답", 100) == "짧은 응답"
@@ -54,3 +54,11 @@ def test_question_generation_all_complete():
     question = generator.generate(plan)
 
     assert '완료' in question
+
+
+def test_next_slot_matches_question():
+    """질문이 물어보는 슬롯을 알려주는지 테스트"""
+    generator = QuestionGenerator()
+
+    assert generator.next_slot({}) == 'destination'
+    assert generator.next_slot({'destination': '제주도'}) == 'start_date'
@@ -0,0 +1,161 @@
+"""
+RateLimiter (프로세스 간 공유 LLM 호출 한도) 테스트
+"""
+import asyncio
+import multiprocessing
+
+import pytest
+
+from src.core.env_config import EnvConfig
+from src.utils import rate_limiter
+from src.utils.llm_client import get_llm_client
+from src.utils.rate_limiter import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    RateLimitedLLM,
+    RateLimiter,
+    estimate_tokens,
+)
+
+
+def test_request_bucket_allows_burst_then_waits(tmp_path):
+    """분당 60회 → 10초치(10회)까지 바로 통과하고 그 다음은 보충을 기다림"""
+    limiter = RateLimiter(tmp_path / "rl.sqlite", requests_per_minute=60)
+    for _ in range(10):
+        limiter.acquire(timeout=0)
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.05)
+    limiter.acquire(timeout=2.0)  # 초당 1회 보충
+    assert limiter.stats()["timeouts"] == 1
+
+
+def test_token_bucket_and_settle(tmp_path):
+    """토큰은 예상치로 차감하고 실제 사용량으로 정산"""
+    limiter = RateLimiter(tmp_path / "rl.sqlite", tokens_per_minute=600)  # 용량 100
+    limiter.acquire(80, timeout=0)
+    with pytest.raises(TimeoutError):
+        limiter.acquire(30, timeout=0.05)
+
+    limiter.settle(80, 20)  # 60 반환
+    limiter.acquire(30, timeout=0)
+    assert limiter.levels()["tokens"] == pytest.approx(50, abs=2)
+
+
+def test_low_priority_leaves_reserve(tmp_path):
+    """낮은 우선순위는 reserve만큼 남겨 두고, 높은 우선순위는 끝까지 사용"""
+    limiter = RateLimiter(tmp_path / "rl.sqlite", requests_per_minute=60, low_priority_reserve=0.2)
+    for _ in range(8):
+        limiter.acquire(priority=PRIORITY_LOW, timeout=0)
+
+    with pytest.raises(TimeoutError):
+        limiter.acquire(priority=PRIORITY_LOW, timeout=0.05)
+    limiter.acquire(priority=PRIORITY_HIGH, timeout=0)
+    limiter.acquire(priority=PRIORITY_HIGH, timeout=0)
+
+
+def test_instances_share_the_file(tmp_path):
+    """같은 파일을 쓰는 RateLimiter는 한 버킷을 나눠 씀"""
+    path = tmp_path / "rl.sqlite"
+    a = RateLimiter(path, requests_per_minute=60)
+    b = RateLimiter(path, requests_per_minute=60)
+    for _ in range(5):
+        a.acquire(timeout=0)
+        b.acquire(timeout=0)
+
+    with pytest.raises(TimeoutError):
+        b.acquire(timeout=0.05)
+
+
+def _take_all(path: str, results):
+    limiter = RateLimiter(path, requests_per_minute=60)
+    taken = 0
+    for _ in range(10):
+        try:
+            limiter.acquire(timeout=0.1)
+            taken += 1
+        except TimeoutError:
+            break
+    results.put(taken)
+
+
+def test_processes_share_one_limit(tmp_path):
+    """여러 프로세스가 동시에 받아도 합계가 한도를 넘지 않음"""
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    processes = [context.Process(target=_take_all, args=(str(tmp_path / "rl.sqlite"), results)) for _ in range(3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(10)
+
+    total = sum(results.get(timeout=5) for _ in processes)
+    # 용량 10 + 기다리는 동안 보충된 1~2회
+    assert 10 <= total <= 12
+
+
+def test_async_acquire(tmp_path):
+    """aacquire는 이벤트 루프를 막지 않고 같은 버킷을 사용"""
+    limiter = RateLimiter(tmp_path / "rl.sqlite", requests_per_minute=60)
+
+    async def scenario():
+        for _ in range(10):
+            await limiter.aacquire(timeout=0)
+        with pytest.raises(TimeoutError):
+            await limiter.aacquire(timeout=0.05)
+
+    asyncio.run(scenario())
+
+
+class _FakeResponse:
+    def __init__(self, content: str, total_tokens: int):
+        self.content = content
+        self.usage_metadata = {"total_tokens": total_tokens}
+
+
+class _FakeLLM:
+    model_name = "fake"
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return _FakeResponse("ok", 10)
+
+
+def test_rate_limited_llm_settles_actual_usage(tmp_path):
+    """래퍼는 호출 전에 예상치를 받고 호출 후 실제 사용량으로 정산"""
+    limiter = RateLimiter(tmp_path / "rl.sqlite", tokens_per_minute=6000)  # 용량 1000
+    llm = RateLimitedLLM(_FakeLLM(), limiter, PRIORITY_LOW)
+    messages = [{"role": "user", "content": "제주도 3박 4일"}]
+
+    assert estimate_tokens(messages) > 10
+    assert llm.invoke(messages).content == "ok"
+    assert llm.model_name == "fake"
+    assert limiter.levels()["tokens"] == pytest.approx(990, abs=2)
+
+
+def test_get_llm_client_wraps_when_enabled(tmp_path, monkeypatch):
+    """LLM_MAX_RPM을 설정하면 GLM 클라이언트를 우선순위와 함께 감쌈"""
+    monkeypatch.setattr(EnvConfig, "USE_IPC_LLM", False)
+    monkeypatch.setattr(EnvConfig, "GLM_API_KEY", "test-key")
+    monkeypatch.setattr(EnvConfig, "LLM_MAX_RPM", 120.0)
+    monkeypatch.setattr(EnvConfig, "LLM_RATE_LIMIT_DB", str(tmp_path / "rl.sqlite"))
+    monkeypatch.setattr(rate_limiter, "_shared", None)
+
+    llm = get_llm_client(priority=PRIORITY_LOW)
+    assert isinstance(llm, RateLimitedLLM)
+    assert llm.priority == PRIORITY_LOW
+    assert llm.limiter is rate_limiter.get_rate_limiter()
+
+    monkeypatch.setattr(EnvConfig, "LLM_MAX_RPM", 0.0)
+    assert not isinstance(get_llm_client(), RateLimitedLLM)
+
+
+def test_invalid_limits(tmp_path):
+    """음수 한도와 범위 밖 reserve는 거부"""
+    with pytest.raises(ValueError):
+        RateLimiter(tmp_path / "rl.sqlite", requests_per_minute=-1)
+    with pytest.raises(ValueError):
+        RateLimiter(tmp_path / "rl.sqlite", low_priority_reserve=1.0)
@@ -1,6 +1,7 @@
 """
 ResponseParser 단위 테스트
 """
+import datetime
 import pytest
 from src.services.response_parser import ResponseParser
 
@@ -29,7 +30,7 @@ def test_parse_date_format_korean():
     """한국어 형식 날짜 파싱 테스트"""
     parser = ResponseParser()
     response = "3월 15일에 출발할 거예요"
-    result = parser.parse(response)
+    result = parser.parse(response, reference_date=datetime.date(2026, 1, 1))
 
     assert 'start_date' in result
     assert result['start_date'] == '2026-03-15'
@@ -73,3 +74,88 @@ def test_parse_no_information():
     result = parser.parse(response)
 
     assert len(result) == 0
+
+
+def test_parse_relative_date():
+    """상대 날짜가 기준일에 대해 해석되는지 테스트"""
+    parser = ResponseParser()
+    # 2026-10-19는 월요일
+    result = parser.parse("다음 주 금요일에 출발해요", reference_date=datetime.date(2026, 10, 19))
+
+    assert result['start_date'] == '2026-10-30'
+
+
+def test_parse_answer_to_pending_slot():
+    """직전 질문이 물어본 슬롯으로 짧은 답변을 해석하는지 테스트"""
+    parser = ResponseParser()
+
+    assert parser.parse("4요", pending_slot="duration") == {"duration": "4일"}
+    assert parser.parse("4요") == {}
+
+
+def test_pending_slot_answer_skips_llm():
+    """질문한 슬롯만 답한 응답은 LLM을 호출하지 않는지 테스트"""
+    class FailingLLM:
+        def invoke(self, messages):
+            raise AssertionError("LLM이 호출되면 안 됩니다")
+
+    parser = ResponseParser()
+    parser.use_llm, parser.llm = True, FailingLLM()
+
+    assert parser.parse("제주도요", pending_slot="destination") == {"destination": "제주도"}
+
+
+def test_llm_failure_falls_back_with_reference_date():
+    """LLM 호출이 실패해도 규칙 파싱이 같은 기준일로 상대 날짜를 해석하는지 테스트"""
+    class FailingLLM:
+        def invoke(self, messages):
+            raise RuntimeError("연결 실패")
+
+    parser = ResponseParser()
+    parser.use_llm, parser.llm = True, FailingLLM()
+    # 2026-01-05는 월요일
+    result = parser.parse("다음 주 금요일에 출발", reference_date=datetime.date(2026, 1, 5))
+
+    assert result["start_date"] == "2026-01-16"
+
+
+def test_parse_detailed_sources():
+    """규칙 값은 규칙 출처, LLM 값은 LLM 출처, 같은 입력의 재호출은 캐시 출처인지 테스트"""
+    class CountingLLM:
+        calls = 0
+
+        def invoke(self, messages):
+            CountingLLM.calls += 1
+            return '{"destination": "오사카", "budget": null}'
+
+    parser = ResponseParser()
+    assert parser.parse_detailed("제주도로 가요")["destination"].source == "rule"
+
+    parser.use_llm, parser.llm = True, CountingLLM()
+    first = parser.parse_detailed("오사카 가볼까 고민 중이에요 (출처 테스트)")
+    second = parser.parse_detailed("오사카 가볼까 고민 중이에요 (출처 테스트)")
+
+    assert first.to_dict() == second.to_dict() == {"destination": "오사카"}
+    assert (first["destination"].source, second["destination"].source) == ("llm", "cache")
+    assert CountingLLM.calls == 1
+
+
+def test_llm_cache_is_per_model():
+    """LLM 클라이언트를 바꾸면 같은 입력이라도 이전 모델의 캐시 결과를 쓰지 않는지 테스트"""
+    class FixedLLM:
+        def __init__(self, destination):
+            self.destination = destination
+
+        def invoke(self, messages):
+            return '{"destination": "%s"}' % self.destination
+
+    parser = ResponseParser()
+    parser.use_llm = True
+    text = "어디로 갈지 고민 중이에요 (모델별 캐시 테스트)"
+
+    parser.llm = FixedLLM("오사카")
+    first = parser.parse(text)
+    parser.llm = FixedLLM("교토")
+    second = parser.parse(text)
+
+    assert (first, second) == ({"destination": "오사카"}, {"destination": "교토"})
@@ -0,0 +1,204 @@
+"""
+RuleEngine 단위 테스트
+"""
+import datetime
+import pytest
+from src.services.rule_engine import RuleEngine, SlotRule, find_backtracking_risks, get_rule_engine
+from tests.perf.bench_rule_engine import SAMPLE_UTTERANCES
+from tests.perf.legacy_rule_parser import LegacyRuleParser
+
+# 기존 파서는 2026년을 가정하므로 같은 해의 기준일로 비교
+REFERENCE_DATE = datetime.date(2026, 1, 1)
+
+# 기존 파서와 의도적으로 다른 결과 (겹치는 구간 해소)
+INTENDED_DIFFERENCES = {
+    # "15일"은 날짜 구간이므로 기간으로 다시 쓰이지 않음
+    "3월 15일에 출발할 거예요": {"start_date": "2026-03-15"},
+    # 더 긴 "남자친구"가 "친구"보다 먼저 구간을 차지
+    "남자친구와 함께요": {"companions": "남자친구"},
+    # 지명 사전에 있는 목적지
+    "양양으로 서핑 여행 가요": {"destination": "양양", "purpose": "서핑"},
+}
+
+
+def test_engine_matches_legacy_parser():
+    """의도한 차이를 제외하면 기존 파서와 같은 결과를 내는지 테스트"""
+    engine = get_rule_engine()
+    legacy = LegacyRuleParser()
+
+    for text in SAMPLE_UTTERANCES:
+        expected = INTENDED_DIFFERENCES.get(text, legacy.parse(text))
+        assert engine.extract(text, REFERENCE_DATE) == expected, text
+
+
+def test_candidates_do_not_overlap():
+    """한 번의 스캔에서 나온 후보 구간이 겹치지 않는지 테스트"""
+    candidates = get_rule_engine().scan("제주도로 3월 15일에 3박 4일로 가려고 해요")
+
+    assert [c.rule_id for c in candidates] == [
+        "destination.gazetteer", "start_date.expression", "duration.nights_days"
+    ]
+    for before, after in zip(candidates, candidates[1:]):
+        assert before.end <= after.start
+
+
+def test_rule_order_is_priority():
+    """같은 슬롯 안에서는 앞선 규칙의 후보가 선택되는지 테스트"""
+    engine = RuleEngine([
+        SlotRule("duration.nights_days", "duration", r"(\d{1,3})박\s*(\d{1,3})일", "{0}박 {1}일"),
+        SlotRule("duration.days", "duration", r"(\d{1,3})일", "{0}일"),
+    ])
+
+    assert engine.extract("5일 아니고 2박 3일") == {"duration": "2박 3일"}
+
+
+def test_fallback_rule_skips_claimed_spans():
+    """fallback 규칙은 빈 슬롯만, 다른 후보와 겹치지 않게 채우는지 테스트"""
+    engine = get_rule_engine()
+
+    assert engine.extract("단풍 보러 설악으로 여행 가요")["destination"] == "설악"
+    assert "destination" not in engine.extract("내일로 가요")
+    assert engine.extract("부산으로 가요") == {"destination": "부산"}
+
+
+def test_rules_without_first_char_index():
+    """첫 글자를 계산할 수 없는 패턴도 같은 결과를 내는지 테스트"""
+    engine = RuleEngine([
+        SlotRule("budget.any", "budget", r"(?=\d)(\d{1,7})만원", "{0}만원"),
+        SlotRule("companions.alone", "companions", r"혼자"),
+    ])
+
+    assert engine.extract("혼자 50만원") == {"companions": "혼자", "budget": "50만원"}
+
+
+def test_named_groups_rejected():
+    """이름 있는 그룹은 그룹 번호 매핑을 깨므로 거부하는지 테스트"""
+    with pytest.raises(ValueError):
+        RuleEngine([SlotRule("bad", "budget", r"(?P<amount>\d{1,7})만원")])
+
+
+def test_default_rules_cover_schema_slots(sample_config):
+    """기본 규칙이 스키마의 모든 슬롯을 다루는지 테스트"""
+    assert set(get_rule_engine().slots) == set(sample_config.all_slots)
+
+
+@pytest.mark.parametrize("text, slot, expected", [
+    ("4", "duration", {"duration": "4일"}),
+    ("4일이요", "start_date", {"start_date": "2026-01-04"}),
+    ("100 정도요", "budget", {"budget": "100만원"}),
+    ("강릉이요", "destination", {"destination": "강릉"}),
+    ("2명이요", "companions", {"companions": "2명"}),
+    ("아니요", "destination", {}),
+    ("크로아티아요", "destination", {"destination": "크로아티아"}),
+])
+def test_expected_slot_answer(text, slot, expected):
+    """직전 질문이 물어본 슬롯의 완화된 규칙으로 짧은 답변을 해석하는지 테스트"""
+    engine = get_rule_engine()
+
+    assert engine.extract(text, REFERENCE_DATE, expected_slot=slot) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "그냥요", "글쎄요", "아무거나요", "상관없어요", "상관없음", "몰라요", "모르겠어요",
+    "괜찮아요", "어디든요", "추천해주세요", "고민중이에요", "아뇨",
+])
+def test_filler_answer_is_not_destination(text):
+    """목적지 질문에 대한 얼버무림/추임새 답변은 목적지로 추출하지 않는지 테스트"""
+    assert get_rule_engine().extract(text, REFERENCE_DATE, expected_slot="destination") == {}
+
+
+def test_targeted_rules_need_question():
+    """targeted 규칙은 그 슬롯을 물어보지 않았으면 적용되지 않는지 테스트"""
+    engine = get_rule_engine()
+
+    assert engine.extract("4", REFERENCE_DATE) == {}
+    assert engine.extract("4일이요", REFERENCE_DATE) == {"duration": "4일"}
+
+
+def test_expected_slot_with_more_information():
+    """답변에 다른 슬롯 정보가 더 있으면 전체 스캔 결과와 합치는지 테스트"""
+    engine = get_rule_engine()
+
+    assert engine.extract("4일, 혼자 가요", REFERENCE_DATE, expected_slot="start_date") == {
+        "start_date": "2026-01-04", "companions": "혼자",
+    }
+    # 답변 구간을 더 길게 덮는 다른 슬롯 표현이면 전체 스캔 해석 유지
+    assert engine.extract("3월 15일이요", REFERENCE_DATE, expected_slot="duration") == {
+        "start_date": "2026-03-15",
+    }
+
+
+def test_extract_answer_only_for_plain_answers():
+    """extract_answer는 질문한 슬롯만 답한 경우에만 결과를 돌려주는지 테스트"""
+    engine = get_rule_engine()
+
+    assert engine.extract_answer("부산이요", "destination") == {"destination": "부산"}
+    assert engine.extract_answer("부산이요 3박 4일로", "destination") is None
+    assert engine.extract_answer("잘 모르겠어요", "destination") is None
+
+
+@pytest.mark.parametrize("pattern", [
+    r"(a+)+b",  # 중첩된 무한 반복
+    r"\s*(?:요)?\s*x",  # 같은 글자를 받는 인접한 무한 반복
+    r"(\d+)일",  # 무한 반복으로 시작 (검색 시 제곱 시간)
+])
+def test_backtracking_patterns_rejected(pattern):
+    """역추적이 폭발할 수 있는 패턴을 컴파일 시 거부하는지 테스트"""
+    assert find_backtracking_risks(pattern)
+    with pytest.raises(ValueError):
+        RuleEngine([SlotRule("bad", "budget", pattern)])
+
+
+def test_default_rules_are_backtracking_safe():
+    """기본 규칙(날짜 해석기 패턴 포함)에 역추적 위험이 없는지 테스트"""
+    for rule in get_rule_engine().rules:
+        assert find_backtracking_risks(rule.pattern) == [], rule.rule_id
+
+
+def test_windowed_scan_matches_single_scan():
+    """긴 입력을 구간으로 나눠 스캔해도 구간 경계의 표현을 놓치지 않는지 테스트"""
+    rules = get_rule_engine().rules
+    windowed = RuleEngine(rules, window=128)
+    # 구간 경계(128자) 근처에 걸치는 표현
+    text = "음 " * 60 + "제주도로 3박 4일 가족 여행" + " 음" * 200 + " 100만원"
+
+    assert windowed.extract(text) == {
+        "destination": "제주도", "duration": "3박 4일", "companions": "가족", "budget": "100만원",
+    }
+    assert windowed.scan(text) == RuleEngine(rules, window=10_000).scan(text)
+
+
+def test_extract_detailed_confidence_and_span():
+    """추출 값마다 규칙 신뢰도, 규칙 ID, 정규화된 텍스트 기준 구간이 붙는지 테스트"""
+    engine = get_rule_engine()
+    result = engine.extract_detailed("어딘가로 가고 싶어요, 3박 4일", REFERENCE_DATE)
+
+    assert result.to_dict() == {"destination": "어딘가", "duration": "3박 4일"}
+    assert result["destination"].rule_id == "destination.generic"
+    assert result["duration"].confidence > result["destination"].confidence
+    assert result["duration"].span == (13, 18)
+    assert result.uncertain(0.5) == ["destination"]
+
+
+def test_date_confidence_by_expression_kind():
+    """날짜 값의 신뢰도가 표현 종류(정확한 날짜/막연한 주)에 따라 달라지는지 테스트"""
+    engine = get_rule_engine()
+    exact = engine.extract_detailed("2026-03-15 출발", REFERENCE_DATE)["start_date"]
+    vague = engine.extract_detailed("다음 주에 출발", REFERENCE_DATE)["start_date"]
+
+    assert exact.confidence == 1.0
+    assert vague.confidence < 0.6
+    assert exact.rule_id == vague.rule_id == "start_date.expression"
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("공주 놀이 좋아해", {}),
+    ("경주 결과가 궁금해", {}),
+    ("공주로 여행 가요", {"destination": "공주"}),
+    ("파리 여행", {"destination": "파리"}),
+    ("동경 가고 싶어", {"destination": "도쿄"}),
+    ("공주시 맛집", {"destination": "공주", "purpose": "맛집"}),
+])
+def test_ambiguous_destination_needs_travel_context(text, expected):
+    """일반 명사와 겹치는 지명 표기는 여행 맥락이 뒤따를 때만 목적지로 인정하는지 테스트"""
+    assert get_rule_engine().extract(text, REFERENCE_DATE) == expected
@@ -0,0 +1,219 @@
+"""
+다중 프로세스 서빙 (WorkerPool, HTTP 엔드포인트) 테스트
+"""
+import asyncio
+import json
+import os
+import signal
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import Future
+
+import pytest
+
+from src.core.admission import AdmissionRejected
+from src.core.env_config import EnvConfig
+from src.serve import WorkerError, WorkerPool, create_app, dispatch, make_http_server
+from src.serve.app import _retry_after, outcome
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with WorkerPool(2, threads_per_worker=4) as pool:
+        yield pool
+
+
+def _thread_on(pool: WorkerPool, index: int, prefix: str) -> str:
+    """index번 워커가 맡는 thread_id 하나"""
+    return next(f"{prefix}-{n}" for n in range(1000) if pool.worker_for(f"{prefix}-{n}") == index)
+
+
+def test_routing_is_stable():
+    """thread_id → 워커 번호는 풀 인스턴스와 관계없이 같고 워커에 고르게 퍼짐"""
+    a, b = WorkerPool(4), WorkerPool(4)
+    ids = [f"session-{n}" for n in range(400)]
+
+    assert [a.worker_for(i) for i in ids] == [b.worker_for(i) for i in ids]
+    counts = [sum(a.worker_for(i) == w for i in ids) for w in range(4)]
+    assert min(counts) > 60
+
+
+def test_invalid_pool_size():
+    """워커 수와 스레드 수는 1 이상"""
+    with pytest.raises(ValueError):
+        WorkerPool(2, threads_per_worker=0)
+
+
+def test_conversation_stays_on_its_worker(pool):
+    """run → continue → state → reset이 같은 워커의 메모리 세션에서 이어짐"""
+    thread_id = _thread_on(pool, 1, "conv")
+
+    pool.call("run", thread_id, message="부산으로 여행 가고 싶어요")
+    result = pool.call("continue", thread_id, message="3월 15일부터 2박 3일")
+    state = pool.call("state", thread_id)
+
+    assert result["turn_count"] == 1
+    assert state["current_plan"]["destination"] == "부산"
+    # 다른 워커에는 이 세션이 없음
+    other = _thread_on(pool, 0, "conv")
+    assert pool.call("state", other) == {}
+
+    pool.call("reset", thread_id)
+    assert pool.call("state", thread_id) == {}
+    assert pool.call("continue", thread_id, message="안녕") is None
+
+
+def test_stream_yields_node_updates(pool):
+    """stream은 노드별 갱신을 실행 순서대로 반환"""
+    thread_id = _thread_on(pool, 0, "stream")
+    pool.call("reset", thread_id)
+
+    nodes = [next(iter(update)) for update in pool.stream(thread_id, "제주도 가고 싶어")]
+    assert nodes[0] == "process_input"
+    assert pool.call("state", thread_id)["current_plan"]["destination"] == "제주도"
+
+    nodes = [next(iter(update)) for update in pool.stream(thread_id, "예산은 100만원")]
+    assert nodes[:2] == ["ask_user", "process_input"]
+    assert pool.call("state", thread_id)["turn_count"] == 1
+
+
+def test_worker_error_is_raised_in_caller(pool):
+    """워커에서 난 예외는 호출한 쪽에서 다시 발생"""
+    with pytest.raises(ValueError):
+        pool.submit("unknown", "t")
+    with pytest.raises(KeyError):
+        pool.call("run", "t")  # message 누락
+
+
+def test_crashed_worker_is_replaced():
+    """죽은 워커는 같은 자리에 다시 시작되고 라우팅은 그대로"""
+    with WorkerPool(1, threads_per_worker=2) as pool:
+        pool.call("run", "t", message="부산 여행")
+        pid = pool.stats()[0]["pid"]
+
+        os.kill(pid, signal.SIGKILL)
+        deadline = time.monotonic() + 10
+        while pool.stats()[0]["restarts"] == 0:
+            assert time.monotonic() < deadline, "재시작되지 않음"
+            time.sleep(0.01)
+
+        assert pool.stats()[0]["pid"] != pid
+        # 수신 스레드가 도는 프로세스에서 fork하지 않고 새 인터프리터 기반으로 재시작
+        assert pool._restart_context.get_start_method() in ("forkserver", "spawn")
+        # 메모리 세션은 사라지지만 새 워커가 요청을 받음
+        assert pool.call("state", "t") == {}
+        assert pool.call("run", "t", message="부산 여행")["messages"]
+
+    with pytest.raises(WorkerError):
+        pool.submit("state", "t")
+
+
+def test_dispatch_errors(pool):
+    """잘못된 경로/메서드/본문은 워커에 보내지 않고 바로 오류"""
+    assert dispatch(pool, "GET", "/nope", b"")[0] == 404
+    assert dispatch(pool, "GET", "/threads/t/run", b"")[0] == 405
+    assert dispatch(pool, "POST", "/threads/t/run", b"not json")[0] == 400
+    assert dispatch(pool, "POST", "/threads/t/run", b'{"message": ""}')[0] == 400
+    status, op, body = dispatch(pool, "GET", "/health", b"")
+    assert status == 200 and len(body["workers"]) == 2
+
+
+def test_http_server_endpoints(pool):
+    """표준 라이브러리 HTTP 서버로 run/stream/state/continue/delete"""
+    server = make_http_server(pool, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/threads/http-1"
+
+    def request(method, path="", body=None):
+        data = json.dumps(body).encode() if body is not None else None
+        req = urllib.request.Request(base + path, data=data, method=method)
+        try:
+            with urllib.request.urlopen(req) as response:
+                return response.status, response.read().decode("utf-8")
+        except urllib.error.HTTPError as e:
+            return e.code, e.read().decode("utf-8")
+
+    try:
+        request("DELETE")
+        status, body = request("POST", "/run", {"message": "부산으로 여행 가고 싶어요"})
+        assert status == 200 and json.loads(body)["current_plan"]["destination"] == "부산"
+
+        status, body = request("POST", "/stream", {"message": "3월 15일부터 2박 3일"})
+        lines = [json.loads(line) for line in body.splitlines()]
+        assert status == 200 and [line["node"] for line in lines[:2]] == ["ask_user", "process_input"]
+
+        status, body = request("GET", "/state")
+        assert json.loads(body)["turn_count"] == 1
+
+        assert request("DELETE") == (200, '{"deleted": true}')
+        assert request("POST", "/continue", {"message": "안녕"})[0] == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_asgi_app(pool):
+    """ASGI 앱은 같은 라우팅을 async로 처리"""
+    app = create_app(pool)
+
+    async def call(method, path, body=b""):
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await app({"type": "http", "method": method, "path": path}, receive, send)
+        payload = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+        return sent[0]["status"], payload.decode("utf-8")
+
+    async def scenario():
+        await call("DELETE", "/threads/asgi-1")
+        status, body = await call("POST", "/threads/asgi-1/run", '{"message": "제주도 가고 싶어"}'.encode())
+        assert status == 200 and json.loads(body)["current_plan"]["destination"] == "제주도"
+
+        status, body = await call("POST", "/threads/asgi-1/stream", '{"message": "예산 100만원"}'.encode())
+        assert status == 200 and body.count("\n") >= 2
+
+        status, body = await call("GET", "/threads/asgi-1/state")
+        assert json.loads(body)["turn_count"] == 1
+        assert (await call("GET", "/threads/asgi-1/run"))[0] == 405
+
+    asyncio.run(scenario())
+
+
+def test_admission_rejection_maps_to_503():
+    """부하 차단은 503과 Retry-After (정수 초)"""
+    future: Future = Future()
+    future.set_exception(AdmissionRejected("queue_full", 2.2))
+    status, body = outcome("run", future)
+
+    assert status == 503 and body["reason"] == "queue_full"
+    assert _retry_after(status, body) == "3"
+
+
+def test_metrics_endpoint(monkeypatch):
+    """ADMISSION_MAX_IN_FLIGHT를 켜면 워커별 대기열 지표를 반환"""
+    monkeypatch.setattr(EnvConfig, "ADMISSION_MAX_IN_FLIGHT", 3)
+    with WorkerPool(2, threads_per_worker=2) as pool:
+        pool.call("run", "m", message="부산 여행")
+        status, _, body = dispatch(pool, "GET", "/metrics", b"")
+
+    assert status == 200
+    assert [m["max_in_flight"] for m in body["workers"]] == [3, 3]
+    assert sum(m["admitted"] for m in body["workers"]) == 1
+
+
+def test_metrics_waits_one_deadline(monkeypatch):
+    """응답 없는 워커가 여럿이어도 metrics는 전체 timeout 한 번만 기다림"""
+    pool = WorkerPool(3)
+    monkeypatch.setattr(pool, "_send", lambda *args: None)  # 응답이 오지 않는 워커
+    started = time.monotonic()
+
+    assert pool.metrics(timeout=0.2) == [None, None, None]
+    assert time.monotonic() - started < 0.5
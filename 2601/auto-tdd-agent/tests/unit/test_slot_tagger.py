@@ -0,0 +1,105 @@
+"""
+SlotTagger 단위 테스트
+"""
+import itertools
+import pytest
+from src.services.response_parser import ResponseParser
+from src.services.slot_tagger import SlotTagger, align, load_slot_tagger
+
+DESTINATIONS = ["제주도", "부산", "강릉", "오사카", "도쿄", "방콕", "파리", "속초", "여수", "다낭"]
+COMPANIONS = ["친구", "가족", "혼자", "동료", "부모님"]
+TEMPLATES = [
+    ("{d}로 가고 싶어요", lambda d, c, n: {"destination": d}),
+    ("{d}에 {c}랑 갈래요", lambda d, c, n: {"destination": d, "companions": c}),
+    ("예산은 {n}만원 정도요", lambda d, c, n: {"budget": f"{n}만원"}),
+    ("{c}랑 {d} 여행 가려고요, 예산은 {n}만원", lambda d, c, n: {
+        "destination": d, "companions": c, "budget": f"{n}만원",
+    }),
+]
+# 슬롯이 없는 발화 (실제 기록에도 많음)
+NO_SLOT_UTTERANCES = ["잘 모르겠어요", "음 글쎄요", "아직 정하지 못했어요", "여행 계획을 도와주세요"]
+
+
+@pytest.fixture(scope="module")
+def tagger():
+    """기록된 LLM 파싱 결과 형태의 합성 데이터로 학습한 태거"""
+    records = [
+        {"utterance": template.format(d=d, c=c, n=n), "plan": {}, "slots": slots(d, c, n)}
+        for (template, slots), d, c, n in itertools.product(
+            TEMPLATES, DESTINATIONS, COMPANIONS, [30, 50, 100]
+        )
+    ]
+    records += [{"utterance": text, "plan": {}, "slots": {}} for text in NO_SLOT_UTTERANCES] * 20
+    tagger, stats = SlotTagger.train(records, epochs=5)
+    assert stats.used == len(records) and stats.skipped == 0
+    return tagger
+
+
+def test_align_requires_verbatim_values():
+    """값이 발화에 토큰 단위로 그대로 나올 때만 BIO 태그를 만드는지 테스트"""
+    tokens, labels = align("제주도로 3박 4일 가요", {"destination": "제주도", "duration": "3박 4일"})
+
+    assert [t.text for t in tokens] == ["제주도로", "3박", "4일", "가요"]
+    assert labels == ["B-destination", "B-duration", "I-duration", "O"]
+    # 정규화된 날짜처럼 발화에 없는 값, 토큰 일부인 값은 학습에서 제외
+    assert align("3월 15일에 가요", {"start_date": "2026-03-15"}) is None
+    assert align("제주도로 가요", {"destination": "제주"}) is None
+
+
+def test_tagger_generalizes_to_unseen_values(tagger):
+    """학습에 없던 지명/인원도 주변 문맥으로 추출하는지 테스트"""
+    result = tagger.extract("삿포로로 가고 싶어요")
+    assert result.to_dict() == {"destination": "삿포로"}
+    assert result["destination"].source == "model"
+
+    assert tagger.extract("예산은 70만원 정도요").to_dict() == {"budget": "70만원"}
+
+
+def test_tagger_round_trip(tagger, tmp_path):
+    """저장한 모델을 다시 로드해도 같은 결과를 내는지 테스트"""
+    path = tmp_path / "slot_tagger.json"
+    tagger.save(path)
+    loaded = load_slot_tagger(path)
+
+    text = "교토에 친구랑 갈래요"
+    assert loaded.extract(text) == tagger.extract(text)
+
+
+def test_parser_tier_escalates_uncertain_results(tagger):
+    """태거가 확실하면 LLM을 생략하고, 찾은 값이 없거나 기준보다 불확실하면 LLM을 호출하는지 테스트"""
+    class CountingLLM:
+        calls = 0
+
+        def invoke(self, messages):
+            CountingLLM.calls += 1
+            return "{}"
+
+    parser = ResponseParser(tagger=tagger)
+    parser.use_llm, parser.llm = True, CountingLLM()
+
+    assert parser.parse("도쿄로 가고 싶어요") == {"destination": "도쿄"}
+    assert CountingLLM.calls == 0
+
+    parser.parse("음 아직 잘 모르겠어요")
+    assert CountingLLM.calls == 1
+
+    parser.tagger_min_confidence = 1.01
+    parser.parse("부산으로 가고 싶어요")
+    assert CountingLLM.calls == 2
+
+
+@pytest.mark.parametrize("text", ["도쿄로 3월 15일에 가고 싶어요", "도쿄로 내일 가고 싶어요"])
+def test_parser_tier_escalates_slots_tagger_cannot_produce(tagger, text):
+    """태거가 학습할 수 없는 날짜처럼 규칙 엔진만 찾은 슬롯이 있으면 LLM을 호출하는지 테스트"""
+    class DateLLM:
+        calls = 0
+
+        def invoke(self, messages):
+            DateLLM.calls += 1
+            return '{"destination": "도쿄", "start_date": "2026-03-15"}'
+
+    parser = ResponseParser(tagger=tagger)
+    parser.use_llm, parser.llm = True, DateLLM()
+
+    assert set(parser.parse(text)) == {"destination", "start_date"}
+    assert DateLLM.calls == 1
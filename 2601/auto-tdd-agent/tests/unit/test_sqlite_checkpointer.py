@@ -0,0 +1,121 @@
+"""
+SQLite 체크포인터 테스트
+"""
+import sqlite3
+import threading
+
+import pytest
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.agent import PlanningAgent
+from src.checkpoint import SqliteCheckpointer
+
+
+def _config(thread_id: str, checkpoint_id: str = None) -> dict:
+    configurable = {"thread_id": thread_id, "checkpoint_ns": ""}
+    if checkpoint_id:
+        configurable["checkpoint_id"] = checkpoint_id
+    return {"configurable": configurable}
+
+
+def _put(saver: SqliteCheckpointer, config: dict, step: int) -> dict:
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"turn_count": step}
+    return saver.put(config, checkpoint, {"source": "loop", "step": step}, {})
+
+
+def test_agent_conversation_survives_restart(tmp_path):
+    """워커 재시작 후 같은 DB로 만든 Agent가 대화를 이어감"""
+    db = tmp_path / "checkpoints.db"
+    agent = PlanningAgent(checkpointer=SqliteCheckpointer(db))
+    agent.run("제주도로 여행 가고 싶어요", thread_id="t1", reference_date="2026-03-01")
+    agent.checkpointer.close()
+
+    restarted = PlanningAgent(checkpointer=SqliteCheckpointer(db))
+    state = restarted.get_current_state("t1")
+    assert state["current_plan"]["destination"] == "제주도"
+
+    result = restarted.continue_conversation("3월 15일에 3박 4일", thread_id="t1")
+    assert result["current_plan"]["destination"] == "제주도"
+    assert result["current_plan"]["duration"]
+
+    restarted.reset("t1")
+    assert restarted.get_current_state("t1") == {}
+
+
+def test_get_list_and_delete(tmp_path):
+    """최신 조회, 특정 체크포인트 조회, 목록 필터/limit/before, 스레드 삭제"""
+    with SqliteCheckpointer(tmp_path / "c.db") as saver:
+        first = _put(saver, _config("a"), 0)
+        second = _put(saver, first, 1)
+        _put(saver, _config("b"), 0)
+
+        latest = saver.get_tuple(_config("a"))
+        assert latest.config == second
+        assert latest.checkpoint["channel_values"] == {"turn_count": 1}
+        assert latest.parent_config["configurable"]["checkpoint_id"] == first["configurable"]["checkpoint_id"]
+        assert saver.get_tuple(first).metadata["step"] == 0
+
+        assert [t.config for t in saver.list(_config("a"))] == [second, first]
+        assert [t.config for t in saver.list(_config("a"), limit=1)] == [second]
+        assert [t.config for t in saver.list(_config("a"), before=second)] == [first]
+        assert [t.metadata["step"] for t in saver.list(None, filter={"step": 0})] == [0, 0]
+
+        saver.delete_thread("a")
+        assert saver.get_tuple(_config("a")) is None
+        assert saver.get_tuple(_config("b")) is not None
+
+
+def test_pending_writes(tmp_path):
+    """중간 쓰기를 체크포인트와 함께 돌려줌 (같은 키 재기록은 무시)"""
+    with SqliteCheckpointer(tmp_path / "c.db") as saver:
+        config = _put(saver, _config("a"), 0)
+        saver.put_writes(config, [("messages", "안녕"), ("turn_count", 1)], task_id="task1")
+        saver.put_writes(config, [("messages", "덮어쓰기")], task_id="task1")
+
+        writes = saver.get_tuple(config).pending_writes
+        assert writes == [("task1", "messages", "안녕"), ("task1", "turn_count", 1)]
+
+
+def test_failed_batch_is_not_committed(tmp_path):
+    """중간에 실패한 쓰기 묶음은 이후 다른 쓰기의 커밋에 섞여 들어가지 않음"""
+    db = tmp_path / "c.db"
+    with SqliteCheckpointer(db) as saver:
+        config = _put(saver, _config("a"), 0)
+        # 두 번째 쓰기의 channel은 SQLite에 바인딩할 수 없는 값
+        with pytest.raises(sqlite3.Error):
+            saver.put_writes(config, [("messages", "안녕"), (object(), "깨진 값")], task_id="task1")
+        _put(saver, _config("b"), 0)
+
+    with SqliteCheckpointer(db) as saver:
+        assert saver.get_tuple(config).pending_writes == []
+        assert saver.get_tuple(_config("b")) is not None
+
+
+def test_wal_mode(tmp_path):
+    """WAL 저널 모드로 열림"""
+    with SqliteCheckpointer(tmp_path / "c.db") as saver:
+        assert saver._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_group_commit_across_sessions(tmp_path):
+    """동시에 쓰는 세션들의 쓰기가 더 적은 커밋으로 묶임"""
+    sessions, turns = 8, 5
+    with SqliteCheckpointer(tmp_path / "c.db", commit_delay=0.005) as saver:
+        barrier = threading.Barrier(sessions)
+
+        def session(index: int):
+            config = _config(f"s{index}")
+            barrier.wait()
+            for step in range(turns):
+                config = _put(saver, config, step)
+
+        threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert saver.commit_count < sessions * turns
+        for index in range(sessions):
+            assert saver.get_tuple(_config(f"s{index}")).metadata["step"] == turns - 1
@@ -0,0 +1,74 @@
+"""
+발화 정규화/토큰화 단위 테스트
+"""
+import pytest
+from src.services.rule_engine import get_rule_engine
+from src.services.text_normalizer import normalize_text, tokenize
+from tests.evaluation.evaluator import plans_match
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("３박４일", "3박4일"),
+    ("  제주도로\t\t가요 ", "제주도로 가요"),
+    ("삼박사일", "3박4일"),
+    ("백만원", "100만원"),
+    ("이천오백만원", "2500만원"),
+    ("사월 십오일", "4월 15일"),
+    ("시월 초", "10월 초"),
+    ("이틀 동안", "2일 동안"),
+    ("친구 두 명이랑", "친구 2명이랑"),
+    ("예산 2백만원", "예산 200만원"),
+    ("3천만원", "3000만원"),
+    ("1천5백만원", "1500만원"),
+    ("일억오천만원", "1억5000만원"),
+    ("이월에 가요", "2월에 가요"),
+])
+def test_numerals_canonicalized(text, expected):
+    """전각 숫자, 공백, 한자어/고유어 수량 표현 정규화 테스트"""
+    assert normalize_text(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "이번 주", "구경하고 사고 싶어요", "회사일", "이달 말", "이천에 가요", "오사카", "삼사일",
+    "일일이 알려줘", "오일장 구경", "포인트 이월되나요", "삼일절에 가요",
+])
+def test_words_starting_with_numerals_kept(text):
+    """수사로 시작하지만 수량이 아닌 단어는 그대로 두는지 테스트"""
+    assert normalize_text(text) == text
+
+
+def test_tokenize_splits_particles():
+    """토큰 위치와 조사 분리 테스트"""
+    tokens = tokenize("제주도로  삼박사일, 부산이요")
+
+    assert [(t.stem, t.particle) for t in tokens] == [
+        ("제주도", "로"), ("3박4일", ""), ("부산", "이요"),
+    ]
+    normalized = normalize_text("제주도로  삼박사일, 부산이요")
+    assert all(normalized[t.start:t.end] == t.text for t in tokens)
+
+
+def test_rule_engine_uses_normalized_text():
+    """규칙 엔진이 정규화된 발화에서 추출하는지 테스트"""
+    assert get_rule_engine().extract("삼박사일로 백만원 정도 생각해요") == {
+        "duration": "3박 4일", "budget": "100만원",
+    }
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("예산 2백만원", {"budget": "200만원"}),
+    ("3천만원", {"budget": "3000만원"}),
+    ("1천5백만원", {"budget": "1500만원"}),
+    ("1억 5천만원", {"budget": "1억 5000만원"}),
+    ("일일이 알려줘", {}),
+    ("오일장 구경", {"purpose": "구경"}),
+])
+def test_digit_multiplier_amounts_and_numeral_words(text, expected):
+    """숫자+자리 단위 금액은 한 숫자로, 수사로 시작하는 일반 단어는 수량으로 추출하지 않는지 테스트"""
+    assert get_rule_engine().extract(text) == expected
+
+
+def test_evaluator_compares_normalized_values():
+    """평가기가 같은 정규화로 값을 비교하는지 테스트"""
+    assert plans_match({"duration": "3박  4일"}, {"duration": "3박 4일"})
+    assert not plans_match({"duration": "3박 4일"}, {"duration": "2박 3일"})
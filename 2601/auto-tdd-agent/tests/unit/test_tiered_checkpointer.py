@@ -0,0 +1,96 @@
+"""
+TieredCheckpointer 테스트
+"""
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.agent import PlanningAgent
+from src.checkpoint import TieredCheckpointer
+
+
+class _Clock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _put(saver, thread_id: str, step: int, parent: dict = None) -> dict:
+    config = parent or {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"turn_count": step}
+    return saver.put(config, checkpoint, {"step": step}, {})
+
+
+def test_idle_session_spills_and_rehydrates(tmp_path):
+    """유휴 세션은 디스크로 내려가고, 다시 읽으면 중간 쓰기까지 그대로 올라옴"""
+    clock = _Clock()
+    saver = TieredCheckpointer(tmp_path / "cold.db", idle_after=60, clock=clock)
+    config = _put(saver, "parked", 0)
+    config = _put(saver, "parked", 1, config)
+    saver.put_writes(config, [("messages", "대기 중")], task_id="task")
+
+    clock.now = 100
+    assert saver.evict_idle() == 1
+    assert saver.hot.memory_usage()["sessions"] == 0
+    assert len(saver.cold.export_thread("parked")) == 2
+
+    restored = saver.get_tuple({"configurable": {"thread_id": "parked"}})
+    assert restored.config == config
+    assert restored.metadata["step"] == 1
+    assert restored.pending_writes == [("task", "messages", "대기 중")]
+    # 한 계층에만 존재
+    assert saver.cold.export_thread("parked") == []
+    assert [t.metadata["step"] for t in saver.list({"configurable": {"thread_id": "parked"}})] == [1, 0]
+
+
+def test_hit_rates(tmp_path):
+    """조회마다 hot/cold/없음 적중 수를 기록"""
+    saver = TieredCheckpointer(tmp_path / "cold.db", max_hot_sessions=1)
+    _put(saver, "a", 0)
+    _put(saver, "b", 0)  # a가 밀려남
+
+    saver.get_tuple({"configurable": {"thread_id": "b"}})  # hot
+    saver.get_tuple({"configurable": {"thread_id": "a"}})  # cold → hot (b가 밀려남)
+    saver.get_tuple({"configurable": {"thread_id": "a"}})  # hot
+    saver.get_tuple({"configurable": {"thread_id": "없음"}})
+
+    stats = saver.tier_stats()
+    assert (stats["hot_hits"], stats["cold_hits"], stats["misses"]) == (2, 1, 1)
+    assert stats["hot_hit_rate"] == 0.5
+    assert stats["spilled"] == 2
+    assert stats["hot_sessions"] == 1
+
+
+def test_delete_and_list_across_tiers(tmp_path):
+    """전체 목록은 두 계층을 합치고, 삭제는 두 계층 모두에서"""
+    saver = TieredCheckpointer(tmp_path / "cold.db", max_hot_sessions=1)
+    _put(saver, "a", 0)
+    _put(saver, "b", 0)
+
+    assert sorted(t.config["configurable"]["thread_id"] for t in saver.list(None)) == ["a", "b"]
+    assert len(list(saver.list(None, limit=1))) == 1
+
+    saver.delete_thread("a")
+    saver.delete_thread("b")
+    assert list(saver.list(None)) == []
+
+
+def test_agent_resumes_after_spill_and_restart(tmp_path):
+    """디스크로 내려간 대화를 재개하고, close 후 새 인스턴스에서도 이어감"""
+    clock = _Clock()
+    db = tmp_path / "cold.db"
+    agent = PlanningAgent(checkpointer=TieredCheckpointer(db, idle_after=60, clock=clock))
+    agent.run("제주도로 여행 가고 싶어요", thread_id="t1", reference_date="2026-03-01")
+
+    clock.now = 100
+    agent.checkpointer.evict_idle()
+    result = agent.continue_conversation("3월 15일에 출발해요", thread_id="t1")
+    assert result["current_plan"]["destination"] == "제주도"
+    assert agent.checkpointer.tier_stats()["cold_hits"] == 1
+    agent.checkpointer.close()
+
+    restarted = PlanningAgent(checkpointer=TieredCheckpointer(db))
+    assert restarted.get_current_state("t1")["current_plan"]["start_date"] == "2026-03-15"
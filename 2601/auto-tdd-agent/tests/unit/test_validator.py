@@ -0,0 +1,101 @@
+"""
+PlanValidator 단위 테스트
+"""
+import pytest
+from src.core.config import AgentConfig
+from src.utils.validator import (
+    PlanValidator,
+    compile_slot_validators,
+    format_budget,
+    parse_budget,
+)
+from tests.evaluation.evaluator import audit_plans
+
+
+@pytest.fixture
+def validator():
+    """money 타입 예산을 포함한 검증기 fixture"""
+    return PlanValidator(AgentConfig.default())
+
+
+def test_validators_compiled_once_per_config(sample_config):
+    """같은 설정이면 컴파일된 검증기를 재사용하는지 테스트"""
+    assert compile_slot_validators(sample_config) is compile_slot_validators(sample_config)
+    assert compile_slot_validators(sample_config)["start_date"].type_name == "date"
+
+
+def test_date_validation_checks_calendar(validator):
+    """날짜 형식뿐 아니라 실제 존재하는 날짜인지 검증하는지 테스트"""
+    assert validator.validate_slot_type("start_date", "2026-03-15") is True
+    assert validator.validate_slot_type("start_date", "2028-02-29") is True
+    assert validator.validate_slot_type("start_date", "2026-02-30") is False
+    assert validator.validate_slot_type("start_date", "2026-13-01") is False
+    assert validator.validate_slot_type("start_date", "2026-3-15") is False
+    assert validator.validate_slot_type("start_date", None) is False
+
+
+@pytest.mark.parametrize("value,expected", [
+    ("50만원", 500_000),
+    ("100 만 원", 1_000_000),
+    ("1억 5천만원", 150_000_000),
+    ("300,000원", 300_000),
+    ("100만원 정도", 1_000_000),
+    ("2백만원", 2_000_000),
+    ("3천만원", 30_000_000),
+    ("1천5백만원", 15_000_000),
+    ("1억5천", 150_000_000),
+    ("3만5천원", 35_000),
+    ("1.5억", 150_000_000),
+    (700000, 700_000),
+    ("만원", 10_000),
+    ("천만원", 10_000_000),
+    ("1,000,000원", 1_000_000),
+    ("30만원, 정도", 300_000),
+    ("적당히", None),
+    ("원", None),
+    ("1,5", None),
+    ("10,00원", None),
+    (True, None),
+])
+def test_parse_budget(value, expected):
+    """예산 문자열을 원 단위 금액으로 파싱하는지 테스트"""
+    assert parse_budget(value) == expected
+
+
+def test_normalize_slots(validator):
+    """슬롯 타입별 정규화 테스트"""
+    assert validator.normalize_slot("start_date", "2026.3.5") == "2026-03-05"
+    assert validator.normalize_slot("start_date", "2026년 3월 5일") == "2026-03-05"
+    assert validator.normalize_slot("budget", "100 만 원") == "100만원"
+    assert validator.normalize_slot("budget", "1천5백만원") == "1500만원"
+    assert validator.normalize_slot("companions", " 친구   2명 ") == "친구 2명"
+    assert validator.normalize_slot("unknown", "그대로") == "그대로"
+    assert format_budget(150_000_000) == "1억 5000만원"
+
+
+def test_validate_many(validator, sample_plan):
+    """여러 plan 일괄 검증 테스트"""
+    plans = [
+        sample_plan,
+        dict(sample_plan, start_date="2026-02-30", budget="많이"),
+        {"destination": "부산"},
+    ]
+    results = list(validator.validate_many(iter(plans)))
+
+    assert results[0].valid is True
+    assert results[1].valid is False
+    assert results[1].invalid_slots == ("start_date", "budget")
+    assert results[2].missing_slots == ("start_date", "duration")
+
+
+def test_audit_plans(sample_plan):
+    """평가 모듈의 일괄 검증 집계 테스트"""
+    summary = audit_plans(
+        [sample_plan, dict(sample_plan, start_date="2026-02-30"), {}],
+        AgentConfig.default(),
+    )
+
+    assert summary["total"] == 3
+    assert summary["valid"] == 1
+    assert summary["invalid_slots"] == {"start_date": 1}
+    assert summary["missing_slots"]["destination"] == 1